@@ -5,11 +5,12 @@ Coordinates LLM calls with game state and tools.
 Supports local backends: LM Studio, Ollama.
 """
 
+import asyncio
 import json
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Literal
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .state import CampaignManager, Campaign
 from .state.schema import FactionName, HistoryType, LeverageWeight
@@ -19,7 +20,8 @@ from .tools.subsets import get_tools_for_phase, get_minimal_tools
 from .tools.hinge_detector import detect_hinge, get_hinge_context
 from .systems.interrupts import InterruptDetector, InterruptCandidate
 from .prompts import PromptLoader
-from .llm.base import LLMClient, Message
+from .llm.aio import AsyncLLMClient, get_llm_loop
+from .llm.base import LLMClient, LLMResponse, Message
 from .llm import create_llm_client
 from .lore import UnifiedRetriever
 from .lore.quotes import get_relevant_quotes, format_quote_for_gm, get_faction_motto
@@ -29,6 +31,11 @@ from .context import (
     StrainTier,
     RollingWindow,
     TranscriptBlock,
+    DigestManager,
+    DigestTracker,
+    PackSection,
+    SceneRecapSummarizer,
+    budgets_for_context,
     format_strain_notice,
     extract_ambient_context,
     LOCAL_BUDGETS,
@@ -44,6 +51,26 @@ class AdvisorResponse:
     error: str | None = None
 
 
+@dataclass
+class ContextPrefetch:
+    """
+    Turn context that doesn't depend on the player's input, built ahead of
+    respond() while they type (see SentinelAgent.prefetch_context).
+
+    Valid while `stamp` matches the campaign; the provisional retrieval is
+    reused only if the submitted input is the text it was run on.
+    """
+    stamp: tuple
+    sections: dict[str, str]
+    ambient: str
+    interrupt: InterruptCandidate | None
+    demand_alerts: str
+    factions: list[str]
+    topic: str = ""
+    strain_tier: StrainTier | None = None
+    retrieval: str = ""
+
+
 class SentinelAgent:
     """
     The SENTINEL Game Master agent.
@@ -117,12 +144,41 @@ class SentinelAgent:
 
         # Initialize prompt packer for context control
         # Local mode uses reduced budgets for 8k context models
+        # Scene recaps for trimmed blocks are condensed by the active client
+        # on a worker thread, so strained turns never wait on them
+        self.recap_summarizer = SceneRecapSummarizer(
+            lambda: getattr(self, "client", None)
+        )
         if local_mode:
-            self.packer = PromptPacker(budgets=LOCAL_BUDGETS, total_budget=5000)
+            self.packer = PromptPacker(
+                budgets=LOCAL_BUDGETS,
+                total_budget=5000,
+                summarizer=self.recap_summarizer,
+            )
         else:
-            self.packer = PromptPacker()
+            self.packer = PromptPacker(summarizer=self.recap_summarizer)
+        # Budgets are re-derived from the model's context window when the
+        # backend reports one (see _sync_budgets); these are the fallback
+        self._template_budgets = (dict(self.packer.budgets), self.packer.total_budget)
+        # Async front end for fan-out requests (see consult); rebuilt when
+        # the client changes
+        self._async_client: AsyncLLMClient | None = None
+        self._budget_model: str | None = None
+        self.response_max_tokens = 2048
         self._last_pack_info: PackInfo | None = None
         self._conversation_window = RollingWindow()
+        # Speculative context from prefetch_context(); bumping the generation
+        # drops it (and any build still in flight)
+        self._prefetch: ContextPrefetch | None = None
+        self._prefetch_lock = threading.Lock()
+        self._context_generation = 0
+
+        # Campaign digest, maintained incrementally from state events
+        self.digest_tracker = DigestTracker(
+            self.manager,
+            DigestManager(self.manager.campaigns_path),
+        )
+        self.digest_tracker.attach()
 
         # Initialize client
         if client is not None:
@@ -160,6 +216,54 @@ class SentinelAgent:
         """Backwards compatibility - access lore via unified retriever."""
         return self.unified_retriever.lore if self.unified_retriever else None
 
+    def close(self) -> None:
+        """
+        Release event-bus subscriptions and background work held by this agent.
+
+        Call when the agent is replaced (backend switch) or at exit, so a
+        discarded agent stops reacting to state events and summarizing.
+        """
+        self.digest_tracker.detach()
+        self.recap_summarizer.shutdown()
+        if self._async_client is not None:
+            get_llm_loop().submit(self._async_client.aclose())
+            self._async_client = None
+
+    def get_async_client(self) -> AsyncLLMClient | None:
+        """Async client for the current backend, on the shared LLM loop."""
+        if not self.client:
+            return None
+        if self._async_client is None or self._async_client.client is not self.client:
+            if self._async_client is not None:
+                get_llm_loop().submit(self._async_client.aclose())
+            self._async_client = AsyncLLMClient(self.client)
+        return self._async_client
+
+    def _sync_budgets(self) -> None:
+        """
+        Scale pack budgets to the current model's context window.
+
+        Runs the probe only when the model changes (clients cache it per
+        model); falls back to the hand-tuned tables when the backend can't
+        report a context length.
+        """
+        model = self.client.model_name
+        if model == self._budget_model:
+            return
+        self._budget_model = model
+
+        context_length = self.client.get_context_length()
+        if context_length:
+            budgets, total = budgets_for_context(
+                context_length,
+                response_tokens=self.response_max_tokens,
+                local=self.local_mode,
+            )
+        else:
+            budgets, total = self._template_budgets
+        self.packer.budgets = dict(budgets)
+        self.packer.total_budget = total
+
     def get_tools(self) -> list[dict]:
         """Get tool schemas for the API.
 
@@ -360,6 +464,7 @@ class SentinelAgent:
         self,
         user_message: str,
         conversation: list[Message] | None = None,
+        on_token: Callable[[str], None] | None = None,
     ) -> str:
         """
         Generate a response to the user message.
@@ -369,6 +474,8 @@ class SentinelAgent:
         Args:
             user_message: The player's input
             conversation: Previous messages in the conversation
+            on_token: If given, the response is streamed and this receives
+                display text as it arrives (tool invocations held back)
 
         Returns:
             The agent's response text
@@ -386,6 +493,8 @@ class SentinelAgent:
         bus = get_event_bus()
         campaign_id = self.manager.current.meta.id if self.manager.current else ""
 
+        self._sync_budgets()
+
         # Build messages for LLM
         messages = list(conversation or [])
         messages.append(Message(role="user", content=user_message))
@@ -397,55 +506,32 @@ class SentinelAgent:
         bus.emit(EventType.STAGE_BUILDING_CONTEXT, campaign_id=campaign_id,
                  detail="Loading prompts and state")
 
-        # Get base sections from prompt loader
-        sections = self.prompt_loader.get_sections(
-            self.manager.current,
-            self.manager,
-        )
+        # State-dependent context: reuse the speculative build from while
+        # the player was typing if the campaign hasn't changed since
+        context = self._take_prefetch()
+        sections = context.sections
+        ambient_context = context.ambient
+        interrupt_candidate = context.interrupt
 
         # Build dynamic hints (hinge detection, thread triggers, etc.)
-        dynamic_hints = self._build_dynamic_hints(user_message)
-        ambient_context = (
-            extract_ambient_context(self.manager.current)
-            if self.manager and self.manager.current
-            else ""
-        )
+        dynamic_hints = self._build_dynamic_hints(user_message, context.demand_alerts)
 
-        # Check for pending interrupts
-        interrupt_candidate: InterruptCandidate | None = None
         interrupt_injection = ""
-        if self.manager and self.manager.current:
-            interrupt_candidate = self._interrupt_detector.check_triggers(
-                self.manager.current
-            )
-
         if interrupt_candidate:
             interrupt_injection = self._format_interrupt_injection(interrupt_candidate)
 
         # Calculate preliminary strain for retrieval budget
-        preliminary_pressure = self.packer.get_pressure(
-            system=sections["system"],
-            rules_core=sections["rules_core"],
-            rules_narrative=sections["rules_narrative"],
-            state=sections["state"] + "\n\n" + dynamic_hints if dynamic_hints else sections["state"],
-            ambient=ambient_context,
-        )
-        strain_tier = StrainTier.from_pressure(preliminary_pressure)
+        strain_tier = self._preliminary_strain(sections, dynamic_hints, ambient_context)
 
         # Stage: Retrieving lore
         bus.emit(EventType.STAGE_RETRIEVING_LORE, campaign_id=campaign_id,
                  detail="Searching campaign history and lore")
 
         # Retrieve with strain-aware budget
-        retrieval_content = ""
-        if self.unified_retriever:
-            unified_result = self.unified_retriever.query(
-                topic=user_message,
-                factions=self._get_active_factions(),
-                strain_tier=strain_tier,  # Pass strain for budget adjustment
-            )
-            if not unified_result.is_empty:
-                retrieval_content = self.unified_retriever.format_for_prompt(unified_result)
+        if context.topic == user_message and context.strain_tier == strain_tier:
+            retrieval_content = context.retrieval
+        else:
+            retrieval_content = self._retrieve(user_message, context.factions, strain_tier)
 
         # Add lore quotes to retrieval
         quote_context = self._get_relevant_quotes(user_message)
@@ -470,46 +556,67 @@ class SentinelAgent:
         bus.emit(EventType.STAGE_PACKING_PROMPT, campaign_id=campaign_id,
                  detail="Assembling context with token budget")
 
-        # Pack everything with budget enforcement
-        # rules_core (decision logic) is always included
-        # rules_narrative (flavor) is cut under strain II+
-        system_prompt, pack_info = self.packer.pack(
-            system=sections["system"],
-            rules_core=sections["rules_core"],
-            rules_narrative=sections["rules_narrative"],
-            state=state_content,
-            ambient=ambient_context,
-            window=self._conversation_window,
-            retrieval=retrieval_content,
-            user_input=user_message,
-        )
+        # Campaign memory digest (cached text; skipped when budgeted out)
+        digest_content = ""
+        if self.packer.budgets[PackSection.DIGEST].tokens > 0:
+            digest_content = self.digest_tracker.prompt_text()
+
+        # Recap jobs started by pack() wait until this turn's LLM call is
+        # done, so they never compete with it for a local backend
+        with self.recap_summarizer.hold():
+            # Pack everything with budget enforcement
+            # rules_core (decision logic) is always included
+            # rules_narrative (flavor) is cut under strain II+
+            system_prompt, pack_info = self.packer.pack(
+                system=sections["system"],
+                rules_core=sections["rules_core"],
+                rules_narrative=sections["rules_narrative"],
+                state=state_content,
+                ambient=ambient_context,
+                digest=digest_content,
+                window=self._conversation_window,
+                retrieval=retrieval_content,
+                user_input=user_message,
+            )
 
-        # Store pack info for /context command
-        self._last_pack_info = pack_info
-
-        # Add strain notice if elevated
-        strain_notice = format_strain_notice(pack_info.strain_tier)
-        if strain_notice:
-            system_prompt = system_prompt + "\n\n---\n\n" + strain_notice
-
-        # Stage: Awaiting LLM
-        bus.emit(EventType.STAGE_AWAITING_LLM, campaign_id=campaign_id,
-                 detail=f"Generating response via {self.client.model_name}",
-                 tokens=pack_info.total_tokens)
-
-        # Use the client's tool loop
-        def tool_executor(name: str, args: dict) -> dict:
-            # Emit tool execution event
-            bus.emit(EventType.STAGE_EXECUTING_TOOL, campaign_id=campaign_id,
-                     tool_name=name, detail=f"Executing {name}")
-            return self.execute_tool(name, args)
-
-        response = self.client.chat_with_tools(
-            messages=messages,
-            system=system_prompt,
-            tools=self.get_tools() if self.client.supports_tools else None,
-            tool_executor=tool_executor,
-        )
+            # Store pack info for /context command
+            self._last_pack_info = pack_info
+
+            # Add strain notice if elevated
+            strain_notice = format_strain_notice(pack_info.strain_tier)
+            if strain_notice:
+                system_prompt = system_prompt + "\n\n---\n\n" + strain_notice
+
+            # Stage: Awaiting LLM
+            bus.emit(EventType.STAGE_AWAITING_LLM, campaign_id=campaign_id,
+                     detail=f"Generating response via {self.client.model_name}",
+                     tokens=pack_info.total_tokens)
+
+            # Use the client's tool loop
+            def tool_executor(name: str, args: dict) -> dict:
+                # Emit tool execution event
+                bus.emit(EventType.STAGE_EXECUTING_TOOL, campaign_id=campaign_id,
+                         tool_name=name, detail=f"Executing {name}")
+                return self.execute_tool(name, args)
+
+            tools = self.get_tools() if self.client.supports_tools else None
+            if on_token is not None:
+                response = self.client.chat_with_tools_stream(
+                    messages=messages,
+                    system=system_prompt,
+                    tools=tools,
+                    tool_executor=tool_executor,
+                    on_text=on_token,
+                    max_tokens=self.response_max_tokens,
+                )
+            else:
+                response = self.client.chat_with_tools(
+                    messages=messages,
+                    system=system_prompt,
+                    tools=tools,
+                    tool_executor=tool_executor,
+                    max_tokens=self.response_max_tokens,
+                )
 
         # Stage: Processing done
         bus.emit(EventType.STAGE_PROCESSING_DONE, campaign_id=campaign_id,
@@ -521,6 +628,7 @@ class SentinelAgent:
                 self.manager.current.meta.id,
                 interrupt_candidate,
             )
+            self._invalidate_prefetch()  # Its interrupt check is now stale
 
         # Update window with assistant response
         self._conversation_window.add_block(TranscriptBlock(
@@ -582,8 +690,11 @@ class SentinelAgent:
 
         return "NARRATIVE"
 
-    def _build_dynamic_hints(self, user_message: str) -> str:
-        """Build dynamic context hints (hinge detection, thread triggers, etc.)."""
+    def _build_dynamic_hints(self, user_message: str, demand_alerts: str | None = None) -> str:
+        """Build dynamic context hints (hinge detection, thread triggers, etc.).
+
+        demand_alerts, when given, is a precomputed _format_urgent_demands().
+        """
         hints = []
 
         # Detect hinge moments in player input
@@ -602,12 +713,130 @@ class SentinelAgent:
             hints.append(self._format_leverage_hints(leverage_hints))
 
         # Check for demand deadlines (overdue/urgent demands)
-        urgent_demands = self.manager.check_demand_deadlines()
-        if urgent_demands:
-            hints.append(self._format_demand_alerts(urgent_demands))
+        if demand_alerts is None:
+            demand_alerts = self._format_urgent_demands()
+        if demand_alerts:
+            hints.append(demand_alerts)
 
         return "\n\n---\n\n".join(hints) if hints else ""
 
+    def _format_urgent_demands(self) -> str:
+        """Alerts for overdue/urgent leverage demands ("" if none)."""
+        urgent_demands = self.manager.check_demand_deadlines()
+        return self._format_demand_alerts(urgent_demands) if urgent_demands else ""
+
+    # -------------------------------------------------------------------------
+    # Context Prefetch
+    # -------------------------------------------------------------------------
+
+    def prefetch_context(self, partial_input: str) -> bool:
+        """
+        Speculatively build the next turn's context while the player types.
+
+        Builds everything respond() needs that depends only on campaign
+        state (prompt sections, ambient context, interrupt and demand
+        checks) plus a provisional retrieval on the partial input. Blocking;
+        call from a worker thread. respond() reuses the result if the
+        campaign hasn't changed, leaving only input-dependent work on Enter.
+
+        Returns:
+            True if a prefetch was built, False if skipped (no campaign, or
+            respond() or another prefetch is busy)
+        """
+        if not self.manager.current or not self._prefetch_lock.acquire(blocking=False):
+            return False
+        try:
+            self._sync_budgets()
+            stamp = self._context_stamp()
+            context = self._build_state_context(stamp)
+            topic = partial_input.strip()
+            if topic:
+                strain = self._preliminary_strain(context.sections, "", context.ambient)
+                context.topic = topic
+                context.strain_tier = strain
+                context.retrieval = self._retrieve(topic, context.factions, strain)
+            if self._context_stamp() != stamp:
+                return False  # State moved underneath us
+            self._prefetch = context
+            return True
+        except Exception:
+            return False  # Speculative; respond() builds it for real
+        finally:
+            self._prefetch_lock.release()
+
+    def _context_stamp(self) -> tuple:
+        """Identifies the campaign state a context build reflects."""
+        campaign = self.manager.current
+        return (
+            campaign.meta.id if campaign else None,
+            campaign.state_version if campaign else 0,
+            self.manager.revision,
+            self._context_generation,
+            self.packer.total_budget,
+        )
+
+    def _invalidate_prefetch(self) -> None:
+        self._context_generation += 1
+        self._prefetch = None
+
+    def _take_prefetch(self) -> ContextPrefetch:
+        """The prefetched context if still valid, else a fresh build."""
+        with self._prefetch_lock:
+            context, self._prefetch = self._prefetch, None
+            stamp = self._context_stamp()
+            if context is not None and context.stamp == stamp:
+                return context
+            return self._build_state_context(stamp)
+
+    def _build_state_context(self, stamp: tuple) -> ContextPrefetch:
+        """Build the input-independent part of a turn's context."""
+        campaign = self.manager.current
+        sections = self.prompt_loader.get_sections(campaign, self.manager)
+        ambient = extract_ambient_context(campaign) if campaign else ""
+
+        # Check for pending interrupts
+        interrupt = None
+        if campaign:
+            interrupt = self._interrupt_detector.check_triggers(campaign)
+
+        return ContextPrefetch(
+            stamp=stamp,
+            sections=sections,
+            ambient=ambient,
+            interrupt=interrupt,
+            demand_alerts=self._format_urgent_demands(),
+            factions=self._get_active_factions(),
+        )
+
+    def _preliminary_strain(
+        self,
+        sections: dict[str, str],
+        dynamic_hints: str,
+        ambient: str,
+    ) -> StrainTier:
+        """Strain estimate (before retrieval) that sizes the retrieval budget."""
+        pressure = self.packer.get_pressure(
+            system=sections["system"],
+            rules_core=sections["rules_core"],
+            rules_narrative=sections["rules_narrative"],
+            state=sections["state"] + "\n\n" + dynamic_hints if dynamic_hints else sections["state"],
+            ambient=ambient,
+        )
+        return StrainTier.from_pressure(pressure)
+
+    def _retrieve(self, topic: str, factions: list[str], strain_tier: StrainTier) -> str:
+        """Lore and campaign memory for topic, formatted for the prompt."""
+        if not self.unified_retriever:
+            return ""
+        unified_result = self.unified_retriever.query(
+            topic=topic,
+            factions=factions,
+            strain_tier=strain_tier,  # Pass strain for budget adjustment
+        )
+        if unified_result.is_empty:
+            return ""
+        return self.unified_retriever.format_for_prompt(unified_result)
+
     # -------------------------------------------------------------------------
     # Council / Consult
     # -------------------------------------------------------------------------
@@ -625,35 +854,21 @@ class SentinelAgent:
         "witness": "witnesses",
     }
 
-    def _query_advisor(
-        self,
-        advisor: str,
-        question: str,
-        context: str,
-    ) -> AdvisorResponse:
-        """Query a single advisor. Used in parallel."""
-        title = self.ADVISORS.get(advisor, advisor.upper())
-
-        if not self.client:
-            return AdvisorResponse(
-                advisor=advisor,
-                title=title,
-                response="",
-                error="No LLM backend available",
-            )
+    # Opens every advisor's system prompt, so the situation forms a prefix
+    # the backend evaluates once and reuses for each advisor
+    COUNCIL_PREFIX = (
+        "# Council Consultation\n\n"
+        "The operative has put one question to several faction advisors. "
+        "Answer only as the advisor described after the situation.\n\n"
+        "# Current Situation\n\n{context}\n\n---\n\n"
+    )
 
-        # Load advisor prompt
+    def _advisor_system(self, advisor: str, question: str, prefix: str) -> str | None:
+        """Advisor system prompt: shared prefix, persona, faction history."""
         advisor_prompt = self.prompt_loader.load_advisor(advisor)
         if not advisor_prompt:
-            return AdvisorResponse(
-                advisor=advisor,
-                title=title,
-                response="",
-                error=f"Advisor prompt not found: {advisor}",
-            )
-
-        # Build system prompt with advisor personality + context
-        system = f"{advisor_prompt}\n\n---\n\n# Current Situation\n\n{context}"
+            return None
+        system = prefix + advisor_prompt
 
         # Add faction-specific campaign history if available
         if self.unified_retriever:
@@ -668,28 +883,29 @@ class SentinelAgent:
                 if unified_result.has_campaign:
                     history_section = self.unified_retriever.format_for_prompt(unified_result)
                     system = system + "\n\n---\n\n" + history_section
+        return system
 
-        try:
-            # Simple completion without tools
-            messages = [Message(role="user", content=question)]
-            response = self.client.chat_with_tools(
-                messages=messages,
-                system=system,
-                tools=None,
-                tool_executor=lambda n, a: {},
-            )
-            return AdvisorResponse(
-                advisor=advisor,
-                title=title,
-                response=response.strip(),
-            )
-        except Exception as e:
+    def _advisor_result(
+        self,
+        advisor: str,
+        result: LLMResponse | BaseException,
+        aclient: AsyncLLMClient,
+    ) -> AdvisorResponse:
+        """AdvisorResponse for one answer (or the error it raised)."""
+        title = self.ADVISORS.get(advisor, advisor.upper())
+        if isinstance(result, asyncio.TimeoutError):
+            error = f"No reply within {aclient.timeout:g}s"
+        elif isinstance(result, Exception):
+            error = str(result)
+        elif isinstance(result, BaseException):
+            raise result  # Cancellation and the like
+        else:
             return AdvisorResponse(
                 advisor=advisor,
                 title=title,
-                response="",
-                error=str(e),
+                response=result.content.strip(),
             )
+        return AdvisorResponse(advisor=advisor, title=title, response="", error=error)
 
     def consult(
         self,
@@ -699,6 +915,9 @@ class SentinelAgent:
         """
         Consult multiple advisors in parallel.
 
+        Runs consult_async() on the shared LLM event loop; interrupting the
+        wait (Ctrl+C) cancels the outstanding requests.
+
         Args:
             question: The player's question
             advisors: Which advisors to query (default: all three)
@@ -706,6 +925,20 @@ class SentinelAgent:
         Returns:
             List of AdvisorResponse objects
         """
+        return get_llm_loop().run(self.consult_async(question, advisors))
+
+    async def consult_async(
+        self,
+        question: str,
+        advisors: list[str] | None = None,
+    ) -> list[AdvisorResponse]:
+        """
+        Consult advisors as one batch (see AsyncLLMClient.chat_batch).
+
+        Every advisor's system prompt opens with the same situation block,
+        so the backend can evaluate it once; only the persona and faction
+        history differ per advisor.
+        """
         if advisors is None:
             advisors = list(self.ADVISORS.keys())
 
@@ -737,23 +970,42 @@ class SentinelAgent:
                 )
 
         context = "\n".join(context_lines) if context_lines else "No active campaign."
-
-        # Query advisors in parallel
-        results: list[AdvisorResponse] = []
-
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = {
-                executor.submit(self._query_advisor, adv, question, context): adv
+        prefix = self.COUNCIL_PREFIX.format(context=context)
+
+        aclient = self.get_async_client()
+        if aclient is None:
+            return [
+                AdvisorResponse(
+                    advisor=adv,
+                    title=self.ADVISORS.get(adv, adv.upper()),
+                    response="",
+                    error="No LLM backend available",
+                )
                 for adv in advisors
-            }
-            for future in as_completed(futures):
-                results.append(future.result())
-
-        # Sort by advisor order
-        order = {adv: i for i, adv in enumerate(advisors)}
-        results.sort(key=lambda r: order.get(r.advisor, 99))
+            ]
+
+        results: dict[str, AdvisorResponse] = {}
+        systems: dict[str, str] = {}
+        for adv in advisors:
+            system = self._advisor_system(adv, question, prefix)
+            if system is None:
+                results[adv] = AdvisorResponse(
+                    advisor=adv,
+                    title=self.ADVISORS.get(adv, adv.upper()),
+                    response="",
+                    error=f"Advisor prompt not found: {adv}",
+                )
+            else:
+                systems[adv] = system
 
-        return results
+        # One batch sharing the situation prefix; answers come back in order
+        messages = [Message(role="user", content=question)]
+        answers = await aclient.chat_batch(
+            [(messages, system) for system in systems.values()], reuse=True,
+        )
+        for adv, answer in zip(systems, answers):
+            results[adv] = self._advisor_result(adv, answer, aclient)
+        return [results[adv] for adv in advisors]
 
 
 # -----------------------------------------------------------------------------
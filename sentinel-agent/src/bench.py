@@ -0,0 +1,245 @@
+"""
+Full-pipeline load benchmark for SentinelAgent.respond().
+
+Runs N turns against the deterministic stub server (llm.stub_server)
+through the real HTTP client, on synthetic campaigns, and reports p50/p95
+per pipeline stage. Stage boundaries are the agent's own STAGE_* events:
+
+    context    building state context (STAGE_BUILDING_CONTEXT ->)
+    retrieval  lore and campaign-history retrieval (STAGE_RETRIEVING_LORE ->)
+    packing    prompt packing (STAGE_PACKING_PROMPT ->)
+    llm        model rounds and tool calls (STAGE_AWAITING_LLM ->)
+    post       bookkeeping after the reply (STAGE_PROCESSING_DONE -> return)
+    total      the whole respond() call
+
+No GPU needed, so CI can fail a build whose p95 exceeds a budget:
+
+    python -m src.bench --turns 40 --budget total=0.5 --budget packing=0.05
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .agent import SentinelAgent
+from .llm.base import Message
+from .llm.lmstudio import LMStudioClient
+from .llm.ollama import OllamaClient
+from .llm.stub_server import StubLLMServer
+from .llm.telemetry import _percentile
+from .state import CampaignManager, MemoryCampaignStore
+from .state.event_bus import EventType, get_event_bus
+from .state.schema import (
+    NPC,
+    Background,
+    Character,
+    FactionName,
+    HistoryType,
+    NPCAgenda,
+)
+
+STAGES = {
+    EventType.STAGE_BUILDING_CONTEXT: "context",
+    EventType.STAGE_RETRIEVING_LORE: "retrieval",
+    EventType.STAGE_PACKING_PROMPT: "packing",
+    EventType.STAGE_AWAITING_LLM: "llm",
+    EventType.STAGE_PROCESSING_DONE: "post",
+}
+
+PLAYER_LINES = [
+    "I check the perimeter before the convoy arrives.",
+    "Ask Marta what she knows about the Nexus drones.",
+    "I slip into the transit tunnel and wait.",
+    "Can we trust the Witnesses with the manifest?",
+    "I offer the broker half up front.",
+    "Let's head back to the safehouse and regroup.",
+]
+
+PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+LORE_DIR = Path(__file__).parent.parent.parent / "lore"
+
+
+@dataclass
+class BenchResult:
+    """Per-stage timings (seconds) of every measured turn."""
+    turns: int
+    backend: str
+    timings: dict[str, list[float]] = field(default_factory=dict)
+
+    def summary(self) -> dict[str, dict[str, float | None]]:
+        """{stage: {p50, p95, max}}."""
+        return {
+            stage: {
+                "p50": _percentile(values, 0.5),
+                "p95": _percentile(values, 0.95),
+                "max": max(values) if values else None,
+            }
+            for stage, values in self.timings.items()
+        }
+
+
+def synthetic_campaign(manager: CampaignManager, seed: int, npcs: int = 8, history: int = 30):
+    """A campaign with a character, NPCs and history, derived from seed."""
+    rng = random.Random(seed)
+    factions = list(FactionName)
+    campaign = manager.create_campaign(f"Bench {seed}")
+    manager.add_character(Character(
+        name=f"Operative {seed}",
+        callsign="Bench",
+        background=rng.choice(list(Background)),
+    ))
+    for i in range(npcs):
+        manager.add_npc(NPC(
+            name=f"Contact {i}",
+            faction=rng.choice(factions),
+            agenda=NPCAgenda(wants="Leverage over the convoy", fears="Exposure"),
+        ))
+    for i in range(history):
+        manager.log_history(
+            rng.choice([HistoryType.MISSION, HistoryType.CONSEQUENCE, HistoryType.FACTION_SHIFT]),
+            f"Turn {i}: {rng.choice(PLAYER_LINES)}",
+        )
+    return campaign
+
+
+def run_benchmark(
+    turns: int = 20,
+    campaigns: int = 2,
+    warmup: int = 2,
+    backend: str = "lmstudio",
+    stream: bool = True,
+    lore_dir: Path | None = LORE_DIR,
+    **stub_config,
+) -> BenchResult:
+    """
+    Drive respond() for `turns` measured turns, spread over `campaigns`
+    synthetic campaigns, against a stub server.
+
+    Args:
+        turns: Measured turns (after warmup)
+        campaigns: Synthetic campaigns to rotate through
+        warmup: Unmeasured turns first (imports, caches, connections)
+        backend: "lmstudio" or "ollama" client
+        stream: Use the streaming path (on_token) like the TUI
+        lore_dir: Lore to retrieve from (None to skip retrieval)
+        **stub_config: StubConfig fields (latency, tokens_per_sec, ...)
+    """
+    result = BenchResult(turns=turns, backend=backend)
+    bus = get_event_bus()
+    marks: list[tuple[str, float]] = []
+
+    def on_stage(event) -> None:
+        marks.append((STAGES[event.type], time.perf_counter()))
+
+    with StubLLMServer(**stub_config) as stub:
+        client_cls = LMStudioClient if backend == "lmstudio" else OllamaClient
+        client = client_cls(base_url=stub.openai_url)
+        manager = CampaignManager(MemoryCampaignStore())
+        agent = SentinelAgent(
+            manager,
+            prompts_dir=PROMPTS_DIR,
+            lore_dir=lore_dir if lore_dir and lore_dir.exists() else None,
+            client=client,
+        )
+        campaign_ids = [synthetic_campaign(manager, seed).meta.id for seed in range(campaigns)]
+        conversations: dict[str, list[Message]] = {cid: [] for cid in campaign_ids}
+
+        for stage_event in STAGES:
+            bus.on(stage_event, on_stage)
+        try:
+            for turn in range(warmup + turns):
+                cid = campaign_ids[turn % len(campaign_ids)]
+                if manager.current is None or manager.current.meta.id != cid:
+                    manager.load_campaign(cid)
+                line = PLAYER_LINES[turn % len(PLAYER_LINES)]
+                conversation = conversations[cid]
+
+                marks.clear()
+                start = time.perf_counter()
+                reply = agent.respond(
+                    line, conversation,
+                    on_token=(lambda _text: None) if stream else None,
+                )
+                end = time.perf_counter()
+                conversation += [
+                    Message(role="user", content=line),
+                    Message(role="assistant", content=reply),
+                ]
+                del conversation[:-12]  # Keep the window bounded like a session
+
+                if turn < warmup:
+                    continue
+                result.timings.setdefault("total", []).append(end - start)
+                bounds = marks + [("", end)]
+                for (stage, at), (_, until) in zip(bounds, bounds[1:]):
+                    result.timings.setdefault(stage, []).append(until - at)
+        finally:
+            for stage_event in STAGES:
+                bus.off(stage_event, on_stage)
+    return result
+
+
+def format_report(result: BenchResult) -> str:
+    lines = [
+        f"respond() x{result.turns} via {result.backend} stub",
+        f"{'stage':<10} {'p50':>9} {'p95':>9} {'max':>9}",
+    ]
+    for stage, stats in result.summary().items():
+        lines.append(
+            f"{stage:<10} "
+            + " ".join(f"{stats[k] * 1000:>7.1f}ms" for k in ("p50", "p95", "max"))
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SentinelAgent.respond() against a stub LLM")
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--campaigns", type=int, default=2)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--backend", choices=["lmstudio", "ollama"], default="lmstudio")
+    parser.add_argument("--no-stream", action="store_true", help="Use the blocking path")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stub seconds to first token")
+    parser.add_argument("--tps", type=float, default=0.0, help="Stub tokens/sec (0 = unpaced)")
+    parser.add_argument("--tool", default=None, help="Have the stub call this tool once per turn")
+    parser.add_argument("--no-lore", action="store_true", help="Skip lore retrieval")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    parser.add_argument(
+        "--budget", action="append", default=[], metavar="STAGE=SECONDS",
+        help="Fail (exit 1) if the stage's p95 exceeds SECONDS",
+    )
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(
+        turns=args.turns,
+        campaigns=args.campaigns,
+        warmup=args.warmup,
+        backend=args.backend,
+        stream=not args.no_stream,
+        lore_dir=None if args.no_lore else LORE_DIR,
+        latency=args.latency,
+        tokens_per_sec=args.tps,
+        tool_name=args.tool,
+    )
+    summary = result.summary()
+    print(json.dumps(summary, indent=2) if args.json else format_report(result))
+
+    failed = False
+    for budget in args.budget:
+        stage, _, limit = budget.partition("=")
+        p95 = (summary.get(stage) or {}).get("p95")
+        if p95 is None:
+            print(f"budget: unknown stage {stage!r}", file=sys.stderr)
+            failed = True
+        elif p95 > float(limit):
+            print(f"budget: {stage} p95 {p95:.3f}s > {float(limit):.3f}s", file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,7 @@ from .packer import (
     StrainTier,
     DEFAULT_BUDGETS,
     LOCAL_BUDGETS,
+    budgets_for_context,
     format_strain_notice,
 )
 from .window import (
@@ -23,11 +24,13 @@ from .window import (
 )
 from .digest import (
     DigestManager,
+    DigestTracker,
     CampaignDigest,
     HingeEntry,
     ThreadEntry,
     DigestSection,
 )
+from .recap import SceneRecapSummarizer
 from .ambient_context import extract_ambient_context
 
 __all__ = [
@@ -42,6 +45,7 @@ __all__ = [
     "StrainTier",
     "DEFAULT_BUDGETS",
     "LOCAL_BUDGETS",
+    "budgets_for_context",
     "format_strain_notice",
     # Window
     "RollingWindow",
@@ -50,10 +54,13 @@ __all__ = [
     "WindowConfig",
     # Digest
     "DigestManager",
+    "DigestTracker",
     "CampaignDigest",
     "HingeEntry",
     "ThreadEntry",
     "DigestSection",
+    # Recap
+    "SceneRecapSummarizer",
     # Ambient context
     "extract_ambient_context",
 ]
@@ -9,16 +9,29 @@ The digest is NOT the transcript. It stores:
 
 This provides persistent memory that survives context window trimming
 and session boundaries.
+
+DigestManager.generate() rebuilds the digest from the whole campaign.
+DigestTracker keeps one up to date from EventBus events instead, so the
+per-turn cost of the DIGEST pack section is a cached string.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+import hashlib
 import json
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from ..state.schema import Campaign, HingeMoment, DormantThread
+    from ..state.schema import (
+        AvoidedSituation,
+        Campaign,
+        DormantThread,
+        HingeMoment,
+        NPC,
+    )
+    from ..state.manager import CampaignManager
+    from ..state.event_bus import EventBus, GameEvent
     from .window import TranscriptBlock
 
 
@@ -30,6 +43,7 @@ class HingeEntry:
     choice: str
     consequence: str  # What shifted
     timestamp: datetime = field(default_factory=datetime.now)
+    hinge_id: str | None = None  # Source HingeMoment, for de-duplication
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -39,6 +53,7 @@ class HingeEntry:
             "choice": self.choice,
             "consequence": self.consequence,
             "timestamp": self.timestamp.isoformat(),
+            "hinge_id": self.hinge_id,
         }
 
     @classmethod
@@ -50,6 +65,7 @@ class HingeEntry:
             choice=data["choice"],
             consequence=data["consequence"],
             timestamp=datetime.fromisoformat(data["timestamp"]),
+            hinge_id=data.get("hinge_id"),
         )
 
 
@@ -61,6 +77,8 @@ class ThreadEntry:
     consequence: str
     severity: str
     created_session: int
+    source_id: str | None = None  # DormantThread or AvoidedSituation id
+    avoided: bool = False         # True for avoided situations
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -70,6 +88,8 @@ class ThreadEntry:
             "consequence": self.consequence,
             "severity": self.severity,
             "created_session": self.created_session,
+            "source_id": self.source_id,
+            "avoided": self.avoided,
         }
 
     @classmethod
@@ -81,6 +101,8 @@ class ThreadEntry:
             consequence=data["consequence"],
             severity=data["severity"],
             created_session=data["created_session"],
+            source_id=data.get("source_id"),
+            avoided=data.get("avoided", False),
         )
 
 
@@ -106,6 +128,24 @@ class CampaignDigest:
     total_hinges: int = 0
     total_faction_shifts: int = 0
 
+    # Versioning: campaign.state_version and source fingerprint the digest
+    # reflects, and a counter bumped on every incremental update (see
+    # DigestTracker). state_version only moves on committed turns, so the
+    # fingerprint catches manager-level edits made while nothing tracked them.
+    state_version: int = 0
+    source_fingerprint: str = ""
+    revision: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        """True if there is nothing worth injecting into a prompt."""
+        return not (
+            self.hinge_index
+            or any(self.standing_reasons.values())
+            or any(self.npc_anchors.values())
+            or self.open_threads
+        )
+
     def to_prompt_text(self) -> str:
         """Format digest for prompt injection."""
         sections = []
@@ -166,6 +206,9 @@ class CampaignDigest:
             "session_count": self.session_count,
             "total_hinges": self.total_hinges,
             "total_faction_shifts": self.total_faction_shifts,
+            "state_version": self.state_version,
+            "source_fingerprint": self.source_fingerprint,
+            "revision": self.revision,
         }
 
     @classmethod
@@ -180,9 +223,89 @@ class CampaignDigest:
             session_count=data.get("session_count", 0),
             total_hinges=data.get("total_hinges", 0),
             total_faction_shifts=data.get("total_faction_shifts", 0),
+            state_version=data.get("state_version", 0),
+            source_fingerprint=data.get("source_fingerprint", ""),
+            revision=data.get("revision", 0),
         )
 
 
+# -----------------------------------------------------------------------------
+# Entry builders (shared by full generation and incremental tracking)
+# -----------------------------------------------------------------------------
+
+def digest_fingerprint(campaign: "Campaign") -> str:
+    """
+    Cheap hash of the campaign state the digest is built from.
+
+    Covers history length, hinges, threads, avoided situations and NPC
+    memory/interaction counts - everything generate() reads.
+    """
+    parts = [
+        str(len(campaign.history)),
+        ",".join(str(len(c.hinge_history)) for c in campaign.characters),
+        ",".join(t.id for t in campaign.dormant_threads),
+        ",".join(f"{a.id}:{int(a.surfaced)}" for a in campaign.avoided_situations),
+        ",".join(
+            f"{n.id}:{len(n.remembers)}:{len(n.interactions)}"
+            for n in campaign.npcs.active + campaign.npcs.dormant
+        ),
+    ]
+    return hashlib.blake2b("|".join(parts).encode(), digest_size=8).hexdigest()
+
+
+def _severity_str(severity) -> str:
+    return severity.value if hasattr(severity, "value") else str(severity)
+
+
+def _hinge_entry(hinge: "HingeMoment") -> HingeEntry:
+    return HingeEntry(
+        session=hinge.session,
+        situation=hinge.situation,
+        choice=hinge.choice,
+        consequence=hinge.what_shifted or "",
+        timestamp=hinge.timestamp,
+        hinge_id=hinge.id,
+    )
+
+
+def _standing_reason(before: str, after: str, cause: str) -> str:
+    return f"{before} -> {after}: {cause}"
+
+
+def _npc_anchors(npc: "NPC") -> list[str]:
+    """Durable memories plus significant recent interactions for one NPC."""
+    anchors = list(npc.remembers)
+    for inter in npc.interactions[-3:]:  # Last 3 interactions
+        if abs(inter.standing_change) >= 5:  # Significant change
+            anchors.append(
+                f"S{inter.session}: {inter.action[:40]} ({inter.standing_change:+d})"
+            )
+    return anchors
+
+
+def _thread_entry(thread: "DormantThread") -> ThreadEntry:
+    return ThreadEntry(
+        origin=thread.origin,
+        trigger_condition=thread.trigger_condition,
+        consequence=thread.consequence,
+        severity=_severity_str(thread.severity),
+        created_session=thread.created_session,
+        source_id=thread.id,
+    )
+
+
+def _avoided_entry(avoided: "AvoidedSituation") -> ThreadEntry:
+    return ThreadEntry(
+        origin=f"[AVOIDED] {avoided.situation}",
+        trigger_condition=avoided.what_was_at_stake,
+        consequence=avoided.potential_consequence,
+        severity=_severity_str(avoided.severity),
+        created_session=avoided.created_session,
+        source_id=avoided.id,
+        avoided=True,
+    )
+
+
 class DigestManager:
     """Manages digest generation and storage."""
 
@@ -217,83 +340,50 @@ class DigestManager:
         """
         digest = CampaignDigest()
         digest.session_count = campaign.meta.session_count
+        digest.state_version = campaign.state_version
+        digest.source_fingerprint = digest_fingerprint(campaign)
         digest.last_updated = datetime.now()
 
-        # Extract hinges from character history
-        for char in campaign.characters:
-            for hinge in char.hinge_history:
-                entry = HingeEntry(
-                    session=hinge.session,
-                    situation=hinge.situation,
-                    choice=hinge.choice,
-                    consequence=hinge.what_shifted or "",
-                    timestamp=hinge.timestamp,
-                )
-                digest.hinge_index.append(entry)
-                digest.total_hinges += 1
+        # Extract hinges from character history, then from logged hinge
+        # moments (log_hinge_moment records them on campaign.history)
+        from ..state.schema import HistoryType
+        seen_hinges: set[str] = set()
+        hinges = [h for char in campaign.characters for h in char.hinge_history]
+        hinges += [
+            entry.hinge for entry in campaign.history
+            if entry.type == HistoryType.HINGE and entry.hinge
+        ]
+        for hinge in hinges:
+            if hinge.id in seen_hinges:
+                continue
+            seen_hinges.add(hinge.id)
+            digest.hinge_index.append(_hinge_entry(hinge))
+            digest.total_hinges += 1
 
         # Extract standing reasons from faction history
-        from ..state.schema import HistoryType
         for entry in campaign.history:
             if entry.type == HistoryType.FACTION_SHIFT and entry.faction_shift:
-                faction_name = entry.faction_shift.faction.value
-                # Build reason from cause and result
-                reason = (
-                    f"{entry.faction_shift.from_standing.value} -> "
-                    f"{entry.faction_shift.to_standing.value}: {entry.faction_shift.cause}"
-                )
+                shift = entry.faction_shift
                 # Keep most recent reason for each faction
-                digest.standing_reasons[faction_name] = reason
+                digest.standing_reasons[shift.faction.value] = _standing_reason(
+                    shift.from_standing.value, shift.to_standing.value, shift.cause,
+                )
                 digest.total_faction_shifts += 1
 
         # Extract NPC memory anchors
         for npc in campaign.npcs.active + campaign.npcs.dormant:
-            if npc.remembers:
-                digest.npc_anchors[npc.name] = list(npc.remembers)
-            # Also capture significant interactions
-            if npc.interactions:
-                interaction_summaries = []
-                for inter in npc.interactions[-3:]:  # Last 3 interactions
-                    if abs(inter.standing_change) >= 5:  # Significant change
-                        interaction_summaries.append(
-                            f"S{inter.session}: {inter.action[:40]} ({inter.standing_change:+d})"
-                        )
-                if interaction_summaries:
-                    existing = digest.npc_anchors.get(npc.name, [])
-                    digest.npc_anchors[npc.name] = existing + interaction_summaries
+            anchors = _npc_anchors(npc)
+            if anchors:
+                digest.npc_anchors[npc.name] = anchors
 
         # Extract open threads
         for thread in campaign.dormant_threads:
-            severity_str = (
-                thread.severity.value
-                if hasattr(thread.severity, "value")
-                else str(thread.severity)
-            )
-            entry = ThreadEntry(
-                origin=thread.origin,
-                trigger_condition=thread.trigger_condition,
-                consequence=thread.consequence,
-                severity=severity_str,
-                created_session=thread.created_session,
-            )
-            digest.open_threads.append(entry)
+            digest.open_threads.append(_thread_entry(thread))
 
         # Also include avoided situations as potential threads
         for avoided in campaign.avoided_situations:
             if not avoided.surfaced:
-                severity_str = (
-                    avoided.severity.value
-                    if hasattr(avoided.severity, "value")
-                    else str(avoided.severity)
-                )
-                entry = ThreadEntry(
-                    origin=f"[AVOIDED] {avoided.situation}",
-                    trigger_condition=avoided.what_was_at_stake,
-                    consequence=avoided.potential_consequence,
-                    severity=severity_str,
-                    created_session=avoided.created_session,
-                )
-                digest.open_threads.append(entry)
+                digest.open_threads.append(_avoided_entry(avoided))
 
         return digest
 
@@ -434,3 +524,285 @@ class DigestManager:
         kept.sort(key=lambda b: b.timestamp)
 
         return kept, archived
+
+
+class DigestTracker:
+    """
+    Keeps a CampaignDigest current by listening to the EventBus.
+
+    The full walk in DigestManager.generate() runs once per campaign, or
+    when the persisted digest was written at a different state_version.
+    After that each hinge, faction shift, NPC memory and thread event is
+    applied as a delta, and the prompt text is cached until the next one.
+
+    Usage:
+        tracker = DigestTracker(manager)
+        tracker.attach()
+        digest_text = tracker.prompt_text()   # "" until there is content
+    """
+
+    def __init__(
+        self,
+        manager: "CampaignManager",
+        digest_manager: DigestManager | None = None,
+        bus: "EventBus | None" = None,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            manager: Campaign manager whose current campaign is tracked
+            digest_manager: Storage for persisted digests
+            bus: Event bus to subscribe to (defaults to the global bus)
+        """
+        self.manager = manager
+        self.digest_manager = digest_manager or DigestManager()
+        self._bus = bus
+        self._campaign_id: str | None = None
+        self._digest: CampaignDigest | None = None
+        self._prompt_cache: str | None = None
+
+    def _handlers(self) -> dict:
+        from ..state.event_bus import EventType
+        return {
+            EventType.CAMPAIGN_LOADED: self._on_campaign_loaded,
+            EventType.HINGE_MOMENT: self._on_hinge,
+            EventType.FACTION_CHANGED: self._on_faction_changed,
+            EventType.NPC_ADDED: self._on_npc_changed,
+            EventType.NPC_MEMORY_ADDED: self._on_npc_changed,
+            EventType.NPC_INTERACTION: self._on_npc_changed,
+            EventType.THREAD_QUEUED: self._on_thread_queued,
+            EventType.THREAD_SURFACED: self._on_thread_surfaced,
+            EventType.AVOIDANCE_LOGGED: self._on_avoidance_logged,
+            EventType.AVOIDANCE_SURFACED: self._on_avoidance_surfaced,
+            EventType.TURN_RESOLVED: self._on_turn_resolved,
+        }
+
+    def attach(self) -> None:
+        """Subscribe to digest-relevant events."""
+        if self._bus is None:
+            from ..state.event_bus import get_event_bus
+            self._bus = get_event_bus()
+        for event_type, handler in self._handlers().items():
+            self._bus.on(event_type, handler)
+
+    def detach(self) -> None:
+        """Unsubscribe from the event bus."""
+        if self._bus is None:
+            return
+        for event_type, handler in self._handlers().items():
+            self._bus.off(event_type, handler)
+
+    # -------------------------------------------------------------------------
+    # Access
+    # -------------------------------------------------------------------------
+
+    @property
+    def digest(self) -> CampaignDigest | None:
+        """The digest for the current campaign (loaded or built on demand)."""
+        campaign = self.manager.current
+        if campaign is None:
+            return None
+        if self._digest is None or self._campaign_id != campaign.meta.id:
+            self._load_or_rebuild(campaign)
+        return self._digest
+
+    def prompt_text(self) -> str:
+        """
+        Digest text for the DIGEST pack section.
+
+        Cached until the next change. Returns "" while the digest is empty
+        so the packer skips the section instead of injecting a placeholder.
+        """
+        digest = self.digest
+        if digest is None:
+            return ""
+        if self._prompt_cache is None:
+            self._prompt_cache = "" if digest.is_empty else digest.to_prompt_text()
+        return self._prompt_cache
+
+    def rebuild(self, persist: bool = True) -> CampaignDigest | None:
+        """
+        Regenerate the digest from the full campaign.
+
+        Args:
+            persist: Save to disk (persisted campaigns only). Pass False when
+                the caller saves through digest_manager itself.
+        """
+        campaign = self.manager.current
+        if campaign is None:
+            return None
+        self._campaign_id = campaign.meta.id
+        self._digest = self.digest_manager.generate(campaign)
+        self._prompt_cache = None
+        if persist:
+            self._persist(campaign)
+        return self._digest
+
+    def _load_or_rebuild(self, campaign: "Campaign") -> None:
+        existing = self.digest_manager.load(campaign.meta.id) if campaign.persisted_ else None
+        if (
+            existing is not None
+            and existing.state_version == campaign.state_version
+            and existing.source_fingerprint == digest_fingerprint(campaign)
+        ):
+            self._campaign_id = campaign.meta.id
+            self._digest = existing
+            self._prompt_cache = None
+        else:
+            self.rebuild()
+
+    def _persist(self, campaign: "Campaign") -> None:
+        # Mirrors save_campaign(): ephemeral campaigns never touch disk
+        if campaign.persisted_ and self._digest is not None:
+            self.digest_manager.save(campaign.meta.id, self._digest)
+
+    # -------------------------------------------------------------------------
+    # Event handlers
+    # -------------------------------------------------------------------------
+
+    def _tracked(self, event: "GameEvent") -> CampaignDigest | None:
+        """Digest to update for this event, or None if it isn't ours."""
+        campaign = self.manager.current
+        if campaign is None or (event.campaign_id and event.campaign_id != campaign.meta.id):
+            return None
+        if self._digest is None or self._campaign_id != campaign.meta.id:
+            # First sight of this campaign: the full build already includes
+            # whatever change raised the event
+            self._load_or_rebuild(campaign)
+            return None
+        return self._digest
+
+    def _changed(self) -> None:
+        campaign = self.manager.current
+        digest = self._digest
+        digest.revision += 1
+        digest.state_version = campaign.state_version
+        digest.source_fingerprint = digest_fingerprint(campaign)
+        digest.session_count = campaign.meta.session_count
+        digest.last_updated = datetime.now()
+        self._prompt_cache = None
+        self._persist(campaign)
+
+    def _on_campaign_loaded(self, event: "GameEvent") -> None:
+        campaign = self.manager.current
+        if campaign is not None and campaign.meta.id == event.campaign_id:
+            self._load_or_rebuild(campaign)
+
+    def _on_hinge(self, event: "GameEvent") -> None:
+        digest = self._tracked(event)
+        if digest is None:
+            return
+        hinge_id = event.data.get("hinge_id")
+        if hinge_id and any(h.hinge_id == hinge_id for h in digest.hinge_index):
+            return
+        digest.hinge_index.append(HingeEntry(
+            session=event.data.get("session", event.session),
+            situation=event.data.get("situation", ""),
+            choice=event.data.get("choice", ""),
+            consequence=event.data.get("what_shifted", ""),
+            timestamp=event.timestamp,
+            hinge_id=hinge_id,
+        ))
+        digest.total_hinges += 1
+        self._changed()
+
+    def _on_faction_changed(self, event: "GameEvent") -> None:
+        digest = self._tracked(event)
+        if digest is None:
+            return
+        data = event.data
+        digest.standing_reasons[data["faction"]] = _standing_reason(
+            data["before"], data["after"], data.get("reason", ""),
+        )
+        digest.total_faction_shifts += 1
+        # Cascades that actually moved a standing are logged as shifts too
+        for cascade in data.get("cascades") or []:
+            if cascade["before"] != cascade["after"]:
+                digest.standing_reasons[cascade["faction"]] = _standing_reason(
+                    cascade["before"], cascade["after"], cascade.get("reason", ""),
+                )
+                digest.total_faction_shifts += 1
+        self._changed()
+
+    def _on_npc_changed(self, event: "GameEvent") -> None:
+        digest = self._tracked(event)
+        if digest is None:
+            return
+        npc = self.manager.get_npc(event.data.get("npc_id", ""))
+        if npc is None:
+            return
+        anchors = _npc_anchors(npc)
+        if anchors == digest.npc_anchors.get(npc.name, []):
+            return
+        if anchors:
+            digest.npc_anchors[npc.name] = anchors
+        else:
+            digest.npc_anchors.pop(npc.name, None)
+        self._changed()
+
+    def _on_thread_queued(self, event: "GameEvent") -> None:
+        digest = self._tracked(event)
+        if digest is None:
+            return
+        thread_id = event.data.get("thread_id")
+        thread = next(
+            (t for t in reversed(self.manager.current.dormant_threads) if t.id == thread_id),
+            None,
+        )
+        if thread is None:
+            return
+        # Dormant threads sit ahead of avoided situations, as in generate()
+        index = next(
+            (i for i, t in enumerate(digest.open_threads) if t.avoided),
+            len(digest.open_threads),
+        )
+        digest.open_threads.insert(index, _thread_entry(thread))
+        self._changed()
+
+    def _remove_thread(self, event: "GameEvent", source_id: str | None) -> None:
+        digest = self._tracked(event)
+        if digest is None or not source_id:
+            return
+        remaining = [t for t in digest.open_threads if t.source_id != source_id]
+        if len(remaining) != len(digest.open_threads):
+            digest.open_threads = remaining
+            self._changed()
+
+    def _on_thread_surfaced(self, event: "GameEvent") -> None:
+        self._remove_thread(event, event.data.get("thread_id"))
+
+    def _on_avoidance_logged(self, event: "GameEvent") -> None:
+        digest = self._tracked(event)
+        if digest is None:
+            return
+        avoidance_id = event.data.get("avoidance_id")
+        avoided = next(
+            (a for a in self.manager.current.avoided_situations if a.id == avoidance_id),
+            None,
+        )
+        if avoided is None or avoided.surfaced:
+            return
+        digest.open_threads.append(_avoided_entry(avoided))
+        self._changed()
+
+    def _on_avoidance_surfaced(self, event: "GameEvent") -> None:
+        self._remove_thread(event, event.data.get("avoidance_id"))
+
+    def _on_turn_resolved(self, event: "GameEvent") -> None:
+        # TurnOrchestrator.commit drops surfaced threads from the campaign
+        # directly (the cascade's THREAD_SURFACED is emitted before that
+        # happens); reconcile against the live list, but only touch the
+        # cache and disk if something actually went away.
+        digest = self._tracked(event)
+        if digest is None:
+            return
+        campaign = self.manager.current
+        live = {t.id for t in campaign.dormant_threads}
+        remaining = [
+            t for t in digest.open_threads if t.avoided or t.source_id in live
+        ]
+        if len(remaining) == len(digest.open_threads):
+            return
+        digest.open_threads = remaining
+        self._changed()
@@ -15,13 +15,17 @@ Sections (ordered):
 8. User Input (current turn)
 """
 
+import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .tokenizer import count_tokens, truncate_to_budget, get_default_counter
 from .window import RollingWindow, TranscriptBlock, WindowConfig
 
+if TYPE_CHECKING:
+    from .recap import SceneRecapSummarizer
+
 
 class PackSection(str, Enum):
     """Sections of the prompt pack, in order."""
@@ -74,6 +78,52 @@ LOCAL_BUDGETS: dict[PackSection, SectionBudget] = {
 }
 
 
+def budgets_for_context(
+    context_length: int,
+    response_tokens: int = 2048,
+    reserve_tokens: int = 1000,
+    local: bool = False,
+    max_total: int = 32000,
+) -> tuple[dict[PackSection, SectionBudget], int]:
+    """
+    Derive pack budgets from a model's context window.
+
+    The pack gets what's left after the response and a reserve for tool
+    schemas and framing (16k -> ~13k, 8k -> ~5k, matching the hand-tuned
+    tables). Fixed sections (can_truncate=False) keep their template size;
+    truncatable ones are scaled to fill the rest, so sections a template
+    skips (budget 0) stay skipped.
+
+    Args:
+        context_length: Model context window in tokens
+        response_tokens: Tokens reserved for the reply (request max_tokens)
+        reserve_tokens: Tokens reserved for tool schemas and message framing
+        local: Scale LOCAL_BUDGETS (condensed prompts) instead of DEFAULT_BUDGETS
+        max_total: Upper bound on the pack, to keep prompt processing sane
+
+    Returns:
+        Tuple of (budgets, total_budget)
+    """
+    template = LOCAL_BUDGETS if local else DEFAULT_BUDGETS
+    fixed = sum(b.tokens for b in template.values() if not b.can_truncate)
+    flexible = sum(b.tokens for b in template.values() if b.can_truncate)
+
+    # Never go below the fixed sections plus a minimal window
+    total = context_length - response_tokens - reserve_tokens
+    total = max(fixed + 1000, min(total, max_total))
+    scale = (total - fixed) / flexible if flexible else 0.0
+
+    budgets = {
+        section: budget if not budget.can_truncate else SectionBudget(
+            tokens=int(budget.tokens * scale),
+            required=budget.required,
+            can_truncate=True,
+        )
+        for section, budget in template.items()
+    }
+    return budgets, total
+
+
 class StrainTier(Enum):
     """Memory strain tiers based on context pressure."""
     NORMAL = "normal"       # < 0.70 - Full context available
@@ -115,6 +165,8 @@ class PackInfo:
     warnings: list[str] = field(default_factory=list)
     trimmed_blocks: int = 0
     scene_recap: str | None = None
+    # Packer wall time per stage (count, sections, window, assemble), in ms
+    stage_ms: dict[str, float] = field(default_factory=dict)
 
     @property
     def is_over_budget(self) -> bool:
@@ -141,10 +193,19 @@ class PromptPacker:
         self,
         budgets: dict[PackSection, SectionBudget] | None = None,
         total_budget: int = 13000,
+        summarizer: "SceneRecapSummarizer | None" = None,
     ):
         self.budgets = budgets or DEFAULT_BUDGETS.copy()
         self.total_budget = total_budget
-        self._counter = get_default_counter()
+        self.summarizer = summarizer
+        self._token_counter = None  # Lazy load
+
+    @property
+    def _counter(self):
+        """Lazy-load token counter (first use loads the encoder)."""
+        if self._token_counter is None:
+            self._token_counter = get_default_counter()
+        return self._token_counter
 
     def pack(
         self,
@@ -185,30 +246,52 @@ class PromptPacker:
 
         sections: list[SectionContent] = []
         warnings: list[str] = []
+        stage_ms: dict[str, float] = {}
+        stage_start = time.perf_counter()
+
+        def end_stage(name: str) -> None:
+            nonlocal stage_start
+            now = time.perf_counter()
+            stage_ms[name] = (now - stage_start) * 1000
+            stage_start = now
+
+        # Count every section once, in one batch; the counts are reused for
+        # pressure, budget checks and warnings below
+        raw_contents = {
+            PackSection.SYSTEM: system,
+            PackSection.RULES_CORE: rules_core,
+            PackSection.RULES_NARRATIVE: rules_narrative,
+            PackSection.STATE: state,
+            PackSection.AMBIENT: ambient,
+            PackSection.DIGEST: digest,
+            PackSection.RETRIEVAL: retrieval,
+            PackSection.INPUT: user_input,
+        }
+        to_count = [section for section, content in raw_contents.items() if content]
+        counts = dict.fromkeys(raw_contents, 0)
+        counts.update(zip(
+            to_count,
+            self._counter.count_batch([raw_contents[s] for s in to_count]),
+        ))
 
         # Calculate preliminary pressure to determine strain tier early
         # Include window estimate for accurate strain calculation
-        preliminary_total = sum(
-            self._counter.count(content)
-            for content in [
-                system,
-                rules_core,
-                rules_narrative,
-                state,
-                ambient,
-                digest,
-                retrieval,
-                user_input,
-            ]
-            if content
-        )
-        # Estimate window contribution (use budget as upper bound)
+        preliminary_total = sum(counts.values())
+        # Estimate window contribution (use budget as upper bound); blocks
+        # carry their token count from add_block()
         if window:
+            blocks = window.blocks
+            uncounted = [b for b in blocks if b.token_count is None]
+            if uncounted:
+                tokens = self._counter.count_batch([b.content for b in uncounted])
+                for block, count in zip(uncounted, tokens):
+                    block.token_count = count
             window_estimate = min(
-                sum(self._counter.count(b.content) for b in window.blocks),
+                sum(b.token_count for b in blocks),
                 self.budgets[PackSection.WINDOW].tokens
             )
             preliminary_total += window_estimate
+        end_stage("count")
         preliminary_pressure = preliminary_total / self.total_budget
         strain_tier = StrainTier.from_pressure(preliminary_pressure)
 
@@ -217,7 +300,7 @@ class PromptPacker:
         if not include_narrative and rules_narrative:
             warnings.append(
                 f"Narrative guidance skipped due to {strain_tier.value} "
-                f"({self._counter.count(rules_narrative)} tokens saved)"
+                f"({counts[PackSection.RULES_NARRATIVE]} tokens saved)"
             )
 
         # Process each section in order
@@ -237,7 +320,7 @@ class PromptPacker:
                 continue
 
             budget = self.budgets[section]
-            token_count = self._counter.count(content)
+            token_count = counts[section] if content else 0
             truncated = False
             original_tokens = None
 
@@ -245,7 +328,9 @@ class PromptPacker:
                 if budget.can_truncate:
                     original_tokens = token_count
                     content = self._counter.truncate_to_budget(content, budget.tokens)
-                    token_count = self._counter.count(content)
+                    # Truncation guarantees the budget; use it as the
+                    # (conservative) count rather than encoding again
+                    token_count = budget.tokens
                     truncated = True
                     warnings.append(
                         f"{section.value} truncated: {original_tokens} → {token_count} tokens"
@@ -263,6 +348,8 @@ class PromptPacker:
                 original_tokens=original_tokens,
             ))
 
+        end_stage("sections")
+
         # Process window separately (it has special handling)
         window_content = ""
         trimmed_blocks = 0
@@ -291,9 +378,21 @@ class PromptPacker:
             window_content = self._format_window_blocks(window_blocks)
             window_tokens = self._counter.count(window_content)
 
+            # Prepare an LLM recap of trimmed blocks in the background;
+            # use it at strain II+ once ready, else fall back to counts
+            recap_text = None
+            if (
+                trimmed_blocks > 0
+                and self.summarizer
+                and self.summarizer.should_prepare(preliminary_pressure)
+            ):
+                recap_text = self.summarizer.request(
+                    window.get_trimmed_blocks(window_budget)
+                )
+
             # Get scene recap if we trimmed blocks and are at strain II+
             if trimmed_blocks > 0 and preliminary_pressure >= 0.85:
-                scene_recap = window.get_trimmed_summary()
+                scene_recap = recap_text or window.get_trimmed_summary(window_budget)
 
             sections.append(SectionContent(
                 section=PackSection.WINDOW,
@@ -302,6 +401,8 @@ class PromptPacker:
                 truncated=trimmed_blocks > 0,
             ))
 
+        end_stage("window")
+
         # Calculate totals
         total_tokens = sum(s.token_count for s in sections)
         pressure = total_tokens / self.total_budget
@@ -321,6 +422,8 @@ class PromptPacker:
 
         # Assemble final prompt
         packed_prompt = self._assemble_prompt(sections, scene_recap)
+        end_stage("assemble")
+        pack_info.stage_ms = stage_ms
 
         return packed_prompt, pack_info
 
@@ -365,7 +468,7 @@ class PromptPacker:
             # Find window section and insert recap before it
             for i, part in enumerate(parts):
                 if "## Recent Conversation" in part or "## Conversation History" in part:
-                    parts.insert(i, f"[{scene_recap}]")
+                    parts.insert(i, scene_recap)
                     break
 
         assembled = "\n\n---\n\n".join(parts)
@@ -451,11 +554,8 @@ class PromptPacker:
 
     def get_pressure(self, **kwargs: Any) -> float:
         """Calculate pressure without full packing."""
-        total = 0
-        for section, content in kwargs.items():
-            if content:
-                total += self._counter.count(str(content))
-        return total / self.total_budget
+        texts = [str(content) for content in kwargs.values() if content]
+        return sum(self._counter.count_batch(texts)) / self.total_budget
 
 
 def format_strain_notice(tier: StrainTier) -> str | None:
@@ -0,0 +1,257 @@
+"""
+Background scene-recap summarizer for memory strain.
+
+Under Strain II+ the packer trims transcript blocks and inserts a scene
+recap in their place. RollingWindow.get_trimmed_summary() can only count
+what was dropped; this module condenses the trimmed blocks into real recap
+text with the configured LLM, on a worker thread, so the turn that
+triggers it never waits.
+
+The recap is rolling: each job folds newly trimmed blocks into the
+previous recap, with a bounded input, so a long session never produces an
+unbounded summarization prompt. Only one job runs at a time, and jobs wait
+while the agent holds the backend for a turn (see hold()).
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from .tokenizer import get_default_counter
+
+if TYPE_CHECKING:
+    from ..llm.base import LLMClient
+    from .window import TranscriptBlock
+
+
+RECAP_SYSTEM_PROMPT = (
+    "You condense tabletop RPG transcripts into a scene recap for the GM. "
+    "Write one short paragraph in past tense. Keep names, factions, promises, "
+    "threats and choices the player made. No commentary, no options, no lists."
+)
+
+ROLE_LABELS = {"user": "PLAYER", "assistant": "GM", "system": "SYSTEM"}
+
+
+def format_recap(text: str) -> str:
+    """Wrap recap text the way RollingWindow.get_trimmed_summary() does."""
+    return f"[Scene recap: {text}]"
+
+
+class SceneRecapSummarizer:
+    """
+    Maintains a rolling LLM recap of trimmed transcript blocks.
+
+    Usage:
+        summarizer = SceneRecapSummarizer(lambda: agent.client)
+        packer = PromptPacker(summarizer=summarizer)
+
+        with summarizer.hold():   # main turn owns the backend
+            client.chat_with_tools(...)
+    """
+
+    def __init__(
+        self,
+        client_provider: Callable[[], "LLMClient | None"],
+        pressure_threshold: float = 0.70,
+        max_words: int = 120,
+        max_input_tokens: int = 1500,
+    ):
+        """
+        Initialize the summarizer.
+
+        Args:
+            client_provider: Returns the LLM client to summarize with (looked
+                up per job so backend switches are picked up)
+            pressure_threshold: Window pressure at which recaps are prepared.
+                Defaults to Strain I so a recap is usually ready by the time
+                Strain II needs it.
+            max_words: Target recap length
+            max_input_tokens: Cap on new transcript sent per job; blocks past
+                the cap are folded in by later jobs
+        """
+        self._client_provider = client_provider
+        self.pressure_threshold = pressure_threshold
+        self.max_words = max_words
+        self.max_input_tokens = max_input_tokens
+        self._token_counter = None  # Lazy load
+
+        self._cond = threading.Condition()
+        self._recap: str | None = None
+        self._covered: set[str] = set()
+        self._failed: set[str] = set()
+        self._worker: threading.Thread | None = None
+        self._holds = 0
+        self._generation = 0
+        self._closed = False
+
+    @property
+    def _counter(self):
+        """Lazy-load token counter."""
+        if self._token_counter is None:
+            self._token_counter = get_default_counter()
+        return self._token_counter
+
+    def should_prepare(self, pressure: float) -> bool:
+        """Whether window pressure is high enough to prepare a recap."""
+        return pressure >= self.pressure_threshold
+
+    def request(self, blocks: list["TranscriptBlock"]) -> str | None:
+        """
+        Get recap text for trimmed blocks without blocking.
+
+        Returns the current rolling recap (which may not yet cover the newest
+        trimmed blocks), or None if there is none. If blocks are uncovered and
+        no job is running, one is started to fold them in.
+        """
+        if not blocks:
+            return None
+        ids = {b.id for b in blocks}
+
+        with self._cond:
+            if self._closed:
+                return self._recap
+            if self._covered and not (self._covered & ids):
+                # Nothing in common: a different conversation (new campaign,
+                # cleared window). Start over.
+                self._reset_locked()
+
+            pending = [
+                b for b in blocks
+                if b.id not in self._covered and b.id not in self._failed
+            ]
+            if pending and self._worker is None:
+                batch = self._bounded(pending)
+                self._worker = threading.Thread(
+                    target=self._run,
+                    args=(self._generation, self._recap, batch),
+                    name="scene-recap",
+                    daemon=True,  # Never hold interpreter exit on a slow backend
+                )
+                self._worker.start()
+            return self._recap
+
+    @property
+    def recap(self) -> str | None:
+        """The current rolling recap, if any."""
+        with self._cond:
+            return self._recap
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        """Keep recap jobs off the backend while the main turn uses it."""
+        with self._cond:
+            self._holds += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._holds -= 1
+                self._cond.notify_all()
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Block until the running recap job finishes (for tests)."""
+        with self._cond:
+            worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+
+    def reset(self) -> None:
+        """Forget the current recap (e.g. when the conversation is cleared)."""
+        with self._cond:
+            self._reset_locked()
+
+    def shutdown(self) -> None:
+        """Stop accepting work; a running job's result is discarded."""
+        with self._cond:
+            self._closed = True
+            self._generation += 1
+            self._cond.notify_all()
+
+    # -------------------------------------------------------------------------
+    # Worker
+    # -------------------------------------------------------------------------
+
+    def _reset_locked(self) -> None:
+        self._recap = None
+        self._covered = set()
+        self._failed = set()
+        self._generation += 1  # Results of a running job are discarded
+
+    def _bounded(self, blocks: list["TranscriptBlock"]) -> list["TranscriptBlock"]:
+        """Oldest uncovered blocks that fit the input cap (at least one)."""
+        batch = []
+        total = 0
+        for block in blocks:
+            tokens = block.token_count or self._counter.count(block.content)
+            if batch and total + tokens > self.max_input_tokens:
+                break
+            batch.append(block)
+            total += tokens
+        return batch
+
+    def _run(
+        self,
+        generation: int,
+        previous: str | None,
+        batch: list["TranscriptBlock"],
+    ) -> None:
+        with self._cond:
+            # Wait for the main turn to release the backend
+            while self._holds and generation == self._generation:
+                self._cond.wait()
+            stale = generation != self._generation
+
+        text = ""
+        if not stale:
+            try:
+                text = self._summarize(previous, batch)
+            except Exception:
+                text = ""
+
+        with self._cond:
+            if generation == self._generation:
+                ids = {b.id for b in batch}
+                if text:
+                    self._recap = format_recap(text)
+                    self._covered |= ids
+                else:
+                    # Don't retry the same blocks every turn
+                    self._failed |= ids
+            self._worker = None
+
+    def _summarize(
+        self,
+        previous: str | None,
+        batch: list["TranscriptBlock"],
+    ) -> str:
+        from ..llm.base import Message
+
+        client = self._client_provider()
+        if client is None:
+            return ""
+
+        transcript = "\n\n".join(
+            f"[{ROLE_LABELS.get(b.role, 'UNKNOWN')}]: "
+            + self._counter.truncate_to_budget(b.content, self.max_input_tokens)
+            for b in batch
+        )
+        if previous:
+            prompt = (
+                f"Recap so far:\n{previous}\n\n"
+                f"Fold in what happened next, in at most {self.max_words} "
+                f"words total:\n\n{transcript}"
+            )
+        else:
+            prompt = (
+                f"Summarize this earlier part of the scene in at most "
+                f"{self.max_words} words:\n\n{transcript}"
+            )
+
+        response = client.chat(
+            [Message(role="user", content=prompt)],
+            system=RECAP_SYSTEM_PROMPT,
+            temperature=0.2,
+            max_tokens=self.max_words * 2,
+        )
+        return " ".join(response.content.split())
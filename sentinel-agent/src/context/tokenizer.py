@@ -3,28 +3,65 @@ Token counting with tiktoken + fallback.
 
 Uses cl100k_base encoding (Claude/GPT-4 compatible) when tiktoken is available,
 falls back to conservative character-based estimation when not.
+
+The encoder is loaded lazily on first use (importing tiktoken and loading
+cl100k_base costs hundreds of milliseconds, or a network timeout when the
+encoding isn't cached). Entry points can call preload_tokenizer() to do that
+work on a background thread while the UI starts.
 """
 
+import threading
 from typing import Protocol, runtime_checkable
 
-# Try to import tiktoken, fall back gracefully
+# Loaded on first use by _get_encoder()
 _tiktoken_encoder = None
 _HAS_TIKTOKEN = False
-
-try:
-    import tiktoken
-    _tiktoken_encoder = tiktoken.get_encoding("cl100k_base")
-    _HAS_TIKTOKEN = True
-except (ImportError, Exception):
-    # Catch ImportError (tiktoken not installed) and any network/proxy errors
-    # during encoding download
-    pass
+_encoder_loaded = False
+_encoder_lock = threading.Lock()
 
 
 # Conservative estimate: ~4 chars per token for English prose
 # This is intentionally conservative to avoid overflow
 CHARS_PER_TOKEN_FALLBACK = 4
 
+# Upper bound on chars/token used to size the prefix that truncation encodes.
+# English prose averages ~4; code and long words run higher.
+CHARS_PER_TOKEN_CEILING = 6
+
+
+def _get_encoder():
+    """Load the cl100k_base encoder once; None if tiktoken is unusable."""
+    global _tiktoken_encoder, _HAS_TIKTOKEN, _encoder_loaded
+    if _encoder_loaded:
+        return _tiktoken_encoder
+    with _encoder_lock:
+        if not _encoder_loaded:
+            try:
+                import tiktoken
+                _tiktoken_encoder = tiktoken.get_encoding("cl100k_base")
+                _HAS_TIKTOKEN = True
+            except (ImportError, Exception):
+                # Catch ImportError (tiktoken not installed) and any
+                # network/proxy errors during encoding download
+                pass
+            _encoder_loaded = True
+    return _tiktoken_encoder
+
+
+def preload_tokenizer() -> threading.Thread | None:
+    """
+    Load the encoder on a daemon thread so first use doesn't pay for it.
+
+    Returns the thread, or None if the encoder is already loaded.
+    """
+    if _encoder_loaded:
+        return None
+    thread = threading.Thread(
+        target=_get_encoder, name="tokenizer-preload", daemon=True,
+    )
+    thread.start()
+    return thread
+
 
 def count_tokens(text: str) -> int:
     """
@@ -42,15 +79,17 @@ def count_tokens(text: str) -> int:
     if not text:
         return 0
 
-    if _HAS_TIKTOKEN and _tiktoken_encoder is not None:
-        return len(_tiktoken_encoder.encode(text))
+    encoder = _get_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text))
 
     # Conservative fallback
     return len(text) // CHARS_PER_TOKEN_FALLBACK
 
 
 def has_tiktoken() -> bool:
-    """Check if tiktoken is available."""
+    """Check if tiktoken is available (loads the encoder if needed)."""
+    _get_encoder()
     return _HAS_TIKTOKEN
 
 
@@ -62,6 +101,10 @@ class TokenCounter(Protocol):
         """Count tokens in text."""
         ...
 
+    def count_batch(self, texts: list[str]) -> list[int]:
+        """Count tokens in several texts at once."""
+        ...
+
     def truncate_to_budget(self, text: str, max_tokens: int) -> str:
         """Truncate text to fit within token budget."""
         ...
@@ -70,10 +113,16 @@ class TokenCounter(Protocol):
 class TiktokenCounter:
     """Token counter using tiktoken (accurate)."""
 
-    def __init__(self, encoding_name: str = "cl100k_base"):
-        if not _HAS_TIKTOKEN:
-            raise ImportError("tiktoken is required for TiktokenCounter")
-        self._encoder = tiktoken.get_encoding(encoding_name)
+    def __init__(self, encoding_name: str = "cl100k_base", encoder=None):
+        if encoder is None:
+            if not has_tiktoken():
+                raise ImportError("tiktoken is required for TiktokenCounter")
+            if encoding_name == "cl100k_base":
+                encoder = _tiktoken_encoder
+            else:
+                import tiktoken
+                encoder = tiktoken.get_encoding(encoding_name)
+        self._encoder = encoder
 
     def count(self, text: str) -> int:
         """Count tokens using tiktoken."""
@@ -81,18 +130,51 @@ class TiktokenCounter:
             return 0
         return len(self._encoder.encode(text))
 
+    def count_batch(self, texts: list[str]) -> list[int]:
+        """
+        Count tokens in several texts with one encoder call.
+
+        Uses encode_ordinary_batch, which spreads the texts over tiktoken's
+        own thread pool (the Rust encoder releases the GIL).
+        """
+        non_empty = [t for t in texts if t]
+        if not non_empty:
+            return [0] * len(texts)
+        batch = getattr(self._encoder, "encode_ordinary_batch", None)
+        if batch is not None:
+            encoded = iter(len(tokens) for tokens in batch(non_empty))
+        else:
+            encoded = iter(len(self._encoder.encode(t)) for t in non_empty)
+        return [next(encoded) if t else 0 for t in texts]
+
     def truncate_to_budget(self, text: str, max_tokens: int) -> str:
-        """Truncate text to fit within token budget (preserves token boundaries)."""
+        """
+        Truncate text to fit within token budget (preserves token boundaries).
+
+        Encodes only a prefix sized from CHARS_PER_TOKEN_CEILING, growing it
+        if the estimate was short, so cost tracks the budget rather than the
+        length of the input.
+        """
         if not text:
             return ""
+        if max_tokens <= 0:
+            return ""
 
-        tokens = self._encoder.encode(text)
-        if len(tokens) <= max_tokens:
-            return text
-
-        # Truncate and decode
-        truncated_tokens = tokens[:max_tokens]
-        return self._encoder.decode(truncated_tokens)
+        # Tokens near the end of a prefix can merge differently once the rest
+        # of the text follows; keep a margin of tokens we never return.
+        margin = 8
+        prefix_chars = (max_tokens + margin) * CHARS_PER_TOKEN_CEILING
+        while True:
+            prefix = text[:prefix_chars]
+            tokens = self._encoder.encode(prefix)
+            if len(prefix) == len(text):
+                # Whole text encoded: exact answer
+                if len(tokens) <= max_tokens:
+                    return text
+                return self._encoder.decode(tokens[:max_tokens])
+            if len(tokens) >= max_tokens + margin:
+                return self._encoder.decode(tokens[:max_tokens])
+            prefix_chars *= 2
 
 
 class FallbackCounter:
@@ -107,6 +189,10 @@ class FallbackCounter:
             return 0
         return len(text) // self._chars_per_token
 
+    def count_batch(self, texts: list[str]) -> list[int]:
+        """Estimate tokens for several texts."""
+        return [len(t) // self._chars_per_token if t else 0 for t in texts]
+
     def truncate_to_budget(self, text: str, max_tokens: int) -> str:
         """Truncate text to fit within estimated token budget."""
         if not text:
@@ -131,7 +217,7 @@ def get_counter() -> TokenCounter:
 
     Returns TiktokenCounter if tiktoken is installed, FallbackCounter otherwise.
     """
-    if _HAS_TIKTOKEN:
+    if has_tiktoken():
         return TiktokenCounter()
     return FallbackCounter()
 
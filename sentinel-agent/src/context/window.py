@@ -274,14 +274,29 @@ class RollingWindow:
         result = [b for b in self._blocks if b.id in candidate_ids]
         return result
 
-    def get_trimmed_summary(self) -> str | None:
+    def get_trimmed_blocks(
+        self,
+        budget_override: int | None = None,
+    ) -> list[TranscriptBlock]:
+        """
+        Get blocks that fall outside the window, in chronological order.
+
+        Args:
+            budget_override: Override token budget (uses config default if None)
+        """
+        window_ids = {b.id for b in self.get_window(budget_override)}
+        return [b for b in self._blocks if b.id not in window_ids]
+
+    def get_trimmed_summary(self, budget_override: int | None = None) -> str | None:
         """
         Generate a summary of trimmed content (for Strain II+).
 
         Returns a "Scene Recap" paragraph summarizing trimmed blocks.
+
+        Args:
+            budget_override: Override token budget (uses config default if None)
         """
-        window_ids = {b.id for b in self.get_window()}
-        trimmed = [b for b in self._blocks if b.id not in window_ids]
+        trimmed = self.get_trimmed_blocks(budget_override)
 
         if not trimmed:
             return None
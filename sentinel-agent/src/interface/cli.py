@@ -7,6 +7,7 @@ Supports local backends: LM Studio and Ollama.
 
 import sys
 import argparse
+import atexit
 from pathlib import Path
 from rich.panel import Panel
 from rich.prompt import Prompt
@@ -14,6 +15,7 @@ from prompt_toolkit import prompt as pt_prompt
 
 from ..state import CampaignManager
 from ..agent import SentinelAgent
+from ..context.tokenizer import preload_tokenizer
 from ..llm.base import Message
 from ..tools.hinge_detector import detect_hinge
 
@@ -24,7 +26,13 @@ from .renderer import (
     render_narrative_block, render_choice_block, detect_block_type,
     BlockType,
 )
-from .config import load_config, set_backend
+from .config import (
+    apply_capability_cache,
+    apply_perf_log,
+    apply_response_cache,
+    load_config,
+    set_backend,
+)
 from .glyphs import (
     g, format_context_meter, context_warning, estimate_conversation_tokens,
     CONTEXT_LIMITS,
@@ -58,6 +66,9 @@ def main():
     )
     args = parser.parse_args()
 
+    # Load the tokenizer while the banner plays
+    preload_tokenizer()
+
     # Initialize paths
     base_dir = Path(__file__).parent.parent.parent.parent  # SENTINEL root
     prompts_dir = Path(__file__).parent.parent.parent / "prompts"
@@ -73,6 +84,9 @@ def main():
 
     # Initialize status bar from config
     status_bar.enabled = show_status_bar
+    apply_response_cache(config, campaigns_dir)
+    apply_capability_cache(campaigns_dir)
+    apply_perf_log(config, campaigns_dir)
 
     # Command line --no-animate overrides config
     if args.no_animate:
@@ -95,6 +109,8 @@ def main():
         backend=saved_backend,
         local_mode=args.local,
     )
+    # Late-bound: closes whichever agent is current at exit
+    atexit.register(lambda: agent.close())
 
     # Restore saved model if using LM Studio/Ollama
     if saved_model and agent.backend in ("lmstudio", "ollama"):
@@ -192,6 +208,7 @@ def main():
                     if cmd == "/backend" and result:
                         console.print(f"[dim]Switching to {result}...[/dim]")
                         set_backend(result, campaigns_dir)  # Save preference
+                        agent.close()
                         agent = SentinelAgent(
                             manager,
                             prompts_dir=prompts_dir,
@@ -2678,6 +2678,79 @@ def cmd_consequences(manager: CampaignManager, agent: SentinelAgent, args: list[
     return None
 
 
+# -----------------------------------------------------------------------------
+# LLM Telemetry Commands
+# -----------------------------------------------------------------------------
+
+def cmd_perf(manager: CampaignManager, agent: SentinelAgent, args: list[str]):
+    """Show LLM latency and throughput per backend.
+
+    Usage:
+        /perf          - Calls made this session
+        /perf history  - Every call in the telemetry log (all sessions)
+        /perf clear    - Reset this session's numbers
+    """
+    from ..llm.telemetry import get_metrics_store, load_metrics, summarize
+
+    store = get_metrics_store()
+    sub = args[0].lower() if args else ""
+
+    if sub == "clear":
+        store.clear()
+        console.print(f"[{THEME['dim']}]Session telemetry cleared[/{THEME['dim']}]")
+        return
+
+    if sub == "history":
+        if store.export_path is None:
+            console.print(f"[{THEME['dim']}]Telemetry log is off (perf_log in config)[/{THEME['dim']}]")
+            return
+        title = "LLM PERFORMANCE (ALL SESSIONS)"
+        summary = summarize(load_metrics(store.export_path))
+    else:
+        title = "LLM PERFORMANCE (THIS SESSION)"
+        summary = store.summary()
+
+    console.print(f"\n[bold {THEME['primary']}]{title}[/bold {THEME['primary']}]")
+    if not summary:
+        console.print(f"[{THEME['dim']}]No LLM calls recorded yet[/{THEME['dim']}]")
+        return
+
+    for backend, stats in summary.items():
+        console.print(
+            f"\n  [{THEME['accent']}]{backend}[/{THEME['accent']}] "
+            f"[{THEME['dim']}]{', '.join(stats['models'])}[/{THEME['dim']}]"
+        )
+        console.print(
+            f"    [{THEME['secondary']}]Calls:[/{THEME['secondary']}] {stats['calls']}  "
+            f"[{THEME['secondary']}]Tokens:[/{THEME['secondary']}] "
+            f"{stats['prompt_tokens']:,} in / {stats['completion_tokens']:,} out"
+        )
+        console.print(
+            f"    [{THEME['secondary']}]Latency:[/{THEME['secondary']}] "
+            f"p50 {_format_seconds(stats['latency_p50'])}  p95 {_format_seconds(stats['latency_p95'])}  "
+            f"[{THEME['secondary']}]TTFT:[/{THEME['secondary']}] "
+            f"p50 {_format_seconds(stats['ttft_p50'])}  p95 {_format_seconds(stats['ttft_p95'])}"
+        )
+        console.print(
+            f"    [{THEME['secondary']}]Throughput:[/{THEME['secondary']}] "
+            f"{stats['tokens_per_sec']:.1f} tok/s"
+        )
+
+    last = store.last()
+    if last is not None and sub != "history":
+        source = "backend usage" if last.usage_reported else "local count"
+        console.print(
+            f"\n  [{THEME['dim']}]Last call: {last.prompt_tokens:,} → {last.completion_tokens:,} tokens "
+            f"in {last.latency:.2f}s ({last.tokens_per_sec:.1f} tok/s, {source})[/{THEME['dim']}]"
+        )
+    if store.export_path is not None:
+        console.print(f"\n[{THEME['dim']}]Log: {store.export_path}[/{THEME['dim']}]")
+
+
+def _format_seconds(value: float | None) -> str:
+    return f"{value:.2f}s" if value is not None else "—"
+
+
 # -----------------------------------------------------------------------------
 # Context Debug Commands
 # -----------------------------------------------------------------------------
@@ -2822,6 +2895,11 @@ def _show_context_debug(manager: CampaignManager, agent: SentinelAgent, pack_inf
             f"  {pack_info.total_tokens:,} / {pack_info.total_budget:,} tokens "
             f"({pack_info.pressure:.1%})"
         )
+        if pack_info.stage_ms:
+            timings = " | ".join(
+                f"{stage} {ms:.1f}ms" for stage, ms in pack_info.stage_ms.items()
+            )
+            console.print(f"  [{THEME['dim']}]Packing: {timings}[/{THEME['dim']}]")
 
         # Trimmed blocks info
         if pack_info.trimmed_blocks > 0:
@@ -3463,6 +3541,10 @@ def _simulate_whatif(manager: CampaignManager, agent: SentinelAgent, args: list[
         console.print(f"[{THEME['warning']}]{result.error}[/{THEME['warning']}]")
         return
 
+    if result.measured:
+        console.print(result.measured, style=THEME['dim'], markup=False)
+        console.print()
+
     console.print(Panel(
         result.analysis,
         title=f"[bold {THEME['warning']}]TIMELINE DIVERGENCE[/bold {THEME['warning']}]",
@@ -3506,8 +3588,13 @@ def cmd_checkpoint(manager: CampaignManager, agent: SentinelAgent, args: list[st
 
     # Step 1: Generate/update digest
     console.print(f"[{THEME['secondary']}]Generating digest...[/{THEME['secondary']}]")
-    digest_manager = DigestManager(Path("campaigns"))
-    digest = digest_manager.generate(campaign)
+    tracker = getattr(agent, "digest_tracker", None)
+    # Save through the tracker's manager so there is one digest location
+    digest_manager = tracker.digest_manager if tracker is not None else DigestManager(Path("campaigns"))
+    if tracker is not None:
+        digest = tracker.rebuild(persist=False)
+    else:
+        digest = digest_manager.generate(campaign)
     digest_path = digest_manager.save(campaign_id, digest)
 
     console.print(f"  [{THEME['accent']}]{g('success')}[/{THEME['accent']}] Digest saved: {digest_path.name}")
@@ -3569,11 +3656,14 @@ def cmd_compress(manager: CampaignManager, agent: SentinelAgent, args: list[str]
 
     campaign = manager.current
     campaign_id = campaign.meta.id
-    digest_manager = DigestManager(Path("campaigns"))
+    tracker = getattr(agent, "digest_tracker", None)
+    # Save through the tracker's manager so there is one digest location
+    digest_manager = tracker.digest_manager if tracker is not None else DigestManager(Path("campaigns"))
 
     # Check for show mode
     if args and args[0].lower() == "show":
-        existing = digest_manager.load(campaign_id)
+        # The live digest is maintained from events; fall back to disk
+        existing = tracker.digest if tracker is not None else digest_manager.load(campaign_id)
         if existing:
             console.print(f"\n[bold {THEME['primary']}]CURRENT DIGEST[/bold {THEME['primary']}]")
             console.print(f"[{THEME['dim']}]Last updated: {existing.last_updated.strftime('%Y-%m-%d %H:%M')}[/{THEME['dim']}]")
@@ -3586,7 +3676,10 @@ def cmd_compress(manager: CampaignManager, agent: SentinelAgent, args: list[str]
     console.print(f"\n[bold {THEME['primary']}]COMPRESSING MEMORY[/bold {THEME['primary']}]")
 
     # Generate and save digest
-    digest = digest_manager.generate(campaign)
+    if tracker is not None:
+        digest = tracker.rebuild(persist=False)
+    else:
+        digest = digest_manager.generate(campaign)
     digest_path = digest_manager.save(campaign_id, digest)
 
     console.print(f"[{THEME['accent']}]{g('success')}[/{THEME['accent']}] Digest updated")
@@ -4399,6 +4492,7 @@ def create_commands(manager: CampaignManager, agent: SentinelAgent, conversation
         "/backend": cmd_backend,
         "/model": cmd_model,
         "/ping": cmd_ping,
+        "/perf": cmd_perf,
         "/banner": cmd_banner,
         "/statusbar": cmd_statusbar,
         "/lore": cmd_lore,
@@ -4540,6 +4634,8 @@ def register_all_commands():
                      handler=cmd_statusbar)
     register_command("/ping", "Test backend connection", CommandCategory.SETTINGS,
                      handler=cmd_ping)
+    register_command("/perf", "Show LLM latency and throughput", CommandCategory.SETTINGS,
+                     handler=cmd_perf)
 
     # Lore Commands
     register_command("/lore", "Search lore", CommandCategory.LORE,
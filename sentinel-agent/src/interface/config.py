@@ -15,6 +15,9 @@ class Config(TypedDict, total=False):
     model: str | None  # Model name for LM Studio/Ollama
     animate_banner: bool  # Show animated banner on startup
     show_status_bar: bool  # Show persistent status bar
+    response_cache: bool  # Reuse answers to repeated analyses (/simulate, /consult)
+    response_cache_mb: int  # Size bound for the response cache
+    perf_log: bool  # Append LLM call telemetry to campaigns/.perf.jsonl
 
 
 DEFAULT_CONFIG: Config = {
@@ -22,6 +25,9 @@ DEFAULT_CONFIG: Config = {
     "model": None,
     "animate_banner": True,
     "show_status_bar": True,
+    "response_cache": False,
+    "response_cache_mb": 64,
+    "perf_log": True,
 }
 
 # Backend names that were removed when SENTINEL went local-only.
@@ -97,3 +103,38 @@ def set_show_status_bar(show: bool, campaigns_dir: Path | str = "campaigns") ->
     config = load_config(campaigns_dir)
     config["show_status_bar"] = show
     save_config(config, campaigns_dir)
+
+
+def apply_response_cache(config: Config, campaigns_dir: Path | str = "campaigns") -> None:
+    """Enable the LLM response cache beside the campaigns if config asks for it."""
+    from ..llm.cache import disable_response_cache, enable_response_cache
+
+    if config.get("response_cache"):
+        enable_response_cache(
+            Path(campaigns_dir) / ".response_cache",
+            max_bytes=int(config.get("response_cache_mb", 64)) * 1024 * 1024,
+        )
+    else:
+        disable_response_cache()
+
+
+def apply_capability_cache(campaigns_dir: Path | str = "campaigns") -> None:
+    """Persist backend capability probes beside the campaigns."""
+    from ..llm.capabilities import enable_capability_cache
+
+    enable_capability_cache(Path(campaigns_dir) / ".capabilities.json")
+
+
+def get_perf_log_path(campaigns_dir: Path | str = "campaigns") -> Path:
+    """Get path to the LLM telemetry log."""
+    return Path(campaigns_dir) / ".perf.jsonl"
+
+
+def apply_perf_log(config: Config, campaigns_dir: Path | str = "campaigns") -> None:
+    """Export LLM call telemetry beside the campaigns if config asks for it."""
+    from ..llm.telemetry import disable_metrics_export, enable_metrics_export
+
+    if config.get("perf_log", True):
+        enable_metrics_export(get_perf_log_path(campaigns_dir))
+    else:
+        disable_metrics_export()
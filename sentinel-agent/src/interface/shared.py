@@ -38,6 +38,7 @@ class SimulateResult:
     success: bool
     analysis: str = ""
     error: str = ""
+    measured: str = ""  # Rollout statistics the analysis narrates, if any
 
 
 # =============================================================================
@@ -366,10 +367,12 @@ Provide a structured analysis:
 Be concise. Use bullet points. This is speculative analysis, not narration."""
 
     try:
-        response = client.chat(
+        # Same action against the same state is the same analysis
+        response = client.chat_cached(
             messages=[Message(role="user", content=analysis_prompt)],
             system="You are a game consequence analyzer. Provide structured, concise analysis of potential action outcomes. Do not narrate scenes.",
             max_tokens=800,
+            reuse=True,
         )
         analysis = response.content if hasattr(response, 'content') else str(response)
         return SimulateResult(success=True, analysis=analysis)
@@ -444,10 +447,12 @@ Provide a structured prediction:
 Be specific to this NPC's personality and history. Keep it concise."""
 
     try:
-        response = client.chat(
+        # Same action against the same state is the same analysis
+        response = client.chat_cached(
             messages=[Message(role="user", content=analysis_prompt)],
             system="You are predicting NPC behavior based on their established personality, standing, and history. Be specific and grounded in the provided context.",
             max_tokens=600,
+            reuse=True,
         )
         prediction = response.content if hasattr(response, 'content') else str(response)
 
@@ -470,6 +475,7 @@ def simulate_whatif(
         return SimulateResult(success=False, error="No campaign loaded")
 
     from ..llm.base import Message
+    from ..systems.simulation import proposal_from_text, simulate_many
 
     # Get relevant history
     history_events = get_faction_shift_history(manager, limit=15)
@@ -485,6 +491,25 @@ def simulate_whatif(
 Active threads: {len(manager.current.dormant_threads)}
 Session count: {manager.current.meta.session_count}"""
 
+    # Measure what the engine does with the divergent choice, when the
+    # query names a faction or region it can act on
+    measured = ""
+    candidate = proposal_from_text(query)
+    if candidate is not None:
+        try:
+            report, baseline = simulate_many(manager.current, [candidate, None])
+            measured = report.format(baseline, manager.current)
+        except Exception:
+            measured = ""  # Fall back to the unmeasured analysis
+
+    measured_section = f"""
+MEASURED OUTCOMES (turn-engine rollouts of this choice vs. the current path):
+{measured}
+
+Narrate these measured outcomes. Treat the percentages as how likely each
+consequence is; do not invent different numbers.
+""" if measured else ""
+
     analysis_prompt = f"""The player wants to explore an alternate timeline.
 
 WHAT-IF QUERY: "{query}"
@@ -494,7 +519,7 @@ CAMPAIGN HISTORY (key events):
 
 CURRENT STATE:
 {current_state}
-
+{measured_section}
 Analyze this alternate path:
 
 1. DIVERGENCE POINT
@@ -519,13 +544,15 @@ Analyze this alternate path:
 This is speculative alternate history analysis. Be specific but acknowledge uncertainty."""
 
     try:
-        response = client.chat(
+        # Same action against the same state is the same analysis
+        response = client.chat_cached(
             messages=[Message(role="user", content=analysis_prompt)],
             system="You are analyzing alternate timelines in a TTRPG campaign. Ground your analysis in the provided history while exploring plausible divergent paths.",
             max_tokens=800,
+            reuse=True,
         )
         analysis = response.content if hasattr(response, 'content') else str(response)
-        return SimulateResult(success=True, analysis=analysis)
+        return SimulateResult(success=True, analysis=analysis, measured=measured)
     except Exception as e:
         return SimulateResult(success=False, error=str(e))
 
@@ -6,6 +6,8 @@ Main stream in center, SELF dock (left) and WORLD dock (right) toggle with [ and
 import asyncio
 import random
 import subprocess
+import textwrap
+import time
 from datetime import datetime
 from difflib import get_close_matches
 from pathlib import Path
@@ -28,9 +30,18 @@ from ..state.schema import Campaign, Standing, Character, DormantThread
 from ..agent import SentinelAgent
 from ..context import StrainTier, format_strain_notice
 from ..llm.base import Message
+from ..llm.telemetry import get_metrics_store
 from ..tools.hinge_detector import detect_hinge
+from ..systems.snapshots import SnapshotFeed
 from .choices import parse_response, ChoiceBlock
-from .config import load_config, set_backend, set_model as save_model
+from .config import (
+    apply_capability_cache,
+    apply_perf_log,
+    apply_response_cache,
+    load_config,
+    set_backend,
+    set_model as save_model,
+)
 from .glyphs import g, energy_bar
 from .renderer import format_tags_rich
 from .command_registry import get_registry
@@ -67,6 +78,16 @@ class InputValidation:
     choice_index: int | None = None  # 0-indexed choice for CHOICE type
 
 
+# Streaming preview: repaint at most this often, show this many trailing lines
+STREAM_PREVIEW_INTERVAL = 0.05
+STREAM_PREVIEW_LINES = 8
+
+# Speculative context build: start this long after the last keystroke, once
+# the input is at least this long (see SentinelAgent.prefetch_context)
+PREFETCH_DEBOUNCE = 0.4
+PREFETCH_MIN_CHARS = 3
+
+
 # Patterns that indicate in-game narrative action
 ACTION_STARTERS = (
     # First-person actions
@@ -539,9 +560,12 @@ class CommandInput(Input):
         self._history_buffer = ""
 
     def watch_value(self, value: str) -> None:
-        """Called when input value changes - update suggestions."""
+        """Called when input value changes - update suggestions and prefetch."""
         if self._suggestion_display:
             self._suggestion_display.update_suggestions(value)
+        app = self.app
+        if hasattr(app, "_schedule_prefetch"):
+            app._schedule_prefetch(value)
 
     def action_complete(self) -> None:
         """Tab completion action."""
@@ -714,6 +738,7 @@ class ContextBar(Static):
         self.strain_tier: StrainTier = StrainTier.NORMAL
         self.section_info: str = ""
         self.backend: str | None = None  # Track current backend for cloud detection
+        self.perf_info: str = ""  # Last LLM call: time to first token, tok/s
 
     def set_backend(self, backend: str | None):
         """Set the current backend (affects display mode)."""
@@ -750,6 +775,15 @@ class ContextBar(Static):
         self.section_info = ""
         self.refresh_display()
 
+    def update_perf(self, metrics):
+        """Update from the last call's CallMetrics (llm.telemetry)."""
+        if metrics is None:
+            self.perf_info = ""
+        else:
+            ttft = f"{metrics.ttft:.1f}s" if metrics.ttft is not None else "—"
+            self.perf_info = f"TTFT {ttft} · {metrics.tokens_per_sec:.0f} tok/s"
+        self.refresh_display()
+
     def refresh_display(self):
         # Local backends — show pressure bar and strain tracking
         tier_name, tier_color = self.TIER_DISPLAY.get(
@@ -777,6 +811,9 @@ class ContextBar(Static):
         if self.section_info:
             display.append(f"  │ {self.section_info}", style=Theme.DIM)
 
+        if self.perf_info:
+            display.append(f"  │ {self.perf_info}", style=Theme.DIM)
+
         self.update(display)
 
 
@@ -1349,6 +1386,19 @@ class SentinelTUI(App):
         border: solid {Theme.BORDER};
     }}
 
+    #stream-preview {{
+        height: auto;
+        width: 100%;
+        background: {Theme.BG};
+        color: {Theme.TEXT};
+        display: none;
+        padding: 0 1;
+    }}
+
+    #stream-preview.visible {{
+        display: block;
+    }}
+
     #thinking-panel {{
         height: auto;
         max-height: 5;
@@ -1513,6 +1563,7 @@ class SentinelTUI(App):
         self.prompts_dir: Path | None = None
         self.lore_dir: Path | None = None
         self.local_mode = local_mode
+        self._prefetch_timer = None
         # Command history (for persistence)
         self._history: list[str] = []
         self._history_file = Path("campaigns") / ".tui_history"
@@ -1549,6 +1600,7 @@ class SentinelTUI(App):
             with Container(id="center-column"):
                 with Vertical(id="console-wrapper"):
                     yield RichLog(id="output-log", highlight=True, markup=True)
+                    yield Static(id="stream-preview")
                     yield ThinkingPanel(id="thinking-panel")
                     yield LoadingIndicator(id="thinking-indicator")
                     yield ChoiceButtons(id="choice-buttons")
@@ -1583,6 +1635,17 @@ class SentinelTUI(App):
         bus.on(EventType.CAMPAIGN_LOADED, self._on_campaign_loaded)
         bus.on(EventType.SOCIAL_ENERGY_CHANGED, self._on_energy_changed)
 
+        # Turn engine snapshots: refresh only the docks whose paths changed
+        self._snapshot_feed = SnapshotFeed()
+        self._snapshot_feed.subscribe(
+            ("/turn_count", "/region", "/location"), self._on_snapshot_paths("#header", HeaderBar),
+        )
+        self._snapshot_feed.subscribe("/character", self._on_snapshot_paths("#self-dock", SelfDock))
+        self._snapshot_feed.subscribe(
+            ("/factions", "/npcs"), self._on_snapshot_paths("#world-dock", WorldDock),
+        )
+        bus.on(EventType.SNAPSHOT_UPDATED, self._snapshot_feed.on_event)
+
         # Processing stage events (for thinking panel)
         bus.on(EventType.STAGE_BUILDING_CONTEXT, self._on_processing_stage)
         bus.on(EventType.STAGE_RETRIEVING_LORE, self._on_processing_stage)
@@ -1600,6 +1663,11 @@ class SentinelTUI(App):
         # Show startup animation (runs as worker to avoid blocking)
         self._run_startup_animation()
 
+    def on_unmount(self):
+        """Release the agent's event subscriptions on exit."""
+        if self.agent:
+            self.agent.close()
+
     def _update_clock(self):
         """Update the header clock."""
         self.query_one("#header", HeaderBar).refresh_display()
@@ -1810,6 +1878,9 @@ class SentinelTUI(App):
         config = load_config(campaigns_dir)
         saved_backend = config.get("backend", "auto")
         saved_model = config.get("model")
+        apply_response_cache(config, campaigns_dir)
+        apply_capability_cache(campaigns_dir)
+        apply_perf_log(config, campaigns_dir)
 
         self.manager = CampaignManager(campaigns_dir)
 
@@ -1845,6 +1916,7 @@ class SentinelTUI(App):
         # Set backend for cloud detection (affects display mode)
         if self.agent:
             context_bar.set_backend(self.agent.backend)
+        context_bar.update_perf(get_metrics_store().last())
         if self.agent and hasattr(self.agent, '_last_pack_info'):
             context_bar.update_from_pack_info(self.agent._last_pack_info)
         else:
@@ -2019,6 +2091,21 @@ class SentinelTUI(App):
 
         self.call_from_thread(update)
 
+    def _on_snapshot_paths(self, selector: str, widget_type: type):
+        """Feed handler that refreshes one dock from the current campaign."""
+        def handler(snapshot: dict, paths: list[str]) -> None:
+            def update():
+                try:
+                    self.query_one(selector, widget_type).update_campaign(
+                        self.manager.current if self.manager else None
+                    )
+                except Exception:
+                    pass
+
+            self.call_from_thread(update)
+
+        return handler
+
     def _on_npc_changed(self, event: GameEvent) -> None:
         """Handle NPC changes - update WORLD dock."""
         def update():
@@ -2541,6 +2628,46 @@ class SentinelTUI(App):
         choice_buttons = self.query_one("#choice-buttons", ChoiceButtons)
         choice_buttons.clear_choices()
 
+    def _schedule_prefetch(self, value: str):
+        """Debounce a speculative context build for the input being typed."""
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+            self._prefetch_timer = None
+        text = value.strip()
+        if (
+            len(text) < PREFETCH_MIN_CHARS
+            or text.startswith("/")
+            or not self.agent
+            or not self.agent.client
+            or not self.manager
+            or not self.manager.current
+        ):
+            return
+        self._prefetch_timer = self.set_timer(
+            PREFETCH_DEBOUNCE, lambda: self._prefetch_context(text)
+        )
+
+    @work(thread=True, exclusive=True, group="prefetch")
+    def _prefetch_context(self, text: str):
+        """Build the next turn's state context off the UI thread."""
+        if self.agent:
+            self.agent.prefetch_context(text)
+
+    def _show_stream_preview(self, text: str, width: int):
+        """Show the tail of a response that is still streaming in."""
+        lines: list[str] = []
+        for paragraph in text.splitlines():
+            lines.extend(textwrap.wrap(paragraph, max(width, 20)) or [""])
+        preview = self.query_one("#stream-preview", Static)
+        preview.update(Text("\n".join(lines[-STREAM_PREVIEW_LINES:])))
+        preview.add_class("visible")
+
+    def _clear_stream_preview(self):
+        """Hide the streaming preview once the full response is rendered."""
+        preview = self.query_one("#stream-preview", Static)
+        preview.update("")
+        preview.remove_class("visible")
+
     @work(thread=True)
     async def handle_action(self, user_input: str):
         """Handle regular action input (runs in thread)."""
@@ -2572,8 +2699,26 @@ class SentinelTUI(App):
                     f"[{Theme.WARNING}]{g('hinge')} HINGE MOMENT[/{Theme.WARNING}]"
                 ))
 
+            # Stream the reply into the preview as it arrives; the first
+            # token paints immediately, later ones are throttled
+            streamed: list[str] = []
+            last_paint = 0.0
+
+            def on_token(text: str) -> None:
+                nonlocal last_paint
+                streamed.append(text)
+                now = time.monotonic()
+                if now - last_paint >= STREAM_PREVIEW_INTERVAL:
+                    last_paint = now
+                    self.call_from_thread(
+                        self._show_stream_preview, "".join(streamed), log_width,
+                    )
+
             # Get response
-            response = self.agent.respond(user_input, self.conversation)
+            response = self.agent.respond(
+                user_input, self.conversation, on_token=on_token,
+            )
+            self.call_from_thread(self._clear_stream_preview)
             self.conversation.append(Message(role="user", content=user_input))
             self.conversation.append(Message(role="assistant", content=response))
 
@@ -2630,7 +2775,8 @@ class SentinelTUI(App):
                 f"[{Theme.DANGER}]Error: {e}[/{Theme.DANGER}]"
             ))
         finally:
-            # Hide thinking indicator
+            # Hide thinking indicator (and a preview left by a failed stream)
+            self.call_from_thread(self._clear_stream_preview)
             self.call_from_thread(indicator.remove_class, "visible")
 
         # Refresh panels on main thread
@@ -2813,6 +2959,10 @@ class SentinelTUI(App):
                 ))
                 return
 
+            # Show the measured rollout odds the analysis narrates
+            if result.measured:
+                self.call_from_thread(log.write, Text(result.measured + "\n", style=Theme.DIM))
+
             # Display analysis in panel
             panel_width = 70
             analysis_panel = Panel(
@@ -2853,6 +3003,10 @@ def main():
     )
     args = parser.parse_args()
 
+    # Load the tokenizer while the startup animation plays
+    from ..context.tokenizer import preload_tokenizer
+    preload_tokenizer()
+
     app = SentinelTUI(local_mode=args.local)
     app.run()
 
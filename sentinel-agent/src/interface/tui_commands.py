@@ -784,6 +784,7 @@ def tui_help(app: "SENTINELApp", log: "RichLog", args: list[str]) -> None:
         f"  [{Theme.ACCENT}]/model[/{Theme.ACCENT}] [name] - Switch model\n"
         f"  [{Theme.ACCENT}]/copy[/{Theme.ACCENT}] - Copy last output\n"
         f"  [{Theme.ACCENT}]/ping[/{Theme.ACCENT}] - Test backend/model\n"
+        f"  [{Theme.ACCENT}]/perf[/{Theme.ACCENT}] [history|clear] - LLM latency & throughput\n"
         f"  [{Theme.ACCENT}]/checkpoint[/{Theme.ACCENT}] - Save & relieve memory pressure\n"
         f"  [{Theme.ACCENT}]/compress[/{Theme.ACCENT}] - Update campaign digest\n"
         f"  [{Theme.ACCENT}]/clear[/{Theme.ACCENT}] - Clear conversation\n"
@@ -869,6 +870,8 @@ def tui_backend(app: "SENTINELApp", log: "RichLog", args: list[str]) -> None:
     else:
         backend = args[0].lower()
         log.write(Text.from_markup(f"[{Theme.DIM}]Switching to {backend}...[/{Theme.DIM}]"))
+        if app.agent:
+            app.agent.close()
         app.agent = SentinelAgent(
             app.manager,
             prompts_dir=app.prompts_dir,
@@ -1378,10 +1381,13 @@ def tui_compress(app: "SENTINELApp", log: "RichLog", args: list[str]) -> None:
     from ..context import DigestManager
 
     campaign = app.manager.current
-    digest_manager = DigestManager(Path("campaigns"))
+    tracker = getattr(app.agent, "digest_tracker", None)
+    # Save through the tracker's manager so there is one digest location
+    digest_manager = tracker.digest_manager if tracker is not None else DigestManager(Path("campaigns"))
 
     if args and args[0].lower() == "show":
-        existing = digest_manager.load(campaign.meta.id)
+        # The live digest is maintained from events; fall back to disk
+        existing = tracker.digest if tracker is not None else digest_manager.load(campaign.meta.id)
         if existing:
             log.write(Text.from_markup(f"[bold {Theme.TEXT}]Current Digest[/bold {Theme.TEXT}]"))
             log.write(Text.from_markup(f"[{Theme.DIM}]Last updated: {existing.last_updated.strftime('%Y-%m-%d %H:%M')}[/{Theme.DIM}]"))
@@ -1391,7 +1397,10 @@ def tui_compress(app: "SENTINELApp", log: "RichLog", args: list[str]) -> None:
         return
 
     log.write(Text.from_markup(f"[bold {Theme.TEXT}]Compressing Memory[/bold {Theme.TEXT}]"))
-    digest = digest_manager.generate(campaign)
+    if tracker is not None:
+        digest = tracker.rebuild(persist=False)
+    else:
+        digest = digest_manager.generate(campaign)
     digest_manager.save(campaign.meta.id, digest)
     log.write(Text.from_markup(f"[{Theme.FRIENDLY}]Digest updated[/{Theme.FRIENDLY}]"))
 
@@ -1535,6 +1544,56 @@ def tui_ping(app: "SENTINELApp", log: "RichLog", args: list[str]) -> None:
     asyncio.create_task(app._ping_backend(log))
 
 
+def tui_perf(app: "SENTINELApp", log: "RichLog", args: list[str]) -> None:
+    """Show LLM latency and throughput per backend."""
+    from ..llm.telemetry import get_metrics_store, load_metrics, summarize
+
+    store = get_metrics_store()
+    sub = args[0].lower() if args else ""
+
+    if sub == "clear":
+        store.clear()
+        log.write(Text.from_markup(f"[{Theme.DIM}]Session telemetry cleared[/{Theme.DIM}]"))
+        app.refresh_all_panels()
+        return
+
+    if sub == "history":
+        if store.export_path is None:
+            log.write(Text.from_markup(f"[{Theme.DIM}]Telemetry log is off (perf_log in config)[/{Theme.DIM}]"))
+            return
+        title = "LLM Performance (all sessions)"
+        summary = summarize(load_metrics(store.export_path))
+    else:
+        title = "LLM Performance (this session)"
+        summary = store.summary()
+
+    log.write(Text.from_markup(f"[bold {Theme.TEXT}]{title}[/bold {Theme.TEXT}]"))
+    if not summary:
+        log.write(Text.from_markup(f"[{Theme.DIM}]No LLM calls recorded yet[/{Theme.DIM}]"))
+        return
+
+    def seconds(value: float | None) -> str:
+        return f"{value:.2f}s" if value is not None else "—"
+
+    for backend, stats in summary.items():
+        log.write(Text.from_markup(
+            f"  [{Theme.ACCENT}]{backend}[/{Theme.ACCENT}] "
+            f"[{Theme.DIM}]{', '.join(stats['models'])}[/{Theme.DIM}]"
+        ))
+        log.write(Text.from_markup(
+            f"    {stats['calls']} calls  "
+            f"{stats['prompt_tokens']:,} in / {stats['completion_tokens']:,} out tokens"
+        ))
+        log.write(Text.from_markup(
+            f"    latency p50 {seconds(stats['latency_p50'])} p95 {seconds(stats['latency_p95'])}  "
+            f"TTFT p50 {seconds(stats['ttft_p50'])} p95 {seconds(stats['ttft_p95'])}  "
+            f"[{Theme.FRIENDLY}]{stats['tokens_per_sec']:.1f} tok/s[/{Theme.FRIENDLY}]"
+        ))
+
+    if store.export_path is not None:
+        log.write(Text.from_markup(f"[{Theme.DIM}]Log: {store.export_path}[/{Theme.DIM}]"))
+
+
 # -----------------------------------------------------------------------------
 # Shop Command
 # -----------------------------------------------------------------------------
@@ -2851,6 +2910,7 @@ def register_tui_handlers() -> None:
     set_tui_handler("/copy", tui_copy)
     set_tui_handler("/dock", tui_dock)
     set_tui_handler("/ping", tui_ping)
+    set_tui_handler("/perf", tui_perf)
 
     # Settings
     set_tui_handler("/backend", tui_backend)
@@ -1,21 +1,28 @@
 """LLM backend clients for SENTINEL agent."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Literal
 
-from .base import LLMClient, LLMResponse, Message, ToolCall, ToolResult
+from .aio import AsyncLLMClient, get_llm_loop
+from .base import LLMClient, LLMResponse, Message, StreamChunk, ToolCall, ToolResult
 from .lmstudio import LMStudioClient
 from .ollama import OllamaClient
+from .pooled import PooledLLMClient
 from .skills import parse_skills, format_tools_for_prompt, strip_skill_tags
 
 __all__ = [
     "LLMClient",
+    "AsyncLLMClient",
+    "get_llm_loop",
     "LLMResponse",
     "Message",
+    "StreamChunk",
     "ToolCall",
     "ToolResult",
     "LMStudioClient",
     "OllamaClient",
+    "PooledLLMClient",
     "MockLLMClient",
     "create_llm_client",
     "detect_backend",
@@ -41,6 +48,7 @@ class MockLLMClient(LLMClient):
         self,
         responses: list[str] | None = None,
         model_name: str = "mock-model",
+        context_length: int | None = None,
     ):
         """
         Initialize mock client.
@@ -49,10 +57,12 @@ class MockLLMClient(LLMClient):
             responses: List of responses to return in order.
                        Cycles through if more calls than responses.
             model_name: Name to report as model_name property.
+            context_length: Context window to report (None = unknown).
         """
         self._responses = responses or ["Mock response"]
         self._call_count = 0
         self._model_name = model_name
+        self._context_length = context_length
         self.calls: list[dict] = []  # Record of all calls made
 
     @property
@@ -66,6 +76,9 @@ class MockLLMClient(LLMClient):
     def is_available(self) -> bool:
         return True
 
+    def get_context_length(self) -> int | None:
+        return self._context_length
+
     def chat(
         self,
         messages: list[Message],
@@ -91,6 +104,7 @@ class MockLLMClient(LLMClient):
         system: str | None = None,
         tools: list[dict] | None = None,
         tool_executor: Callable[[str, dict], dict] | None = None,
+        **kwargs,
     ) -> str:
         """Return next mock response (no tool execution)."""
         self.calls.append({
@@ -103,6 +117,29 @@ class MockLLMClient(LLMClient):
         self._call_count += 1
         return response
 
+    def chat_with_tools_stream(
+        self,
+        messages: list[Message],
+        system: str | None = None,
+        tools: list[dict] | None = None,
+        tool_executor: Callable[[str, dict], dict] | None = None,
+        on_text: Callable[[str], None] | None = None,
+        **kwargs,
+    ) -> str:
+        """Return next mock response, streamed word by word to on_text."""
+        self.calls.append({
+            "method": "chat_with_tools_stream",
+            "messages": messages,
+            "system": system,
+            "tools": tools,
+        })
+        response = self._responses[self._call_count % len(self._responses)]
+        self._call_count += 1
+        if on_text is not None:
+            for word in response.split(" "):
+                on_text(word + " ")
+        return response
+
     def set_responses(self, responses: list[str]) -> None:
         """Update the list of responses."""
         self._responses = responses
@@ -123,14 +160,30 @@ BackendType = Literal["lmstudio", "ollama", "auto"]
 LOCAL_BACKENDS = frozenset({"lmstudio", "ollama"})
 
 
+def _client_for(client_cls: type, base_url: str) -> LLMClient:
+    """
+    A client for base_url, or a PooledLLMClient over several servers when
+    base_url is a comma-separated list (e.g. two inference boxes).
+    """
+    urls = [url.strip() for url in base_url.split(",") if url.strip()]
+    if len(urls) > 1:
+        return PooledLLMClient([client_cls(base_url=url) for url in urls])
+    return client_cls(base_url=base_url)
+
+
 def detect_backend(
     lmstudio_url: str = "http://127.0.0.1:1234/v1",
     ollama_url: str = "http://127.0.0.1:11434/v1",
+    timeout: float = 0.5,
 ) -> tuple[str, LLMClient] | tuple[None, None]:
     """
     Auto-detect available local LLM backend.
 
-    Preference order: LM Studio > Ollama
+    Preference order: LM Studio > Ollama. Both are probed at once, so
+    startup waits for the slower check only when LM Studio is down.
+
+    Args:
+        timeout: Per-backend availability check timeout in seconds
 
     Returns:
         Tuple of (backend_name, client) or (None, None) if nothing available.
@@ -138,19 +191,26 @@ def detect_backend(
     lmstudio_url = os.environ.get("LMSTUDIO_BASE_URL", lmstudio_url)
     ollama_url = os.environ.get("OLLAMA_BASE_URL", ollama_url)
 
+    def probe(factory: Callable[[], LLMClient]) -> LLMClient | None:
+        try:
+            client = factory()
+            return client if client.is_available(timeout=timeout) else None
+        except Exception:
+            return None
+
+    candidates = [
+        ("lmstudio", lambda: _client_for(LMStudioClient, lmstudio_url)),
+        ("ollama", lambda: _client_for(OllamaClient, ollama_url)),
+    ]
+    executor = ThreadPoolExecutor(max_workers=len(candidates), thread_name_prefix="detect")
     try:
-        client = LMStudioClient(base_url=lmstudio_url)
-        if client.is_available():
-            return ("lmstudio", client)
-    except Exception:
-        pass
-
-    try:
-        client = OllamaClient(base_url=ollama_url)
-        if client.is_available():
-            return ("ollama", client)
-    except Exception:
-        pass
+        futures = [(name, executor.submit(probe, factory)) for name, factory in candidates]
+        for name, future in futures:
+            client = future.result()
+            if client is not None:
+                return (name, client)
+    finally:
+        executor.shutdown(wait=False)  # Don't wait on a probe whose answer is moot
 
     return (None, None)
 
@@ -178,6 +238,17 @@ def create_llm_client(
         name, client = detect_backend(lmstudio_url, ollama_url)
         return (name or "none", client)
 
+    if backend in LOCAL_BACKENDS:
+        url = lmstudio_url if backend == "lmstudio" else ollama_url
+        if "," in url:
+            client = _client_for(
+                LMStudioClient if backend == "lmstudio" else OllamaClient, url
+            )
+            if client.is_available():
+                return (backend, client)
+            print(f"No {backend} server available at {url}")
+            return (backend, None)
+
     if backend == "lmstudio":
         try:
             from .lmstudio import create_lmstudio_client
@@ -0,0 +1,514 @@
+"""
+asyncio LLM client layer.
+
+The blocking clients are fine for the one-at-a-time GM turn, but fan-out
+work (council consults, previews) paid a thread per request. This module
+does those requests on one shared event loop instead:
+
+- AsyncConnectionPool: keep-alive HTTP/1.1 over stdlib asyncio streams
+- AsyncLLMClient: async chat()/chat_stream() for an LLMClient's endpoint,
+  with per-request timeouts and bounded concurrency, plus chat_batch() for
+  requests sharing a prompt prefix
+- LLMEventLoop: a background loop that sync code submits coroutines to;
+  interrupting the caller cancels the work
+
+No dependencies beyond the standard library.
+"""
+
+import asyncio
+import concurrent.futures
+import io
+import json
+import threading
+import urllib.error
+from typing import TYPE_CHECKING, AsyncIterator, Coroutine, TypeVar
+from urllib.parse import urlsplit
+
+from .base import LLMResponse, Message, StreamChunk
+from .cache import cacheable, get_response_cache, request_key
+from .pool import MAX_IDLE_PER_HOST
+from .streaming import ChatStreamAccumulator, StreamDecoder
+
+if TYPE_CHECKING:
+    from .base import LLMClient
+
+T = TypeVar("T")
+
+_READ_SIZE = 65536
+
+
+class AsyncHTTPResponse:
+    """
+    A response read from an asyncio stream.
+
+    Supports Content-Length, chunked and read-to-close bodies. The
+    connection returns to the pool on aclose() if the body was fully read.
+    """
+
+    def __init__(self, pool, key, reader, writer, status, reason, headers):
+        self._pool = pool
+        self._key = key
+        self._reader = reader
+        self._writer = writer
+        self.status = status
+        self.reason = reason
+        self.headers = headers  # Lower-cased names
+
+        self._chunked = "chunked" in headers.get("transfer-encoding", "").lower()
+        self._remaining: int | None = None
+        if not self._chunked and "content-length" in headers:
+            self._remaining = int(headers["content-length"])
+        self._keep_alive = (
+            headers.get("connection", "").lower() != "close"
+            and (self._chunked or self._remaining is not None)
+        )
+        self._done = self._remaining == 0 or status in (204, 304)
+
+    async def read_chunk(self) -> bytes:
+        """The next piece of the body; b"" at the end."""
+        if self._done:
+            return b""
+        reader = self._reader
+        if self._chunked:
+            size_line = await reader.readline()
+            size = int(size_line.split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass  # Trailers
+                self._done = True
+                return b""
+            data = await reader.readexactly(size)
+            await reader.readexactly(2)  # CRLF after each chunk
+            return data
+        if self._remaining is not None:
+            data = await reader.read(min(_READ_SIZE, self._remaining))
+            if not data:
+                raise asyncio.IncompleteReadError(b"", self._remaining)
+            self._remaining -= len(data)
+            self._done = self._remaining == 0
+            return data
+        data = await reader.read(_READ_SIZE)
+        self._done = not data
+        return data
+
+    async def read(self) -> bytes:
+        """The whole (remaining) body."""
+        parts = []
+        while chunk := await self.read_chunk():
+            parts.append(chunk)
+        return b"".join(parts)
+
+    async def iter_lines(self) -> AsyncIterator[bytes]:
+        """Body lines as they arrive (for SSE / NDJSON streams)."""
+        buffer = b""
+        while chunk := await self.read_chunk():
+            buffer += chunk
+            while (newline := buffer.find(b"\n")) >= 0:
+                yield buffer[:newline + 1]
+                buffer = buffer[newline + 1:]
+        if buffer:
+            yield buffer
+
+    async def aclose(self) -> None:
+        """Release the connection: pooled if the body was fully read."""
+        if self._writer is None:
+            return
+        reader, writer, self._writer = self._reader, self._writer, None
+        if self._done and self._keep_alive:
+            self._pool._release(self._key, reader, writer)
+        else:
+            writer.close()
+
+
+class AsyncConnectionPool:
+    """
+    Keep-alive HTTP/1.1 connections over asyncio streams, keyed by host.
+
+    Bound to the event loop it is used on. Errors are raised as
+    urllib.error.HTTPError / URLError, like the blocking pool.
+    """
+
+    def __init__(self, max_idle_per_host: int = MAX_IDLE_PER_HOST):
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: dict[tuple, list] = {}
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncHTTPResponse:
+        """Send a request and return the response once its headers arrive."""
+        parts = urlsplit(url)
+        key = (parts.scheme or "http", parts.hostname or "127.0.0.1", parts.port)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {parts.netloc}"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        lines.append(f"Content-Length: {len(body or b'')}")
+        request = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b"")
+
+        for attempt in range(2):
+            reader, writer, reused = await self._acquire(key, fresh=attempt > 0)
+            try:
+                writer.write(request)
+                await writer.drain()
+                status, reason, response_headers = await _read_head(reader)
+            except (ConnectionError, asyncio.IncompleteReadError) as e:
+                writer.close()
+                if reused and attempt == 0:
+                    continue  # Server dropped an idle connection; retry fresh
+                raise urllib.error.URLError(e) from e
+            except OSError as e:
+                writer.close()
+                raise urllib.error.URLError(e) from e
+            except BaseException:
+                writer.close()  # Cancelled mid-request
+                raise
+            break
+
+        response = AsyncHTTPResponse(
+            self, key, reader, writer, status, reason, response_headers,
+        )
+        if status >= 400:
+            try:
+                payload = await response.read()
+            finally:
+                await response.aclose()
+            raise urllib.error.HTTPError(
+                url, status, reason, response_headers, io.BytesIO(payload),
+            )
+        return response
+
+    async def aclose(self) -> None:
+        """Close every idle connection."""
+        idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for _, writer in conns:
+                writer.close()
+
+    async def _acquire(self, key: tuple, fresh: bool = False):
+        if not fresh:
+            conns = self._idle.get(key) or []
+            while conns:
+                reader, writer = conns.pop()
+                if not writer.is_closing() and not reader.at_eof():
+                    return reader, writer, True
+                writer.close()
+
+        scheme, host, port = key
+        port = port or (443 if scheme == "https" else 80)
+        try:
+            reader, writer = await asyncio.open_connection(
+                host, port, ssl=True if scheme == "https" else None,
+            )
+        except OSError as e:
+            raise urllib.error.URLError(e) from e
+        return reader, writer, False
+
+    def _release(self, key: tuple, reader, writer) -> None:
+        conns = self._idle.setdefault(key, [])
+        if len(conns) < self.max_idle_per_host:
+            conns.append((reader, writer))
+        else:
+            writer.close()
+
+
+async def _read_head(reader) -> tuple[int, str, dict[str, str]]:
+    """Status line and headers of an HTTP/1.x response."""
+    line = await reader.readline()
+    if not line:
+        raise ConnectionResetError("Connection closed before response")
+    parts = line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+    status = int(parts[1])
+    reason = parts[2] if len(parts) > 2 else ""
+
+    headers: dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return status, reason, headers
+
+
+class AsyncLLMClient:
+    """
+    asyncio front end for an LLMClient.
+
+    HTTP backends (LM Studio, Ollama) are spoken to directly over asyncio
+    streams, reusing the blocking client's request format, resolved
+    endpoint and auth. Other clients run their blocking chat() in a worker
+    thread. Either way at most max_concurrency requests are in flight, and
+    each is bounded by timeout.
+
+    Usage:
+        aclient = AsyncLLMClient(agent.client)
+        replies = await asyncio.gather(*(aclient.chat(m) for m in batches))
+    """
+
+    def __init__(
+        self,
+        client: "LLMClient",
+        max_concurrency: int = 3,
+        timeout: float | None = None,
+    ):
+        """
+        Initialize the async client.
+
+        Args:
+            client: Blocking client whose backend to talk to
+            max_concurrency: Requests allowed in flight at once
+            timeout: Seconds per request (default: the client's timeout).
+                For streams it bounds the wait for each piece.
+        """
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout if timeout is not None else getattr(client, "timeout", 120)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._pool = AsyncConnectionPool()
+
+    @property
+    def speaks_http(self) -> bool:
+        """Whether requests go over asyncio streams (vs a worker thread)."""
+        return hasattr(self.client, "_build_chat_request") and hasattr(self.client, "_endpoint")
+
+    async def chat(
+        self,
+        messages: list[Message],
+        system: str | None = None,
+        tools: list[dict] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        reuse: bool = False,
+    ) -> LLMResponse:
+        """
+        Send a chat completion request.
+
+        Goes through the response cache like LLMClient.chat_cached(): for
+        temperature 0, or when reuse=True.
+        """
+        return await self._chat(messages, system, tools, temperature, max_tokens, reuse)
+
+    async def chat_batch(
+        self,
+        requests: list[tuple[list[Message], str | None]],
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        reuse: bool = False,
+    ) -> list[LLMResponse | BaseException]:
+        """
+        Send requests whose prompts share a prefix, scheduled for prefix reuse.
+
+        If the backend decodes at least len(requests) sequences in parallel
+        (llama.cpp-style slots) they are dispatched together as one batch.
+        Otherwise the first request goes out alone and the rest follow as
+        soon as it produces output: by then the server has evaluated the
+        shared prefix and cached it, so the followers only pay for their
+        own suffix instead of queueing up to evaluate it again.
+
+        Args:
+            requests: (messages, system) per request, shared prefix first
+            temperature: Sampling temperature for every request
+            max_tokens: Maximum response tokens for every request
+            reuse: Serve and store answers through the response cache
+
+        Returns:
+            A response, or the exception it raised, per request (in order)
+        """
+        async def send(request, started: asyncio.Event | None = None):
+            messages, system = request
+            return await self._chat(
+                messages, system, None, temperature, max_tokens, reuse, started,
+            )
+
+        parallel_slots = getattr(self.client, "parallel_slots", None)
+        slots = await asyncio.to_thread(parallel_slots) if parallel_slots else None
+        if len(requests) <= 1 or (slots is not None and slots >= len(requests)):
+            return list(await asyncio.gather(
+                *(send(r) for r in requests), return_exceptions=True,
+            ))
+
+        started = asyncio.Event()
+        lead = asyncio.ensure_future(send(requests[0], started))
+        waiter = asyncio.ensure_future(started.wait())
+        try:
+            await asyncio.wait({lead, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+        results = await asyncio.gather(
+            lead, *(send(r) for r in requests[1:]), return_exceptions=True,
+        )
+        return list(results)
+
+    async def _chat(
+        self,
+        messages: list[Message],
+        system: str | None,
+        tools: list[dict] | None,
+        temperature: float,
+        max_tokens: int,
+        reuse: bool,
+        started: asyncio.Event | None = None,
+    ) -> LLMResponse:
+        """chat(), optionally signalling `started` once output arrives."""
+        cache = getattr(self.client, "response_cache", None) or get_response_cache()
+        key = None
+        if cache is not None and cacheable(temperature, reuse):
+            model = self.client.model_name
+            key = request_key(model, messages, system, tools, temperature, max_tokens)
+            cached = cache.get(model, key)
+            if cached is not None:
+                return cached
+
+        response = None
+        async for chunk in self.chat_stream(
+            messages, system=system, tools=tools,
+            temperature=temperature, max_tokens=max_tokens,
+        ):
+            if started is not None:
+                started.set()
+            if chunk.response is not None:
+                response = chunk.response
+        response = response or LLMResponse(content="")
+
+        if key is not None and (response.content or response.tool_calls):
+            cache.put(model, key, response)
+        return response
+
+    async def chat_stream(
+        self,
+        messages: list[Message],
+        system: str | None = None,
+        tools: list[dict] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a chat completion: text deltas, then the full response."""
+        async with self._semaphore:
+            if not self.speaks_http:
+                response = await asyncio.wait_for(
+                    asyncio.to_thread(
+                        self.client.chat, messages, system, tools, temperature, max_tokens,
+                    ),
+                    self.timeout,
+                )
+                if response.content:
+                    yield StreamChunk(text=response.content)
+                yield StreamChunk(response=response)
+                return
+
+            url, headers, body = await self._prepare(
+                messages, system, tools, temperature, max_tokens,
+            )
+            response = await asyncio.wait_for(
+                self._pool.request("POST", url, body=body, headers=headers),
+                self.timeout,
+            )
+            accumulator = ChatStreamAccumulator()
+            decoder = StreamDecoder(response.headers.get("content-type", ""))
+            lines = response.iter_lines()
+            try:
+                while not decoder.done:
+                    try:
+                        line = await asyncio.wait_for(lines.__anext__(), self.timeout)
+                    except StopAsyncIteration:
+                        event = decoder.flush()
+                        if event is not None:
+                            accumulator.feed(event)
+                        break
+                    event = decoder.feed(line)
+                    if event is None:
+                        continue
+                    if "error" in event:
+                        raise RuntimeError(f"Backend error: {event['error']}")
+                    text = accumulator.feed(event)
+                    if text:
+                        yield StreamChunk(text=text)
+                if decoder.done:
+                    # Drain to the end of the body so the connection is reusable
+                    async for _ in lines:
+                        pass
+            finally:
+                await lines.aclose()
+                await response.aclose()
+            yield StreamChunk(response=accumulator.response())
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._pool.aclose()
+
+    async def _prepare(self, messages, system, tools, temperature, max_tokens):
+        client = self.client
+        if getattr(client, "_resolved_base_url", True) is None:
+            # Let the blocking client walk its candidate URLs once
+            await asyncio.to_thread(client.list_models)
+        # May probe tool support / the model list (cached after first use)
+        request_data = await asyncio.to_thread(
+            client._build_chat_request,
+            messages, system, tools, temperature, max_tokens, True,
+        )
+        url, headers = client._endpoint("chat/completions")
+        return url, headers, json.dumps(request_data).encode("utf-8")
+
+
+class LLMEventLoop:
+    """
+    A background asyncio loop shared by async LLM work.
+
+    Sync callers submit coroutines and wait on the result; if the wait is
+    interrupted (Ctrl+C) or times out, the coroutine is cancelled, which
+    closes its in-flight connections.
+    """
+
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop (started on first use)."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="llm-event-loop",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coro: Coroutine[object, object, T]) -> "concurrent.futures.Future[T]":
+        """Schedule coro on the loop; cancel() the future to cancel it."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[object, object, T], timeout: float | None = None) -> T:
+        """Run coro on the loop and wait for its result."""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("LLMEventLoop.run() called from the loop itself; await instead")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+
+_event_loop: LLMEventLoop | None = None
+_event_loop_lock = threading.Lock()
+
+
+def get_llm_loop() -> LLMEventLoop:
+    """Get the process-wide LLM event loop."""
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = LLMEventLoop()
+        return _event_loop
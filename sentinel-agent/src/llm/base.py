@@ -5,9 +5,11 @@ Defines the interface that all backends must implement.
 Adapted from Sovwren's multi-backend pattern.
 """
 
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from typing import Any, Callable, Iterator, Literal
 
 
 @dataclass
@@ -80,12 +82,113 @@ class LLMResponse:
     content: str
     tool_calls: list[ToolCall] = field(default_factory=list)
     finish_reason: str = "stop"
+    # Token usage as reported by the backend (None if it didn't say)
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
 
     @property
     def has_tool_calls(self) -> bool:
         return len(self.tool_calls) > 0
 
 
+@dataclass
+class StreamChunk:
+    """One step of a streamed response: a text delta, or the final response."""
+    text: str = ""
+    response: LLMResponse | None = None  # Set on the last chunk only
+
+
+# -----------------------------------------------------------------------------
+# Tool execution
+# -----------------------------------------------------------------------------
+
+# Workers for read-only tool calls made in the same model round
+TOOL_WORKERS = 4
+
+_tool_pool: ThreadPoolExecutor | None = None
+_tool_pool_lock = threading.Lock()
+
+
+def _get_tool_pool() -> ThreadPoolExecutor:
+    global _tool_pool
+    with _tool_pool_lock:
+        if _tool_pool is None:
+            _tool_pool = ThreadPoolExecutor(
+                max_workers=TOOL_WORKERS, thread_name_prefix="tool",
+            )
+        return _tool_pool
+
+
+def run_tool_calls(
+    calls: list[tuple[str, dict]],
+    tool_executor: Callable[[str, dict], dict] | None,
+    tools: list[dict],
+) -> list[dict]:
+    """
+    Execute one round's tool calls and return their results in call order.
+
+    Consecutive calls to tools whose schema sets "read_only" run
+    concurrently; any other call waits for the reads before it and runs
+    alone, so mutations keep the order the model asked for.
+    """
+    if tool_executor is None:
+        return [{"error": "No tool executor provided"} for _ in calls]
+
+    read_only = {t["name"] for t in tools if t.get("read_only")}
+    results: list[dict | None] = [None] * len(calls)
+    reads: list[int] = []
+
+    def run_reads() -> None:
+        if len(reads) == 1:
+            name, args = calls[reads[0]]
+            results[reads[0]] = tool_executor(name, args)
+        elif reads:
+            pool = _get_tool_pool()
+            futures = [(i, pool.submit(tool_executor, *calls[i])) for i in reads]
+            for i, future in futures:
+                results[i] = future.result()
+        reads.clear()
+
+    for i, (name, args) in enumerate(calls):
+        if name in read_only:
+            reads.append(i)
+        else:
+            run_reads()
+            results[i] = tool_executor(name, args)
+    run_reads()
+    return results
+
+
+class ToolDispatch:
+    """
+    Starts one round's tool calls as they are discovered in a stream.
+
+    Read-only calls go to the tool pool right away, while the model is
+    still generating. From the first mutating call on, calls are held and
+    run by results() in run_tool_calls() order, so a mutation still runs
+    after the reads before it and mutations keep the model's order.
+    """
+
+    def __init__(self, tool_executor: Callable[[str, dict], dict] | None, tools: list[dict]):
+        self.tool_executor = tool_executor
+        self.tools = tools
+        self._read_only = {t["name"] for t in tools if t.get("read_only")}
+        self._started: list[Future] = []
+        self._held: list[tuple[str, dict]] = []
+
+    def submit(self, name: str, args: dict) -> None:
+        """Start (or hold) one call."""
+        if self.tool_executor is not None and not self._held and name in self._read_only:
+            self._started.append(_get_tool_pool().submit(self.tool_executor, name, args))
+        else:
+            self._held.append((name, args))
+
+    def results(self) -> list[dict]:
+        """Every call's result, in submission order."""
+        results = [future.result() for future in self._started]
+        return results + run_tool_calls(self._held, self.tool_executor, self.tools)
+
+
 class LLMClient(ABC):
     """
     Abstract base class for LLM backends.
@@ -131,6 +234,123 @@ class LLMClient(ABC):
         """
         pass
 
+    # Opt-in response cache; None defers to the process-wide one (llm.cache)
+    response_cache = None
+
+    def chat_cached(
+        self,
+        messages: list[Message],
+        system: str | None = None,
+        tools: list[dict] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        reuse: bool = False,
+    ) -> LLMResponse:
+        """
+        chat() through the response cache, when one is enabled.
+
+        The cache is consulted only for deterministic requests (temperature
+        0) or when the caller passes reuse=True because a repeat answer is
+        acceptable (analyses, previews).
+        """
+        from .cache import cacheable, get_response_cache, request_key
+
+        cache = self.response_cache or get_response_cache()
+        if cache is None or not cacheable(temperature, reuse):
+            return self.chat(
+                messages, system=system, tools=tools,
+                temperature=temperature, max_tokens=max_tokens,
+            )
+
+        model = self.model_name
+        key = request_key(model, messages, system, tools, temperature, max_tokens)
+        response = cache.get(model, key)
+        if response is None:
+            response = self.chat(
+                messages, system=system, tools=tools,
+                temperature=temperature, max_tokens=max_tokens,
+            )
+            if response.content or response.tool_calls:
+                cache.put(model, key, response)
+        return response
+
+    def chat_stream(
+        self,
+        messages: list[Message],
+        system: str | None = None,
+        tools: list[dict] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+    ) -> Iterator[StreamChunk]:
+        """
+        Stream a chat completion.
+
+        Yields text deltas as they arrive, then a final chunk whose
+        `response` is the complete LLMResponse (content and tool calls).
+        Backends without streaming yield the whole reply as one delta.
+        """
+        response = self.chat(
+            messages,
+            system=system,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        if response.content:
+            yield StreamChunk(text=response.content)
+        yield StreamChunk(response=response)
+
+    def get_context_length(self) -> int | None:
+        """
+        Context window of the current model, in tokens, if the backend
+        reports it. Backends cache the probe per model.
+        """
+        return None
+
+    def parallel_slots(self) -> int | None:
+        """
+        Sequences the backend decodes in parallel, if it reports it
+        (llama.cpp-style servers). None means unknown.
+        """
+        return None
+
+    # Backend name keying persisted probe results (llm.capabilities);
+    # None for clients that don't probe
+    capability_backend: str | None = None
+
+    @property
+    def telemetry_label(self) -> str:
+        """How this backend is named in telemetry (llm.telemetry)."""
+        from urllib.parse import urlsplit
+
+        name = self.capability_backend or type(self).__name__
+        base_url = getattr(self, "_configured_base_url", None)
+        host = urlsplit(base_url).netloc if base_url else ""
+        return f"{name}@{host}" if host else name
+
+    def _start_call(self):
+        """Begin timing a backend call; finish() the timer with the response."""
+        from .telemetry import CallTimer
+
+        return CallTimer(self.telemetry_label, self.model_name)
+
+    def _stored_capabilities(self, model: str) -> dict[str, Any]:
+        """Persisted probe results for model at this client's configured URL."""
+        from .capabilities import get_capability_cache
+
+        cache = get_capability_cache()
+        if cache is None or self.capability_backend is None:
+            return {}
+        return cache.get(self.capability_backend, self._configured_base_url, model)
+
+    def _store_capabilities(self, model: str, **fields: Any) -> None:
+        """Persist probe results so the next start can skip the probe."""
+        from .capabilities import get_capability_cache
+
+        cache = get_capability_cache()
+        if cache is not None and self.capability_backend is not None:
+            cache.update(self.capability_backend, self._configured_base_url, model, **fields)
+
     def chat_with_tools(
         self,
         messages: list[Message],
@@ -175,6 +395,65 @@ class LLMClient(ABC):
                 messages, system, tools, tool_executor, max_iterations, **kwargs
             )
 
+    def chat_with_tools_stream(
+        self,
+        messages: list[Message],
+        system: str | None = None,
+        tools: list[dict] | None = None,
+        tool_executor: callable = None,
+        on_text: Callable[[str], None] | None = None,
+        max_iterations: int = 5,
+        **kwargs,
+    ) -> str:
+        """
+        Streaming chat_with_tools: on_text receives display text as it arrives.
+
+        Text is forwarded token by token except around tool invocations:
+        native tool-call deltas never reach on_text, and skill tags
+        (<tool>...</tool>) are held back until they can be told apart from
+        prose, then swallowed. Returns the same final text as
+        chat_with_tools().
+        """
+        def emit(text: str) -> None:
+            if text and on_text is not None:
+                on_text(text)
+
+        if not tools:
+            response = self._complete(messages, system, None, emit, **kwargs)
+            return response.content
+
+        if self.supports_tools:
+            return self._chat_with_native_tools(
+                messages, system, tools, tool_executor, max_iterations,
+                on_text=emit, **kwargs
+            )
+        return self._chat_with_skill_tools(
+            messages, system, tools, tool_executor, max_iterations,
+            on_text=emit, **kwargs
+        )
+
+    def _complete(
+        self,
+        messages: list[Message],
+        system: str | None,
+        tools: list[dict] | None,
+        on_text: Callable[[str], None] | None,
+        **kwargs,
+    ) -> LLMResponse:
+        """One model round: chat(), or chat_stream() feeding on_text."""
+        if tools:
+            kwargs["tools"] = tools
+        if on_text is None:
+            return self.chat(messages, system=system, **kwargs)
+
+        response = None
+        for chunk in self.chat_stream(messages, system=system, **kwargs):
+            if chunk.response is not None:
+                response = chunk.response
+            elif chunk.text:
+                on_text(chunk.text)
+        return response or LLMResponse(content="")
+
     def _chat_with_native_tools(
         self,
         messages: list[Message],
@@ -182,17 +461,15 @@ class LLMClient(ABC):
         tools: list[dict],
         tool_executor: callable,
         max_iterations: int,
+        on_text: Callable[[str], None] | None = None,
         **kwargs,
     ) -> str:
         """Handle tool calls using native function calling."""
         current_messages = list(messages)
 
         for _ in range(max_iterations):
-            response = self.chat(
-                current_messages,
-                system=system,
-                tools=tools,
-                **kwargs,
+            response = self._complete(
+                current_messages, system, tools, on_text, **kwargs
             )
 
             if not response.has_tool_calls:
@@ -206,12 +483,12 @@ class LLMClient(ABC):
             ))
 
             # Execute tools and add results
-            for tool_call in response.tool_calls:
-                if tool_executor:
-                    result = tool_executor(tool_call.name, tool_call.arguments)
-                else:
-                    result = {"error": "No tool executor provided"}
-
+            results = run_tool_calls(
+                [(tc.name, tc.arguments) for tc in response.tool_calls],
+                tool_executor,
+                tools,
+            )
+            for tool_call, result in zip(response.tool_calls, results):
                 import json
                 current_messages.append(Message(
                     role="tool",
@@ -229,6 +506,7 @@ class LLMClient(ABC):
         tools: list[dict],
         tool_executor: callable,
         max_iterations: int,
+        on_text: Callable[[str], None] | None = None,
         **kwargs,
     ) -> str:
         """
@@ -240,8 +518,6 @@ class LLMClient(ABC):
         from .skills import (
             format_tools_for_prompt,
             format_tool_results,
-            parse_skills,
-            skills_to_tool_calls,
             strip_skill_tags,
         )
 
@@ -268,32 +544,20 @@ class LLMClient(ABC):
             current_messages.insert(0, Message(role="user", content=tool_prompt))
 
         for _ in range(max_iterations):
-            response = self.chat(
-                current_messages,
-                system=system,
-                **kwargs,
+            content, skills, outcomes = self._stream_skill_round(
+                current_messages, system, tools, tool_executor, on_text, **kwargs
             )
 
-            # Parse skill invocations from response
-            skills = parse_skills(response.content)
-
             if not skills:
                 # No tool calls, return cleaned response
-                return strip_skill_tags(response.content)
+                return strip_skill_tags(content)
 
-            # Execute skills
-            results = []
-            for skill in skills:
-                if tool_executor:
-                    result = tool_executor(skill.name, skill.arguments)
-                else:
-                    result = {"error": "No tool executor provided"}
-                results.append((skill.name, result))
+            results = [(skill.name, result) for skill, result in zip(skills, outcomes)]
 
             # Add assistant message and results for next round
             current_messages.append(Message(
                 role="assistant",
-                content=response.content,
+                content=content,
             ))
 
             # Feed results back as user message
@@ -304,4 +568,61 @@ class LLMClient(ABC):
             ))
 
         # Hit max iterations - return last response cleaned
-        return strip_skill_tags(response.content)
+        return strip_skill_tags(content)
+
+    # Skill rounds stop generating once prose follows a tool tag: it was
+    # written without the tool results and the next round replaces it
+    skill_early_stop = True
+
+    def _stream_skill_round(
+        self,
+        messages: list[Message],
+        system: str | None,
+        tools: list[dict],
+        tool_executor: callable,
+        on_text: Callable[[str], None] | None,
+        **kwargs,
+    ) -> tuple[str, list, list[dict]]:
+        """
+        One skill-tool round: stream the reply, starting each tool as its
+        tag closes. Returns (reply text, skills, their results).
+        """
+        from .streaming import SkillTagBuffer
+
+        tag_buffer = SkillTagBuffer(stop_after_tags=self.skill_early_stop)
+        dispatch = ToolDispatch(tool_executor, tools)
+        skills = []
+        content = None
+
+        def consume(text: str) -> None:
+            shown = tag_buffer.feed(text)
+            for skill in tag_buffer.take_skills():
+                skills.append(skill)
+                dispatch.submit(skill.name, skill.arguments)
+            if shown and on_text is not None:
+                on_text(shown)
+
+        stream = self.chat_stream(messages, system=system, **kwargs)
+        try:
+            for chunk in stream:
+                if chunk.response is not None:
+                    content = chunk.response.content
+                    break
+                consume(chunk.text)
+                if tag_buffer.stopped:
+                    break  # Closing the stream cancels the generation
+        finally:
+            stream.close()
+
+        if content is None or tag_buffer.stopped:
+            content = tag_buffer.content
+        elif content.startswith(tag_buffer.content):
+            # Whatever the final response holds beyond the streamed deltas
+            consume(content[len(tag_buffer.content):])
+            if tag_buffer.stopped:
+                content = tag_buffer.content
+        tail = tag_buffer.flush()
+        if tail and on_text is not None:
+            on_text(tail)
+        return content, skills, dispatch.results()
+
@@ -0,0 +1,245 @@
+"""
+Content-addressed on-disk cache of LLM responses.
+
+Analyses like /simulate and /consult are often re-asked verbatim: same
+model, system prompt, messages and sampling settings. With the cache
+enabled those repeat requests are answered from disk, and replaying a
+recorded transcript needs no model at all.
+
+Entries are keyed by a BLAKE2 hash of the canonicalized request, stored one
+JSON file per entry under a per-model namespace directory, and evicted
+least-recently-used once the cache exceeds its size bound. File mtimes
+carry recency across processes.
+
+The cache is opt-in (config `response_cache`), and only used for requests
+that are deterministic (temperature 0) or whose caller allows reuse.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from .base import LLMResponse, Message, ToolCall
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def canonical_request(
+    model: str,
+    messages: list[Message],
+    system: str | None,
+    tools: list[dict] | None,
+    temperature: float,
+    max_tokens: int,
+) -> bytes:
+    """Stable byte encoding of everything that determines a response."""
+    payload = {
+        "model": model,
+        "system": system or "",
+        "messages": [
+            {
+                "role": m.role,
+                "content": m.content,
+                "tool_calls": [
+                    {"id": tc.id, "name": tc.name, "arguments": tc.arguments}
+                    for tc in m.tool_calls
+                ],
+                "tool_call_id": m.tool_call_id,
+            }
+            for m in messages
+        ],
+        "tools": tools or [],
+        "temperature": round(float(temperature), 4),
+        "max_tokens": max_tokens,
+    }
+    return json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def request_key(*args, **kwargs) -> str:
+    """Hex digest of canonical_request(*args, **kwargs)."""
+    return hashlib.blake2b(canonical_request(*args, **kwargs), digest_size=16).hexdigest()
+
+
+def cacheable(temperature: float, reuse: bool) -> bool:
+    """Whether a request may be answered from the cache."""
+    return reuse or temperature == 0
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of LLMResponses on disk.
+
+    Usage:
+        cache = ResponseCache(Path("campaigns/.response_cache"))
+        key = request_key(model, messages, system, None, 0.0, 800)
+        response = cache.get(model, key)
+        if response is None:
+            response = client.chat(...)
+            cache.put(model, key, response)
+    """
+
+    def __init__(self, root: Path | str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Directory holding one subdirectory per model
+            max_bytes: Total size above which least-recently-used entries
+                are evicted
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: OrderedDict[Path, int] | None = None  # path -> size, LRU first
+        self._total = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model: str, key: str) -> LLMResponse | None:
+        """The cached response for key, or None."""
+        path = self._path(model, key)
+        with self._lock:
+            index = self._load_index()
+            if path not in index:
+                self.misses += 1
+                return None
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                os.utime(path)  # Recency survives restarts
+            except (OSError, json.JSONDecodeError):
+                self._forget(path)
+                self.misses += 1
+                return None
+            index.move_to_end(path)
+            self.hits += 1
+
+        return LLMResponse(
+            content=data["content"],
+            tool_calls=[
+                ToolCall(id=tc["id"], name=tc["name"], arguments=tc["arguments"])
+                for tc in data.get("tool_calls", [])
+            ],
+            finish_reason=data.get("finish_reason", "stop"),
+        )
+
+    def put(self, model: str, key: str, response: LLMResponse) -> None:
+        """Store a response, evicting old entries past the size bound."""
+        body = json.dumps({
+            "model": model,
+            "content": response.content,
+            "tool_calls": [
+                {"id": tc.id, "name": tc.name, "arguments": tc.arguments}
+                for tc in response.tool_calls
+            ],
+            "finish_reason": response.finish_reason,
+            "created": time.time(),
+        }).encode("utf-8")
+
+        path = self._path(model, key)
+        with self._lock:
+            index = self._load_index()
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                tmp.write_bytes(body)
+                tmp.replace(path)
+            except OSError:
+                return
+            self._forget(path, unlink=False)
+            index[path] = len(body)
+            self._total += len(body)
+            self._evict()
+
+    def clear(self, model: str | None = None) -> int:
+        """Delete all entries (or one model's). Returns the count removed."""
+        with self._lock:
+            index = self._load_index()
+            prefix = self._namespace(model) if model is not None else None
+            doomed = [p for p in index if prefix is None or p.parent.name == prefix]
+            for path in doomed:
+                self._forget(path)
+            return len(doomed)
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            self._load_index()
+            return self._total
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load_index())
+
+    # -------------------------------------------------------------------------
+    # Internals (call with the lock held)
+    # -------------------------------------------------------------------------
+
+    def _namespace(self, model: str) -> str:
+        """Readable, collision-free directory name for a model id."""
+        slug = re.sub(r"[^A-Za-z0-9._-]+", "_", model)[:48] or "model"
+        digest = hashlib.blake2b(model.encode("utf-8"), digest_size=4).hexdigest()
+        return f"{slug}-{digest}"
+
+    def _path(self, model: str, key: str) -> Path:
+        return self.root / self._namespace(model) / f"{key}.json"
+
+    def _load_index(self) -> "OrderedDict[Path, int]":
+        if self._index is None:
+            entries = []
+            if self.root.exists():
+                for path in self.root.glob("*/*.json"):
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, path, stat.st_size))
+            entries.sort()
+            self._index = OrderedDict((path, size) for _, path, size in entries)
+            self._total = sum(size for _, _, size in entries)
+        return self._index
+
+    def _forget(self, path: Path, unlink: bool = True) -> None:
+        size = self._index.pop(path, None)
+        if size is not None:
+            self._total -= size
+        if unlink:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _evict(self) -> None:
+        while self._total > self.max_bytes and len(self._index) > 1:
+            oldest = next(iter(self._index))
+            self._forget(oldest)
+
+
+_cache: ResponseCache | None = None
+
+
+def enable_response_cache(
+    root: Path | str,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> ResponseCache:
+    """Turn on the process-wide response cache used by all clients."""
+    global _cache
+    _cache = ResponseCache(root, max_bytes=max_bytes)
+    return _cache
+
+
+def disable_response_cache() -> None:
+    """Turn off the process-wide response cache."""
+    global _cache
+    _cache = None
+
+
+def get_response_cache() -> ResponseCache | None:
+    """The process-wide response cache, if enabled."""
+    return _cache
@@ -0,0 +1,128 @@
+"""
+Persisted results of backend capability probes.
+
+Finding out whether a model supports native tool calling costs a real
+completion, and the context length and endpoint quirks each cost a request
+too. None of that changes while the same model stays loaded, so the
+results are kept in a small JSON file keyed by backend, configured URL and
+model id, and startup with an unchanged model skips the probes entirely.
+
+Entries expire after a day, so a model reloaded with different settings
+is re-probed eventually; set_model() and a backend switch look up the new
+key and probe only if it is missing.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+DEFAULT_TTL = 24 * 60 * 60
+
+# Model slot for facts about the server rather than one model
+BACKEND_ENTRY = "*"
+
+
+class CapabilityCache:
+    """
+    Capability probe results on disk.
+
+    Usage:
+        cache = CapabilityCache(Path("campaigns/.capabilities.json"))
+        entry = cache.get("lmstudio", "http://127.0.0.1:1234/v1", "qwen2.5-7b")
+        if "supports_tools" not in entry:
+            cache.update("lmstudio", url, model, supports_tools=probe())
+    """
+
+    def __init__(self, path: Path | str, ttl: float = DEFAULT_TTL):
+        """
+        Initialize the cache.
+
+        Args:
+            path: JSON file holding all entries
+            ttl: Seconds before an entry is probed again
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    def get(self, backend: str, base_url: str, model: str) -> dict[str, Any]:
+        """Cached capabilities for a model ({} if unknown or expired)."""
+        with self._lock:
+            entry = self._load().get(self._key(backend, base_url, model))
+            if entry is None or time.time() - entry.get("probed", 0) > self.ttl:
+                return {}
+            return {k: v for k, v in entry.items() if k != "probed"}
+
+    def update(self, backend: str, base_url: str, model: str, **fields: Any) -> None:
+        """Merge probe results into a model's entry and save."""
+        with self._lock:
+            entries = self._load()
+            key = self._key(backend, base_url, model)
+            entry = entries.get(key)
+            if entry is None or time.time() - entry.get("probed", 0) > self.ttl:
+                entry = {}
+            entry.update(fields)
+            entry["probed"] = time.time()
+            entries[key] = entry
+            self._save()
+
+    def invalidate(self, backend: str, base_url: str, model: str | None = None) -> None:
+        """Forget one model's entry, or everything known about a backend URL."""
+        with self._lock:
+            entries = self._load()
+            if model is not None:
+                entries.pop(self._key(backend, base_url, model), None)
+            else:
+                prefix = self._key(backend, base_url, "")
+                for key in [k for k in entries if k.startswith(prefix)]:
+                    del entries[key]
+            self._save()
+
+    # -------------------------------------------------------------------------
+    # Internals (call with the lock held)
+    # -------------------------------------------------------------------------
+
+    def _key(self, backend: str, base_url: str, model: str) -> str:
+        return f"{backend}|{base_url.rstrip('/')}|{model}"
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self._entries = data if isinstance(data, dict) else {}
+            except (OSError, json.JSONDecodeError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self._entries, indent=2), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError:
+            pass  # Probing again next start is the only cost
+
+
+_cache: CapabilityCache | None = None
+
+
+def enable_capability_cache(path: Path | str, ttl: float = DEFAULT_TTL) -> CapabilityCache:
+    """Turn on the process-wide capability cache used by all clients."""
+    global _cache
+    _cache = CapabilityCache(path, ttl=ttl)
+    return _cache
+
+
+def disable_capability_cache() -> None:
+    """Turn off the process-wide capability cache."""
+    global _cache
+    _cache = None
+
+
+def get_capability_cache() -> CapabilityCache | None:
+    """The process-wide capability cache, if enabled."""
+    return _cache
@@ -8,12 +8,14 @@ Supports tool calling with compatible models.
 import json
 import os
 import time
-import urllib.request
 import urllib.error
 from urllib.parse import urlparse, urlunparse
-from typing import Any
+from typing import Any, Iterator
 
-from .base import LLMClient, LLMResponse, Message, ToolCall
+from .base import LLMClient, LLMResponse, Message, StreamChunk, ToolCall
+from .capabilities import BACKEND_ENTRY
+from .pool import get_connection_pool
+from .streaming import ChatStreamAccumulator, iter_stream_events, parse_usage
 
 
 class LMStudioClient(LLMClient):
@@ -26,12 +28,15 @@ class LMStudioClient(LLMClient):
     Tool calling support depends on the loaded model.
     """
 
+    capability_backend = "lmstudio"
+
     def __init__(
         self,
         base_url: str = "http://127.0.0.1:1234/v1",
         model: str | None = None,
         timeout: int = 120,
         api_key: str | None = None,
+        model_list_ttl: float = 30.0,
     ):
         """
         Initialize LM Studio client.
@@ -40,12 +45,31 @@ class LMStudioClient(LLMClient):
             base_url: LM Studio API base URL
             model: Model name (or None to use whatever's loaded)
             timeout: Request timeout in seconds
+            model_list_ttl: Seconds a fetched model list is reused
         """
         self.base_url = base_url.rstrip("/")
+        self._configured_base_url = self.base_url  # Keys persisted probe results
         self._model = model
         self.timeout = timeout
         self._supports_tools: bool | None = None
         self._api_key = api_key
+        self._context_lengths: dict[str, int | None] = {}
+        self._parallel_slots: int | None = None
+        self._slots_probed = False
+        self._pool = get_connection_pool()
+        # Base URL that last answered; candidates are re-probed only when it
+        # stops accepting connections
+        self._resolved_base_url: str | None = None
+        self._use_auth = False  # Server has asked for a key before
+        self.model_list_ttl = model_list_ttl
+        self._models_cache: tuple[float, list[str]] | None = None
+
+        # Endpoint quirks found by an earlier run: skip the candidate walk
+        endpoint = self._stored_capabilities(BACKEND_ENTRY)
+        self._stored_endpoint = (endpoint.get("api_root"), endpoint.get("use_auth", False))
+        if endpoint.get("api_root"):
+            self._use_auth = bool(endpoint.get("use_auth"))
+            self._resolve(endpoint["api_root"])
 
     def _candidate_base_urls(self) -> list[str]:
         """Return OpenAI-compatible API root candidates (hosts + `/v1`).
@@ -115,12 +139,18 @@ class LMStudioClient(LLMClient):
         if self._supports_tools is not None:
             return self._supports_tools
 
+        model = self.model_name
+        stored = self._stored_capabilities(model).get("supports_tools")
+        if isinstance(stored, bool):
+            self._supports_tools = stored
+            return stored
+
         # Test with a simple tool call
         try:
             response = self._make_request(
                 "chat/completions",
                 {
-                    "model": self.model_name,
+                    "model": model,
                     "messages": [{"role": "user", "content": "test"}],
                     "tools": [{
                         "type": "function",
@@ -134,13 +164,99 @@ class LMStudioClient(LLMClient):
                 },
             )
             self._supports_tools = True
+        except ConnectionError as e:
+            self._supports_tools = False
+            cause = e.__cause__
+            if isinstance(cause, urllib.error.URLError) and not isinstance(
+                cause, urllib.error.HTTPError
+            ):
+                return False  # Server unreachable; don't persist a guess
         except Exception:
             self._supports_tools = False
 
+        self._store_capabilities(model, supports_tools=self._supports_tools)
         return self._supports_tools
 
+    def get_context_length(self) -> int | None:
+        """Context length of the current model from LM Studio's REST API.
+
+        `/api/v0/models` (beside the OpenAI-compatible `/v1`) reports
+        `loaded_context_length` for loaded models and `max_context_length`
+        for all of them; the loaded value is what requests actually get.
+        """
+        model = self.model_name
+        if model in self._context_lengths:
+            return self._context_lengths[model]
+        stored = self._stored_capabilities(model)
+        if "context_length" in stored:
+            self._context_lengths[model] = stored["context_length"]
+            return stored["context_length"]
+
+        root = self.base_url[: -len("/v1")] if self.base_url.endswith("/v1") else self.base_url
+        length: int | None = None
+        try:
+            with self._pool.request(
+                "GET",
+                f"{root}/api/v0/models",
+                headers=self._make_headers(include_auth=True),
+                timeout=min(self.timeout, 5),
+            ) as resp:
+                data = json.loads(resp.read().decode("utf-8")).get("data", [])
+            for item in data if isinstance(data, list) else []:
+                if isinstance(item, dict) and item.get("id") == model:
+                    value = item.get("loaded_context_length") or item.get("max_context_length")
+                    if isinstance(value, int) and value > 0:
+                        length = value
+                    break
+        except Exception:
+            length = None
+        self._context_lengths[model] = length
+        if length is not None:
+            self._store_capabilities(model, context_length=length)
+        return length
+
+    def parallel_slots(self) -> int | None:
+        """Parallel sequences, from a llama.cpp-style server's `/props`.
+
+        llama.cpp's server (and servers built on it) report `total_slots`,
+        the `--parallel` setting, beside the OpenAI-compatible `/v1`; LM
+        Studio itself doesn't, so this is None there.
+        """
+        if self._slots_probed:
+            return self._parallel_slots
+        stored = self._stored_capabilities(BACKEND_ENTRY)
+        if "parallel_slots" in stored:
+            self._parallel_slots = stored["parallel_slots"]
+            self._slots_probed = True
+            return self._parallel_slots
+
+        root = self.base_url[: -len("/v1")] if self.base_url.endswith("/v1") else self.base_url
+        slots: int | None = None
+        try:
+            with self._pool.request(
+                "GET",
+                f"{root}/props",
+                headers=self._make_headers(include_auth=self._use_auth),
+                timeout=min(self.timeout, 5),
+            ) as resp:
+                value = json.loads(resp.read().decode("utf-8")).get("total_slots")
+            if isinstance(value, int) and value > 0:
+                slots = value
+        except (urllib.error.HTTPError, ValueError, AttributeError):
+            pass  # Answered, but not a llama.cpp server
+        except Exception:
+            return None  # Unreachable; ask again next time
+        self._parallel_slots = slots
+        self._slots_probed = True
+        self._store_capabilities(BACKEND_ENTRY, parallel_slots=slots)
+        return slots
+
     def _get_models(self) -> list[str]:
-        """Get list of available models."""
+        """Get list of available models (cached for model_list_ttl seconds)."""
+        now = time.monotonic()
+        if self._models_cache is not None and now - self._models_cache[0] < self.model_list_ttl:
+            return list(self._models_cache[1])
+
         response = self._make_request("models", method="GET")
         if not isinstance(response, dict):
             return []
@@ -154,7 +270,8 @@ class LMStudioClient(LLMClient):
             model_id = item.get("id")
             if isinstance(model_id, str) and model_id:
                 models.append(model_id)
-        return models
+        self._models_cache = (now, models)
+        return list(models)
 
     def _extract_error_message(self, response: object) -> str:
         if not isinstance(response, dict):
@@ -181,7 +298,36 @@ class LMStudioClient(LLMClient):
         data: dict | None = None,
         method: str = "POST",
     ) -> dict:
-        """Make HTTP request to LM Studio API."""
+        """
+        Make HTTP request to LM Studio API.
+
+        Requests go straight to the resolved base URL over a pooled
+        keep-alive connection. The candidate URLs are walked only on first
+        use, or when the resolved URL refuses the connection.
+        """
+        resolved = self._resolved_base_url
+        if resolved is not None:
+            try:
+                return self._request_candidates([resolved], endpoint, data, method)
+            except ConnectionError as e:
+                cause = e.__cause__
+                if not isinstance(cause, urllib.error.URLError) or isinstance(
+                    cause, urllib.error.HTTPError
+                ):
+                    raise  # The server answered; probing elsewhere won't help
+                self._resolved_base_url = None
+        return self._request_candidates(
+            self._candidate_base_urls(), endpoint, data, method
+        )
+
+    def _request_candidates(
+        self,
+        candidates: list[str],
+        endpoint: str,
+        data: dict | None,
+        method: str,
+    ) -> dict:
+        """Send the request to each candidate base URL until one answers."""
         def looks_like_success(payload: object) -> bool:
             if not isinstance(payload, dict):
                 return False
@@ -195,21 +341,19 @@ class LMStudioClient(LLMClient):
 
         last_error: Exception | None = None
         tried_urls: list[str] = []
-        for candidate_base_url in self._candidate_base_urls():
+        for candidate_base_url in candidates:
             url = f"{candidate_base_url}/{endpoint}"
             tried_urls.append(url)
 
             def request_with_auth(include_auth: bool) -> dict:
-                if method == "GET":
-                    req = urllib.request.Request(url, headers=self._make_headers(include_auth=include_auth))
-                else:
-                    req = urllib.request.Request(
-                        url,
-                        data=json.dumps(data).encode("utf-8") if data else None,
-                        headers=self._make_headers(include_auth=include_auth),
-                        method=method,
-                    )
-                with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                body = json.dumps(data).encode("utf-8") if data and method != "GET" else None
+                with self._pool.request(
+                    method,
+                    url,
+                    body=body,
+                    headers=self._make_headers(include_auth=include_auth),
+                    timeout=self.timeout,
+                ) as resp:
                     return json.loads(resp.read().decode("utf-8"))
 
             def request_with_retries(*, include_auth: bool) -> dict:
@@ -228,21 +372,22 @@ class LMStudioClient(LLMClient):
                         raise
 
             try:
-                response = request_with_retries(include_auth=False)
+                response = request_with_retries(include_auth=self._use_auth)
                 if not looks_like_success(response):
                     last_error = RuntimeError(self._extract_error_message(response))
                     continue
-                self.base_url = candidate_base_url.rstrip("/")
+                self._resolve(candidate_base_url)
                 return response
             except urllib.error.HTTPError as e:
                 # Retry with auth only if the server explicitly denies us.
-                if e.code in (401, 403):
+                if e.code in (401, 403) and not self._use_auth:
                     try:
                         response = request_with_retries(include_auth=True)
                         if not looks_like_success(response):
                             last_error = RuntimeError(self._extract_error_message(response))
                             continue
-                        self.base_url = candidate_base_url.rstrip("/")
+                        self._use_auth = True
+                        self._resolve(candidate_base_url)
                         return response
                     except Exception as e2:
                         last_error = e2
@@ -258,18 +403,32 @@ class LMStudioClient(LLMClient):
             f"Make sure LM Studio is running with a model loaded. "
             f"Error: {last_error}\n"
             f"Tried: {', '.join(tried_urls[:4])}{'...' if len(tried_urls) > 4 else ''}"
-        )
+        ) from last_error
 
-    def chat(
+    def _resolve(self, base_url: str) -> None:
+        """Remember the base URL that answered (persisted when it changes)."""
+        self.base_url = base_url.rstrip("/")
+        self._resolved_base_url = self.base_url
+        endpoint = (self.base_url, self._use_auth)
+        if endpoint != self._stored_endpoint:
+            self._stored_endpoint = endpoint
+            self._store_capabilities(BACKEND_ENTRY, api_root=self.base_url, use_auth=self._use_auth)
+
+    def _endpoint(self, endpoint: str) -> tuple[str, dict[str, str]]:
+        """URL and headers for a request to the resolved API root."""
+        base = self._resolved_base_url or self.base_url
+        return f"{base}/{endpoint}", self._make_headers(include_auth=self._use_auth)
+
+    def _build_chat_request(
         self,
         messages: list[Message],
-        system: str | None = None,
-        tools: list[dict] | None = None,
-        temperature: float = 0.7,
-        max_tokens: int = 2048,
-    ) -> LLMResponse:
-        """Send chat completion request."""
-
+        system: str | None,
+        tools: list[dict] | None,
+        temperature: float,
+        max_tokens: int,
+        stream: bool = False,
+    ) -> dict:
+        """Build an OpenAI-format chat/completions request body."""
         # Convert messages to OpenAI format
         api_messages = []
 
@@ -311,8 +470,11 @@ class LMStudioClient(LLMClient):
             "messages": api_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "stream": False,
+            "stream": stream,
         }
+        if stream:
+            # Ask for the trailing usage chunk (telemetry token counts)
+            request_data["stream_options"] = {"include_usage": True}
 
         # Add tools if supported
         if tools and self.supports_tools:
@@ -327,8 +489,23 @@ class LMStudioClient(LLMClient):
                 }
                 for t in tools
             ]
+        return request_data
+
+    def chat(
+        self,
+        messages: list[Message],
+        system: str | None = None,
+        tools: list[dict] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+    ) -> LLMResponse:
+        """Send chat completion request."""
+        request_data = self._build_chat_request(
+            messages, system, tools, temperature, max_tokens,
+        )
 
         # Make request
+        timer = self._start_call()
         response = self._make_request("chat/completions", request_data)
 
         # Parse response
@@ -347,10 +524,78 @@ class LMStudioClient(LLMClient):
                     arguments=json.loads(tc["function"]["arguments"]),
                 ))
 
-        return LLMResponse(
+        prompt_tokens, completion_tokens = parse_usage(response)
+        result = LLMResponse(
             content=message.get("content") or "",
             tool_calls=tool_calls,
             finish_reason=choice.get("finish_reason", "stop"),
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+        )
+        timer.finish(result, messages, system)
+        return result
+
+    def chat_stream(
+        self,
+        messages: list[Message],
+        system: str | None = None,
+        tools: list[dict] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+    ) -> Iterator[StreamChunk]:
+        """Stream a chat completion over Server-Sent Events."""
+        request_data = self._build_chat_request(
+            messages, system, tools, temperature, max_tokens, stream=True,
+        )
+        accumulator = ChatStreamAccumulator()
+        timer = self._start_call()
+        with self._open_stream("chat/completions", request_data) as resp:
+            for event in iter_stream_events(resp):
+                if "error" in event:
+                    raise RuntimeError(self._extract_error_message(event))
+                timer.first_token()
+                text = accumulator.feed(event)
+                if text:
+                    yield StreamChunk(text=text)
+        response = accumulator.response()
+        timer.finish(response, messages, system)
+        yield StreamChunk(response=response)
+
+    def _open_stream(self, endpoint: str, data: dict):
+        """Open a streaming POST; the caller reads and closes the response."""
+        last_error: Exception | None = None
+        candidates = self._candidate_base_urls()
+        if self._resolved_base_url is not None:
+            candidates = list(dict.fromkeys([self._resolved_base_url, *candidates]))
+        body = json.dumps(data).encode("utf-8")
+        for candidate_base_url in candidates:
+            url = f"{candidate_base_url}/{endpoint}"
+            for include_auth in dict.fromkeys((self._use_auth, True)):
+                try:
+                    resp = self._pool.request(
+                        "POST",
+                        url,
+                        body=body,
+                        headers=self._make_headers(include_auth=include_auth),
+                        timeout=self.timeout,
+                    )
+                except urllib.error.HTTPError as e:
+                    last_error = e
+                    # Retry with auth only if the server explicitly denies us.
+                    if e.code in (401, 403) and not include_auth:
+                        continue
+                    break
+                except urllib.error.URLError as e:
+                    last_error = e
+                    break
+                self._use_auth = include_auth
+                self._resolve(candidate_base_url)
+                return resp
+
+        raise ConnectionError(
+            f"Cannot connect to LM Studio at {self.base_url}. "
+            f"Make sure LM Studio is running with a model loaded. "
+            f"Error: {last_error}"
         )
 
     def is_available(self, timeout: float = 1.0) -> bool:
@@ -363,9 +608,10 @@ class LMStudioClient(LLMClient):
         """
         # Quick connection test - only try the configured URL
         url = f"{self.base_url}/models"
-        req = urllib.request.Request(url, headers=self._make_headers(include_auth=False))
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
+            with self._pool.request(
+                "GET", url, headers=self._make_headers(include_auth=False), timeout=timeout,
+            ) as resp:
                 data = json.loads(resp.read().decode("utf-8"))
                 models = data.get("data", [])
                 return isinstance(models, list) and len(models) > 0
@@ -6,12 +6,20 @@ Supports tool calling with compatible models.
 """
 
 import json
-import urllib.request
+import os
+import time
 import urllib.error
 from urllib.parse import urlparse, urlunparse
-from typing import Any
+from typing import Any, Iterator
 
-from .base import LLMClient, LLMResponse, Message, ToolCall
+from .base import LLMClient, LLMResponse, Message, StreamChunk, ToolCall
+from .capabilities import BACKEND_ENTRY
+from .pool import get_connection_pool
+from .streaming import ChatStreamAccumulator, iter_stream_events, parse_usage
+
+# Context Ollama allocates when neither the model's num_ctx parameter nor
+# OLLAMA_CONTEXT_LENGTH set one (the OpenAI-compatible API can't pass it)
+OLLAMA_DEFAULT_CONTEXT = 4096
 
 
 class OllamaClient(LLMClient):
@@ -24,11 +32,14 @@ class OllamaClient(LLMClient):
     Tool calling support depends on the loaded model.
     """
 
+    capability_backend = "ollama"
+
     def __init__(
         self,
         base_url: str = "http://127.0.0.1:11434/v1",
         model: str | None = None,
         timeout: int = 120,
+        model_list_ttl: float = 30.0,
     ):
         """
         Initialize Ollama client.
@@ -37,11 +48,26 @@ class OllamaClient(LLMClient):
             base_url: Ollama API base URL
             model: Model name (e.g., "llama3.2", "mistral", "qwen2.5")
             timeout: Request timeout in seconds
+            model_list_ttl: Seconds a fetched model list is reused
         """
         self.base_url = base_url.rstrip("/")
+        self._configured_base_url = self.base_url  # Keys persisted probe results
         self._model = model
         self.timeout = timeout
         self._supports_tools: bool | None = None
+        self._context_lengths: dict[str, int | None] = {}
+        self._pool = get_connection_pool()
+        # Base URL that last answered; candidates are re-probed only when it
+        # stops accepting connections
+        self._resolved_base_url: str | None = None
+        self.model_list_ttl = model_list_ttl
+        self._models_cache: tuple[float, list[str]] | None = None
+
+        # API root found by an earlier run: skip the candidate walk
+        endpoint = self._stored_capabilities(BACKEND_ENTRY)
+        self._stored_endpoint = endpoint.get("api_root")
+        if endpoint.get("api_root"):
+            self._resolve(endpoint["api_root"])
 
     def _candidate_base_urls(self) -> list[str]:
         """Return base URL candidates (handles common localhost/IPv6 issues on Windows)."""
@@ -85,12 +111,18 @@ class OllamaClient(LLMClient):
         if self._supports_tools is not None:
             return self._supports_tools
 
+        model = self.model_name
+        stored = self._stored_capabilities(model).get("supports_tools")
+        if isinstance(stored, bool):
+            self._supports_tools = stored
+            return stored
+
         # Test with a simple tool call
         try:
             response = self._make_request(
                 "chat/completions",
                 {
-                    "model": self.model_name,
+                    "model": model,
                     "messages": [{"role": "user", "content": "test"}],
                     "tools": [{
                         "type": "function",
@@ -104,15 +136,78 @@ class OllamaClient(LLMClient):
                 },
             )
             self._supports_tools = True
+        except ConnectionError as e:
+            self._supports_tools = False
+            cause = e.__cause__
+            if isinstance(cause, urllib.error.URLError) and not isinstance(
+                cause, urllib.error.HTTPError
+            ):
+                return False  # Server unreachable; don't persist a guess
         except Exception:
             self._supports_tools = False
 
+        self._store_capabilities(model, supports_tools=self._supports_tools)
         return self._supports_tools
 
+    def get_context_length(self) -> int | None:
+        """Effective context length of the current model via `/api/show`.
+
+        Ollama runs a model at its `num_ctx` parameter if the Modelfile sets
+        one, else at OLLAMA_CONTEXT_LENGTH / the server default - not at the
+        architecture maximum in `model_info`, which only caps the result.
+        """
+        model = self.model_name
+        if model in self._context_lengths:
+            return self._context_lengths[model]
+        stored = self._stored_capabilities(model)
+        if "context_length" in stored:
+            self._context_lengths[model] = stored["context_length"]
+            return stored["context_length"]
+
+        root = self.base_url[: -len("/v1")] if self.base_url.endswith("/v1") else self.base_url
+        length: int | None = None
+        try:
+            with self._pool.request(
+                "POST",
+                f"{root}/api/show",
+                body=json.dumps({"model": model}).encode("utf-8"),
+                headers={"Content-Type": "application/json"},
+                timeout=min(self.timeout, 5),
+            ) as resp:
+                info = json.loads(resp.read().decode("utf-8"))
+            num_ctx = None
+            for line in (info.get("parameters") or "").splitlines():
+                parts = line.split()
+                if len(parts) == 2 and parts[0] == "num_ctx" and parts[1].isdigit():
+                    num_ctx = int(parts[1])
+            if num_ctx is None:
+                env = os.environ.get("OLLAMA_CONTEXT_LENGTH", "")
+                num_ctx = int(env) if env.isdigit() else OLLAMA_DEFAULT_CONTEXT
+            model_max = next(
+                (
+                    v for k, v in (info.get("model_info") or {}).items()
+                    if k.endswith(".context_length") and isinstance(v, int)
+                ),
+                None,
+            )
+            length = min(num_ctx, model_max) if model_max else num_ctx
+        except Exception:
+            length = None
+        self._context_lengths[model] = length
+        if length is not None:
+            self._store_capabilities(model, context_length=length)
+        return length
+
     def _get_models(self) -> list[str]:
-        """Get list of available models."""
+        """Get list of available models (cached for model_list_ttl seconds)."""
+        now = time.monotonic()
+        if self._models_cache is not None and now - self._models_cache[0] < self.model_list_ttl:
+            return list(self._models_cache[1])
+
         response = self._make_request("models", method="GET")
-        return [m["id"] for m in response.get("data", [])]
+        models = [m["id"] for m in response.get("data", [])]
+        self._models_cache = (now, models)
+        return list(models)
 
     def _make_request(
         self,
@@ -120,26 +215,50 @@ class OllamaClient(LLMClient):
         data: dict | None = None,
         method: str = "POST",
     ) -> dict:
-        """Make HTTP request to Ollama API."""
+        """
+        Make HTTP request to Ollama API.
+
+        Requests go straight to the resolved base URL over a pooled
+        keep-alive connection. The candidate URLs are walked only on first
+        use, or when the resolved URL refuses the connection.
+        """
+        resolved = self._resolved_base_url
+        if resolved is not None:
+            try:
+                return self._request_candidates([resolved], endpoint, data, method)
+            except ConnectionError as e:
+                if isinstance(e.__cause__, urllib.error.HTTPError):
+                    raise  # The server answered; probing elsewhere won't help
+                self._resolved_base_url = None
+        return self._request_candidates(
+            self._candidate_base_urls(), endpoint, data, method
+        )
+
+    def _request_candidates(
+        self,
+        candidates: list[str],
+        endpoint: str,
+        data: dict | None,
+        method: str,
+    ) -> dict:
+        """Send the request to each candidate base URL until one answers."""
         last_error: Exception | None = None
-        for candidate_base_url in self._candidate_base_urls():
+        for candidate_base_url in candidates:
             url = f"{candidate_base_url}/{endpoint}"
-
             if method == "GET":
-                req = urllib.request.Request(url)
+                body, headers = None, {}
             else:
-                req = urllib.request.Request(
-                    url,
-                    data=json.dumps(data).encode("utf-8") if data else None,
-                    headers={"Content-Type": "application/json"},
-                    method=method,
-                )
+                body = json.dumps(data).encode("utf-8") if data else None
+                headers = {"Content-Type": "application/json"}
 
             try:
-                with urllib.request.urlopen(req, timeout=self.timeout) as resp:
-                    self.base_url = candidate_base_url.rstrip("/")
-                    return json.loads(resp.read().decode("utf-8"))
-            except (urllib.error.HTTPError, urllib.error.URLError) as e:
+                with self._pool.request(
+                    method, url, body=body, headers=headers, timeout=self.timeout,
+                ) as resp:
+                    result = json.loads(resp.read().decode("utf-8"))
+                self._resolve(candidate_base_url)
+                return result
+            except urllib.error.URLError as e:
                 last_error = e
                 continue
 
@@ -147,18 +266,31 @@ class OllamaClient(LLMClient):
             f"Cannot connect to Ollama at {self.base_url}. "
             f"Make sure Ollama is running. "
             f"Error: {last_error}"
-        )
+        ) from last_error
 
-    def chat(
+    def _resolve(self, base_url: str) -> None:
+        """Remember the base URL that answered (persisted when it changes)."""
+        self.base_url = base_url.rstrip("/")
+        self._resolved_base_url = self.base_url
+        if self.base_url != self._stored_endpoint:
+            self._stored_endpoint = self.base_url
+            self._store_capabilities(BACKEND_ENTRY, api_root=self.base_url)
+
+    def _endpoint(self, endpoint: str) -> tuple[str, dict[str, str]]:
+        """URL and headers for a request to the resolved API root."""
+        base = self._resolved_base_url or self.base_url
+        return f"{base}/{endpoint}", {"Content-Type": "application/json"}
+
+    def _build_chat_request(
         self,
         messages: list[Message],
-        system: str | None = None,
-        tools: list[dict] | None = None,
-        temperature: float = 0.7,
-        max_tokens: int = 2048,
-    ) -> LLMResponse:
-        """Send chat completion request."""
-
+        system: str | None,
+        tools: list[dict] | None,
+        temperature: float,
+        max_tokens: int,
+        stream: bool = False,
+    ) -> dict:
+        """Build an OpenAI-format chat/completions request body."""
         # Convert messages to OpenAI format
         api_messages = []
 
@@ -202,6 +334,10 @@ class OllamaClient(LLMClient):
             "messages": api_messages,
             "temperature": temperature,
         }
+        if stream:
+            request_data["stream"] = True
+            # Ask for the trailing usage chunk (telemetry token counts)
+            request_data["stream_options"] = {"include_usage": True}
 
         # Add tools if supported
         if tools and self.supports_tools:
@@ -216,8 +352,23 @@ class OllamaClient(LLMClient):
                 }
                 for t in tools
             ]
+        return request_data
+
+    def chat(
+        self,
+        messages: list[Message],
+        system: str | None = None,
+        tools: list[dict] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+    ) -> LLMResponse:
+        """Send chat completion request."""
+        request_data = self._build_chat_request(
+            messages, system, tools, temperature, max_tokens,
+        )
 
         # Make request
+        timer = self._start_call()
         response = self._make_request("chat/completions", request_data)
 
         # Parse response
@@ -233,10 +384,69 @@ class OllamaClient(LLMClient):
                     arguments=json.loads(tc["function"]["arguments"]),
                 ))
 
-        return LLMResponse(
+        prompt_tokens, completion_tokens = parse_usage(response)
+        result = LLMResponse(
             content=message.get("content") or "",
             tool_calls=tool_calls,
             finish_reason=choice.get("finish_reason", "stop"),
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+        )
+        timer.finish(result, messages, system)
+        return result
+
+    def chat_stream(
+        self,
+        messages: list[Message],
+        system: str | None = None,
+        tools: list[dict] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+    ) -> Iterator[StreamChunk]:
+        """Stream a chat completion (SSE from /v1, NDJSON from native routes)."""
+        request_data = self._build_chat_request(
+            messages, system, tools, temperature, max_tokens, stream=True,
+        )
+        accumulator = ChatStreamAccumulator()
+        timer = self._start_call()
+        with self._open_stream("chat/completions", request_data) as resp:
+            for event in iter_stream_events(resp):
+                if "error" in event:
+                    raise RuntimeError(f"Ollama error: {event['error']}")
+                timer.first_token()
+                text = accumulator.feed(event)
+                if text:
+                    yield StreamChunk(text=text)
+        response = accumulator.response()
+        timer.finish(response, messages, system)
+        yield StreamChunk(response=response)
+
+    def _open_stream(self, endpoint: str, data: dict):
+        """Open a streaming POST; the caller reads and closes the response."""
+        last_error: Exception | None = None
+        candidates = self._candidate_base_urls()
+        if self._resolved_base_url is not None:
+            candidates = list(dict.fromkeys([self._resolved_base_url, *candidates]))
+        body = json.dumps(data).encode("utf-8")
+        for candidate_base_url in candidates:
+            try:
+                resp = self._pool.request(
+                    "POST",
+                    f"{candidate_base_url}/{endpoint}",
+                    body=body,
+                    headers={"Content-Type": "application/json"},
+                    timeout=self.timeout,
+                )
+            except urllib.error.URLError as e:
+                last_error = e
+                continue
+            self._resolve(candidate_base_url)
+            return resp
+
+        raise ConnectionError(
+            f"Cannot connect to Ollama at {self.base_url}. "
+            f"Make sure Ollama is running. "
+            f"Error: {last_error}"
         )
 
     def is_available(self, timeout: float = 1.0) -> bool:
@@ -249,9 +459,8 @@ class OllamaClient(LLMClient):
         """
         # Quick connection test - only try the configured URL
         url = f"{self.base_url}/models"
-        req = urllib.request.Request(url)
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
+            with self._pool.request("GET", url, timeout=timeout) as resp:
                 data = json.loads(resp.read().decode("utf-8"))
                 models = data.get("data", [])
                 return isinstance(models, list) and len(models) > 0
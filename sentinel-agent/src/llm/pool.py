@@ -0,0 +1,194 @@
+"""
+Keep-alive HTTP connection pool for local backends.
+
+urllib opens (and tears down) a TCP connection per request. Against a local
+LM Studio / Ollama server that handshake dominates small requests, so the
+clients send everything through a shared pool of persistent http.client
+connections instead.
+
+Errors are raised as urllib.error.HTTPError / URLError so callers keep the
+error handling they had with urlopen().
+"""
+
+import http.client
+import io
+import threading
+import urllib.error
+from urllib.parse import urlsplit
+
+# Idle connections kept per (scheme, host, port)
+MAX_IDLE_PER_HOST = 4
+
+# Failures that mean a reused keep-alive connection was closed by the server
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+    ConnectionAbortedError,
+)
+
+
+class PooledResponse:
+    """
+    An HTTP response whose connection goes back to the pool when closed.
+
+    Iterates the body line by line (for streaming) or read() returns all of
+    it. Use as a context manager.
+    """
+
+    def __init__(self, pool: "ConnectionPool", key: tuple, conn, response):
+        self._pool = pool
+        self._key = key
+        self._conn = conn
+        self._response = response
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+
+    def read(self, amt: int | None = None) -> bytes:
+        return self._response.read(amt)
+
+    def readline(self) -> bytes:
+        return self._response.readline()
+
+    def __iter__(self):
+        while True:
+            line = self._response.readline()
+            if not line:
+                return
+            yield line
+
+    def close(self) -> None:
+        """Release the connection: reused if the body was fully read."""
+        if self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        if self._response.isclosed() and not self._response.will_close:
+            self._pool._release(self._key, conn)
+        else:
+            self._response.close()
+            conn.close()
+
+    def __enter__(self) -> "PooledResponse":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of persistent HTTP connections, keyed by host.
+
+    Usage:
+        with get_connection_pool().request("GET", url, timeout=5) as resp:
+            data = json.loads(resp.read())
+    """
+
+    def __init__(self, max_idle_per_host: int = MAX_IDLE_PER_HOST):
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float = 120,
+    ) -> PooledResponse:
+        """
+        Send a request and return the open response.
+
+        Raises:
+            urllib.error.HTTPError: Status >= 400 (body already read)
+            urllib.error.URLError: Connection failed
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme or "http", parts.hostname or "127.0.0.1", parts.port)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        conn, reused = self._acquire(key, timeout)
+        try:
+            response = self._send(conn, method, target, body, headers or {})
+        except _STALE_ERRORS as e:
+            conn.close()
+            if not reused:
+                raise urllib.error.URLError(e) from e
+            # The server dropped an idle keep-alive connection; retry fresh
+            conn, _ = self._acquire(key, timeout, fresh=True)
+            try:
+                response = self._send(conn, method, target, body, headers or {})
+            except (OSError, http.client.HTTPException) as e2:
+                conn.close()
+                raise urllib.error.URLError(e2) from e2
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise urllib.error.URLError(e) from e
+
+        pooled = PooledResponse(self, key, conn, response)
+        if response.status >= 400:
+            payload = pooled.read()
+            pooled.close()
+            raise urllib.error.HTTPError(
+                url, response.status, response.reason, response.headers,
+                io.BytesIO(payload),
+            )
+        return pooled
+
+    def clear(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _send(self, conn, method, target, body, headers):
+        conn.request(method, target, body=body, headers=headers)
+        return conn.getresponse()
+
+    def _acquire(self, key: tuple, timeout: float, fresh: bool = False):
+        """An idle connection for key (reused=True) or a new one."""
+        if not fresh:
+            with self._lock:
+                conns = self._idle.get(key)
+                conn = conns.pop() if conns else None
+            if conn is not None:
+                conn.timeout = timeout
+                try:
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+                except OSError:
+                    conn.close()  # Socket already gone; fall through to a new one
+
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def _release(self, key: tuple, conn) -> None:
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < self.max_idle_per_host:
+                conns.append(conn)
+                return
+        conn.close()
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> ConnectionPool:
+    """Get the process-wide connection pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool()
+        return _pool
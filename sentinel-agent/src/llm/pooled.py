@@ -0,0 +1,374 @@
+"""
+Failover and load balancing across several local backends.
+
+PooledLLMClient wraps a list of LLMClients (e.g. LM Studio on two boxes)
+behind the ordinary LLMClient interface:
+
+- Routing: each request goes to the member with the fewest requests in
+  flight, ties broken by configuration order.
+- Circuit breaker: after `failure_threshold` consecutive failures a member
+  is skipped for `reset_after` seconds; then a background health check
+  (or, if nothing else is up, one trial request) decides whether it is
+  back.
+- Hedging: if the chosen member hasn't produced its first token within
+  `hedge_after` seconds, the same request is also sent to the next member
+  and whichever starts answering first is used. The loser's stream is
+  abandoned and its connection closed.
+- Failover: a request that fails before producing output is retried on
+  the next member.
+
+Members are expected to serve the same model; model name, tool support
+and context length are taken from the first member that is up.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator
+
+from .base import LLMClient, LLMResponse, Message, StreamChunk
+
+
+@dataclass
+class _Member:
+    """A pooled client and its routing state."""
+    client: LLMClient
+    index: int
+    outstanding: int = 0
+    failures: int = 0  # Consecutive
+    open_until: float = 0.0  # Circuit open (skipped) until this monotonic time
+    checking: bool = False  # Background health check in flight
+
+    @property
+    def name(self) -> str:
+        return getattr(self.client, "base_url", None) or f"member-{self.index}"
+
+
+class PooledLLMClient(LLMClient):
+    """
+    LLMClient that spreads requests over several backends.
+
+    Usage:
+        client = PooledLLMClient([
+            LMStudioClient(base_url="http://box1:1234/v1"),
+            LMStudioClient(base_url="http://box2:1234/v1"),
+        ], hedge_after=0.8)
+        response = client.chat([Message(role="user", content="...")])
+    """
+
+    def __init__(
+        self,
+        clients: list[LLMClient],
+        hedge_after: float | None = 1.0,
+        failure_threshold: int = 3,
+        reset_after: float = 30.0,
+        health_timeout: float = 0.5,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            clients: Member clients, in order of preference
+            hedge_after: Seconds to wait for a first token before also
+                asking another member (None disables hedging)
+            failure_threshold: Consecutive failures that open a member's
+                circuit
+            reset_after: Seconds an open circuit stays open before the
+                member is health-checked again
+            health_timeout: Timeout for is_available() health checks
+        """
+        if not clients:
+            raise ValueError("PooledLLMClient needs at least one client")
+        self.members = [_Member(client, i) for i, client in enumerate(clients)]
+        self.hedge_after = hedge_after
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.health_timeout = health_timeout
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(4, 2 * len(clients)), thread_name_prefix="llm-pool",
+        )
+
+    # -------------------------------------------------------------------------
+    # LLMClient interface
+    # -------------------------------------------------------------------------
+
+    @property
+    def primary(self) -> LLMClient:
+        """First member whose circuit is closed (or the first member)."""
+        now = time.monotonic()
+        with self._lock:
+            for member in self.members:
+                if member.open_until <= now:
+                    return member.client
+        return self.members[0].client
+
+    @property
+    def model_name(self) -> str:
+        return self.primary.model_name
+
+    @property
+    def supports_tools(self) -> bool:
+        return self.primary.supports_tools
+
+    @property
+    def base_url(self) -> str:
+        return ", ".join(m.name for m in self.members)
+
+    def get_context_length(self) -> int | None:
+        return self.primary.get_context_length()
+
+    def chat(
+        self,
+        messages: list[Message],
+        system: str | None = None,
+        tools: list[dict] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+    ) -> LLMResponse:
+        """Send a chat request to the pool (hedged, with failover)."""
+        response = None
+        for chunk in self.chat_stream(
+            messages, system=system, tools=tools,
+            temperature=temperature, max_tokens=max_tokens,
+        ):
+            if chunk.response is not None:
+                response = chunk.response
+        return response or LLMResponse(content="")
+
+    def chat_stream(
+        self,
+        messages: list[Message],
+        system: str | None = None,
+        tools: list[dict] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+    ) -> Iterator[StreamChunk]:
+        """
+        Stream from whichever member starts answering first.
+
+        Until a member produces its first chunk the request can be hedged
+        to, or fail over to, other members. After that the stream is
+        committed to that member; a failure mid-stream is raised.
+        """
+        kwargs = {
+            "system": system, "tools": tools,
+            "temperature": temperature, "max_tokens": max_tokens,
+        }
+        events: queue.Queue = queue.Queue()
+        attempts: dict[int, threading.Event] = {}  # attempt id -> cancel flag
+        tried: set[int] = set()
+        last_error: Exception | None = None
+        winner: int | None = None
+
+        def launch() -> bool:
+            member = self._route(exclude=tried)
+            if member is None:
+                return False
+            tried.add(member.index)
+            cancel = threading.Event()
+            attempts[member.index] = cancel
+            self._executor.submit(self._run_attempt, member, messages, kwargs, events, cancel)
+            return True
+
+        if not launch():
+            raise ConnectionError("No LLM backend in the pool is available")
+
+        try:
+            hedge_deadline = (
+                time.monotonic() + self.hedge_after if self.hedge_after is not None else None
+            )
+            while winner is None:
+                timeout = None
+                if hedge_deadline is not None:
+                    timeout = max(0.0, hedge_deadline - time.monotonic())
+                try:
+                    index, kind, payload = events.get(timeout=timeout)
+                except queue.Empty:
+                    # Slow first token: also ask another member (once)
+                    launch()
+                    hedge_deadline = None
+                    continue
+
+                if kind == "error":
+                    attempts.pop(index, None)
+                    last_error = payload
+                    if not attempts and not launch():
+                        raise last_error
+                    continue
+                if kind == "done":
+                    # Finished without output (empty stream): nothing to wait for
+                    attempts.pop(index, None)
+                    if not attempts:
+                        return
+                    continue
+                if kind == "chunk":
+                    winner = index
+                    for other, cancel in attempts.items():
+                        if other != winner:
+                            cancel.set()
+                    yield payload
+                    if payload.response is not None:
+                        return
+
+            while True:
+                index, kind, payload = events.get()
+                if index != winner:
+                    continue  # Stragglers from abandoned attempts
+                if kind == "error":
+                    raise payload
+                if kind == "done":
+                    return
+                yield payload
+                if payload.response is not None:
+                    return
+        finally:
+            for cancel in attempts.values():
+                cancel.set()
+
+    def parallel_slots(self) -> int | None:
+        """Sequences the pool serves at once: each member's slots (or one)."""
+        return sum(member.client.parallel_slots() or 1 for member in self.members)
+
+    def is_available(self, timeout: float = 1.0) -> bool:
+        """True if any member is available."""
+        return any(self._check(member, timeout) for member in self.members)
+
+    def list_models(self) -> list[str]:
+        """Models of the primary member."""
+        list_models = getattr(self.primary, "list_models", None)
+        return list_models() if list_models else [self.model_name]
+
+    def set_model(self, model: str) -> None:
+        """Set the model on every member."""
+        for member in self.members:
+            if hasattr(member.client, "set_model"):
+                member.client.set_model(model)
+
+    def get_model_info(self) -> dict:
+        """Model info of the primary member, plus per-member pool state."""
+        get_info = getattr(self.primary, "get_model_info", None)
+        info = get_info() if get_info else {"available": True, "model": self.model_name}
+        info["pool"] = self.stats()
+        return info
+
+    def stats(self) -> list[dict]:
+        """Routing state of each member."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "backend": m.name,
+                    "outstanding": m.outstanding,
+                    "failures": m.failures,
+                    "circuit": "open" if m.open_until > now else "closed",
+                }
+                for m in self.members
+            ]
+
+    def close(self) -> None:
+        """Stop the worker threads (in-flight attempts finish first)."""
+        self._executor.shutdown(wait=False)
+
+    # -------------------------------------------------------------------------
+    # Routing and health
+    # -------------------------------------------------------------------------
+
+    def _route(self, exclude: set[int]) -> _Member | None:
+        """Least-outstanding member with a closed circuit, else a trial."""
+        now = time.monotonic()
+        with self._lock:
+            candidates = [m for m in self.members if m.index not in exclude]
+            closed = [m for m in candidates if m.open_until <= now]
+            if closed:
+                chosen = min(closed, key=lambda m: (m.outstanding, m.index))
+            elif candidates:
+                # Everything is down: trial request to the one open longest
+                chosen = min(candidates, key=lambda m: (m.open_until, m.index))
+            else:
+                return None
+            chosen.outstanding += 1
+        return chosen
+
+    def _run_attempt(
+        self,
+        member: _Member,
+        messages: list[Message],
+        kwargs: dict,
+        events: queue.Queue,
+        cancel: threading.Event,
+    ) -> None:
+        """Stream one member's answer into events until done or cancelled."""
+        stream = None
+        try:
+            stream = member.client.chat_stream(messages, **kwargs)
+            for chunk in stream:
+                if cancel.is_set():
+                    break
+                events.put((member.index, "chunk", chunk))
+            self._record(member, ok=True)
+            events.put((member.index, "done", None))
+        except Exception as e:
+            self._record(member, ok=False)
+            events.put((member.index, "error", e))
+        finally:
+            if stream is not None and hasattr(stream, "close"):
+                stream.close()  # Abandoned streams release their connection
+            with self._lock:
+                member.outstanding -= 1
+
+    def _record(self, member: _Member, ok: bool) -> None:
+        """Update the member's circuit after a request."""
+        with self._lock:
+            if ok:
+                member.failures = 0
+                member.open_until = 0.0
+                return
+            member.failures += 1
+            if member.failures >= self.failure_threshold:
+                member.open_until = time.monotonic() + self.reset_after
+                start_check = not member.checking
+                member.checking = True
+            else:
+                start_check = False
+        if start_check:
+            threading.Thread(
+                target=self._health_loop, args=(member,),
+                name=f"llm-pool-health-{member.index}", daemon=True,
+            ).start()
+
+    def _health_loop(self, member: _Member) -> None:
+        """While a member's circuit is open, health-check it each reset period."""
+        try:
+            while True:
+                with self._lock:
+                    wait = member.open_until - time.monotonic()
+                    if member.open_until == 0.0:
+                        return  # Closed by a successful request meanwhile
+                if wait > 0:
+                    time.sleep(wait)
+                if self._check(member, self.health_timeout):
+                    with self._lock:
+                        member.failures = 0
+                        member.open_until = 0.0
+                    return
+                with self._lock:
+                    member.open_until = time.monotonic() + self.reset_after
+        finally:
+            with self._lock:
+                member.checking = False
+
+    def _check(self, member: _Member, timeout: float) -> bool:
+        """Health check: the member's is_available(), if it has one."""
+        is_available = getattr(member.client, "is_available", None)
+        if is_available is None:
+            return True
+        try:
+            try:
+                return bool(is_available(timeout=timeout))
+            except TypeError:
+                return bool(is_available())
+        except Exception:
+            return False
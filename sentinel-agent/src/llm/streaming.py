@@ -0,0 +1,342 @@
+"""
+Streaming response parsing for local backends.
+
+LM Studio and Ollama's OpenAI-compatible endpoints stream Server-Sent
+Events (`data: {...}` lines, terminated by `data: [DONE]`); Ollama's
+native API streams newline-delimited JSON. Both are reduced here to the
+same thing: text deltas as they arrive, then one complete LLMResponse.
+"""
+
+import json
+from typing import Iterable, Iterator
+
+from .base import LLMResponse, ToolCall
+from .skills import ParsedSkill, parse_skills
+
+
+class StreamDecoder:
+    """
+    Incremental SSE / NDJSON decoder: feed body lines, get JSON events.
+
+    The format comes from the Content-Type if it names one, else from the
+    first non-empty line (`data:` means SSE). Handles multi-line `data:`
+    fields, comment lines and the OpenAI `[DONE]` sentinel; payloads that
+    aren't JSON objects are skipped.
+    """
+
+    def __init__(self, content_type: str = ""):
+        content_type = content_type.lower()
+        self._sse: bool | None = None
+        if "event-stream" in content_type:
+            self._sse = True
+        elif "ndjson" in content_type:
+            self._sse = False
+        self._data_lines: list[str] = []
+        self.done = False  # [DONE] seen
+
+    def feed(self, raw: bytes) -> dict | None:
+        """Consume one body line; returns the event it completes, if any."""
+        if self.done:
+            return None
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        if self._sse is None:
+            if not line.strip():
+                return None
+            self._sse = line.lstrip().startswith("data:")
+        if not self._sse:
+            return _json_object(line.strip())
+
+        if not line:
+            # Blank line ends an event
+            return self._dispatch()
+        if line.startswith(":"):
+            return None  # Comment / keep-alive
+        if line.startswith("data:"):
+            value = line[5:].removeprefix(" ")
+            if value == "[DONE]":
+                self.done = True
+                return self._dispatch()
+            self._data_lines.append(value)
+        return None
+
+    def flush(self) -> dict | None:
+        """End of body: the last event, if it was never terminated."""
+        return self._dispatch() if self._sse else None
+
+    def _dispatch(self) -> dict | None:
+        payload = "\n".join(self._data_lines)
+        self._data_lines.clear()
+        return _json_object(payload)
+
+
+def _json_object(payload: str) -> dict | None:
+    if not payload:
+        return None
+    try:
+        event = json.loads(payload)
+    except json.JSONDecodeError:
+        return None
+    return event if isinstance(event, dict) else None
+
+
+def _decode(decoder: StreamDecoder, lines: Iterable[bytes]) -> Iterator[dict]:
+    for raw in lines:
+        event = decoder.feed(raw)
+        if event is not None:
+            yield event
+        if decoder.done:
+            return
+    event = decoder.flush()
+    if event is not None:
+        yield event
+
+
+def iter_sse_data(lines: Iterable[bytes]) -> Iterator[dict]:
+    """Parse Server-Sent Events into JSON payloads, up to `[DONE]`."""
+    return _decode(StreamDecoder("text/event-stream"), lines)
+
+
+def iter_ndjson(lines: Iterable[bytes]) -> Iterator[dict]:
+    """Parse newline-delimited JSON objects, skipping blank or broken lines."""
+    return _decode(StreamDecoder("application/x-ndjson"), lines)
+
+
+def iter_stream_events(resp) -> Iterator[dict]:
+    """Parse an HTTP response body as SSE or NDJSON (see StreamDecoder)."""
+    return _decode(StreamDecoder(resp.headers.get("Content-Type") or ""), resp)
+
+
+def parse_usage(event: dict) -> tuple[int | None, int | None]:
+    """
+    (prompt_tokens, completion_tokens) reported in a response or event.
+
+    Reads an OpenAI `usage` object or Ollama's native prompt_eval_count /
+    eval_count; (None, None) when the backend reported neither.
+    """
+    usage = event.get("usage")
+    if isinstance(usage, dict):
+        return usage.get("prompt_tokens"), usage.get("completion_tokens")
+    if "eval_count" in event or "prompt_eval_count" in event:
+        return event.get("prompt_eval_count"), event.get("eval_count")
+    return None, None
+
+
+class ChatStreamAccumulator:
+    """
+    Folds streamed chat events into text deltas and a final LLMResponse.
+
+    Understands OpenAI chat.completion.chunk events (content deltas and
+    indexed tool-call fragments, plus the trailing `usage` chunk) and
+    Ollama native /api/chat events.
+    """
+
+    def __init__(self):
+        self._content: list[str] = []
+        self._tool_parts: dict[int, dict] = {}
+        self._tool_calls: list[ToolCall] = []
+        self.finish_reason = "stop"
+        self.done = False
+        self.prompt_tokens: int | None = None
+        self.completion_tokens: int | None = None
+
+    def feed(self, event: dict) -> str:
+        """Consume one event; returns the text it adds (may be "")."""
+        prompt_tokens, completion_tokens = parse_usage(event)
+        if completion_tokens is not None:
+            self.prompt_tokens = prompt_tokens
+            self.completion_tokens = completion_tokens
+        if "choices" in event:
+            return self._feed_openai(event)
+        if "message" in event or "done" in event:
+            return self._feed_ollama(event)
+        return ""
+
+    def _feed_openai(self, event: dict) -> str:
+        choices = event.get("choices") or []
+        if not choices:
+            return ""
+        choice = choices[0]
+        # A server that ignored stream=true sends the whole message at once
+        delta = choice.get("delta") or choice.get("message") or {}
+        for fragment in delta.get("tool_calls") or []:
+            index = fragment.get("index", len(self._tool_parts))
+            part = self._tool_parts.setdefault(
+                index, {"id": "", "name": "", "arguments": ""},
+            )
+            if fragment.get("id"):
+                part["id"] = fragment["id"]
+            function = fragment.get("function") or {}
+            if function.get("name"):
+                part["name"] += function["name"]
+            if function.get("arguments"):
+                part["arguments"] += function["arguments"]
+        if choice.get("finish_reason"):
+            self.finish_reason = choice["finish_reason"]
+            self.done = True
+        text = delta.get("content") or ""
+        if text:
+            self._content.append(text)
+        return text
+
+    def _feed_ollama(self, event: dict) -> str:
+        message = event.get("message") or {}
+        for tc in message.get("tool_calls") or []:
+            function = tc.get("function") or {}
+            arguments = function.get("arguments") or {}
+            if isinstance(arguments, str):
+                arguments = json.loads(arguments) if arguments else {}
+            self._tool_calls.append(ToolCall(
+                id=tc.get("id") or f"call_{len(self._tool_calls)}",
+                name=function.get("name", ""),
+                arguments=arguments,
+            ))
+        if event.get("done"):
+            self.finish_reason = event.get("done_reason") or "stop"
+            self.done = True
+        text = message.get("content") or ""
+        if text:
+            self._content.append(text)
+        return text
+
+    def response(self) -> LLMResponse:
+        """The complete response assembled from everything fed so far."""
+        tool_calls = list(self._tool_calls)
+        for index in sorted(self._tool_parts):
+            part = self._tool_parts[index]
+            tool_calls.append(ToolCall(
+                id=part["id"] or f"call_{index}",
+                name=part["name"],
+                arguments=json.loads(part["arguments"]) if part["arguments"] else {},
+            ))
+        return LLMResponse(
+            content="".join(self._content),
+            tool_calls=tool_calls,
+            finish_reason=self.finish_reason,
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+        )
+
+
+# Openers of the skill formats parsed by skills.parse_skills, with closers
+SKILL_TAGS = (
+    ("<tool>", "</tool>"),
+    ("[TOOL:", ")]"),
+    ("```tool", "```"),
+)
+
+
+class SkillTagBuffer:
+    """
+    Incremental skill-tag parser for streamed text.
+
+    Text is released for display as soon as it can't be the start of a
+    skill tag; a tag is swallowed whole, since it gets stripped from the
+    final reply. Each tag is parsed the moment its closer arrives, so the
+    tool loop can start it while the model is still generating
+    (take_skills()).
+
+    With stop_after_tags, prose that resumes after a tag ends the round:
+    the model wrote it without the tool results, and it would be thrown
+    away next round anyway. `stopped` tells the caller to cancel the rest
+    of the generation; `content` is the reply up to the end of the last tag.
+    """
+
+    def __init__(self, stop_after_tags: bool = False):
+        self.stop_after_tags = stop_after_tags
+        self.stopped = False
+        self._pending = ""
+        self._opener = ""
+        self._closer: str | None = None
+        self._raw = ""  # Everything fed
+        self._tags_closed = 0
+        self._last_tag_end = 0  # Offset in _raw just past the last closer
+        self._skills: list[ParsedSkill] = []
+
+    @property
+    def content(self) -> str:
+        """The raw reply so far (cut after the last tag once stopped)."""
+        return self._raw[:self._last_tag_end] if self.stopped else self._raw
+
+    def feed(self, text: str) -> str:
+        """Add streamed text; returns what is safe to display now."""
+        if self.stopped:
+            return ""
+        self._raw += text
+        self._pending += text
+        out: list[str] = []
+        while self._pending:
+            if self._closer is not None:
+                end = self._pending.find(self._closer)
+                if end < 0:
+                    break
+                end += len(self._closer)
+                self._tags_closed += 1
+                self._last_tag_end = self._offset + end
+                self._skills.extend(parse_skills(self._opener + self._pending[:end]))
+                self._pending = self._pending[end:]
+                self._closer = None
+                continue
+
+            start, opener, closer = self._find_opener()
+            if start >= 0:
+                if not self._release(self._pending[:start], out):
+                    break
+                # The opener as written (tags match case-insensitively)
+                self._opener = self._pending[start:start + len(opener)]
+                self._closer = closer
+                self._pending = self._pending[start + len(opener):]
+                continue
+
+            # Hold back a tail that could still grow into an opener
+            hold = self._partial_opener_length()
+            cut = len(self._pending) - hold
+            if self._release(self._pending[:cut], out):
+                self._pending = self._pending[cut:]
+            break
+        return "".join(out)
+
+    def take_skills(self) -> list[ParsedSkill]:
+        """Skills whose tags closed since the last call, in reply order."""
+        skills, self._skills = self._skills, []
+        return skills
+
+    def flush(self) -> str:
+        """End of stream: release held text that never became a tag."""
+        text = "" if self._closer is not None or self.stopped else self._pending
+        self._pending = ""
+        self._closer = None
+        return text
+
+    def _release(self, text: str, out: list[str]) -> bool:
+        """Queue text for display; False (and stop) if it is prose after a tag."""
+        if self.stop_after_tags and self._tags_closed and text.strip():
+            self.stopped = True
+            self._pending = ""
+            return False
+        out.append(text)
+        return True
+
+    @property
+    def _offset(self) -> int:
+        """Where _pending starts in _raw."""
+        return len(self._raw) - len(self._pending)
+
+    def _find_opener(self) -> tuple[int, str, str]:
+        best, best_opener, best_closer = -1, "", ""
+        lowered = self._pending.lower()
+        for opener, closer in SKILL_TAGS:
+            index = lowered.find(opener.lower())
+            if index >= 0 and (best < 0 or index < best):
+                best, best_opener, best_closer = index, opener, closer
+        return best, best_opener, best_closer
+
+    def _partial_opener_length(self) -> int:
+        lowered = self._pending.lower()
+        longest = 0
+        for opener, _ in SKILL_TAGS:
+            opener = opener.lower()
+            for size in range(min(len(opener) - 1, len(lowered)), 0, -1):
+                if lowered.endswith(opener[:size]):
+                    longest = max(longest, size)
+                    break
+        return longest
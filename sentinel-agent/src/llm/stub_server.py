@@ -0,0 +1,324 @@
+"""
+Deterministic local LLM server for tests and benchmarks.
+
+Speaks enough of the OpenAI-compatible API (what LM Studio serves) and
+Ollama's native API for the real HTTP clients to run against it without a
+GPU:
+
+- GET  /v1/models, POST /v1/chat/completions (SSE or JSON, tool calls, usage)
+- GET  /api/tags, POST /api/chat (NDJSON or JSON), POST /api/show
+- GET  /api/v0/models (LM Studio context length), GET /props (slots)
+
+Replies are a pure function of the request, so runs are repeatable: the
+text is drawn from a fixed vocabulary seeded by a hash of the messages.
+Timing is configurable: `latency` before the first token, then
+`tokens_per_sec`.
+
+Usage:
+    with StubLLMServer(latency=0.05, tokens_per_sec=200) as stub:
+        client = LMStudioClient(base_url=stub.openai_url)
+
+    python -m src.llm.stub_server --port 1234 --latency 0.2 --tps 40
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+VOCABULARY = (
+    "the signal fades as rain hits the checkpoint glass while nexus drones "
+    "sweep the lower market and your contact from ember waits beside a "
+    "burned out transit car counting minutes on a cracked display she "
+    "says the convoy moves at dawn and the witnesses already know"
+).split()
+
+
+@dataclass
+class StubConfig:
+    """What the stub answers and how fast."""
+    model: str = "stub-model"
+    latency: float = 0.0  # Seconds before the first token
+    tokens_per_sec: float = 0.0  # 0 = no pacing
+    reply_tokens: int = 48
+    context_length: int = 16384
+    slots: int | None = None  # Reported as /props total_slots
+    tool_name: str | None = None  # Call this tool (if offered) before answering
+    tool_args: dict | None = None
+
+
+def reply_text(messages: list[dict], n_tokens: int) -> str:
+    """The deterministic reply to a conversation."""
+    seed = hashlib.blake2b(
+        json.dumps(messages, sort_keys=True).encode("utf-8"), digest_size=8,
+    ).digest()
+    start = int.from_bytes(seed, "big")
+    words = [VOCABULARY[(start + i * 7) % len(VOCABULARY)] for i in range(n_tokens)]
+    return " ".join(words).capitalize() + "."
+
+
+def _prompt_tokens(messages: list[dict]) -> int:
+    return sum(len(str(m.get("content") or "").split()) for m in messages)
+
+
+class StubLLMServer:
+    """
+    The stub on a background thread (port 0 picks a free port).
+
+    Records each request path in `requests` for assertions.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, **config):
+        self.config = StubConfig(**config)
+        self.requests: list[str] = []
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def openai_url(self) -> str:
+        """Base URL for LMStudioClient / OllamaClient."""
+        return f"{self.url}/v1"
+
+    def start(self) -> "StubLLMServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="stub-llm", daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Replies
+    # -------------------------------------------------------------------------
+
+    def answer(self, request: dict) -> tuple[list[str], list[dict]]:
+        """(text tokens, tool calls) for a chat request."""
+        config = self.config
+        messages = request.get("messages") or []
+        offered = {
+            (t.get("function") or t).get("name") for t in request.get("tools") or []
+        }
+        last_role = messages[-1].get("role") if messages else None
+        if config.tool_name in offered and last_role != "tool":
+            return [], [{"name": config.tool_name, "arguments": config.tool_args or {}}]
+        text = reply_text(messages, config.reply_tokens)
+        tokens = text.split(" ")
+        return [t if i == 0 else f" {t}" for i, t in enumerate(tokens)], []
+
+    def pace(self, first: bool) -> None:
+        """Sleep for the first-token latency, or one token's worth."""
+        config = self.config
+        if first and config.latency:
+            time.sleep(config.latency)
+        elif not first and config.tokens_per_sec:
+            time.sleep(1.0 / config.tokens_per_sec)
+
+
+def _make_handler(stub: StubLLMServer):
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive, as real servers do
+        disable_nagle_algorithm = True  # Headers and body go out separately
+
+        def log_message(self, *args):
+            pass
+
+        # --- plumbing ---------------------------------------------------------
+
+        def _json(self, status: int, payload: dict) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _start_chunked(self, content_type: str) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+
+        def _chunk(self, data: bytes) -> None:
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+
+        def _body(self) -> dict:
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                data = json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                return {}
+            return data if isinstance(data, dict) else {}
+
+        # --- routes -----------------------------------------------------------
+
+        def do_GET(self):
+            stub.requests.append(self.path)
+            config = stub.config
+            if self.path == "/v1/models":
+                self._json(200, {"object": "list", "data": [{"id": config.model}]})
+            elif self.path == "/api/tags":
+                self._json(200, {"models": [{"name": config.model, "model": config.model}]})
+            elif self.path == "/api/v0/models":
+                self._json(200, {"data": [{
+                    "id": config.model, "loaded_context_length": config.context_length,
+                }]})
+            elif self.path == "/props" and config.slots:
+                self._json(200, {"total_slots": config.slots})
+            else:
+                self._json(404, {"error": f"no route for {self.path}"})
+
+        def do_POST(self):
+            stub.requests.append(self.path)
+            request = self._body()
+            if self.path == "/v1/chat/completions":
+                self._openai_chat(request)
+            elif self.path == "/api/chat":
+                self._ollama_chat(request)
+            elif self.path == "/api/show":
+                self._json(200, {
+                    "parameters": f"num_ctx {stub.config.context_length}",
+                    "model_info": {"stub.context_length": stub.config.context_length},
+                })
+            else:
+                self._json(404, {"error": f"no route for {self.path}"})
+
+        def _openai_chat(self, request: dict) -> None:
+            tokens, tool_calls = stub.answer(request)
+            prompt_tokens = _prompt_tokens(request.get("messages") or [])
+            usage = {"prompt_tokens": prompt_tokens, "completion_tokens": max(len(tokens), 1)}
+            finish = "tool_calls" if tool_calls else "stop"
+            openai_calls = [
+                {
+                    "index": i, "id": f"call_{i}", "type": "function",
+                    "function": {"name": c["name"], "arguments": json.dumps(c["arguments"])},
+                }
+                for i, c in enumerate(tool_calls)
+            ]
+
+            if not request.get("stream"):
+                stub.pace(first=True)
+                for _ in tokens[1:]:
+                    stub.pace(first=False)
+                message = {"role": "assistant", "content": "".join(tokens)}
+                if openai_calls:
+                    message["tool_calls"] = openai_calls
+                self._json(200, {
+                    "object": "chat.completion",
+                    "model": stub.config.model,
+                    "choices": [{"index": 0, "message": message, "finish_reason": finish}],
+                    "usage": usage,
+                })
+                return
+
+            def event(payload: dict) -> None:
+                self._chunk(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+
+            def delta(d: dict, finish_reason: str | None = None) -> dict:
+                return {
+                    "object": "chat.completion.chunk",
+                    "choices": [{"index": 0, "delta": d, "finish_reason": finish_reason}],
+                }
+
+            self._start_chunked("text/event-stream")
+            stub.pace(first=True)
+            if openai_calls:
+                event(delta({"tool_calls": openai_calls}))
+            for i, token in enumerate(tokens):
+                if i:
+                    stub.pace(first=False)
+                event(delta({"content": token}))
+            event(delta({}, finish))
+            if (request.get("stream_options") or {}).get("include_usage"):
+                event({"object": "chat.completion.chunk", "choices": [], "usage": usage})
+            self._chunk(b"data: [DONE]\n\n")
+            self._chunk(b"")
+
+        def _ollama_chat(self, request: dict) -> None:
+            tokens, tool_calls = stub.answer(request)
+            counts = {
+                "prompt_eval_count": _prompt_tokens(request.get("messages") or []),
+                "eval_count": max(len(tokens), 1),
+            }
+            ollama_calls = [
+                {"function": {"name": c["name"], "arguments": c["arguments"]}}
+                for c in tool_calls
+            ]
+
+            if request.get("stream") is False:
+                stub.pace(first=True)
+                for _ in tokens[1:]:
+                    stub.pace(first=False)
+                message = {"role": "assistant", "content": "".join(tokens)}
+                if ollama_calls:
+                    message["tool_calls"] = ollama_calls
+                self._json(200, {
+                    "model": stub.config.model, "message": message,
+                    "done": True, "done_reason": "stop", **counts,
+                })
+                return
+
+            def line(payload: dict) -> None:
+                self._chunk((json.dumps(payload) + "\n").encode("utf-8"))
+
+            self._start_chunked("application/x-ndjson")
+            stub.pace(first=True)
+            if ollama_calls:
+                line({"message": {"role": "assistant", "content": "", "tool_calls": ollama_calls},
+                      "done": False})
+            for i, token in enumerate(tokens):
+                if i:
+                    stub.pace(first=False)
+                line({"message": {"role": "assistant", "content": token}, "done": False})
+            line({"message": {"role": "assistant", "content": ""},
+                  "done": True, "done_reason": "stop", **counts})
+            self._chunk(b"")
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Deterministic local LLM stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1234)
+    parser.add_argument("--model", default="stub-model")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to first token")
+    parser.add_argument("--tps", type=float, default=0.0, help="Tokens per second (0 = unpaced)")
+    parser.add_argument("--reply-tokens", type=int, default=48)
+    parser.add_argument("--slots", type=int, default=None, help="Report parallel slots")
+    args = parser.parse_args()
+
+    stub = StubLLMServer(
+        host=args.host, port=args.port, model=args.model, latency=args.latency,
+        tokens_per_sec=args.tps, reply_tokens=args.reply_tokens, slots=args.slots,
+    )
+    print(f"Stub LLM server on {stub.openai_url} (model {args.model})")
+    try:
+        stub._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
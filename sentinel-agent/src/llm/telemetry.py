@@ -0,0 +1,256 @@
+"""
+Per-backend latency and throughput telemetry.
+
+Every chat()/chat_stream() against a real backend records one CallMetrics:
+prompt and completion tokens, time to first token, total latency and
+generation speed. Token counts come from the backend's `usage` report when
+it sends one and from the local tokenizer otherwise.
+
+Records go into a rolling in-memory store (the TUI context bar and /perf
+read it) and, once export is enabled, are appended to a JSONL file so
+throughput can be compared across sessions, models and machines.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable
+
+from .base import LLMResponse, Message
+
+# Calls kept in memory for summaries
+DEFAULT_WINDOW = 500
+
+
+@dataclass
+class CallMetrics:
+    """Measurements of one completed LLM call."""
+    backend: str  # e.g. "lmstudio@127.0.0.1:1234"
+    model: str
+    prompt_tokens: int
+    completion_tokens: int
+    latency: float  # Seconds, request start to last byte
+    ttft: float | None  # Seconds to first token (streamed calls only)
+    tokens_per_sec: float  # Completion tokens over generation time
+    usage_reported: bool  # Token counts came from the backend
+    streamed: bool
+    timestamp: float  # Wall clock, for cross-session logs
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CallMetrics":
+        return cls(**{name: data.get(name) for name in cls.__dataclass_fields__})
+
+
+def _percentile(values: list[float], fraction: float) -> float | None:
+    """Nearest-rank percentile (None for no values)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(records: Iterable[CallMetrics]) -> dict[str, dict]:
+    """
+    Aggregate calls per backend.
+
+    Returns {backend: {calls, prompt_tokens, completion_tokens,
+    latency_p50, latency_p95, ttft_p50, ttft_p95, tokens_per_sec}} where
+    tokens_per_sec is total completion tokens over total generation time.
+    """
+    grouped: dict[str, list[CallMetrics]] = {}
+    for record in records:
+        grouped.setdefault(record.backend, []).append(record)
+
+    summary = {}
+    for backend, calls in grouped.items():
+        latencies = [c.latency for c in calls]
+        ttfts = [c.ttft for c in calls if c.ttft is not None]
+        completion = sum(c.completion_tokens for c in calls)
+        generating = sum(_generation_time(c.latency, c.ttft) for c in calls)
+        summary[backend] = {
+            "calls": len(calls),
+            "models": sorted({c.model for c in calls}),
+            "prompt_tokens": sum(c.prompt_tokens for c in calls),
+            "completion_tokens": completion,
+            "latency_p50": _percentile(latencies, 0.5),
+            "latency_p95": _percentile(latencies, 0.95),
+            "ttft_p50": _percentile(ttfts, 0.5),
+            "ttft_p95": _percentile(ttfts, 0.95),
+            "tokens_per_sec": completion / generating if generating > 0 else 0.0,
+        }
+    return summary
+
+
+def _generation_time(latency: float, ttft: float | None) -> float:
+    """Time spent producing tokens: after the first one when that is known."""
+    if ttft is not None and latency > ttft:
+        return latency - ttft
+    return latency
+
+
+class MetricsStore:
+    """
+    Rolling window of recent calls, optionally mirrored to a JSONL file.
+
+    Usage:
+        store = MetricsStore(export_path=Path("campaigns/.perf.jsonl"))
+        store.record(metrics)
+        store.summary()["lmstudio@127.0.0.1:1234"]["tokens_per_sec"]
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW, export_path: Path | str | None = None):
+        """
+        Initialize the store.
+
+        Args:
+            window: Number of recent calls kept in memory
+            export_path: JSONL file each call is appended to (None = no export)
+        """
+        self._calls: deque[CallMetrics] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.export_path = Path(export_path) if export_path else None
+
+    def record(self, metrics: CallMetrics) -> None:
+        """Add a call (and append it to the export file, if any)."""
+        with self._lock:
+            self._calls.append(metrics)
+            if self.export_path is not None:
+                try:
+                    self.export_path.parent.mkdir(parents=True, exist_ok=True)
+                    with self.export_path.open("a", encoding="utf-8") as f:
+                        f.write(json.dumps(asdict(metrics)) + "\n")
+                except OSError:
+                    pass  # Telemetry never breaks a turn
+
+    def recent(self, n: int | None = None) -> list[CallMetrics]:
+        """The last n calls (all in the window if n is None), oldest first."""
+        with self._lock:
+            calls = list(self._calls)
+        return calls if n is None else calls[-n:]
+
+    def last(self) -> CallMetrics | None:
+        """The most recent call."""
+        with self._lock:
+            return self._calls[-1] if self._calls else None
+
+    def summary(self) -> dict[str, dict]:
+        """Per-backend aggregates over the window (see summarize)."""
+        return summarize(self.recent())
+
+    def clear(self) -> None:
+        """Forget the in-memory window (the export file is kept)."""
+        with self._lock:
+            self._calls.clear()
+
+
+def load_metrics(path: Path | str) -> list[CallMetrics]:
+    """Read an exported JSONL log, skipping unreadable lines."""
+    records = []
+    try:
+        with Path(path).open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(CallMetrics.from_dict(json.loads(line)))
+                except (json.JSONDecodeError, TypeError, AttributeError):
+                    continue
+    except OSError:
+        pass
+    return records
+
+
+class CallTimer:
+    """
+    Times one backend call and records it when the response is complete.
+
+    Usage (streaming):
+        timer = CallTimer("lmstudio@127.0.0.1:1234", model)
+        for delta in stream:
+            timer.first_token()
+            ...
+        timer.finish(response, messages, system)
+    """
+
+    def __init__(self, backend: str, model: str, store: "MetricsStore | None" = None):
+        self.backend = backend
+        self.model = model
+        self.store = store
+        self._start = time.perf_counter()
+        self._ttft: float | None = None
+
+    def first_token(self) -> None:
+        """Mark the first token's arrival (later calls are ignored)."""
+        if self._ttft is None:
+            self._ttft = time.perf_counter() - self._start
+
+    def finish(
+        self,
+        response: LLMResponse,
+        messages: list[Message],
+        system: str | None = None,
+    ) -> CallMetrics:
+        """Record the finished call; token counts fall back to local counting."""
+        latency = time.perf_counter() - self._start
+        usage_reported = response.completion_tokens is not None
+        prompt_tokens = response.prompt_tokens
+        if prompt_tokens is None:
+            prompt_tokens = _count_prompt(messages, system)
+        completion_tokens = response.completion_tokens
+        if completion_tokens is None:
+            completion_tokens = _count_completion(response)
+
+        generating = _generation_time(latency, self._ttft)
+        metrics = CallMetrics(
+            backend=self.backend,
+            model=self.model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            latency=latency,
+            ttft=self._ttft,
+            tokens_per_sec=completion_tokens / generating if generating > 0 else 0.0,
+            usage_reported=usage_reported,
+            streamed=self._ttft is not None,
+            timestamp=time.time(),
+        )
+        (self.store or get_metrics_store()).record(metrics)
+        return metrics
+
+
+def _count_prompt(messages: list[Message], system: str | None) -> int:
+    from ..context.tokenizer import count_tokens
+
+    total = count_tokens(system or "")
+    for msg in messages:
+        total += count_tokens(msg.content or "")
+    return total
+
+
+def _count_completion(response: LLMResponse) -> int:
+    from ..context.tokenizer import count_tokens
+
+    total = count_tokens(response.content)
+    for tc in response.tool_calls:
+        total += count_tokens(tc.name) + count_tokens(json.dumps(tc.arguments))
+    return total
+
+
+_store = MetricsStore()
+
+
+def get_metrics_store() -> MetricsStore:
+    """The process-wide metrics store all clients record into."""
+    return _store
+
+
+def enable_metrics_export(path: Path | str) -> MetricsStore:
+    """Append every recorded call to a JSONL file from now on."""
+    _store.export_path = Path(path)
+    return _store
+
+
+def disable_metrics_export() -> None:
+    """Stop appending calls to the JSONL file."""
+    _store.export_path = None
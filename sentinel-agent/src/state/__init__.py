@@ -27,6 +27,8 @@ from .memvid_adapter import (
     FrameType,
     MEMVID_AVAILABLE,
 )
+from .overlay import CampaignOverlay
+from .triggers import TriggerIndex, trigger_index
 from .event_bus import (
     EventBus,
     EventType,
@@ -65,6 +67,11 @@ __all__ = [
     "create_memvid_adapter",
     "FrameType",
     "MEMVID_AVAILABLE",
+    # Copy-on-write overlay
+    "CampaignOverlay",
+    # Trigger index
+    "TriggerIndex",
+    "trigger_index",
     # Event Bus
     "EventBus",
     "EventType",
@@ -0,0 +1,118 @@
+"""
+Append-only log of committed turn actions.
+
+Every action the TurnOrchestrator commits is appended with the seed it
+resolved under and the state_version it produced; every Nth entry also
+carries a hash of the resulting campaign state. A campaign snapshot plus
+the log entries after it is enough to rebuild (and verify) later state:
+see systems.replay.
+
+Implementations:
+- JsonlActionLog: one JSON line per action, next to the campaign file
+- MemoryActionLog: in-memory (testing, simulation)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Protocol, runtime_checkable
+
+from pydantic import BaseModel, ValidationError
+
+from .overlay import CampaignOverlay
+from .schemas.action import Action
+
+if TYPE_CHECKING:
+    from .schema import Campaign
+
+
+# Fields rewritten on every save, so not part of the replayable state
+_VOLATILE_FIELDS = {"saved_at": True, "meta": {"updated_at"}}
+
+
+def state_hash(campaign: "Campaign | CampaignOverlay") -> str:
+    """Stable digest of a campaign's replayable state."""
+    if isinstance(campaign, CampaignOverlay):
+        campaign = campaign.materialize()
+    data = campaign.model_dump(mode="json", exclude=_VOLATILE_FIELDS)
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+class LoggedAction(BaseModel):
+    """One committed action."""
+    action: Action
+    seed: int
+    state_version: int  # Campaign state_version after the action
+    state_hash: str | None = None  # state_hash() after the action, at checkpoints
+
+
+@runtime_checkable
+class ActionLog(Protocol):
+    """Append-only action storage for one campaign."""
+
+    def append(self, entry: LoggedAction) -> None:
+        """Record a committed action."""
+        ...
+
+    def entries(self) -> Iterator[LoggedAction]:
+        """All recorded actions, oldest first."""
+        ...
+
+
+class JsonlActionLog:
+    """
+    Action log as JSON lines.
+
+    Appends never rewrite earlier lines. A torn final line (crash
+    mid-append) is skipped on read.
+    """
+
+    SUFFIX = ".actions.jsonl"
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+
+    @classmethod
+    def for_campaign(cls, campaigns_dir: Path | str, campaign_id: str) -> "JsonlActionLog":
+        """The log stored alongside a JsonCampaignStore campaign."""
+        return cls(Path(campaigns_dir) / f"{campaign_id}{cls.SUFFIX}")
+
+    def append(self, entry: LoggedAction) -> None:
+        """Record a committed action."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(entry.model_dump_json() + "\n")
+
+    def entries(self) -> Iterator[LoggedAction]:
+        """All recorded actions, oldest first."""
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield LoggedAction.model_validate_json(line)
+                except ValidationError:
+                    continue  # Torn write
+
+
+class MemoryActionLog:
+    """In-memory action log."""
+
+    def __init__(self):
+        self._entries: list[LoggedAction] = []
+
+    def append(self, entry: LoggedAction) -> None:
+        """Record a committed action."""
+        self._entries.append(entry)
+
+    def entries(self) -> Iterator[LoggedAction]:
+        """All recorded actions, oldest first."""
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
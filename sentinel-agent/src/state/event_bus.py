@@ -19,10 +19,11 @@ Usage:
         print(f"Faction {event.data['faction']} changed!")
 """
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Any
+from typing import Callable, Any, Iterator
 
 
 class EventType(Enum):
@@ -35,11 +36,14 @@ class EventType(Enum):
     NPC_ADDED = "npc.added"
     NPC_DISPOSITION_CHANGED = "npc.disposition_changed"
     NPC_MEMORY_ADDED = "npc.memory_added"
+    NPC_INTERACTION = "npc.interaction"
     NPC_INTERRUPT = "npc.interrupt"
 
     # Thread events
     THREAD_QUEUED = "thread.queued"
     THREAD_SURFACED = "thread.surfaced"
+    AVOIDANCE_LOGGED = "avoidance.logged"
+    AVOIDANCE_SURFACED = "avoidance.surfaced"
 
     # Character events
     SOCIAL_ENERGY_CHANGED = "energy.changed"
@@ -81,6 +85,7 @@ class EventType(Enum):
     TURN_RESOLVING = "turn.resolving"
     TURN_RESOLVED = "turn.resolved"
     TURN_END = "turn.end"
+    SNAPSHOT_UPDATED = "turn.snapshot_updated"
 
     # Standing events (for cascade triggers)
     STANDING_CHANGED = "standing.changed"
@@ -138,6 +143,7 @@ class EventBus:
         self._listeners: dict[EventType, list[EventHandler]] = {}
         self._history: list[GameEvent] = []
         self._history_limit = 100  # Keep last N events for debugging
+        self._muted = 0
 
     def on(self, event_type: EventType, handler: EventHandler) -> None:
         """
@@ -188,6 +194,8 @@ class EventBus:
             campaign_id=campaign_id,
             session=session,
         )
+        if self._muted:
+            return event
 
         # Store in history for debugging
         self._history.append(event)
@@ -205,6 +213,20 @@ class EventBus:
 
         return event
 
+    @contextmanager
+    def muted(self) -> Iterator[None]:
+        """
+        Drop emitted events for the duration (no listeners, no history).
+
+        For re-running state changes that already happened, e.g. replaying
+        an action log. Mutes every emitter, including other threads.
+        """
+        self._muted += 1
+        try:
+            yield
+        finally:
+            self._muted -= 1
+
     def clear(self) -> None:
         """Clear all listeners. Useful for testing."""
         self._listeners.clear()
@@ -14,6 +14,7 @@ from .schema import (
     CampaignMeta,
     Character,
     CharacterArc,
+    FactionShiftRecord,
     HistoryEntry,
     HistoryType,
     HingeMoment,
@@ -36,6 +37,7 @@ from .store import CampaignStore, JsonCampaignStore, EventQueueStore
 from .memvid_adapter import MemvidAdapter, create_memvid_adapter, MEMVID_AVAILABLE
 from .event_bus import get_event_bus, EventType
 from .character_yaml import generate_stubs_for_campaign, sync_portraits
+from .triggers import trigger_index
 
 # Lazy import for systems to avoid circular imports
 _leverage_system = None
@@ -117,6 +119,15 @@ class CampaignManager:
         # Narrative Scratchpad
         self._scratchpad = ""
 
+        # Bumped by every save_campaign(). Mutations all save, so views
+        # derived from the campaign can tell whether they are stale
+        self.revision = 0
+
+    @property
+    def campaigns_path(self) -> Path:
+        """Directory holding campaign saves and their sidecar files (digests)."""
+        return self._campaigns_path
+
     @property
     def leverage(self):
         """Get the leverage system (lazy initialization)."""
@@ -297,6 +308,15 @@ class CampaignManager:
 
         self.save_campaign()
 
+        get_event_bus().emit(
+            EventType.NPC_INTERACTION,
+            campaign_id=self.current.meta.id,
+            session=session,
+            npc_id=npc_id,
+            npc_name=npc.name,
+            standing_change=standing_change,
+        )
+
         # Also save to memvid for semantic search
         frame_id = None
         if self._memvid:
@@ -468,6 +488,7 @@ class CampaignManager:
 
             self.current = campaign
             self._cache[campaign.meta.id] = campaign
+            trigger_index(campaign)
 
             # Persist if migrations or events were processed
             if migrated or events_processed > 0:
@@ -743,6 +764,7 @@ class CampaignManager:
         """
         if not self.current:
             return False
+        self.revision += 1
 
         # Only write to disk if campaign has been persisted
         if not self.current.persisted_:
@@ -1373,6 +1395,16 @@ class CampaignManager:
 
         npc.remembers.append(memory)
         self.save_campaign()
+
+        # Emit event for UI and digest updates
+        get_event_bus().emit(
+            EventType.NPC_MEMORY_ADDED,
+            campaign_id=self.current.meta.id,
+            session=self.current.meta.session_count,
+            npc_id=npc_id,
+            npc_name=npc.name,
+            memory=memory,
+        )
         return True
 
     def check_npc_triggers(self, tags: list[str]) -> list[dict]:
@@ -1485,6 +1517,12 @@ class CampaignManager:
             type=HistoryType.FACTION_SHIFT,
             summary=f"{faction.value}: {before.value} → {after.value} ({reason})",
             is_permanent=False,
+            faction_shift=FactionShiftRecord(
+                faction=faction,
+                from_standing=before,
+                to_standing=after,
+                cause=reason,
+            ),
         )
 
         # Save to memvid
@@ -1622,6 +1660,12 @@ class CampaignManager:
                         type=HistoryType.FACTION_SHIFT,
                         summary=f"{other_faction.value}: {before.value} → {after.value} ({cascade_reason})",
                         is_permanent=False,
+                        faction_shift=FactionShiftRecord(
+                            faction=other_faction,
+                            from_standing=before,
+                            to_standing=after,
+                            cause=cascade_reason,
+                        ),
                     )
 
         return cascades
@@ -1723,13 +1767,26 @@ class CampaignManager:
                 dormant_threads_created=dormant_threads_created,
             )
 
-        return self.log_history(
+        entry = self.log_history(
             type=HistoryType.HINGE,
             summary=f"HINGE: {choice}",
             is_permanent=True,
             hinge=hinge,
         )
 
+        # Emit event for UI and digest updates
+        get_event_bus().emit(
+            EventType.HINGE_MOMENT,
+            campaign_id=self.current.meta.id,
+            session=self.current.meta.session_count,
+            hinge_id=hinge.id,
+            situation=situation,
+            choice=choice,
+            what_shifted=hinge.what_shifted,
+        )
+
+        return entry
+
     # -------------------------------------------------------------------------
     # Dormant Threads
     # -------------------------------------------------------------------------
@@ -1757,7 +1814,9 @@ class CampaignManager:
             trigger_keywords=keywords,
         )
 
+        triggers = trigger_index(self.current)
         self.current.dormant_threads.append(thread)
+        triggers.add_thread(thread)
 
         # Save to memvid
         if self._memvid:
@@ -1773,6 +1832,7 @@ class CampaignManager:
             thread_id=thread.id,
             origin=origin,
             trigger_condition=trigger_condition,
+            consequence=consequence,
             severity=severity,
         )
 
@@ -1787,9 +1847,11 @@ class CampaignManager:
         if not self.current:
             return None
 
+        triggers = trigger_index(self.current)
         for i, thread in enumerate(self.current.dormant_threads):
             if thread.id == thread_id:
                 activated = self.current.dormant_threads.pop(i)
+                triggers.remove_thread(thread_id)
 
                 self.log_history(
                     type=HistoryType.CONSEQUENCE,
@@ -1829,14 +1891,12 @@ class CampaignManager:
         if not input_keywords:
             return []
 
+        triggers = trigger_index(self.current)
         matches = []
-        for thread in self.current.dormant_threads:
-            thread_keywords = set(thread.trigger_keywords)
-            matched = thread_keywords & input_keywords
-
+        for thread, matched in triggers.match_threads(input_keywords):
             # Require 2+ matches to reduce false positives
             if len(matched) >= 2:
-                score = len(matched) / max(len(thread_keywords), 1)
+                score = len(matched) / max(triggers.keyword_count(thread.id), 1)
                 age = self.current.meta.session_count - thread.created_session
                 matches.append({
                     "thread_id": thread.id,
@@ -1959,6 +2019,15 @@ class CampaignManager:
         )
 
         self.save_campaign()
+
+        get_event_bus().emit(
+            EventType.AVOIDANCE_LOGGED,
+            campaign_id=self.current.meta.id,
+            session=self.current.meta.session_count,
+            avoidance_id=avoided.id,
+            situation=situation,
+            severity=avoided.severity.value,
+        )
         return avoided
 
     def surface_avoidance(
@@ -1989,6 +2058,14 @@ class CampaignManager:
                 )
 
                 self.save_campaign()
+
+                get_event_bus().emit(
+                    EventType.AVOIDANCE_SURFACED,
+                    campaign_id=self.current.meta.id,
+                    session=self.current.meta.session_count,
+                    avoidance_id=avoided.id,
+                    what_happened=what_happened,
+                )
                 return avoided
 
         return None
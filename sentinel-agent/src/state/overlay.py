@@ -0,0 +1,303 @@
+"""
+Copy-on-write overlay over a Campaign.
+
+Resolvers and cascades take a campaign and mutate it in place. Running them
+against a CampaignOverlay leaves the campaign untouched: reads fall through
+to the shared base, and the first write into a top-level field
+(campaign.map_state, campaign.factions, ...) copies just that field into
+the overlay's delta. A travel turn copies map_state and characters, not
+history or the NPC registry.
+
+    overlay = CampaignOverlay(campaign)
+    events, _ = resolver(action, overlay, seed)
+    overlay.diff()     # {"map_state": MapState(...), ...}
+    overlay.commit()   # assign the changed fields onto campaign in one step
+
+Nested objects read through the overlay come back as read-through views
+that copy their field on first write or method call (methods may mutate).
+Scalars and enums come back as-is. Overlays stack: a base may itself be an
+overlay, and commit() applies the delta one layer down.
+"""
+
+from __future__ import annotations
+
+import copy
+from datetime import date, time, timedelta
+from enum import Enum
+from types import MethodType
+from typing import TYPE_CHECKING, Any, Iterator
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from .schema import Campaign
+
+
+# Values returned as-is; everything else is wrapped in a view
+_IMMUTABLE = (str, int, float, bytes, Enum, date, time, timedelta, frozenset, type(None))
+
+# Container methods that only read, so views answer them without copying
+_DICT_READERS = frozenset({"get", "keys", "values", "items"})
+_LIST_READERS = frozenset({"index", "count"})
+
+
+class CampaignOverlay:
+    """
+    A writable view of a campaign that records changes in its own delta.
+
+    Attribute access mirrors Campaign. Methods defined on the Campaign
+    model run against the overlay; pydantic's model_* methods do not
+    (call them on materialize() or after commit()).
+    """
+
+    __slots__ = ("_base", "_delta", "_trigger_index")
+
+    def __init__(self, base: "Campaign | CampaignOverlay"):
+        object.__setattr__(self, "_base", base)
+        object.__setattr__(self, "_delta", {})
+        object.__setattr__(self, "_trigger_index", None)  # See state.triggers.trigger_index
+
+    @property
+    def base(self) -> "Campaign | CampaignOverlay":
+        """The campaign (or overlay) this overlay writes through to on commit."""
+        return self._base
+
+    def __repr__(self) -> str:
+        return f"CampaignOverlay({self._model_class().__name__}, delta={sorted(self._delta)})"
+
+    # ─── Attribute protocol ──────────────────────────────────────
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if name in self._delta:
+            return self._delta[name]
+
+        attr = _class_attr(self._model_class(), name)
+        if isinstance(attr, property):
+            return attr.fget(self)
+        if callable(attr):
+            return MethodType(attr, self)
+
+        value = self._raw(name)
+        if callable(value):
+            raise AttributeError(
+                f"{name}() is not available on an overlay; use materialize() or commit() first"
+            )
+        return _wrap(self, (name,), value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in CampaignOverlay.__slots__:
+            object.__setattr__(self, name, value)
+            return
+        if name not in self._model_class().model_fields:
+            raise AttributeError(f"{self._model_class().__name__} has no field {name!r}")
+        self._delta[name] = _unwrap(value)
+
+    # ─── Delta ───────────────────────────────────────────────────
+
+    def touched(self, *names: str) -> bool:
+        """True if any of the named fields has been copied into the delta."""
+        return any(name in self._delta for name in names)
+
+    def touch(self, *names: str) -> None:
+        """Copy fields into the delta now, e.g. before handing out raw references."""
+        for name in names:
+            self._materialize(name)
+
+    def peek(self, name: str) -> Any:
+        """
+        A field's current value, uncopied. For read-only use: writes through
+        it reach the base when the field is not in the delta.
+        """
+        return self._raw(name)
+
+    def diff(self) -> dict[str, Any]:
+        """Fields whose value differs from the base, with their new values."""
+        return {
+            name: value for name, value in self._delta.items()
+            if value != self._base_value(name)
+        }
+
+    def commit(self) -> dict[str, Any]:
+        """
+        Assign the changed fields onto the base and clear the delta.
+
+        Returns:
+            The applied changes, as diff() reported them
+        """
+        changes = self.diff()
+        for name, value in changes.items():
+            setattr(self._base, name, value)
+        self._delta.clear()
+        self._trigger_index = None
+        return changes
+
+    def discard(self) -> None:
+        """Drop every pending change."""
+        self._delta.clear()
+        self._trigger_index = None
+
+    def fork(self) -> "CampaignOverlay":
+        """An independent overlay over the same base, starting from this delta."""
+        twin = CampaignOverlay(self._base)
+        twin._delta.update(copy.deepcopy(self._delta))
+        return twin
+
+    def materialize(self) -> "Campaign":
+        """
+        A Campaign with the delta applied. Unchanged fields are shared
+        with the base, so treat the result as read-only.
+        """
+        base = self._base.materialize() if isinstance(self._base, CampaignOverlay) else self._base
+        return base.model_copy(update=self._delta)
+
+    # ─── Internals ───────────────────────────────────────────────
+
+    def _model_class(self) -> type[BaseModel]:
+        base = self._base
+        while isinstance(base, CampaignOverlay):
+            base = base._base
+        return type(base)
+
+    def _raw(self, name: str) -> Any:
+        if name in self._delta:
+            return self._delta[name]
+        return self._base_value(name)
+
+    def _base_value(self, name: str) -> Any:
+        if isinstance(self._base, CampaignOverlay):
+            return self._base._raw(name)
+        return getattr(self._base, name)
+
+    def _materialize(self, name: str) -> Any:
+        if name not in self._delta:
+            self._delta[name] = copy.deepcopy(self._base_value(name))
+        return self._delta[name]
+
+
+class _View:
+    """
+    Read-through reference to a nested object, addressed by its path from
+    the overlay. Resolved on every access, so a view taken before its field
+    was copied keeps working after.
+    """
+
+    __slots__ = ("_overlay", "_path")
+
+    def __init__(self, overlay: CampaignOverlay, path: tuple):
+        object.__setattr__(self, "_overlay", overlay)
+        object.__setattr__(self, "_path", path)
+
+    def _target(self) -> Any:
+        value = self._overlay._raw(self._path[0])
+        for kind, key in self._path[1:]:
+            value = getattr(value, key) if kind == "attr" else value[key]
+        return value
+
+    def _writable(self) -> Any:
+        self._overlay._materialize(self._path[0])
+        return self._target()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        target = self._target()
+        if isinstance(target, dict) and name in _DICT_READERS:
+            return getattr(self, f"_dict_{name}")
+        if isinstance(target, list) and name in _LIST_READERS:
+            return getattr(target, name)  # Compares by value; returns scalars
+
+        value = getattr(target, name)
+        if callable(value):
+            return getattr(self._writable(), name)
+        return _wrap(self._overlay, self._path + (("attr", name),), value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._writable(), name, _unwrap(value))
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._writable(), name)
+
+    # ─── Container protocol ──────────────────────────────────────
+
+    def __getitem__(self, key: Any) -> Any:
+        return _wrap(self._overlay, self._path + (("item", key),), self._target()[key])
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._writable()[key] = _unwrap(value)
+
+    def __delitem__(self, key: Any) -> None:
+        del self._writable()[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        target = self._target()
+        if not isinstance(target, list):
+            yield from target
+            return
+        for i in range(len(target)):
+            yield _wrap(self._overlay, self._path + (("item", i),), target[i])
+
+    def __len__(self) -> int:
+        return len(self._target())
+
+    def __bool__(self) -> bool:
+        return bool(self._target())
+
+    def __contains__(self, item: Any) -> bool:
+        return _unwrap_ref(item) in self._target()
+
+    def __eq__(self, other: Any) -> bool:
+        return self._target() == _unwrap_ref(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self._target())
+
+    def _dict_get(self, key: Any, default: Any = None) -> Any:
+        target = self._target()
+        if key not in target:
+            return default
+        return self[key]
+
+    def _dict_keys(self):
+        return self._target().keys()
+
+    def _dict_values(self) -> list[Any]:
+        return [self[key] for key in self._target()]
+
+    def _dict_items(self) -> list[tuple[Any, Any]]:
+        return [(key, self[key]) for key in self._target()]
+
+
+def _class_attr(cls: type, name: str) -> Any:
+    """A method or property the model class itself defines (not BaseModel's)."""
+    for klass in cls.__mro__:
+        if klass is BaseModel:
+            break
+        if name in klass.__dict__:
+            return klass.__dict__[name]
+    return None
+
+
+def _wrap(overlay: CampaignOverlay, path: tuple, value: Any) -> Any:
+    # Fields already in the delta are private to the overlay: no view needed
+    if isinstance(value, _IMMUTABLE) or path[0] in overlay._delta:
+        return value
+    return _View(overlay, path)
+
+
+def _unwrap_ref(value: Any) -> Any:
+    return value._target() if isinstance(value, _View) else value
+
+
+def _unwrap(value: Any) -> Any:
+    """Assigned values hold copies, never views or the base's own objects."""
+    if isinstance(value, _View):
+        return copy.deepcopy(value._target())
+    if isinstance(value, list):
+        return [_unwrap(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _unwrap(v) for k, v in value.items()}
+    return value
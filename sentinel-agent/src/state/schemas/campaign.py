@@ -1,8 +1,8 @@
 from datetime import datetime
 from enum import Enum
-from typing import Literal
+from typing import Any, Literal
 from uuid import uuid4
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from .base import (
     FactionName, 
     Urgency, 
@@ -188,6 +188,7 @@ class Campaign(BaseModel):
     turn_count: int = 0
     state_version: int = 0
     last_session_snapshot: CampaignSnapshot | None = None
+    _trigger_index: Any = PrivateAttr(default=None)  # state.triggers.TriggerIndex
 
     def save_checkpoint(self) -> None:
         self.saved_at = datetime.now()
@@ -1,6 +1,7 @@
 """TurnResult schema — the output of a resolved turn."""
 
 from datetime import datetime
+from typing import Any
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -8,12 +9,31 @@ from pydantic import BaseModel, Field
 from .event import TurnEvent
 
 
+class SnapshotDelta(BaseModel):
+    """
+    Structural change between two UI snapshots, as JSON Pointer paths.
+
+    Applies to the snapshot at base_version (None: no previous snapshot,
+    changed holds the whole thing) and yields the one at state_version.
+    """
+    base_version: int | None = None
+    state_version: int
+    changed: dict[str, Any] = Field(default_factory=dict)  # "/factions/Nexus" -> "Friendly"
+    removed: list[str] = Field(default_factory=list)
+
+    @property
+    def paths(self) -> list[str]:
+        return [*self.changed, *self.removed]
+
+
 class TurnResult(BaseModel):
     action_id: str
+    action_ids: list[str] = Field(default_factory=list)  # Every action, for batch commits
     success: bool
     state_version: int
     events: list[TurnEvent] = Field(default_factory=list)
     state_snapshot: dict = Field(default_factory=dict)
+    snapshot_delta: SnapshotDelta | None = None  # state_snapshot vs the previous turn's
     seed: int = Field(default_factory=lambda: int(uuid4().int % (2**31)))
     narrative_hooks: list[str] = Field(default_factory=list)
     cascade_notices: list[dict] = Field(default_factory=list)
@@ -116,6 +116,17 @@ class MapState(BaseModel):
     regions: dict[Region, RegionState] = Field(default_factory=dict)
     current_region: Region = Region.RUST_CORRIDOR
 
+    def make_connected(self, region: Region, session: int) -> RegionState:
+        """Mark a region visited: at least CONNECTED (EMBEDDED is kept)."""
+        state = self.regions.setdefault(region, RegionState())
+        if state.first_aware_session is None:
+            state.first_aware_session = session
+        if state.first_visited_session is None:
+            state.first_visited_session = session
+        if state.connectivity != RegionConnectivity.EMBEDDED:
+            state.connectivity = RegionConnectivity.CONNECTED
+        return state
+
 class FavorToken(BaseModel):
     npc_id: str
     npc_name: str
@@ -10,6 +10,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Protocol, runtime_checkable
 
+from .action_log import JsonlActionLog
 from .schema import Campaign, EventQueue, PendingEvent
 
 
@@ -102,11 +103,14 @@ class JsonCampaignStore:
         return None
 
     def delete(self, campaign_id: str) -> bool:
-        """Delete campaign file."""
+        """Delete campaign file (and its action log)."""
         campaign_file = self.campaigns_dir / f"{campaign_id}.json"
 
         if campaign_file.exists():
             campaign_file.unlink()
+            action_log = self.campaigns_dir / f"{campaign_id}{JsonlActionLog.SUFFIX}"
+            if action_log.exists():
+                action_log.unlink()
             return True
 
         return False
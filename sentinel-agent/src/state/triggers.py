@@ -0,0 +1,188 @@
+"""
+Keyword trigger index for dormant threads and enhancement leverage.
+
+Maps each trigger keyword to the dormant threads and enhancements that use
+it, so matching player input or a turn event costs about the size of the
+input keyword set instead of threads x keywords.
+
+The index lives on the campaign (`trigger_index(campaign)`) and is kept
+current by the manager's queue/surface/grant paths. Code that edits the
+lists directly (mission offers, the turn orchestrator) is caught by a
+cheap signature check and the index is rebuilt on next use.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+from .overlay import CampaignOverlay
+
+if TYPE_CHECKING:
+    from .schema import Campaign, DormantThread, Enhancement
+
+
+@dataclass
+class _Entry:
+    """One indexed thread or enhancement."""
+    seq: int  # Position order, so matches come back in list order
+    item: object
+    keywords: frozenset[str]
+    character_id: str | None = None
+
+
+class TriggerIndex:
+    """Keyword -> dormant threads and enhancements that use it."""
+
+    def __init__(self, campaign: "Campaign"):
+        self._campaign = campaign
+        self._seq = 0
+        self._threads: dict[str, _Entry] = {}
+        self._enhancements: dict[str, _Entry] = {}
+        self._thread_keys: dict[str, set[str]] = {}
+        self._enhancement_keys: dict[str, set[str]] = {}
+        self.rebuild()
+
+    def __deepcopy__(self, memo):
+        # A deep-copied campaign would otherwise drag a second copy of itself
+        # in through self._campaign; copies build their own index on first use
+        return None
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def rebuild(self) -> None:
+        """Index every dormant thread and enhancement from scratch."""
+        self._seq = 0
+        self._threads.clear()
+        self._enhancements.clear()
+        self._thread_keys.clear()
+        self._enhancement_keys.clear()
+        for thread in self._campaign.dormant_threads:
+            self._add(self._threads, self._thread_keys, thread.id, thread, thread.trigger_keywords)
+        for char in self._campaign.characters:
+            for enhancement in char.enhancements:
+                self._add(
+                    self._enhancements, self._enhancement_keys, enhancement.id,
+                    enhancement, enhancement.leverage_keywords, char.id,
+                )
+        self._stamp()
+
+    def is_current(self) -> bool:
+        """False if the lists were edited without going through the index."""
+        return (
+            self._thread_signature == self._threads_now()
+            and self._enhancement_signature == self._enhancements_now()
+        )
+
+    def add_thread(self, thread: "DormantThread") -> None:
+        """Index a thread just appended to campaign.dormant_threads."""
+        self._add(self._threads, self._thread_keys, thread.id, thread, thread.trigger_keywords)
+        self._stamp()
+
+    def remove_thread(self, thread_id: str) -> None:
+        """Drop a thread just removed from campaign.dormant_threads."""
+        self._remove(self._threads, self._thread_keys, thread_id)
+        self._stamp()
+
+    def add_enhancement(self, character_id: str, enhancement: "Enhancement") -> None:
+        """Index an enhancement just appended to a character."""
+        self._add(
+            self._enhancements, self._enhancement_keys, enhancement.id,
+            enhancement, enhancement.leverage_keywords, character_id,
+        )
+        self._stamp()
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def match_threads(self, keywords: Iterable[str]) -> list[tuple["DormantThread", set[str]]]:
+        """Threads sharing any keyword, with the matched keywords, in list order."""
+        return [
+            (entry.item, matched)
+            for entry, matched in self._match(self._threads, self._thread_keys, keywords)
+        ]
+
+    def match_enhancements(
+        self, keywords: Iterable[str],
+    ) -> list[tuple[str, "Enhancement", set[str]]]:
+        """(character_id, enhancement, matched keywords), in grant order."""
+        return [
+            (entry.character_id, entry.item, matched)
+            for entry, matched in self._match(self._enhancements, self._enhancement_keys, keywords)
+        ]
+
+    def keyword_count(self, thread_id: str) -> int:
+        """Distinct trigger keywords of an indexed thread."""
+        entry = self._threads.get(thread_id)
+        return len(entry.keywords) if entry else 0
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _add(self, entries, keys, item_id, item, keywords, character_id=None) -> None:
+        self._remove(entries, keys, item_id)
+        normalized = frozenset(kw.lower() for kw in keywords)
+        entries[item_id] = _Entry(self._seq, item, normalized, character_id)
+        self._seq += 1
+        for kw in normalized:
+            keys.setdefault(kw, set()).add(item_id)
+
+    @staticmethod
+    def _remove(entries, keys, item_id) -> None:
+        entry = entries.pop(item_id, None)
+        if entry is None:
+            return
+        for kw in entry.keywords:
+            ids = keys.get(kw)
+            if ids is not None:
+                ids.discard(item_id)
+                if not ids:
+                    del keys[kw]
+
+    @staticmethod
+    def _match(entries, keys, keywords) -> list[tuple[_Entry, set[str]]]:
+        matched: dict[str, set[str]] = {}
+        for kw in keywords:
+            for item_id in keys.get(kw, ()):
+                matched.setdefault(item_id, set()).add(kw)
+        hits = [(entries[item_id], kws) for item_id, kws in matched.items()]
+        hits.sort(key=lambda hit: hit[0].seq)
+        return hits
+
+    def _threads_now(self) -> tuple[int, int]:
+        threads = self._campaign.dormant_threads
+        return (id(threads), len(threads))
+
+    def _enhancements_now(self) -> tuple[tuple[int, int], ...]:
+        return tuple(
+            (id(char.enhancements), len(char.enhancements))
+            for char in self._campaign.characters
+        )
+
+    def _stamp(self) -> None:
+        self._thread_signature = self._threads_now()
+        self._enhancement_signature = self._enhancements_now()
+
+
+def trigger_index(campaign: "Campaign | CampaignOverlay") -> TriggerIndex:
+    """
+    The campaign's trigger index, built or rebuilt as needed.
+
+    An overlay that hasn't copied its threads or characters shares its
+    base's index; once it has, it indexes its own copies. Edit the lists
+    before asking for the index, not after.
+    """
+    if isinstance(campaign, CampaignOverlay):
+        if not campaign.touched("dormant_threads", "characters"):
+            return trigger_index(campaign.base)
+        campaign.touch("dormant_threads", "characters")
+    index = campaign._trigger_index
+    if index is None or index._campaign is not campaign:  # Unbuilt, or a shallow copy's
+        index = campaign._trigger_index = TriggerIndex(campaign)
+    elif not index.is_current():
+        index.rebuild()
+    return index
@@ -11,9 +11,11 @@ from .jobs import JobSystem
 from .favors import FavorSystem
 from .endgame import EndgameSystem
 from .interrupts import InterruptDetector, InterruptCandidate, InterruptTrigger, InterruptUrgency
-from .turns import TurnOrchestrator, TurnPhase, TurnError, StaleStateError
+from .turns import TurnOrchestrator, TurnPhase, TurnError, StaleStateError, BatchRejectedError
 from .validation import ActionValidator
 from .cascades import CascadeProcessor, CascadeResult, Notice, NoticeSeverity
+from .snapshots import SnapshotBuilder, SnapshotFeed
+from .routes import RouteGraph, RoutePlan, route_graph
 
 __all__ = [
     "LeverageSystem",
@@ -30,9 +32,15 @@ __all__ = [
     "TurnPhase",
     "TurnError",
     "StaleStateError",
+    "BatchRejectedError",
     "ActionValidator",
     "CascadeProcessor",
     "CascadeResult",
     "Notice",
     "NoticeSeverity",
+    "SnapshotBuilder",
+    "SnapshotFeed",
+    "RouteGraph",
+    "RoutePlan",
+    "route_graph",
 ]
@@ -25,9 +25,19 @@ from pydantic import BaseModel, Field
 
 from ..state.schemas.event import TurnEvent
 from ..state.event_bus import get_event_bus, EventType
+from ..state.triggers import trigger_index
+from .faction_matrix import (
+    ALLIED,
+    FACTION_INDEX,
+    FACTIONS,
+    STANDING_INDEX,
+    STANDINGS,
+    ripple_matrix,
+    shift_standings,
+)
 
 if TYPE_CHECKING:
-    from ..state.schema import Campaign
+    from ..state.schema import Campaign, FactionName
 
 
 # ─── Configuration ───────────────────────────────────────────
@@ -117,6 +127,7 @@ class CascadeProcessor:
     def __init__(self, config: dict | None = None):
         self._config = config or CASCADE_CONFIG
         self._bus = get_event_bus()
+        self._ripples = ripple_matrix(**self._config.get("faction_propagation", {}))
 
     def process(
         self,
@@ -212,23 +223,13 @@ class CascadeProcessor:
         Allied factions (relationship > threshold) get a positive ripple.
         Hostile factions (relationship < -threshold) get an inverted ripple.
         """
-        from ..state.schema import (
-            FactionName,
-            FACTION_RELATIONS,
-            get_faction_relation,
-        )
+        from ..state.schema import FactionName
 
         faction_name = event.payload.get("faction")
         delta = event.payload.get("delta", 0)
         if not faction_name or delta == 0:
             return [], []
 
-        config = self._config.get("faction_propagation", {})
-        allied_threshold = config.get("allied_threshold", 30)
-        allied_multiplier = config.get("allied_multiplier", 0.3)
-        hostile_threshold = config.get("hostile_threshold", -30)
-        hostile_multiplier = config.get("hostile_multiplier", -0.2)
-
         # Find the FactionName enum for the affected faction
         try:
             affected_faction = FactionName(faction_name)
@@ -238,59 +239,151 @@ class CascadeProcessor:
         events: list[TurnEvent] = []
         notice_details: list[str] = []
 
-        # Check all other factions for relationship effects
-        for other_faction in FactionName:
-            if other_faction == affected_faction:
+        # One row of the precomputed ripple matrix covers every other faction
+        for other_faction, propagated_delta, kind in self._ripples.ripple(affected_faction, delta):
+            relation = "allied with" if kind == ALLIED else "hostile to"
+            reason = f"{relation} {affected_faction.value}"
+
+            # Apply the standing shift
+            standing = campaign.factions.get(other_faction)
+            old_standing = standing.standing.value
+            standing.shift(propagated_delta)
+            new_standing = standing.standing.value
+
+            events.append(self._standing_event(
+                event, other_faction, propagated_delta, old_standing, new_standing, reason, depth,
+            ))
+            notice_details.append(
+                f"{other_faction.value}: {old_standing} → {new_standing} ({reason})"
+            )
+
+            # Emit via event bus for TUI reactivity
+            self._bus.emit(
+                EventType.STANDING_CHANGED,
+                campaign_id=campaign.meta.id,
+                session=campaign.meta.session_count,
+                faction=other_faction.value,
+                delta=propagated_delta,
+            )
+
+        notices = []
+        if notice_details:
+            notices.append(Notice(
+                headline="Ripple Effect",
+                details=notice_details,
+                severity=NoticeSeverity.INFO,
+            ))
+
+        return events, notices
+
+    def _standing_event(
+        self,
+        cause: TurnEvent,
+        faction: "FactionName",
+        delta: int,
+        old_standing: str,
+        new_standing: str,
+        reason: str,
+        depth: int,
+    ) -> TurnEvent:
+        """A derived standing.changed event."""
+        return TurnEvent(
+            event_type="standing.changed",
+            source_action=cause.source_action,
+            payload={
+                "faction": faction.value,
+                "delta": delta,
+                "old_standing": old_standing,
+                "new_standing": new_standing,
+                "reason": f"Cascade: {reason}",
+            },
+            cascaded_from=cause.event_id,
+            cascade_depth=depth + 1,
+            summary=f"{faction.value} standing shifted ({reason})",
+        )
+
+    def propagate_batch(
+        self,
+        trigger_events: list[TurnEvent],
+        campaign: "Campaign",
+    ) -> tuple[list[TurnEvent], list[Notice]]:
+        """
+        Propagate many simultaneous standing changes in one pass per wave.
+
+        For simulations and bulk imports. Each wave takes the net delta of
+        every changed faction, computes all pairwise ripples at once, sums
+        them per target and shifts the standings vector; the resulting
+        deltas feed the next wave, up to MAX_CASCADE_DEPTH. A target hit by
+        several sources gets one event naming all of them, caused by the
+        first. Only faction propagation runs here; NPC reactions and
+        thread matching stay per event in process().
+
+        Args:
+            trigger_events: standing.changed events (already applied)
+            campaign: Campaign whose standings are shifted
+
+        Returns:
+            Tuple of (derived_events, player_notices)
+        """
+        from ..state.schema import FactionName
+
+        n = len(FACTIONS)
+        deltas = [0] * n
+        causes: list[TurnEvent | None] = [None] * n
+        depth = 0
+        for event in trigger_events:
+            if event.event_type != "standing.changed":
                 continue
+            try:
+                i = FACTION_INDEX[FactionName(event.payload.get("faction"))]
+            except ValueError:
+                continue
+            deltas[i] += event.payload.get("delta", 0)
+            causes[i] = causes[i] or event
+            depth = max(depth, event.cascade_depth)
 
-            relation = get_faction_relation(affected_faction, other_faction)
-
-            propagated_delta = 0
-            reason = ""
-
-            if relation >= allied_threshold:
-                # Allied faction — positive ripple
-                propagated_delta = int(delta * allied_multiplier)
-                reason = f"allied with {affected_faction.value}"
-            elif relation <= hostile_threshold:
-                # Hostile faction — inverted ripple
-                propagated_delta = int(delta * hostile_multiplier)
-                reason = f"hostile to {affected_faction.value}"
-
-            if propagated_delta != 0:
-                # Apply the standing shift
-                standing = campaign.factions.get(other_faction)
-                old_standing = standing.standing.value
-                standing.shift(propagated_delta)
-                new_standing = standing.standing.value
-
-                cascade_event = TurnEvent(
-                    event_type="standing.changed",
-                    source_action=event.source_action,
-                    payload={
-                        "faction": other_faction.value,
-                        "delta": propagated_delta,
-                        "old_standing": old_standing,
-                        "new_standing": new_standing,
-                        "reason": f"Cascade: {reason}",
-                    },
-                    cascaded_from=event.event_id,
-                    cascade_depth=depth + 1,
-                    summary=f"{other_faction.value} standing shifted ({reason})",
-                )
-                events.append(cascade_event)
-                notice_details.append(
-                    f"{other_faction.value}: {old_standing} → {new_standing} ({reason})"
+        events: list[TurnEvent] = []
+        notice_details: list[str] = []
+        standings = campaign.factions
+
+        while any(deltas) and depth < MAX_CASCADE_DEPTH:
+            contributions = self._ripples.wave(deltas)
+            net = [sum(column) for column in zip(*contributions)]
+            before = [STANDING_INDEX[standings.get(f).standing] for f in FACTIONS]
+            after = shift_standings(before, net)
+
+            next_deltas = [0] * n
+            next_causes: list[TurnEvent | None] = [None] * n
+            for j in range(n):
+                if not net[j]:
+                    continue
+                sources = [i for i in range(n) if contributions[i][j]]
+                reason = ", ".join(
+                    f"{'allied with' if self._ripples.kind[i][j] == ALLIED else 'hostile to'} "
+                    f"{FACTIONS[i].value}"
+                    for i in sources
                 )
+                faction = FACTIONS[j]
+                old_standing = STANDINGS[before[j]].value
+                new_standing = STANDINGS[after[j]].value
+                standings.get(faction).standing = STANDINGS[after[j]]
 
-                # Emit via event bus for TUI reactivity
+                event = self._standing_event(
+                    causes[sources[0]], faction, net[j], old_standing, new_standing, reason, depth,
+                )
+                events.append(event)
+                notice_details.append(f"{faction.value}: {old_standing} → {new_standing} ({reason})")
                 self._bus.emit(
                     EventType.STANDING_CHANGED,
                     campaign_id=campaign.meta.id,
                     session=campaign.meta.session_count,
-                    faction=other_faction.value,
-                    delta=propagated_delta,
+                    faction=faction.value,
+                    delta=net[j],
                 )
+                next_deltas[j], next_causes[j] = net[j], event
+
+            deltas, causes = next_deltas, next_causes
+            depth += 1
 
         notices = []
         if notice_details:
@@ -299,7 +392,6 @@ class CascadeProcessor:
                 details=notice_details,
                 severity=NoticeSeverity.INFO,
             ))
-
         return events, notices
 
     # ─── NPC Reactions ───────────────────────────────────────
@@ -367,6 +459,10 @@ class CascadeProcessor:
             if region:
                 tags = [f"arrived_{region}", f"visit_{region}"]
                 for npc in campaign.npcs.active:
+                    # check_triggers mutates; skip NPCs it can't fire for, so a
+                    # campaign overlay copies the NPC registry only when needed
+                    if not any(t.condition in tags for t in npc.memory_triggers):
+                        continue
                     fired = npc.check_triggers(tags)
                     for trigger in fired:
                         cascade_event = TurnEvent(
@@ -430,48 +526,35 @@ class CascadeProcessor:
             elif isinstance(value, (int, float)):
                 event_keywords.add(str(value))
 
-        # Check each dormant thread
-        threads_to_surface: list[int] = []
-
-        for i, thread in enumerate(campaign.dormant_threads):
-            if not thread.trigger_keywords:
-                continue
-
-            # Check if any trigger keywords match event keywords
-            thread_keywords = {kw.lower() for kw in thread.trigger_keywords}
-            matches = thread_keywords & event_keywords
-
-            if matches:
-                # This thread should surface
-                threads_to_surface.append(i)
-
-                cascade_event = TurnEvent(
-                    event_type="thread.surfaced",
-                    source_action=event.source_action,
-                    payload={
-                        "thread_id": thread.id,
-                        "origin": thread.origin,
-                        "consequence": thread.consequence,
-                        "severity": thread.severity.value,
-                        "matched_keywords": list(matches),
-                    },
-                    cascaded_from=event.event_id,
-                    cascade_depth=depth + 1,
-                    summary=f"A dormant thread stirs: {thread.consequence[:60]}...",
-                )
-                events.append(cascade_event)
-                notice_details.append(
-                    f"[{thread.severity.value.upper()}] {thread.consequence}"
-                )
+        # Threads sharing any trigger keyword with the event surface
+        for thread, matches in trigger_index(campaign).match_threads(event_keywords):
+            cascade_event = TurnEvent(
+                event_type="thread.surfaced",
+                source_action=event.source_action,
+                payload={
+                    "thread_id": thread.id,
+                    "origin": thread.origin,
+                    "consequence": thread.consequence,
+                    "severity": thread.severity.value,
+                    "matched_keywords": list(matches),
+                },
+                cascaded_from=event.event_id,
+                cascade_depth=depth + 1,
+                summary=f"A dormant thread stirs: {thread.consequence[:60]}...",
+            )
+            events.append(cascade_event)
+            notice_details.append(
+                f"[{thread.severity.value.upper()}] {thread.consequence}"
+            )
 
-                # Emit for TUI
-                self._bus.emit(
-                    EventType.THREAD_SURFACED,
-                    campaign_id=campaign.meta.id,
-                    session=campaign.meta.session_count,
-                    thread_id=thread.id,
-                    severity=thread.severity.value,
-                )
+            # Emit for TUI
+            self._bus.emit(
+                EventType.THREAD_SURFACED,
+                campaign_id=campaign.meta.id,
+                session=campaign.meta.session_count,
+                thread_id=thread.id,
+                severity=thread.severity.value,
+            )
 
         # NOTE: We do NOT mutate campaign.dormant_threads here.
         # Surfaced thread IDs are included in the event payloads
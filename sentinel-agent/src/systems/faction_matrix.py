@@ -0,0 +1,131 @@
+"""
+Precomputed faction relation matrix for cascade propagation.
+
+FACTION_RELATIONS is laid out once as an 11x11 matrix in FactionName order.
+Each propagation config folds its thresholds into a ripple matrix: the
+multiplier a standing change carries from row faction to column faction
+(0 where they are neither allied nor hostile enough). One propagation wave
+is then a single vector operation over the faction axis.
+
+NumPy is used when installed (`pip install sentinel-agent[fast]`). The
+pure-Python path walks the same precomputed rows and gives identical
+results.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Sequence
+
+from ..state.schema import FactionName, Standing, get_faction_relation
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore
+    NUMPY_AVAILABLE = False
+
+
+FACTIONS: tuple[FactionName, ...] = tuple(FactionName)
+FACTION_INDEX: dict[FactionName, int] = {f: i for i, f in enumerate(FACTIONS)}
+STANDINGS: tuple[Standing, ...] = tuple(Standing)
+STANDING_INDEX: dict[Standing, int] = {s: i for i, s in enumerate(STANDINGS)}
+
+# Ripple kinds
+ALLIED = 1
+HOSTILE = -1
+
+RELATIONS: list[list[int]] = [
+    [get_faction_relation(a, b) for b in FACTIONS] for a in FACTIONS
+]
+
+
+class RippleMatrix:
+    """
+    Relation matrix with one propagation config's threshold masks applied.
+
+    kind[i][j] is ALLIED, HOSTILE or 0 for a change to faction i as seen
+    by faction j; multiplier[i][j] is the matching config multiplier.
+    Build through ripple_matrix(), which caches per config.
+    """
+
+    def __init__(
+        self,
+        allied_threshold: float,
+        allied_multiplier: float,
+        hostile_threshold: float,
+        hostile_multiplier: float,
+    ):
+        n = len(FACTIONS)
+        self.kind = [[0] * n for _ in range(n)]
+        self.multiplier = [[0.0] * n for _ in range(n)]
+        for i in range(n):
+            for j in range(n):
+                if i == j:
+                    continue
+                relation = RELATIONS[i][j]
+                # Allied wins when both thresholds match, as in the per-pair check
+                if relation >= allied_threshold:
+                    self.kind[i][j], self.multiplier[i][j] = ALLIED, allied_multiplier
+                elif relation <= hostile_threshold:
+                    self.kind[i][j], self.multiplier[i][j] = HOSTILE, hostile_multiplier
+
+        if NUMPY_AVAILABLE:
+            self._multiplier = np.array(self.multiplier, dtype=float)
+
+    def ripple(self, source: FactionName, delta: int) -> list[tuple[FactionName, int, int]]:
+        """
+        (target, propagated delta, kind) for one standing change, in
+        FactionName order. Targets whose ripple truncates to 0 are left out.
+        """
+        i = FACTION_INDEX[source]
+        if NUMPY_AVAILABLE:
+            deltas = np.trunc(delta * self._multiplier[i]).astype(int)
+            return [
+                (FACTIONS[j], int(deltas[j]), self.kind[i][j])
+                for j in np.flatnonzero(deltas)
+            ]
+
+        ripples = []
+        for j, multiplier in enumerate(self.multiplier[i]):
+            if multiplier:
+                propagated = int(delta * multiplier)
+                if propagated:
+                    ripples.append((FACTIONS[j], propagated, self.kind[i][j]))
+        return ripples
+
+    def wave(self, deltas: Sequence[int]) -> list[list[int]]:
+        """
+        Per-pair ripples of simultaneous changes (one delta per faction).
+
+        Returns contributions[i][j], the truncated ripple faction i's change
+        sends to faction j. Column sums are the wave's net deltas.
+        """
+        if NUMPY_AVAILABLE:
+            vector = np.asarray(deltas, dtype=float)
+            return np.trunc(vector[:, None] * self._multiplier).astype(int).tolist()
+
+        return [
+            [int(delta * m) if m else 0 for m in row] if delta else [0] * len(row)
+            for delta, row in zip(deltas, self.multiplier)
+        ]
+
+
+@lru_cache(maxsize=8)
+def ripple_matrix(
+    allied_threshold: float = 30,
+    allied_multiplier: float = 0.3,
+    hostile_threshold: float = -30,
+    hostile_multiplier: float = -0.2,
+) -> RippleMatrix:
+    """The ripple matrix for a faction_propagation config."""
+    return RippleMatrix(allied_threshold, allied_multiplier, hostile_threshold, hostile_multiplier)
+
+
+def shift_standings(standings: Sequence[int], deltas: Sequence[int]) -> list[int]:
+    """Apply deltas to a vector of standing indexes, clamped like FactionStanding.shift."""
+    top = len(STANDINGS) - 1
+    if NUMPY_AVAILABLE:
+        return np.clip(np.add(standings, deltas), 0, top).tolist()
+    return [max(0, min(top, s + d)) for s, d in zip(standings, deltas)]
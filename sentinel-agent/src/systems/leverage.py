@@ -15,6 +15,7 @@ from ..state.schema import (
     LeverageWeight,
 )
 from ..lore.chunker import extract_keywords
+from ..state.triggers import trigger_index
 
 if TYPE_CHECKING:
     from ..state.manager import CampaignManager
@@ -92,7 +93,9 @@ class LeverageSystem:
             leverage_keywords=keywords,
         )
 
+        triggers = trigger_index(self._campaign)
         char.enhancements.append(enhancement)
+        triggers.add_enhancement(char.id, enhancement)
 
         # Log as hinge moment (enhancement acceptance is irreversible)
         self.manager.log_history(
@@ -364,37 +367,35 @@ class LeverageSystem:
 
         current_session = self._campaign.meta.session_count
 
-        for char in self._campaign.characters:
-            for enhancement in char.enhancements:
-                # Skip if already has pending demand or obligation
-                if enhancement.leverage.pending_demand or enhancement.leverage.pending_obligation:
-                    continue
+        characters = {char.id: char for char in self._campaign.characters}
+        matches = trigger_index(self._campaign).match_enhancements(input_keywords)
+        for character_id, enhancement, matched in matches:
+            # Skip if already has pending demand or obligation
+            if enhancement.leverage.pending_demand or enhancement.leverage.pending_obligation:
+                continue
 
-                # Skip if hinted this session already
-                if enhancement.leverage.last_hint_session == current_session:
-                    continue
+            # Skip if hinted this session already
+            if enhancement.leverage.last_hint_session == current_session:
+                continue
+
+            # Require 2+ matches
+            if len(matched) >= 2:
+                char = characters[character_id]
+                sessions_since = current_session - enhancement.granted_session
 
-                # Check keyword match
-                enh_keywords = set(enhancement.leverage_keywords)
-                matched = enh_keywords & input_keywords
-
-                # Require 2+ matches
-                if len(matched) >= 2:
-                    sessions_since = current_session - enhancement.granted_session
-
-                    hints.append({
-                        "character_id": char.id,
-                        "character_name": char.name,
-                        "enhancement_id": enhancement.id,
-                        "enhancement_name": enhancement.name,
-                        "faction": enhancement.source.value,
-                        "weight": enhancement.leverage.weight.value,
-                        "matched_keywords": list(matched),
-                        "sessions_since_grant": sessions_since,
-                        "hint_count": enhancement.leverage.hint_count,
-                        "compliance_count": enhancement.leverage.compliance_count,
-                        "resistance_count": enhancement.leverage.resistance_count,
-                    })
+                hints.append({
+                    "character_id": char.id,
+                    "character_name": char.name,
+                    "enhancement_id": enhancement.id,
+                    "enhancement_name": enhancement.name,
+                    "faction": enhancement.source.value,
+                    "weight": enhancement.leverage.weight.value,
+                    "matched_keywords": list(matched),
+                    "sessions_since_grant": sessions_since,
+                    "hint_count": enhancement.leverage.hint_count,
+                    "compliance_count": enhancement.leverage.compliance_count,
+                    "resistance_count": enhancement.leverage.resistance_count,
+                })
 
         return hints
 
@@ -24,6 +24,7 @@ from ..state.schema import (
     Urgency,
 )
 from ..state.event_bus import get_event_bus, EventType
+from ..state.triggers import trigger_index
 
 if TYPE_CHECKING:
     from ..state.manager import CampaignManager
@@ -278,7 +279,9 @@ class MissionSystem:
                     offer.faction.value.lower() if offer.faction else "",
                 ],
             )
+            triggers = trigger_index(self._campaign)
             self._campaign.dormant_threads.append(thread)
+            triggers.add_thread(thread)
             result["effects"].append({
                 "type": "dormant_thread",
                 "thread_id": thread.id,
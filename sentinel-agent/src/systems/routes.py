@@ -0,0 +1,379 @@
+"""
+Precomputed region route graph.
+
+regions.json is loaded once per process into an immutable RouteGraph
+(route_graph()). Route requirements are compiled into RouteChecks when
+the graph is built: faction ids are resolved to FactionName and minimum
+standings to an index, so checking one is an integer compare or a set
+lookup against a TravelProfile taken from the campaign.
+
+Every distinct check gets a bit. A campaign's profile folds to the mask
+of checks it satisfies, and all-pairs paths (Floyd–Warshall over
+(hops, bypasses) cost vectors) are computed once per mask. Standing or
+vehicle changes that don't flip a requirement reuse the same tables;
+ones that do cost one 11-node recompute.
+
+    graph = route_graph()
+    plan = graph.plan(campaign, "northeast_scar")
+    plan.path                  # ("rust_corridor", ..., "northeast_scar")
+    orchestrator.commit_batch([...plan.proposals()])
+
+    graph.reachable(campaign)  # region -> RoutePlan, for map overlays
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
+
+from ..state.schema import FactionName, Standing
+from ..state.schemas.action import ActionType, Proposal
+
+if TYPE_CHECKING:
+    from ..state.schema import Campaign
+
+
+# Default regions data path
+REGIONS_DATA_PATH = Path(__file__).parent.parent.parent / "data" / "regions.json"
+
+STANDINGS: tuple[Standing, ...] = tuple(Standing)  # Hostile .. Allied
+FACTIONS: tuple[FactionName, ...] = tuple(FactionName)
+FACTION_INDEX: dict[FactionName, int] = {f: i for i, f in enumerate(FACTIONS)}
+
+_NEUTRAL = STANDINGS.index(Standing.NEUTRAL)
+
+# Route states under a profile
+OPEN = "open"  # Requirements met
+BYPASS = "bypass"  # Requirements unmet; an alternative gets through
+CLOSED = "closed"  # Requirements unmet, no alternatives
+
+
+def resolve_faction(faction_id: str) -> FactionName | None:
+    """FactionName for a regions.json id ("ghost_networks") or display name."""
+    key = faction_id.strip().lower().replace(" ", "_")
+    for faction in FACTIONS:
+        if key == faction.name.lower():
+            return faction
+    return None
+
+
+def standing_index(standing: str) -> int:
+    """Position of a standing name in Hostile..Allied (unknown: Neutral)."""
+    for i, s in enumerate(STANDINGS):
+        if s.value.lower() == standing.lower():
+            return i
+    return _NEUTRAL
+
+
+# ─── Profiles and checks ────────────────────────────────────
+
+@dataclass(frozen=True)
+class TravelProfile:
+    """What route requirements look at: standings and vehicle capabilities."""
+    standings: tuple[int, ...]  # Standing index per faction, FactionName order
+    capabilities: frozenset[str]  # Lowercased terrain and type of operational vehicles
+
+    @classmethod
+    def from_campaign(cls, campaign: "Campaign") -> "TravelProfile":
+        standings = tuple(
+            STANDINGS.index(campaign.factions.get(f).standing) for f in FACTIONS
+        )
+        capabilities: set[str] = set()
+        if campaign.characters:
+            for vehicle in campaign.characters[0].vehicles:
+                if vehicle.is_operational:
+                    capabilities.update(t.lower() for t in vehicle.terrain)
+                    capabilities.add(vehicle.type.lower())
+        return cls(standings, frozenset(capabilities))
+
+
+@dataclass(frozen=True)
+class RouteCheck:
+    """
+    One compiled route requirement.
+
+    kind is "faction" (standing at least min_standing), "contact" (not
+    Unfriendly or worse) or "vehicle" (an operational vehicle whose
+    terrain or type matches key). key is the id as written in regions.json.
+    """
+    kind: str
+    key: str
+    faction: FactionName | None = None
+    min_standing: int = _NEUTRAL
+
+    def met(self, profile: TravelProfile) -> bool:
+        if self.kind == "vehicle":
+            return self.key.lower() in profile.capabilities
+        if self.faction is None:
+            return False
+        return profile.standings[FACTION_INDEX[self.faction]] >= self.min_standing
+
+
+def compile_requirement(requirement: Mapping[str, Any]) -> RouteCheck | None:
+    """A RouteCheck for a regions.json requirement (None for unknown types)."""
+    kind = requirement.get("type")
+    if kind == "vehicle":
+        return RouteCheck(kind, requirement.get("capability", ""))
+    if kind in ("faction", "contact"):
+        faction_id = requirement.get("faction", "")
+        min_standing = (
+            standing_index(requirement.get("min_standing", "neutral"))
+            if kind == "faction" else _NEUTRAL
+        )
+        return RouteCheck(kind, faction_id, resolve_faction(faction_id), min_standing)
+    return None
+
+
+# ─── Graph ──────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class RouteEdge:
+    """A direct route between two regions."""
+    source: str
+    target: str
+    checks: tuple[RouteCheck, ...]
+    mask: int  # Bits of the graph's checks this route needs
+    data: Mapping[str, Any]  # The route's regions.json entry (read-only)
+
+    @property
+    def bypassable(self) -> bool:
+        return bool(self.data.get("alternatives"))
+
+    def state(self, satisfied: int) -> str:
+        """OPEN, BYPASS or CLOSED for a mask of satisfied checks."""
+        if self.mask & ~satisfied == 0:
+            return OPEN
+        return BYPASS if self.bypassable else CLOSED
+
+
+@dataclass(frozen=True)
+class RoutePlan:
+    """A multi-hop route."""
+    path: tuple[str, ...]  # Region ids, source first
+    bypassed: tuple[str, ...]  # Destinations whose hop needs an alternative
+
+    @property
+    def hops(self) -> int:
+        return len(self.path) - 1
+
+    @property
+    def bypasses(self) -> int:
+        return len(self.bypassed)
+
+    def proposals(self) -> list[Proposal]:
+        """One travel proposal per hop, in order (see commit_batch)."""
+        return [
+            Proposal(action_type=ActionType.TRAVEL, payload={"to": region})
+            for region in self.path[1:]
+        ]
+
+
+class _PathTable:
+    """All-pairs next hops under one mask, for both cost orderings."""
+
+    def __init__(self, graph: "RouteGraph", satisfied: int):
+        n = len(graph.nodes)
+        # Cost vectors are (hops, bypasses); None is unreachable
+        weights: list[list[tuple[int, int] | None]] = [[None] * n for _ in range(n)]
+        for i in range(n):
+            weights[i][i] = (0, 0)
+        for edge in graph.edges():
+            state = edge.state(satisfied)
+            if state != CLOSED:
+                i, j = graph.index[edge.source], graph.index[edge.target]
+                weights[i][j] = (1, int(state == BYPASS))
+        self.bypass_states = {
+            (e.source, e.target): e.state(satisfied) == BYPASS for e in graph.edges()
+        }
+        self.shortest = _floyd_warshall(weights, lambda c: c)
+        self.cheapest = _floyd_warshall(weights, lambda c: (c[1], c[0]))
+
+
+def _floyd_warshall(weights: list[list[tuple[int, int] | None]], key) -> list[list[int | None]]:
+    """
+    Next-hop matrix minimizing key(cost); costs add componentwise, so
+    lexicographic key orders are consistent with path extension.
+    """
+    n = len(weights)
+    dist = [row[:] for row in weights]
+    nxt = [[j if weights[i][j] is not None else None for j in range(n)] for i in range(n)]
+    for k in range(n):
+        dist_k = dist[k]
+        for i in range(n):
+            d_ik = dist[i][k]
+            if d_ik is None or i == k:
+                continue
+            dist_i, nxt_i = dist[i], nxt[i]
+            for j in range(n):
+                d_kj = dist_k[j]
+                if d_kj is None:
+                    continue
+                candidate = (d_ik[0] + d_kj[0], d_ik[1] + d_kj[1])
+                if dist_i[j] is None or key(candidate) < key(dist_i[j]):
+                    dist_i[j] = candidate
+                    nxt_i[j] = nxt_i[k]
+    return nxt
+
+
+class RouteGraph:
+    """
+    Immutable region graph built from regions.json data.
+
+    Build through route_graph(), which shares one graph per file.
+    """
+
+    # Path tables kept per graph; masks beyond this evict the oldest
+    MAX_TABLES = 64
+
+    def __init__(self, regions: Mapping[str, Any]):
+        self.regions: Mapping[str, Any] = _freeze(regions)
+        self.nodes: tuple[str, ...] = tuple(self.regions)
+        self.index: dict[str, int] = {r: i for i, r in enumerate(self.nodes)}
+
+        bits: dict[RouteCheck, int] = {}
+        edges: dict[tuple[str, str], RouteEdge] = {}
+        for source, info in self.regions.items():
+            for target, route in info.get("routes", {}).items():
+                if target not in self.index:
+                    continue
+                checks = tuple(
+                    check for check in map(compile_requirement, route.get("requirements", ()))
+                    if check is not None
+                )
+                mask = 0
+                for check in checks:
+                    mask |= 1 << bits.setdefault(check, len(bits))
+                edges[(source, target)] = RouteEdge(source, target, checks, mask, route)
+
+        self.checks: tuple[RouteCheck, ...] = tuple(bits)
+        self._edges = edges
+        self._neighbors = {
+            region: tuple(sorted(t for (s, t) in edges if s == region))
+            for region in self.nodes
+        }
+        self._tables: dict[int, _PathTable] = {}
+
+    def edges(self) -> list[RouteEdge]:
+        return list(self._edges.values())
+
+    def route(self, source: str, target: str) -> RouteEdge | None:
+        """The direct route from source to target, if there is one."""
+        return self._edges.get((source, target))
+
+    def neighbors(self, region: str) -> tuple[str, ...]:
+        """Regions one route away, sorted."""
+        return self._neighbors.get(region, ())
+
+    def name(self, region: str) -> str:
+        """Display name of a region."""
+        return self.regions.get(region, {}).get("name", region)
+
+    def satisfied(self, campaign: "Campaign | TravelProfile") -> int:
+        """Mask of this graph's checks the campaign (or profile) meets."""
+        profile = (
+            campaign if isinstance(campaign, TravelProfile)
+            else TravelProfile.from_campaign(campaign)
+        )
+        mask = 0
+        for bit, check in enumerate(self.checks):
+            if check.met(profile):
+                mask |= 1 << bit
+        return mask
+
+    def plan(
+        self,
+        campaign: "Campaign",
+        target: str,
+        source: str | None = None,
+        cheapest: bool = False,
+    ) -> RoutePlan | None:
+        """
+        Best multi-hop route to target.
+
+        Args:
+            campaign: Campaign whose standings and vehicles gate routes
+            target: Destination region id
+            source: Starting region id (default: the current region)
+            cheapest: Fewest bypassed requirements first, then fewest hops
+                (default: fewest hops first)
+
+        Returns:
+            The plan, or None if target can't be reached
+        """
+        source = source or campaign.map_state.current_region.value
+        table = self._table(self.satisfied(campaign))
+        return self._plan(table, table.cheapest if cheapest else table.shortest, source, target)
+
+    def reachable(
+        self,
+        campaign: "Campaign",
+        source: str | None = None,
+        bypass: bool = True,
+    ) -> dict[str, RoutePlan]:
+        """
+        Every region reachable from source, with its shortest plan.
+
+        With bypass=False only routes whose requirements are met count,
+        and each plan is the shortest among those.
+        """
+        source = source or campaign.map_state.current_region.value
+        table = self._table(self.satisfied(campaign))
+        nxt = table.shortest if bypass else table.cheapest
+        plans = {}
+        for target in self.nodes:
+            if target == source:
+                continue
+            plan = self._plan(table, nxt, source, target)
+            if plan is not None and (bypass or not plan.bypasses):
+                plans[target] = plan
+        return plans
+
+    def _table(self, satisfied: int) -> _PathTable:
+        table = self._tables.get(satisfied)
+        if table is None:
+            if len(self._tables) >= self.MAX_TABLES:
+                del self._tables[next(iter(self._tables))]
+            table = self._tables[satisfied] = _PathTable(self, satisfied)
+        return table
+
+    def _plan(self, table: _PathTable, nxt, source: str, target: str) -> RoutePlan | None:
+        if source not in self.index or target not in self.index:
+            return None
+        i, j = self.index[source], self.index[target]
+        if nxt[i][j] is None:
+            return None
+        path = [source]
+        while i != j:
+            i = nxt[i][j]
+            path.append(self.nodes[i])
+        bypassed = tuple(
+            b for a, b in zip(path, path[1:]) if table.bypass_states[(a, b)]
+        )
+        return RoutePlan(tuple(path), bypassed)
+
+
+@lru_cache(maxsize=4)
+def _load_graph(path: Path) -> RouteGraph:
+    regions: dict = {}
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            regions = json.load(f).get("regions", {})
+    return RouteGraph(regions)
+
+
+def route_graph(regions_path: Path | None = None) -> RouteGraph:
+    """The process-wide route graph for a regions file (default: data/regions.json)."""
+    return _load_graph(Path(regions_path or REGIONS_DATA_PATH).resolve())
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of parsed JSON: mapping proxies and tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
@@ -0,0 +1,530 @@
+"""
+Monte Carlo what-if simulator over the turn engine.
+
+Instead of asking the LLM to imagine consequences, roll the campaign
+forward: overlay it (state.overlay), commit a candidate action through the real
+TurnOrchestrator (ActionValidator, TravelResolver, CascadeProcessor), then
+let a random follow-up policy play N more turns. Thousands of seeded
+rollouts run across a ProcessPoolExecutor and are tallied into
+distributions the GM can narrate:
+
+- faction standings at the end of the horizon
+- which dormant threads surfaced (share of rollouts)
+- NPC effective dispositions and cascade reactions
+
+Rollouts are deterministic: rollout i of a run with seed s always draws
+from Random(f"{s}:{i}"), so a candidate and its baseline see the same
+follow-up dice (common random numbers) and their difference is the
+candidate's effect rather than noise.
+
+Usage:
+    report = simulate(campaign, Proposal(action_type="travel", payload={"to": "gulf_passage"}))
+    baseline = simulate(campaign, None)
+    print(report.format(baseline))
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable
+
+from ..state.event_bus import reset_event_bus
+from ..state.overlay import CampaignOverlay
+from ..state.schemas.action import Action, ActionType, Proposal, RequirementStatus
+from ..state.schemas.event import TurnEvent
+from .cascades import CascadeProcessor
+from .travel import TravelResolver
+from .turns import TurnOrchestrator
+from .validation import ActionValidator
+
+if TYPE_CHECKING:
+    from ..state.schema import Campaign
+
+
+DEFAULT_ROLLOUTS = 1000
+DEFAULT_TURNS = 5
+
+# Follow-up policies: (campaign, rng, engine) -> next proposal, or None to pass
+Policy = Callable[["Campaign", random.Random, "SimulationEngine"], "Proposal | None"]
+
+
+def _policy_hold(campaign: "Campaign", rng: random.Random, engine: "SimulationEngine") -> Proposal | None:
+    """Lie low: let the turn pass."""
+    return None
+
+
+def _policy_wander(campaign: "Campaign", rng: random.Random, engine: "SimulationEngine") -> Proposal | None:
+    """Travel along a random route out of the current region."""
+    routes = engine.routes(campaign.map_state.current_region.value)
+    if not routes:
+        return None
+    return Proposal(action_type=ActionType.TRAVEL, payload={"to": rng.choice(routes)})
+
+
+def _policy_drift(campaign: "Campaign", rng: random.Random, engine: "SimulationEngine") -> Proposal | None:
+    """Do a small favor or slight for a random faction."""
+    from ..state.schema import FactionName
+
+    faction = rng.choice(list(FactionName))
+    return Proposal(
+        action_type=ActionType.LOCAL,
+        payload={"standing_changes": {faction.value: rng.choice((-1, 1))}},
+    )
+
+
+POLICIES: dict[str, Policy] = {
+    "hold": _policy_hold,
+    "wander": _policy_wander,
+    "drift": _policy_drift,
+}
+
+
+def resolve_local(action: Action, campaign: "Campaign", seed: int) -> tuple[list[TurnEvent], dict]:
+    """
+    Resolve a local action's standing changes.
+
+    Payload: {"standing_changes": {faction: delta}, "reason": str}. Other
+    local effects are narrative and have no engine resolution yet.
+    """
+    from ..state.schema import FactionName
+
+    events: list[TurnEvent] = []
+    reason = action.payload.get("reason", "Local action")
+    for faction_name, delta in action.payload.get("standing_changes", {}).items():
+        try:
+            faction = FactionName(faction_name)
+        except ValueError:
+            continue
+        standing = campaign.factions.get(faction)
+        old_standing = standing.standing.value
+        standing.shift(delta)
+        events.append(TurnEvent(
+            event_type="standing.changed",
+            source_action=action.action_id,
+            payload={
+                "faction": faction.value,
+                "delta": delta,
+                "old_standing": old_standing,
+                "new_standing": standing.standing.value,
+                "reason": reason,
+            },
+            summary=f"{faction.value} standing shifted ({reason})",
+        ))
+    return events, {}
+
+
+# ─── Rollouts ────────────────────────────────────────────────
+
+@dataclass
+class RolloutOutcome:
+    """End state of one rollout."""
+    policy: str
+    standings: dict[str, str]
+    surfaced_threads: list[str]
+    dispositions: dict[str, str]  # NPC id -> effective disposition
+    reactions: dict[str, int]  # NPC id -> net cascade reactions (+cooperative, -wary)
+    region: str
+    feasible: bool = True  # Whether the candidate action could be committed
+
+
+class SimulationEngine:
+    """The turn-engine components one process reuses across rollouts."""
+
+    def __init__(self):
+        self.validator = ActionValidator()
+        self.travel = TravelResolver()
+        self.cascades = CascadeProcessor()
+
+    def routes(self, region: str) -> list[str]:
+        """Destinations reachable from a region, sorted for determinism."""
+        return list(self.validator.routes.neighbors(region))
+
+    def orchestrator(self, campaign: "Campaign") -> TurnOrchestrator:
+        orchestrator = TurnOrchestrator(campaign)
+        orchestrator.set_validator(self.validator.validate)
+        orchestrator.register_resolver(ActionType.TRAVEL.value, self.travel.resolve)
+        orchestrator.register_resolver(ActionType.LOCAL.value, resolve_local)
+        orchestrator.set_cascade_processor(self.cascades.process)
+        return orchestrator
+
+    def take_turn(
+        self,
+        orchestrator: TurnOrchestrator,
+        proposal: Proposal,
+        rng: random.Random,
+        action_id: str,
+    ) -> list[TurnEvent] | None:
+        """Propose and commit; None if the action isn't feasible."""
+        result = orchestrator.propose(proposal)
+        if not result.feasible:
+            orchestrator.cancel()
+            return None
+        # Unmet requirements are bypassed through a route alternative
+        blocked = any(r.status != RequirementStatus.MET for r in result.requirements)
+        alternative = rng.choice(result.alternatives).type if blocked and result.alternatives else None
+        action = Action(
+            action_id=action_id,
+            action_type=proposal.action_type,
+            state_version=orchestrator.campaign.state_version,
+            payload=proposal.payload,
+            chosen_alternative=alternative,
+        )
+        return orchestrator.commit(action).events
+
+    def rollout(
+        self,
+        base: "Campaign",
+        candidate: Proposal | None,
+        turns: int,
+        policies: list[str],
+        seed: int,
+        index: int,
+    ) -> RolloutOutcome:
+        """Play one rollout on a copy-on-write overlay of base."""
+        rng = random.Random(f"{seed}:{index}")
+        policy_name = rng.choice(policies)
+        policy = POLICIES[policy_name]
+
+        campaign = CampaignOverlay(base)
+        orchestrator = self.orchestrator(campaign)
+        events: list[TurnEvent] = []
+        feasible = True
+
+        if candidate is not None:
+            committed = self.take_turn(orchestrator, candidate, rng, f"sim-{index}-0")
+            feasible = committed is not None
+            events.extend(committed or [])
+        for turn in range(1, turns + 1):
+            proposal = policy(campaign, rng, self)
+            if proposal is not None:
+                events.extend(self.take_turn(orchestrator, proposal, rng, f"sim-{index}-{turn}") or [])
+
+        return _outcome(campaign, policy_name, events, feasible)
+
+
+def _outcome(campaign: CampaignOverlay, policy: str, events: list[TurnEvent], feasible: bool) -> RolloutOutcome:
+    from ..state.schema import FactionName
+
+    factions = campaign.peek("factions")
+    reactions: Counter[str] = Counter()
+    for event in events:
+        if event.event_type == "npc.reacted" and "npc_id" in event.payload:
+            reaction = event.payload.get("reaction", "")
+            reactions[event.payload["npc_id"]] += -1 if reaction == "grew wary" else 1
+
+    dispositions = {}
+    for npc in campaign.peek("npcs").active:
+        standing = factions.get(npc.faction).standing if npc.faction else None
+        dispositions[npc.id] = npc.get_effective_disposition(standing).value
+
+    return RolloutOutcome(
+        policy=policy,
+        standings={f.value: factions.get(f).standing.value for f in FactionName},
+        surfaced_threads=sorted({
+            e.payload["thread_id"] for e in events
+            if e.event_type == "thread.surfaced" and e.payload.get("thread_id")
+        }),
+        dispositions=dispositions,
+        reactions=dict(reactions),
+        region=campaign.map_state.current_region.value,
+        feasible=feasible,
+    )
+
+
+# ─── Aggregation ─────────────────────────────────────────────
+
+@dataclass
+class _Tally:
+    """Counts merged across chunks (cheap to pickle back from workers)."""
+    rollouts: int = 0
+    infeasible: int = 0
+    standings: dict[str, Counter] = field(default_factory=dict)
+    threads: Counter = field(default_factory=Counter)
+    dispositions: dict[str, Counter] = field(default_factory=dict)
+    cooperative: Counter = field(default_factory=Counter)
+    wary: Counter = field(default_factory=Counter)
+    regions: Counter = field(default_factory=Counter)
+    policies: Counter = field(default_factory=Counter)
+
+    def add(self, outcome: RolloutOutcome) -> None:
+        self.rollouts += 1
+        self.infeasible += not outcome.feasible
+        for faction, standing in outcome.standings.items():
+            self.standings.setdefault(faction, Counter())[standing] += 1
+        self.threads.update(outcome.surfaced_threads)
+        for npc_id, disposition in outcome.dispositions.items():
+            self.dispositions.setdefault(npc_id, Counter())[disposition] += 1
+        for npc_id, net in outcome.reactions.items():
+            if net > 0:
+                self.cooperative[npc_id] += 1
+            elif net < 0:
+                self.wary[npc_id] += 1
+        self.regions[outcome.region] += 1
+        self.policies[outcome.policy] += 1
+
+    def merge(self, other: "_Tally") -> None:
+        self.rollouts += other.rollouts
+        self.infeasible += other.infeasible
+        for mine, theirs in ((self.standings, other.standings), (self.dispositions, other.dispositions)):
+            for key, counts in theirs.items():
+                mine.setdefault(key, Counter()).update(counts)
+        for name in ("threads", "cooperative", "wary", "regions", "policies"):
+            getattr(self, name).update(getattr(other, name))
+
+
+@dataclass
+class WhatIfReport:
+    """Outcome distributions over all rollouts (shares in 0..1)."""
+    candidate: Proposal | None
+    rollouts: int
+    turns: int
+    seed: int
+    infeasible: float
+    standings: dict[str, dict[str, float]]  # faction -> {standing: share}
+    threads: dict[str, float]  # thread id -> share surfaced
+    dispositions: dict[str, dict[str, float]]  # NPC id -> {disposition: share}
+    reactions: dict[str, dict[str, float]]  # NPC id -> {"cooperative", "wary": share}
+    regions: dict[str, float]
+    policies: dict[str, int]
+    elapsed: float = 0.0
+
+    @classmethod
+    def from_tally(cls, tally: _Tally, candidate, turns, seed, elapsed) -> "WhatIfReport":
+        n = max(tally.rollouts, 1)
+
+        def shares(counts: Counter) -> dict[str, float]:
+            return {k: v / n for k, v in counts.most_common()}
+
+        return cls(
+            candidate=candidate,
+            rollouts=tally.rollouts,
+            turns=turns,
+            seed=seed,
+            infeasible=tally.infeasible / n,
+            standings={f: shares(c) for f, c in tally.standings.items()},
+            threads=shares(tally.threads),
+            dispositions={npc: shares(c) for npc, c in tally.dispositions.items()},
+            reactions={
+                npc: {"cooperative": tally.cooperative[npc] / n, "wary": tally.wary[npc] / n}
+                for npc in sorted(set(tally.cooperative) | set(tally.wary))
+            },
+            regions=shares(tally.regions),
+            policies=dict(tally.policies),
+            elapsed=elapsed,
+        )
+
+    def expected_standing(self, faction: str) -> float:
+        """Mean standing index (0 = Hostile .. 4 = Allied)."""
+        from .faction_matrix import STANDINGS
+
+        order = {s.value: i for i, s in enumerate(STANDINGS)}
+        return sum(order[s] * p for s, p in self.standings.get(faction, {}).items())
+
+    def format(
+        self,
+        baseline: "WhatIfReport | None" = None,
+        campaign: "Campaign | None" = None,
+        limit: int = 6,
+    ) -> str:
+        """
+        Compact text for the GM prompt: the largest measured effects.
+
+        With a baseline (same seed, no candidate), standings and thread
+        shares are reported as differences from it.
+        """
+        threads = {t.id: t for t in campaign.dormant_threads} if campaign else {}
+        npcs = {n.id: n.name for n in campaign.npcs.active} if campaign else {}
+        lines = [f"{self.rollouts} rollouts x {self.turns} turns"]
+        if self.infeasible:
+            lines.append(f"Candidate action infeasible in {self.infeasible:.0%} of rollouts")
+
+        shifts = []
+        for faction, dist in self.standings.items():
+            mean = self.expected_standing(faction)
+            change = mean - baseline.expected_standing(faction) if baseline else 0.0
+            top, share = next(iter(dist.items()))
+            shifts.append((abs(change), faction, top, share, change))
+        shifts.sort(key=lambda s: (-s[0], s[1]))
+        lines.append("Faction standings (most likely, share" + (", vs baseline)" if baseline else ")"))
+        for _, faction, top, share, change in shifts[:limit]:
+            delta = f", {change:+.2f} steps" if baseline else ""
+            lines.append(f"- {faction}: {top} {share:.0%}{delta}")
+
+        thread_ids = set(self.threads) | (set(baseline.threads) if baseline else set())
+        if thread_ids:
+            lines.append("Dormant threads surfacing")
+            rows = []
+            for thread_id in thread_ids:
+                share = self.threads.get(thread_id, 0.0)
+                base = baseline.threads.get(thread_id, 0.0) if baseline else None
+                rows.append((-(share - (base or 0.0)) if baseline else -share, thread_id, share, base))
+            for _, thread_id, share, base in sorted(rows)[:limit]:
+                label = threads[thread_id].consequence[:60] if thread_id in threads else thread_id
+                versus = f" (baseline {base:.0%})" if base is not None else ""
+                lines.append(f"- {label}: {share:.0%}{versus}")
+
+        npc_ids = set(self.reactions) | (set(baseline.reactions) if baseline else set())
+        if npc_ids:
+            lines.append("NPC reactions (cooperative / wary" + (", vs baseline)" if baseline else ")"))
+            none = {"cooperative": 0.0, "wary": 0.0}
+            rows = []
+            for npc_id in npc_ids:
+                mine = self.reactions.get(npc_id, none)
+                base = baseline.reactions.get(npc_id, none) if baseline else none
+                change = (mine["cooperative"] - base["cooperative"], mine["wary"] - base["wary"])
+                weight = abs(change[0]) + abs(change[1]) if baseline else mine["cooperative"] + mine["wary"]
+                rows.append((-weight, npcs.get(npc_id, npc_id), mine, change))
+            for _, name, mine, change in sorted(rows)[:limit]:
+                versus = f" ({change[0]:+.0%} / {change[1]:+.0%})" if baseline else ""
+                lines.append(f"- {name}: {mine['cooperative']:.0%} / {mine['wary']:.0%}{versus}")
+
+        ends = ", ".join(f"{region} {share:.0%}" for region, share in list(self.regions.items())[:3])
+        lines.append(f"Final region: {ends}")
+        return "\n".join(lines)
+
+
+# ─── Process pool ────────────────────────────────────────────
+
+_worker_campaign: "Campaign | None" = None
+_worker_engine: SimulationEngine | None = None
+
+
+def _init_worker(campaign_json: str) -> None:
+    """Parse the campaign once per process and detach from the app's bus."""
+    global _worker_campaign, _worker_engine
+    from ..state.schema import Campaign
+
+    reset_event_bus()  # Rollouts must never reach the app's subscribers
+    _worker_campaign = Campaign.model_validate_json(campaign_json)
+    _worker_engine = SimulationEngine()
+
+
+def _run_chunk(candidate_json: str | None, start: int, stop: int, turns: int,
+               policies: list[str], seed: int) -> _Tally:
+    candidate = Proposal.model_validate_json(candidate_json) if candidate_json else None
+    tally = _Tally()
+    for index in range(start, stop):
+        tally.add(_worker_engine.rollout(_worker_campaign, candidate, turns, policies, seed, index))
+    return tally
+
+
+def simulate(
+    campaign: "Campaign",
+    candidate: Proposal | None,
+    rollouts: int = DEFAULT_ROLLOUTS,
+    turns: int = DEFAULT_TURNS,
+    policies: list[str] | None = None,
+    seed: int = 0,
+    workers: int | None = None,
+) -> WhatIfReport:
+    """
+    Roll the campaign forward `rollouts` times and tally the outcomes.
+
+    Args:
+        campaign: Starting state (not modified)
+        candidate: Action committed first in every rollout (None = baseline)
+        rollouts: Number of rollouts
+        turns: Follow-up turns after the candidate
+        policies: Follow-up policy names (default: all of POLICIES)
+        seed: Run seed; equal seeds give identical reports
+        workers: Worker processes (default: CPU count)
+
+    Raises:
+        ValueError: If the candidate has no engine resolver, or a policy is unknown
+    """
+    return simulate_many(campaign, [candidate], rollouts, turns, policies, seed, workers)[0]
+
+
+def simulate_many(
+    campaign: "Campaign",
+    candidates: list[Proposal | None],
+    rollouts: int = DEFAULT_ROLLOUTS,
+    turns: int = DEFAULT_TURNS,
+    policies: list[str] | None = None,
+    seed: int = 0,
+    workers: int | None = None,
+) -> list[WhatIfReport]:
+    """
+    simulate() for several candidates on one process pool, e.g. a
+    candidate and its baseline (None). Same seed, same follow-up dice.
+    """
+    policies = sorted(policies or POLICIES)
+    unknown = [p for p in policies if p not in POLICIES]
+    if unknown:
+        raise ValueError(f"Unknown policies: {', '.join(unknown)}")
+    for candidate in candidates:
+        if candidate is not None and candidate.action_type not in (ActionType.TRAVEL, ActionType.LOCAL):
+            raise ValueError(f"No simulation resolver for {candidate.action_type.value} actions")
+
+    started = time.perf_counter()
+    workers = max(1, min(workers or os.cpu_count() or 1, rollouts))
+    chunk = max(1, -(-rollouts // (workers * 4)))
+    campaign_json = campaign.model_dump_json()
+
+    tallies = [_Tally() for _ in candidates]
+    # Spawned, not forked: the TUI calls this from a threaded process
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        workers, mp_context=context, initializer=_init_worker, initargs=(campaign_json,),
+    ) as pool:
+        futures = [
+            (tally, pool.submit(
+                _run_chunk, candidate.model_dump_json() if candidate else None,
+                start, min(start + chunk, rollouts), turns, policies, seed,
+            ))
+            for candidate, tally in zip(candidates, tallies)
+            for start in range(0, rollouts, chunk)
+        ]
+        for tally, future in futures:
+            tally.merge(future.result())
+
+    elapsed = time.perf_counter() - started
+    return [
+        WhatIfReport.from_tally(tally, candidate, turns, seed, elapsed)
+        for candidate, tally in zip(candidates, tallies)
+    ]
+
+
+# Verbs that turn a what-if about a faction into a slight rather than a favor
+_HOSTILE_VERBS = (
+    "betray", "refuse", "refused", "attack", "oppose", "against", "sabotage",
+    "anger", "defy", "reject", "rejected", "abandon", "turn on", "sold out",
+)
+
+
+def proposal_from_text(text: str) -> Proposal | None:
+    """
+    Best-effort candidate action for a what-if query.
+
+    A region mentioned by id or name ("gulf passage") becomes travel;
+    otherwise factions mentioned become a local action shifting their
+    standing by one step, down if a hostile verb appears ("betrayed the
+    Lattice"), up otherwise ("helped Ember"). None if neither is found.
+    """
+    from ..state.schema import FactionName, Region
+
+    lowered = " ".join(text.lower().replace("_", " ").split())
+    for region in Region:
+        if region.value.replace("_", " ") in lowered:
+            return Proposal(action_type=ActionType.TRAVEL, payload={"to": region.value})
+
+    mentioned = [
+        faction for faction in FactionName
+        if faction.value.lower() in lowered or faction.value.lower().split()[0] in lowered.split()
+    ]
+    if not mentioned:
+        return None
+    delta = -1 if any(verb in lowered for verb in _HOSTILE_VERBS) else 1
+    return Proposal(
+        action_type=ActionType.LOCAL,
+        payload={
+            "standing_changes": {faction.value: delta for faction in mentioned},
+            "reason": text,
+        },
+    )
@@ -0,0 +1,291 @@
+"""
+Incremental UI state snapshots and their structural deltas.
+
+The TurnOrchestrator knows which campaign fields a turn changed (its
+overlay's commit() reports them), so the snapshot is rebuilt per section:
+a section whose source fields didn't change is reused as-is, and diffing
+it costs an identity check. Each turn yields the full snapshot (sharing
+unchanged sections with the previous one) and a SnapshotDelta of JSON
+Pointer paths keyed by state_version.
+
+UI side, a SnapshotFeed applies deltas and calls back only the
+subscribers whose paths changed:
+
+    feed = SnapshotFeed()
+    feed.subscribe("/factions", lambda snapshot, paths: world_dock.refresh())
+    bus.on(EventType.SNAPSHOT_UPDATED, feed.on_event)
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from ..state.schemas.turn_result import SnapshotDelta
+
+if TYPE_CHECKING:
+    from ..state.event_bus import GameEvent
+    from ..state.schema import Campaign
+
+
+# ─── Sections ────────────────────────────────────────────────
+
+def _character_section(campaign: "Campaign") -> dict | None:
+    if not campaign.characters:
+        return None
+    char = campaign.characters[0]
+    return {
+        "name": char.name,
+        "credits": char.credits,
+        "social_energy": char.social_energy.current,
+        "social_state": char.social_energy.state,
+    }
+
+
+def _factions_section(campaign: "Campaign") -> dict:
+    factions = {}
+    for faction_name in [
+        "nexus", "ember_colonies", "lattice", "convergence",
+        "covenant", "wanderers", "cultivators", "steel_syndicate",
+        "witnesses", "architects", "ghost_networks",
+    ]:
+        standing = getattr(campaign.factions, faction_name, None)
+        if standing:
+            factions[standing.faction.value] = standing.standing.value
+    return factions
+
+
+def _map_section(campaign: "Campaign") -> dict:
+    return {
+        "current_region": campaign.map_state.current_region.value,
+        "regions": {
+            r.value: {
+                "connectivity": s.connectivity.value,
+                "npcs_met": len(s.npcs_met),
+            }
+            for r, s in campaign.map_state.regions.items()
+        },
+    }
+
+
+def _npcs_section(campaign: "Campaign") -> dict:
+    return {
+        npc.id: {
+            "name": npc.name,
+            "faction": npc.faction.value if npc.faction else None,
+            "disposition": npc.disposition.value,
+        }
+        for npc in campaign.npcs.active
+    }
+
+
+# Snapshot section -> (campaign fields it reads, builder). A section is
+# rebuilt only when a turn changed one of its fields.
+SECTIONS: dict[str, tuple[frozenset[str], Callable[["Campaign"], Any]]] = {
+    "character": (frozenset({"characters"}), _character_section),
+    "factions": (frozenset({"factions"}), _factions_section),
+    "map": (frozenset({"map_state"}), _map_section),
+    "npcs": (frozenset({"npcs"}), _npcs_section),
+}
+
+
+# ─── JSON Pointer diff / apply ──────────────────────────────
+
+def _escape(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff_snapshots(old: dict, new: dict, path: str = "") -> tuple[dict[str, Any], list[str]]:
+    """
+    Structural diff of two snapshot dicts.
+
+    Returns (changed, removed): JSON Pointer -> new value for every leaf
+    (or whole subtree, where the key is new or the type changed) that
+    differs, and the pointers of keys that are gone. Shared sub-dicts
+    (the same object on both sides) are skipped without being walked.
+    """
+    changed: dict[str, Any] = {}
+    removed: list[str] = []
+    _diff(old, new, path, changed, removed)
+    return changed, removed
+
+
+def _diff(old: dict, new: dict, path: str, changed: dict, removed: list) -> None:
+    if old is new:
+        return
+    for key, value in new.items():
+        pointer = f"{path}/{_escape(key)}"
+        if key not in old:
+            changed[pointer] = value
+            continue
+        before = old[key]
+        if isinstance(before, dict) and isinstance(value, dict):
+            _diff(before, value, pointer, changed, removed)
+        elif before != value:
+            changed[pointer] = value
+    for key in old:
+        if key not in new:
+            removed.append(f"{path}/{_escape(key)}")
+
+
+def apply_delta(snapshot: dict, delta: SnapshotDelta) -> dict:
+    """
+    A new snapshot with delta applied. Dicts along changed paths are
+    copied; everything else is shared with the input.
+    """
+    result = dict(snapshot)
+    for pointer in delta.removed:
+        _set(result, pointer, None, remove=True)
+    for pointer, value in delta.changed.items():
+        _set(result, pointer, value)
+    return result
+
+
+def _set(root: dict, pointer: str, value: Any, remove: bool = False) -> None:
+    tokens = [_unescape(t) for t in pointer.split("/")[1:]]
+    node = root
+    for token in tokens[:-1]:
+        child = node.get(token)
+        child = dict(child) if isinstance(child, dict) else {}
+        node[token] = child
+        node = child
+    if remove:
+        node.pop(tokens[-1], None)
+    else:
+        node[tokens[-1]] = value
+
+
+def _touches(pointer: str, prefix: str) -> bool:
+    """True if pointer is prefix, inside it, or one of its ancestors."""
+    if pointer == prefix or not prefix:
+        return True
+    return pointer.startswith(prefix + "/") or prefix.startswith(pointer + "/")
+
+
+# ─── Builder (engine side) ──────────────────────────────────
+
+class SnapshotBuilder:
+    """Builds each turn's snapshot from the last one plus what changed."""
+
+    def __init__(self):
+        self._snapshot: dict | None = None
+        self._version: int | None = None
+
+    @property
+    def snapshot(self) -> dict | None:
+        """The last snapshot built (treat as read-only)."""
+        return self._snapshot
+
+    def invalidate(self) -> None:
+        """Rebuild every section next time (after edits made outside the engine)."""
+        self._version = None
+
+    def build(
+        self,
+        campaign: "Campaign",
+        changed_fields: Iterable[str] | None = None,
+    ) -> tuple[dict, SnapshotDelta]:
+        """
+        The current snapshot and its delta from the previous one.
+
+        Args:
+            campaign: Campaign state
+            changed_fields: Top-level campaign fields changed since the last
+                build; None (or an invalidated builder) rebuilds everything
+
+        Returns:
+            (snapshot, delta). The delta's base_version is None when there
+            was no previous snapshot to diff against.
+        """
+        previous = self._snapshot
+        full = previous is None or self._version is None or changed_fields is None
+        changed_fields = set(changed_fields or ())
+
+        snapshot: dict = {
+            "turn_count": campaign.turn_count,
+            "state_version": campaign.state_version,
+            "region": campaign.region.value if campaign.region else None,
+            "location": campaign.location.value if campaign.location else None,
+        }
+        for name, (fields, build) in SECTIONS.items():
+            if full or fields & changed_fields:
+                section = build(campaign)
+            else:
+                section = previous.get(name)
+            if section is not None:
+                snapshot[name] = section
+
+        changed, removed = diff_snapshots(previous or {}, snapshot)
+        delta = SnapshotDelta(
+            base_version=previous["state_version"] if previous is not None else None,
+            state_version=campaign.state_version,
+            changed=changed,
+            removed=removed,
+        )
+        self._snapshot = snapshot
+        self._version = campaign.state_version
+        return snapshot, delta
+
+
+# ─── Feed (UI side) ─────────────────────────────────────────
+
+SnapshotHandler = Callable[[dict, list[str]], None]
+
+
+class SnapshotFeed:
+    """
+    A UI's copy of the snapshot, kept current from deltas.
+
+    Subscribers name a JSON Pointer path ("/factions", "/map/regions") and
+    are called with (snapshot, changed paths under it) only when a delta
+    touches that path.
+    """
+
+    def __init__(self):
+        self.snapshot: dict = {}
+        self.version: int | None = None
+        self._subscribers: list[tuple[tuple[str, ...], SnapshotHandler]] = []
+
+    def subscribe(self, path: str | Iterable[str], handler: SnapshotHandler) -> None:
+        """
+        Call handler when anything at, under or above path changes.
+
+        Several paths may share one handler; it is called once per delta
+        with the changed paths across all of them.
+        """
+        paths = (path,) if isinstance(path, str) else tuple(path)
+        self._subscribers.append((tuple(p.rstrip("/") for p in paths), handler))
+
+    def reset(self, snapshot: dict) -> None:
+        """Take a full snapshot (initial sync or resync) and notify everyone."""
+        self.snapshot = snapshot
+        self.version = snapshot.get("state_version")
+        for paths, handler in self._subscribers:
+            handler(self.snapshot, list(paths))
+
+    def apply(self, delta: SnapshotDelta) -> bool:
+        """
+        Apply a delta and notify the subscribers it touches.
+
+        Returns False (nothing applied) if the delta doesn't follow this
+        feed's version; resync with reset().
+        """
+        if delta.base_version is not None and delta.base_version != self.version:
+            return False
+        self.snapshot = apply_delta(self.snapshot, delta)
+        self.version = delta.state_version
+
+        paths = delta.paths
+        for prefixes, handler in self._subscribers:
+            touched = [p for p in paths if any(_touches(p, prefix) for prefix in prefixes)]
+            if touched:
+                handler(self.snapshot, touched)
+        return True
+
+    def on_event(self, event: "GameEvent") -> None:
+        """EventBus handler for SNAPSHOT_UPDATED."""
+        if not self.apply(event.data["delta"]):
+            self.reset(event.data["snapshot"])
@@ -21,22 +21,18 @@ Design invariants:
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ..state.schemas.action import Action
 from ..state.schemas.event import TurnEvent
 from ..state.event_bus import get_event_bus, EventType
+from .routes import REGIONS_DATA_PATH, route_graph
 
 if TYPE_CHECKING:
     from ..state.schema import Campaign
 
 
-# Default regions data path
-REGIONS_DATA_PATH = Path(__file__).parent.parent.parent / "data" / "regions.json"
-
-
 class TravelResolver:
     """
     Resolves travel actions between regions.
@@ -52,17 +48,10 @@ class TravelResolver:
 
     def __init__(self, regions_path: Path | None = None):
         self._regions_path = regions_path or REGIONS_DATA_PATH
-        self._regions_data: dict | None = None
 
     def _load_regions(self) -> dict:
-        """Load regions data from JSON (cached)."""
-        if self._regions_data is None:
-            if self._regions_path.exists():
-                with open(self._regions_path, "r", encoding="utf-8") as f:
-                    self._regions_data = json.load(f).get("regions", {})
-            else:
-                self._regions_data = {}
-        return self._regions_data
+        """Regions data from JSON (read-only, shared with the route graph)."""
+        return route_graph(self._regions_path).regions
 
     def resolve(
         self,
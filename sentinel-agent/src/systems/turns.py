@@ -9,6 +9,8 @@ Design principles (from Sentinel 2D §16):
 - State is persisted after RESOLVED, before NARRATING (invariant 4a).
 - Actions during RESOLVING are rejected (concurrency lock).
 - Each phase transition emits events via the EventBus.
+- Seeds derive from the action id, not process state, so a logged action
+  replays identically (systems.replay).
 
 Usage:
     orchestrator = TurnOrchestrator(campaign)
@@ -20,21 +22,31 @@ Usage:
     turn_result = orchestrator.commit(
         Action.from_proposal(proposal, campaign.state_version)
     )
+
+    # Or commit a queue of actions in one pass (one persist, one snapshot)
+    turn_result = orchestrator.commit_batch(queued_actions)
+
+    # UI: apply each turn's snapshot delta (systems.snapshots.SnapshotFeed)
+    bus.on(EventType.SNAPSHOT_UPDATED, feed.on_event)
 """
 
 from __future__ import annotations
 
+import hashlib
 from enum import Enum
 from typing import TYPE_CHECKING, Callable
 
+from ..state.action_log import ActionLog, LoggedAction, state_hash
 from ..state.event_bus import get_event_bus, EventType
 from ..state.schemas.action import (
     Action,
     Proposal,
     ProposalResult,
 )
-from ..state.schemas.turn_result import TurnResult
+from ..state.schemas.turn_result import SnapshotDelta, TurnResult
 from ..state.schemas.event import TurnEvent
+from ..state.overlay import CampaignOverlay
+from .snapshots import SnapshotBuilder
 
 if TYPE_CHECKING:
     from ..state.schema import Campaign
@@ -87,6 +99,44 @@ class InvalidPhaseError(TurnError):
         )
 
 
+def turn_seed(campaign_id: str, action_id: str) -> int:
+    """
+    Resolution seed for an action (invariant 4b).
+
+    A BLAKE2b digest of the action id keyed by the campaign id: stable
+    across processes and restarts (unlike hash() of a str), so a logged
+    action replays under the seed it was first resolved with.
+    """
+    digest = hashlib.blake2b(
+        action_id.encode(), digest_size=8, key=campaign_id.encode()[:64],
+    ).digest()
+    return int.from_bytes(digest, "big") % (2**31)
+
+
+class BatchRejectedError(TurnError):
+    """An action in a batch was infeasible; none of the batch was applied."""
+    def __init__(self, index: int, action: Action, reason: str):
+        self.index = index
+        self.action = action
+        super().__init__(
+            f"Batch action {index + 1} ({action.action_type.value}) is not feasible"
+            + (f": {reason}" if reason else ".")
+        )
+
+
+def _merge_notices(notices: list) -> list[dict]:
+    """Cascade notices as dicts, one per headline and severity with details combined."""
+    merged: dict[tuple, dict] = {}
+    for notice in notices:
+        data = notice if isinstance(notice, dict) else notice.model_dump()
+        key = (data.get("headline"), data.get("severity"))
+        if key in merged:
+            merged[key]["details"].extend(data.get("details", []))
+        else:
+            merged[key] = {**data, "details": list(data.get("details", []))}
+    return list(merged.values())
+
+
 # Type alias for resolver functions
 # Resolver: (action, campaign, seed) -> (list[TurnEvent], dict_state_changes)
 Resolver = Callable[["Action", "Campaign", int], tuple[list[TurnEvent], dict]]
@@ -122,6 +172,10 @@ class TurnOrchestrator:
         self._resolvers: dict[str, Resolver] = {}
         self._cascade_processor: Callable | None = None
         self._persist_fn: Callable[["Campaign"], None] | None = None
+        self._action_log: ActionLog | None = None
+        self._checkpoint_every = 0
+        self._snapshots = SnapshotBuilder()
+        self._changed_fields: set[str] = set()  # Campaign fields changed since the last snapshot
 
     @property
     def phase(self) -> TurnPhase:
@@ -151,6 +205,16 @@ class TurnOrchestrator:
         """Register the persistence function (called after resolution)."""
         self._persist_fn = fn
 
+    def set_action_log(self, log: ActionLog, checkpoint_every: int = 10) -> None:
+        """
+        Register the action log committed actions are appended to.
+
+        Every checkpoint_every-th turn (by turn_count) the entry also
+        records a state hash for replay verification; 0 disables hashing.
+        """
+        self._action_log = log
+        self._checkpoint_every = checkpoint_every
+
     def _transition(self, to: TurnPhase) -> None:
         """Transition to a new phase, enforcing valid transitions."""
         if to not in VALID_TRANSITIONS.get(self._phase, set()):
@@ -264,44 +328,11 @@ class TurnOrchestrator:
             action_type=action.action_type.value,
         )
 
-        # Resolve
-        resolver = self._resolvers.get(action.action_type.value)
-        if resolver is None:
-            raise TurnError(
-                f"No resolver registered for action type: {action.action_type.value}"
-            )
-
-        # Generate seed for deterministic resolution (invariant 4b)
-        seed = hash(action.action_id) % (2**31)
-
-        # Resolution is a pure function: (action, state, seed) -> (events, changes)
-        events, _ = resolver(action, self._campaign, seed)
-
-        # Increment state version and turn count
-        self._campaign.state_version += 1
-        self._campaign.turn_count += 1
+        events, cascade_notices, seed = self._resolve(action)
 
-        # Run cascade processing if registered
-        cascade_notices = []
-        if self._cascade_processor and events:
-            for event in list(events):  # Iterate copy since cascades may add
-                cascade_events, notices = self._cascade_processor(
-                    event, self._campaign,
-                )
-                events.extend(cascade_events)
-                cascade_notices.extend(notices)
-
-        # Remove surfaced dormant threads (deferred from CascadeProcessor)
-        surfaced_thread_ids = {
-            e.payload.get("thread_id")
-            for e in events
-            if e.event_type == "thread.surfaced" and e.payload.get("thread_id")
-        }
-        if surfaced_thread_ids:
-            self._campaign.dormant_threads = [
-                t for t in self._campaign.dormant_threads
-                if t.id not in surfaced_thread_ids
-            ]
+        # Append to the action log before persisting: the log leads the save
+        if self._action_log is not None:
+            self._action_log.append(self._log_entry(action, seed, self._campaign))
 
         # Transition to RESOLVED
         self._transition(TurnPhase.RESOLVED)
@@ -318,7 +349,7 @@ class TurnOrchestrator:
             self._persist_fn(self._campaign)
 
         # Build state snapshot for UI
-        state_snapshot = self._build_snapshot()
+        state_snapshot, snapshot_delta = self._build_snapshot()
 
         # Build narrative hooks from events
         narrative_hooks = [e.summary for e in events if e.summary]
@@ -330,11 +361,13 @@ class TurnOrchestrator:
             state_version=self._campaign.state_version,
             events=events,
             state_snapshot=state_snapshot,
+            snapshot_delta=snapshot_delta,
             seed=seed,
             narrative_hooks=narrative_hooks,
             cascade_notices=[n if isinstance(n, dict) else n.model_dump() for n in cascade_notices],
             turn_number=self._campaign.turn_count,
         )
+        self._emit_snapshot(state_snapshot, snapshot_delta)
 
         # Skip narrating, go straight to complete (narration is optional)
         self._transition(TurnPhase.COMPLETE)
@@ -353,6 +386,231 @@ class TurnOrchestrator:
 
         return turn_result
 
+    def commit_batch(self, actions: list[Action]) -> TurnResult:
+        """
+        Commit a queue of actions as one pipeline run.
+
+        Actions are validated and resolved in order, each against the state
+        the previous ones left, with cascades after each. The state_version
+        check happens once, up front: every action must carry the current
+        version. The whole batch lands in one step, then persists once,
+        emits one TURN_RESOLVING / TURN_RESOLVED / TURN_END and builds one
+        snapshot. If any action is infeasible or fails to resolve, nothing
+        is applied.
+
+        Each action still counts as a turn (state_version and turn_count
+        advance per action) and is logged individually, so the log replays
+        the same as single commits.
+
+        Args:
+            actions: Queued actions, in order
+
+        Returns:
+            TurnResult for the whole batch: all events, merged cascade
+            notices, the final state; action_id and seed of the last action
+
+        Raises:
+            InvalidPhaseError: If not in IDLE phase
+            StaleStateError: If any action's state_version doesn't match
+            BatchRejectedError: If an action is infeasible when reached
+            TurnError: If the batch is empty, no validator is registered,
+                or an action type has no resolver
+        """
+        if self._phase != TurnPhase.IDLE:
+            raise InvalidPhaseError(self._phase, "commit a batch")
+        if not actions:
+            raise TurnError("Cannot commit an empty batch.")
+        if self._validator is None:
+            raise TurnError("No validator registered. Call set_validator() first.")
+
+        # Idempotency check (invariant 4d), once for the whole queue
+        for action in actions:
+            if action.state_version != self._campaign.state_version:
+                raise StaleStateError(
+                    expected=self._campaign.state_version,
+                    got=action.state_version,
+                )
+
+        # Lock: enter RESOLVING
+        self._transition(TurnPhase.PROPOSED)
+        self._transition(TurnPhase.RESOLVING)
+        self._bus.emit(
+            EventType.TURN_RESOLVING,
+            campaign_id=self._campaign.meta.id,
+            session=self._campaign.meta.session_count,
+            action_id=actions[-1].action_id,
+            action_type=actions[-1].action_type.value,
+            action_count=len(actions),
+        )
+
+        batch = CampaignOverlay(self._campaign)
+        events: list[TurnEvent] = []
+        cascade_notices: list = []
+        log_entries: list[LoggedAction] = []
+        try:
+            for index, action in enumerate(actions):
+                self._current_action = action
+                proposal = Proposal(action_type=action.action_type, payload=action.payload)
+                check = self._validator(proposal, batch)
+                if not check.feasible:
+                    raise BatchRejectedError(index, action, check.summary)
+
+                # Later actions in the queue were stamped with the starting version
+                action = action.model_copy(update={"state_version": batch.state_version})
+                action_events, notices, seed = self._resolve(action, batch)
+                events.extend(action_events)
+                cascade_notices.extend(notices)
+                if self._action_log is not None:
+                    log_entries.append(self._log_entry(action, seed, batch))
+        except Exception:
+            # Nothing reached the campaign; release the lock
+            self._phase = TurnPhase.IDLE
+            self._current_action = None
+            raise
+
+        # Apply the whole queue in one step, then log it before persisting
+        self._changed_fields.update(batch.commit())
+        for entry in log_entries:
+            self._action_log.append(entry)
+
+        self._transition(TurnPhase.RESOLVED)
+        self._bus.emit(
+            EventType.TURN_RESOLVED,
+            campaign_id=self._campaign.meta.id,
+            session=self._campaign.meta.session_count,
+            action_id=actions[-1].action_id,
+            action_ids=[a.action_id for a in actions],
+            event_count=len(events),
+        )
+
+        # Persist state BEFORE narrative (invariant 4a)
+        if self._persist_fn:
+            self._persist_fn(self._campaign)
+
+        state_snapshot, snapshot_delta = self._build_snapshot()
+        turn_result = TurnResult(
+            action_id=actions[-1].action_id,
+            action_ids=[a.action_id for a in actions],
+            success=True,
+            state_version=self._campaign.state_version,
+            events=events,
+            state_snapshot=state_snapshot,
+            snapshot_delta=snapshot_delta,
+            seed=seed,
+            narrative_hooks=[e.summary for e in events if e.summary],
+            cascade_notices=_merge_notices(cascade_notices),
+            turn_number=self._campaign.turn_count,
+        )
+        self._emit_snapshot(state_snapshot, snapshot_delta)
+
+        self._transition(TurnPhase.COMPLETE)
+        self._bus.emit(
+            EventType.TURN_END,
+            campaign_id=self._campaign.meta.id,
+            session=self._campaign.meta.session_count,
+            action_id=actions[-1].action_id,
+            turn_number=self._campaign.turn_count,
+        )
+        self._complete_turn()
+
+        return turn_result
+
+    def replay(self, action: Action) -> list[TurnEvent]:
+        """
+        Re-apply a logged action outside the phase machine.
+
+        Resolves under the same seed and cascades as commit(), but skips
+        validation, phase events, persistence and the action log: the
+        action was checked when it was first committed. Used by
+        systems.replay to rebuild state from an action log.
+
+        Raises:
+            InvalidPhaseError: If a turn is in progress
+            StaleStateError: If the action doesn't follow the current state
+        """
+        if self._phase != TurnPhase.IDLE:
+            raise InvalidPhaseError(self._phase, "replay")
+        if action.state_version != self._campaign.state_version:
+            raise StaleStateError(
+                expected=self._campaign.state_version,
+                got=action.state_version,
+            )
+        events, _, _ = self._resolve(action)
+        return events
+
+    def _resolve(
+        self, action: Action, target: "Campaign | CampaignOverlay | None" = None,
+    ) -> tuple[list[TurnEvent], list, int]:
+        """
+        Resolve, cascade and apply an action to target (default: the
+        campaign). Returns (events, notices, seed).
+        """
+        target = self._campaign if target is None else target
+        resolver = self._resolvers.get(action.action_type.value)
+        if resolver is None:
+            raise TurnError(
+                f"No resolver registered for action type: {action.action_type.value}"
+            )
+
+        # Seed for deterministic resolution (invariant 4b)
+        seed = turn_seed(target.meta.id, action.action_id)
+
+        # Resolution is a pure function: (action, state, seed) -> (events, changes).
+        # Resolvers and cascades write to a copy-on-write overlay; the campaign
+        # only changes when the overlay's delta is committed below.
+        overlay = CampaignOverlay(target)
+        events, _ = resolver(action, overlay, seed)
+
+        # Increment state version and turn count
+        overlay.state_version += 1
+        overlay.turn_count += 1
+
+        # Run cascade processing if registered
+        cascade_notices = []
+        if self._cascade_processor and events:
+            for event in list(events):  # Iterate copy since cascades may add
+                cascade_events, notices = self._cascade_processor(
+                    event, overlay,
+                )
+                events.extend(cascade_events)
+                cascade_notices.extend(notices)
+
+        # Remove surfaced dormant threads (deferred from CascadeProcessor).
+        # The trigger index notices the new list and rebuilds on next use.
+        surfaced_thread_ids = {
+            e.payload.get("thread_id")
+            for e in events
+            if e.event_type == "thread.surfaced" and e.payload.get("thread_id")
+        }
+        if surfaced_thread_ids:
+            overlay.dormant_threads = [
+                t for t in overlay.dormant_threads
+                if t.id not in surfaced_thread_ids
+            ]
+
+        # Apply the turn's changes in one step
+        if target is self._campaign:
+            self._changed_fields.update(overlay.commit())
+        else:
+            overlay.commit()  # Into a batch; its own commit reports the fields
+
+        return events, cascade_notices, seed
+
+    def _log_entry(
+        self, action: Action, seed: int, campaign: "Campaign | CampaignOverlay",
+    ) -> LoggedAction:
+        """Action log entry for an action just applied to campaign."""
+        checkpoint = (
+            self._checkpoint_every
+            and campaign.turn_count % self._checkpoint_every == 0
+        )
+        return LoggedAction(
+            action=action,
+            seed=seed,
+            state_version=campaign.state_version,
+            state_hash=state_hash(campaign) if checkpoint else None,
+        )
+
     def _complete_turn(self) -> None:
         """Reset orchestrator state for the next turn."""
         self._transition(TurnPhase.IDLE)
@@ -360,52 +618,33 @@ class TurnOrchestrator:
         self._current_proposal_result = None
         self._current_action = None
 
-    def _build_snapshot(self) -> dict:
+    def invalidate_snapshot(self) -> None:
         """
-        Build a state snapshot for the UI.
+        Rebuild the whole UI snapshot on the next turn.
 
-        This is the authoritative state that the UI renders from.
-        Contains only what the UI needs — not the full campaign.
+        Turns track which campaign fields they change; call this after
+        changing the campaign some other way (manager calls, loading).
         """
-        campaign = self._campaign
-        snapshot: dict = {
-            "turn_count": campaign.turn_count,
-            "state_version": campaign.state_version,
-            "region": campaign.region.value if campaign.region else None,
-            "location": campaign.location.value if campaign.location else None,
-        }
+        self._snapshots.invalidate()
 
-        # Character summary
-        if campaign.characters:
-            char = campaign.characters[0]
-            snapshot["character"] = {
-                "name": char.name,
-                "credits": char.credits,
-                "social_energy": char.social_energy.current,
-                "social_state": char.social_energy.state,
-            }
-
-        # Faction standings
-        snapshot["factions"] = {}
-        for faction_name in [
-            "nexus", "ember_colonies", "lattice", "convergence",
-            "covenant", "wanderers", "cultivators", "steel_syndicate",
-            "witnesses", "architects", "ghost_networks",
-        ]:
-            standing = getattr(campaign.factions, faction_name, None)
-            if standing:
-                snapshot["factions"][standing.faction.value] = standing.standing.value
-
-        # Map state
-        snapshot["map"] = {
-            "current_region": campaign.map_state.current_region.value,
-            "regions": {
-                r.value: {
-                    "connectivity": s.connectivity.value,
-                    "npcs_met": len(s.npcs_met),
-                }
-                for r, s in campaign.map_state.regions.items()
-            },
-        }
+    def _build_snapshot(self) -> tuple[dict, SnapshotDelta]:
+        """
+        Build a state snapshot for the UI, and its delta from the last one.
+
+        This is the authoritative state that the UI renders from.
+        Contains only what the UI needs — not the full campaign. Sections
+        whose campaign fields no turn has changed since the last snapshot
+        are reused, not rebuilt (systems.snapshots).
+        """
+        snapshot, delta = self._snapshots.build(self._campaign, self._changed_fields)
+        self._changed_fields = set()
+        return snapshot, delta
 
-        return snapshot
+    def _emit_snapshot(self, snapshot: dict, delta: SnapshotDelta) -> None:
+        self._bus.emit(
+            EventType.SNAPSHOT_UPDATED,
+            campaign_id=self._campaign.meta.id,
+            session=self._campaign.meta.session_count,
+            delta=delta,
+            snapshot=snapshot,
+        )
@@ -16,7 +16,6 @@ Design principles:
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -30,15 +29,12 @@ from ..state.schemas.action import (
     RequirementStatus,
     Risk,
 )
+from .routes import REGIONS_DATA_PATH, STANDINGS, RouteGraph, TravelProfile, route_graph
 
 if TYPE_CHECKING:
     from ..state.schema import Campaign
 
 
-# Default regions data path
-REGIONS_DATA_PATH = Path(__file__).parent.parent.parent / "data" / "regions.json"
-
-
 class ActionValidator:
     """
     Validates proposals and returns ProposalResults.
@@ -51,17 +47,15 @@ class ActionValidator:
 
     def __init__(self, regions_path: Path | None = None):
         self._regions_path = regions_path or REGIONS_DATA_PATH
-        self._regions_data: dict | None = None
+
+    @property
+    def routes(self) -> RouteGraph:
+        """The shared route graph for this validator's regions file."""
+        return route_graph(self._regions_path)
 
     def _load_regions(self) -> dict:
-        """Load regions data from JSON (cached)."""
-        if self._regions_data is None:
-            if self._regions_path.exists():
-                with open(self._regions_path, "r", encoding="utf-8") as f:
-                    self._regions_data = json.load(f).get("regions", {})
-            else:
-                self._regions_data = {}
-        return self._regions_data
+        """Regions data from JSON (read-only, shared with the route graph)."""
+        return self.routes.regions
 
     def validate(self, proposal: Proposal, campaign: "Campaign") -> ProposalResult:
         """
@@ -96,7 +90,7 @@ class ActionValidator:
         self, proposal: Proposal, campaign: "Campaign",
     ) -> ProposalResult:
         """Validate a travel proposal."""
-        from ..state.schema import Region, FactionName, Standing
+        from ..state.schema import Region
 
         target_region = proposal.payload.get("to")
         if not target_region:
@@ -123,96 +117,52 @@ class ActionValidator:
             )
 
         # Check route exists
-        regions = self._load_regions()
-        current_data = regions.get(current.value, {})
-        routes = current_data.get("routes", {})
-        route = routes.get(target.value)
-
-        if route is None:
-            return ProposalResult(
-                feasible=False,
-                summary=f"No route from {current.value} to {target.value}.",
-            )
-
-        # Check requirements
+        graph = self.routes
+        regions = graph.regions
+        edge = graph.route(current.value, target.value)
+
+        if edge is None:
+            summary = f"No route from {current.value} to {target.value}."
+            plan = graph.plan(campaign, target.value, source=current.value)
+            if plan is not None:
+                via = " → ".join(graph.name(r) for r in plan.path)
+                summary += f" Nearest path: {via} ({plan.hops} turns)."
+            return ProposalResult(feasible=False, summary=summary)
+        route = edge.data
+
+        # Check requirements (compiled when the route graph was built)
         requirements: list[Requirement] = []
         all_met = True
+        profile = TravelProfile.from_campaign(campaign)
+
+        for check in edge.checks:
+            meets = check.met(profile)
+            if not meets:
+                all_met = False
 
-        for req in route.get("requirements", []):
-            req_type = req.get("type")
-
-            if req_type == "faction":
-                # Check faction standing
-                faction_id = req.get("faction", "")
-                min_standing = req.get("min_standing", "neutral")
-                standing_obj = self._get_faction_standing(campaign, faction_id)
-
-                if standing_obj:
-                    current_standing = standing_obj.standing.value.lower()
-                    meets = self._standing_meets_minimum(
-                        current_standing, min_standing,
-                    )
-                    faction_name = standing_obj.faction.value
+            if check.kind == "faction":
+                if check.faction is not None:
+                    faction_name = check.faction.value
+                    current_standing = campaign.factions.get(check.faction).standing.value.lower()
                 else:
-                    meets = False
-                    faction_name = faction_id
-
-                status = (
-                    RequirementStatus.MET if meets
-                    else RequirementStatus.BYPASSABLE  # Routes are negotiable
-                )
-                if not meets:
-                    all_met = False
-
-                requirements.append(Requirement(
-                    label=f"{min_standing.title()} standing with {faction_name}",
-                    status=status,
-                    detail=f"Current: {current_standing if standing_obj else 'unknown'}",
-                    bypass="Use alternative route" if not meets else None,
-                ))
-
-            elif req_type == "vehicle":
-                # Check vehicle capability
-                capability = req.get("capability", "")
-                has_vehicle = self._has_vehicle_capability(campaign, capability)
-
-                status = (
-                    RequirementStatus.MET if has_vehicle
-                    else RequirementStatus.BYPASSABLE
-                )
-                if not has_vehicle:
-                    all_met = False
-
-                requirements.append(Requirement(
-                    label=f"Vehicle with {capability} capability",
-                    status=status,
-                    detail="Have suitable vehicle" if has_vehicle else "No suitable vehicle",
-                    bypass="Use alternative route" if not has_vehicle else None,
-                ))
-
-            elif req_type == "contact":
-                # Check faction contact
-                faction_id = req.get("faction", "")
-                standing_obj = self._get_faction_standing(campaign, faction_id)
-                has_contact = (
-                    standing_obj is not None
-                    and standing_obj.standing.value.lower()
-                    not in ("hostile", "unfriendly")
-                )
-
-                status = (
-                    RequirementStatus.MET if has_contact
-                    else RequirementStatus.BYPASSABLE
-                )
-                if not has_contact:
-                    all_met = False
-
-                requirements.append(Requirement(
-                    label=f"Contact in {faction_id}",
-                    status=status,
-                    detail="Have contact" if has_contact else "No contact available",
-                    bypass="Use alternative route" if not has_contact else None,
-                ))
+                    faction_name = check.key
+                    current_standing = "unknown"
+                label = f"{STANDINGS[check.min_standing].value} standing with {faction_name}"
+                detail = f"Current: {current_standing}"
+            elif check.kind == "vehicle":
+                label = f"Vehicle with {check.key} capability"
+                detail = "Have suitable vehicle" if meets else "No suitable vehicle"
+            else:  # contact
+                label = f"Contact in {check.key}"
+                detail = "Have contact" if meets else "No contact available"
+
+            requirements.append(Requirement(
+                label=label,
+                # Routes are negotiable: unmet requirements can be bypassed
+                status=RequirementStatus.MET if meets else RequirementStatus.BYPASSABLE,
+                detail=detail,
+                bypass="Use alternative route" if not meets else None,
+            ))
 
         # Calculate costs
         costs = CostPreview(turns=1)
@@ -429,40 +379,6 @@ class ActionValidator:
 
     # ─── Helpers ─────────────────────────────────────────────────
 
-    def _get_faction_standing(self, campaign: "Campaign", faction_id: str):
-        """Look up a faction standing by faction ID string."""
-        from ..state.schema import FactionName
-        try:
-            faction_enum = FactionName(faction_id.lower().replace(" ", "_"))
-        except ValueError:
-            return None
-        return campaign.factions.get(faction_enum)
-
-    @staticmethod
-    def _standing_meets_minimum(current: str, minimum: str) -> bool:
-        """Check if current standing meets minimum requirement."""
-        order = ["hostile", "unfriendly", "neutral", "friendly", "allied"]
-        current_idx = order.index(current.lower()) if current.lower() in order else 2
-        minimum_idx = order.index(minimum.lower()) if minimum.lower() in order else 2
-        return current_idx >= minimum_idx
-
-    @staticmethod
-    def _has_vehicle_capability(campaign: "Campaign", capability: str) -> bool:
-        """Check if player has a vehicle with the required capability."""
-        if not campaign.characters:
-            return False
-        char = campaign.characters[0]
-        for vehicle in char.vehicles:
-            if not vehicle.is_operational:
-                continue
-            # Check terrain capabilities
-            if capability.lower() in [t.lower() for t in vehicle.terrain]:
-                return True
-            # Check type match
-            if capability.lower() == vehicle.type.lower():
-                return True
-        return False
-
     @staticmethod
     def _get_active_vehicle(campaign: "Campaign"):
         """Get the player's first operational vehicle, or None."""
@@ -13,6 +13,10 @@ from ..state.schema import FactionName, LeverageWeight
 # -----------------------------------------------------------------------------
 # Tool Schemas
 # -----------------------------------------------------------------------------
+#
+# Schemas may set "read_only": True when the tool never changes campaign
+# state. The tool loop runs read-only calls from one model round
+# concurrently; everything else is mutating and runs in order.
 
 # Dice tools (also defined in dice.py, but centralized here for single source)
 DICE_SCHEMAS = [
@@ -189,6 +193,7 @@ NPC_SCHEMAS = [
     {
         "name": "describe_npc_appearance",
         "description": "Record an NPC's physical appearance for portrait generation. Call this when first describing an NPC or when asked about their appearance.",
+        "read_only": True,  # Writes the NPC's portrait YAML, never campaign state
         "input_schema": {
             "type": "object",
             "properties": {
@@ -529,6 +534,7 @@ DISCOVERY_SCHEMAS = [
     {
         "name": "explore_lore",
         "description": "Active discovery tool. Search lore and campaign history for specific keywords, NPCs, or events to ensure narrative continuity.",
+        "read_only": True,
         "input_schema": {
             "type": "object",
             "properties": {
@@ -550,6 +556,7 @@ DISCOVERY_SCHEMAS = [
     {
         "name": "verify_choices",
         "description": "Validates narrative choices against current game state (faction, background, disposition, energy).",
+        "read_only": True,
         "input_schema": {
             "type": "object",
             "properties": {
@@ -591,6 +598,7 @@ DISCOVERY_SCHEMAS = [
     {
         "name": "read_gm_scratchpad",
         "description": "Read the current transient GM session notes to maintain continuity of soft details.",
+        "read_only": True,
         "input_schema": {
             "type": "object",
             "properties": {}
@@ -0,0 +1,135 @@
+"""
+Tests for cascade faction propagation over the precomputed relation matrix.
+"""
+
+import pytest
+
+from src.state.manager import CampaignManager
+from src.state.schema import FactionName, get_faction_relation
+from src.state.schemas.event import TurnEvent
+from src.state.store import MemoryCampaignStore
+from src.systems import faction_matrix
+from src.systems.cascades import CASCADE_CONFIG, CascadeProcessor
+from src.systems.faction_matrix import RippleMatrix, ripple_matrix, shift_standings
+
+CONFIGS = [
+    CASCADE_CONFIG["faction_propagation"],
+    {"allied_threshold": 15, "allied_multiplier": 0.5,
+     "hostile_threshold": -15, "hostile_multiplier": -0.4},
+    {"allied_threshold": 0, "allied_multiplier": 1.0,
+     "hostile_threshold": 0, "hostile_multiplier": -1.0},
+]
+
+
+def _reference_ripple(source, delta, config):
+    """The per-pair loop the matrix replaces."""
+    ripples = []
+    for other in FactionName:
+        if other == source:
+            continue
+        relation = get_faction_relation(source, other)
+        if relation >= config["allied_threshold"]:
+            propagated = int(delta * config["allied_multiplier"])
+        elif relation <= config["hostile_threshold"]:
+            propagated = int(delta * config["hostile_multiplier"])
+        else:
+            propagated = 0
+        if propagated:
+            ripples.append((other, propagated))
+    return ripples
+
+
+def _standing_change(faction: FactionName, delta: int) -> TurnEvent:
+    return TurnEvent(
+        event_type="standing.changed", source_action="act",
+        payload={"faction": faction.value, "delta": delta},
+    )
+
+
+@pytest.fixture
+def campaign():
+    manager = CampaignManager(MemoryCampaignStore())
+    return manager.create_campaign("Cascades")
+
+
+class TestRippleMatrix:
+    """Matrix rows agree with the per-pair relation lookup."""
+
+    @pytest.mark.parametrize("config", CONFIGS)
+    def test_ripple_matches_pairwise_loop(self, config):
+        matrix = ripple_matrix(**config)
+        for source in FactionName:
+            for delta in (-7, -3, -1, 1, 2, 4, 10):
+                assert [(t, d) for t, d, _ in matrix.ripple(source, delta)] == \
+                    _reference_ripple(source, delta, config)
+
+    def test_wave_sums_per_pair_ripples(self):
+        matrix = ripple_matrix(**CONFIGS[1])
+        deltas = [0] * len(faction_matrix.FACTIONS)
+        deltas[0], deltas[1] = 6, -4
+
+        contributions = matrix.wave(deltas)
+
+        for i, source in enumerate(faction_matrix.FACTIONS):
+            expected = dict(_reference_ripple(source, deltas[i], CONFIGS[1])) if deltas[i] else {}
+            row = {faction_matrix.FACTIONS[j]: d for j, d in enumerate(contributions[i]) if d}
+            assert row == expected
+
+    def test_shift_standings_clamps(self):
+        assert shift_standings([0, 2, 4], [-2, 1, 3]) == [0, 3, 4]
+
+    def test_numpy_and_python_paths_agree(self, monkeypatch):
+        pytest.importorskip("numpy")
+        config = CONFIGS[1]
+        fast = RippleMatrix(**config)
+        monkeypatch.setattr(faction_matrix, "NUMPY_AVAILABLE", False)
+        slow = RippleMatrix(**config)
+
+        deltas = list(range(-5, 6))
+        assert slow.wave(deltas) == fast.wave(deltas)
+        for source in FactionName:
+            assert slow.ripple(source, 9) == fast.ripple(source, 9)
+
+
+class TestPropagation:
+    """CascadeProcessor events and notices."""
+
+    def test_single_change_ripples(self, campaign):
+        processor = CascadeProcessor()
+
+        events, notices = processor.process(_standing_change(FactionName.NEXUS, 10), campaign)
+
+        standing_events = [e for e in events if e.event_type == "standing.changed"]
+        assert [(e.payload["faction"], e.payload["delta"]) for e in standing_events[:3]] == [
+            ("Lattice", 3), ("Witnesses", -2), ("Ghost Networks", -2),
+        ]
+        assert standing_events[0].payload["reason"] == "Cascade: allied with Nexus"
+        assert campaign.factions.get(FactionName.LATTICE).standing.value == "Allied"
+        assert notices[0].headline == "Ripple Effect"
+        assert notices[0].details[0] == "Lattice: Neutral → Allied (allied with Nexus)"
+
+    def test_batch_matches_single_first_wave(self, campaign):
+        manager = CampaignManager(MemoryCampaignStore())
+        other = manager.create_campaign("Single")
+        processor = CascadeProcessor()
+
+        batch, _ = processor.propagate_batch([_standing_change(FactionName.COVENANT, 5)], campaign)
+        single, _ = processor._propagate_faction(_standing_change(FactionName.COVENANT, 5), other, 0)
+
+        first_wave = [e for e in batch if e.cascade_depth == 1]
+        assert [e.payload for e in first_wave] == [e.payload for e in single]
+
+    def test_batch_merges_simultaneous_changes(self, campaign):
+        processor = CascadeProcessor(config={"faction_propagation": CONFIGS[1]})
+        nexus, covenant = _standing_change(FactionName.NEXUS, 4), _standing_change(FactionName.COVENANT, 4)
+
+        events, notices = processor.propagate_batch([nexus, covenant], campaign)
+
+        witnesses = next(e for e in events if e.payload["faction"] == "Witnesses")
+        # Nexus (hostile, -1) and Covenant (allied, +2) both reach the Witnesses
+        assert witnesses.payload["delta"] == 1
+        assert witnesses.payload["reason"] == "Cascade: hostile to Nexus, allied with Covenant"
+        assert witnesses.cascaded_from == nexus.event_id
+        assert campaign.factions.get(FactionName.WITNESSES).standing.value == "Friendly"
+        assert all(e.cascade_depth <= 5 for e in events)
+        assert len(notices) == 1
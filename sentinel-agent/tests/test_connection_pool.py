@@ -0,0 +1,478 @@
+"""
+Tests for the keep-alive connection pools (blocking and asyncio), cached
+endpoint resolution and capability probes, backend detection, the
+multi-backend pool, and the async client layer.
+"""
+
+import asyncio
+import concurrent.futures
+import json
+import threading
+import time
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.llm.aio import AsyncConnectionPool, AsyncLLMClient, LLMEventLoop
+from src.llm.base import LLMResponse, Message
+from src.llm.pool import ConnectionPool
+from src.llm.pooled import PooledLLMClient
+
+
+class FakeBackend:
+    """OpenAI-compatible stub that records requests and client connections."""
+
+    def __init__(self):
+        self.paths: list[str] = []
+        self.connections: set[tuple] = set()
+        self.drop_idle = False  # Close connections without telling the client
+        self.delay = 0.0  # Seconds before answering a POST
+        self.fail = False  # Answer POSTs with 500
+        self.slots: int | None = None  # llama.cpp-style /props total_slots
+        backend = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive
+            wbufsize = -1  # One write per response, as real servers do
+
+            def _reply(self, status: int, payload: dict):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                if backend.drop_idle:
+                    self.close_connection = True
+
+            def do_GET(self):
+                backend.paths.append(self.path)
+                backend.connections.add(self.client_address)
+                if self.path == "/v1/models":
+                    self._reply(200, {"object": "list", "data": [{"id": "test-model"}]})
+                elif self.path == "/props" and backend.slots:
+                    self._reply(200, {"total_slots": backend.slots})
+                else:
+                    self._reply(404, {"error": "not found"})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                request = json.loads(self.rfile.read(length) or b"{}")
+                backend.paths.append(self.path)
+                backend.connections.add(self.client_address)
+                if backend.fail:
+                    self._reply(500, {"error": "model crashed"})
+                    return
+                time.sleep(backend.delay)
+                if request.get("stream"):
+                    usage = (request.get("stream_options") or {}).get("include_usage")
+                    self._stream(["Hel", "lo"], usage=bool(usage))
+                    return
+                self._reply(200, {
+                    "choices": [{
+                        "message": {"role": "assistant", "content": "ok"},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": {"prompt_tokens": 12, "completion_tokens": 1},
+                })
+
+            def _stream(self, pieces: list[str], usage: bool = False):
+                """Chunked SSE, as LM Studio sends it."""
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                events = [
+                    {"choices": [{"index": 0, "delta": {"content": p}, "finish_reason": None}]}
+                    for p in pieces
+                ]
+                if usage:
+                    events.append({
+                        "choices": [],
+                        "usage": {"prompt_tokens": 12, "completion_tokens": len(pieces)},
+                    })
+                for event in events:
+                    self._chunk(f"data: {json.dumps(event)}\n\n".encode())
+                self._chunk(b"data: [DONE]\n\n")
+                self._chunk(b"")
+
+            def _chunk(self, data: bytes):
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.flush()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def backend():
+    server = FakeBackend()
+    yield server
+    server.close()
+
+
+class TestConnectionPool:
+    """Persistent connections and urllib-compatible errors."""
+
+    def test_requests_reuse_one_connection(self, backend):
+        pool = ConnectionPool()
+        for _ in range(5):
+            with pool.request("GET", f"{backend.url}/v1/models", timeout=5) as resp:
+                assert json.loads(resp.read())["data"][0]["id"] == "test-model"
+        pool.clear()
+
+        assert len(backend.paths) == 5
+        assert len(backend.connections) == 1
+
+    def test_http_errors_raise_httperror(self, backend):
+        pool = ConnectionPool()
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            pool.request("GET", f"{backend.url}/missing", timeout=5)
+        assert exc.value.code == 404
+        pool.clear()
+
+    def test_refused_connection_raises_urlerror(self, backend):
+        url = backend.url
+        backend.close()
+        with pytest.raises(urllib.error.URLError):
+            ConnectionPool().request("GET", f"{url}/v1/models", timeout=1)
+
+    def test_dropped_idle_connection_is_retried(self, backend):
+        pool = ConnectionPool()
+        backend.drop_idle = True
+        for _ in range(3):
+            with pool.request("GET", f"{backend.url}/v1/models", timeout=5) as resp:
+                assert resp.status == 200
+                resp.read()
+        pool.clear()
+
+        assert len(backend.connections) == 3
+
+
+class TestEndpointResolution:
+    """Clients resolve the base URL once and cache the model list."""
+
+    def test_lmstudio_resolves_once_and_caches_models(self, backend):
+        from src.llm.base import Message
+        from src.llm.lmstudio import LMStudioClient
+
+        # Configured without /v1: the first request walks the candidates
+        client = LMStudioClient(base_url=backend.url)
+        client._supports_tools = False
+        assert client.model_name == "test-model"
+        assert client.base_url == f"{backend.url}/v1"
+
+        probes = len(backend.paths)
+        for _ in range(3):
+            client.chat([Message(role="user", content="hi")])
+        assert client.model_name == "test-model"
+
+        # Three chats, no further /models or candidate probing
+        assert backend.paths[probes:] == ["/v1/chat/completions"] * 3
+
+    def test_ollama_reprobes_after_connection_failure(self, backend):
+        from src.llm.ollama import OllamaClient
+
+        client = OllamaClient(base_url=f"{backend.url}/v1", model_list_ttl=0)
+        assert client.list_models() == ["test-model"]
+        assert client._resolved_base_url == f"{backend.url}/v1"
+
+        client._resolved_base_url = "http://127.0.0.1:9/v1"  # Nothing listens
+        assert client.list_models() == ["test-model"]
+        assert client._resolved_base_url == f"{backend.url}/v1"
+
+
+@pytest.fixture
+def capability_cache(tmp_path):
+    from src.llm.capabilities import disable_capability_cache, enable_capability_cache
+
+    cache = enable_capability_cache(tmp_path / "capabilities.json")
+    yield cache
+    disable_capability_cache()
+
+
+class TestCapabilityCache:
+    """Probe results persist across client instances (process restarts)."""
+
+    def test_second_start_skips_probes(self, backend, capability_cache):
+        from src.llm.lmstudio import LMStudioClient
+
+        # Configured without /v1: the first start walks the candidates
+        first = LMStudioClient(base_url=backend.url)
+        assert first.supports_tools is True
+        assert first.base_url == f"{backend.url}/v1"
+        probes = len(backend.paths)
+
+        second = LMStudioClient(base_url=backend.url)
+        assert second.base_url == f"{backend.url}/v1"  # Before any request
+        assert second.supports_tools is True
+        # Only the loaded-model lookup; no candidate walk, no tool probe
+        assert backend.paths[probes:] == ["/v1/models"]
+
+        second.set_model("other-model")
+        assert second.supports_tools is True
+        assert backend.paths[probes + 1:] == ["/v1/chat/completions"]
+
+    def test_unreachable_server_is_not_remembered(self, backend, capability_cache):
+        from src.llm.ollama import OllamaClient
+
+        client = OllamaClient(base_url="http://127.0.0.1:9/v1", model="m")
+        assert client.supports_tools is False
+        assert capability_cache.get("ollama", "http://127.0.0.1:9/v1", "m") == {}
+
+    def test_entries_expire(self, tmp_path):
+        from src.llm.capabilities import CapabilityCache
+
+        cache = CapabilityCache(tmp_path / "caps.json", ttl=60)
+        cache.update("ollama", "http://h/v1", "m", supports_tools=True)
+        assert CapabilityCache(tmp_path / "caps.json").get("ollama", "http://h/v1", "m") == {
+            "supports_tools": True,
+        }
+        assert CapabilityCache(tmp_path / "caps.json", ttl=-1).get("ollama", "http://h/v1", "m") == {}
+
+
+class TestDetectBackend:
+    """Both backends are probed at once; LM Studio wins when both answer."""
+
+    def test_falls_back_to_ollama(self, backend, monkeypatch):
+        from src.llm import detect_backend
+
+        monkeypatch.delenv("LMSTUDIO_BASE_URL", raising=False)
+        monkeypatch.delenv("OLLAMA_BASE_URL", raising=False)
+        name, client = detect_backend(
+            lmstudio_url="http://127.0.0.1:9/v1", ollama_url=f"{backend.url}/v1",
+        )
+        assert name == "ollama"
+        assert client.base_url == f"{backend.url}/v1"
+
+    def test_prefers_lmstudio(self, backend, monkeypatch):
+        from src.llm import detect_backend
+
+        monkeypatch.delenv("LMSTUDIO_BASE_URL", raising=False)
+        monkeypatch.delenv("OLLAMA_BASE_URL", raising=False)
+        name, _ = detect_backend(
+            lmstudio_url=f"{backend.url}/v1", ollama_url=f"{backend.url}/v1",
+        )
+        assert name == "lmstudio"
+
+    def test_nothing_available(self, monkeypatch):
+        from src.llm import detect_backend
+
+        monkeypatch.delenv("LMSTUDIO_BASE_URL", raising=False)
+        monkeypatch.delenv("OLLAMA_BASE_URL", raising=False)
+        assert detect_backend("http://127.0.0.1:9/v1", "http://127.0.0.1:9/v1") == (None, None)
+
+
+@pytest.fixture
+def second_backend():
+    server = FakeBackend()
+    yield server
+    server.close()
+
+
+def _lmstudio(backend: FakeBackend):
+    from src.llm.lmstudio import LMStudioClient
+
+    client = LMStudioClient(base_url=f"{backend.url}/v1", model="test-model")
+    client._supports_tools = False
+    return client
+
+
+def _chats(backend: FakeBackend) -> int:
+    return backend.paths.count("/v1/chat/completions")
+
+
+class TestPooledClient:
+    """Routing, hedging and failover across two stub servers."""
+
+    def test_least_outstanding_routing(self, backend, second_backend):
+        backend.delay = second_backend.delay = 0.2
+        pool = PooledLLMClient(
+            [_lmstudio(backend), _lmstudio(second_backend)], hedge_after=None,
+        )
+        msgs = [Message(role="user", content="hi")]
+
+        with concurrent.futures.ThreadPoolExecutor(2) as ex:
+            replies = list(ex.map(lambda _: pool.chat(msgs).content, range(2)))
+
+        assert replies == ["Hello", "Hello"]
+        assert _chats(backend) == _chats(second_backend) == 1
+        pool.close()
+
+    def test_slow_first_token_is_hedged(self, backend, second_backend):
+        backend.delay = 1.0
+        pool = PooledLLMClient(
+            [_lmstudio(backend), _lmstudio(second_backend)], hedge_after=0.1,
+        )
+
+        start = time.perf_counter()
+        reply = pool.chat([Message(role="user", content="hi")])
+        elapsed = time.perf_counter() - start
+
+        assert reply.content == "Hello"
+        assert elapsed < 0.6
+        assert _chats(second_backend) == 1
+        pool.close()
+
+    def test_failover_and_circuit_breaker(self, backend, second_backend):
+        backend.fail = True
+        pool = PooledLLMClient(
+            [_lmstudio(backend), _lmstudio(second_backend)],
+            hedge_after=None, failure_threshold=2, reset_after=0.2,
+        )
+        msgs = [Message(role="user", content="hi")]
+
+        for _ in range(2):
+            assert pool.chat(msgs).content == "Hello"
+        assert pool.stats()[0]["circuit"] == "open"
+
+        posts = _chats(backend)
+        assert pool.chat(msgs).content == "Hello"
+        assert _chats(backend) == posts  # Skipped while open
+        assert _chats(second_backend) == 3
+
+        # The health check closes the circuit once the server answers again
+        backend.fail = False
+        deadline = time.monotonic() + 2
+        while pool.stats()[0]["circuit"] == "open" and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert pool.stats()[0]["circuit"] == "closed"
+        pool.close()
+
+    def test_all_members_down(self, backend):
+        backend.fail = True
+        pool = PooledLLMClient([_lmstudio(backend)], hedge_after=None)
+        with pytest.raises(ConnectionError):
+            pool.chat([Message(role="user", content="hi")])
+        pool.close()
+
+
+class SlowClient:
+    """Blocking client that records how many chats overlap."""
+
+    def __init__(self, delay: float, slots: int | None = None):
+        self.delay = delay
+        self.slots = slots
+        self.active = 0
+        self.peak = 0
+        self.started: list[str] = []
+        self._lock = threading.Lock()
+
+    def parallel_slots(self):
+        return self.slots
+
+    def chat(self, messages, system=None, tools=None, temperature=0.7, max_tokens=2048):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.started.append(system)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return LLMResponse(content=messages[0].content)
+
+
+class TestAsyncLayer:
+    """asyncio pool, AsyncLLMClient and the shared loop."""
+
+    def test_async_pool_reuses_connection_across_streams(self, backend):
+        async def run():
+            pool = AsyncConnectionPool()
+            for _ in range(3):
+                response = await pool.request("GET", f"{backend.url}/v1/models")
+                assert json.loads(await response.read())["data"][0]["id"] == "test-model"
+                await response.aclose()
+            await pool.aclose()
+
+        asyncio.run(run())
+        assert len(backend.connections) == 1
+
+    def test_async_client_streams_from_http_backend(self, backend):
+        from src.llm.lmstudio import LMStudioClient
+
+        client = LMStudioClient(base_url=f"{backend.url}/v1", model="test-model")
+        client._supports_tools = False
+        client.list_models()  # Resolve the endpoint up front
+        backend.connections.clear()
+
+        async def run():
+            aclient = AsyncLLMClient(client)
+            chunks = [c async for c in aclient.chat_stream([Message(role="user", content="hi")])]
+            reply = await aclient.chat([Message(role="user", content="hi")])
+            await aclient.aclose()
+            return chunks, reply
+
+        chunks, reply = asyncio.run(run())
+        assert [c.text for c in chunks[:-1]] == ["Hel", "lo"]
+        assert chunks[-1].response.content == "Hello"
+        assert reply.content == "Hello"
+        # Both streams fully drained over one keep-alive connection
+        assert len(backend.connections) == 1
+
+    def test_concurrency_is_bounded(self):
+        slow = SlowClient(delay=0.05)
+
+        async def run():
+            aclient = AsyncLLMClient(slow, max_concurrency=2)
+            return await asyncio.gather(*(
+                aclient.chat([Message(role="user", content=str(i))]) for i in range(5)
+            ))
+
+        replies = asyncio.run(run())
+        assert [r.content for r in replies] == ["0", "1", "2", "3", "4"]
+        assert slow.peak == 2
+
+    @pytest.mark.parametrize("slots, peak", [(3, 3), (None, 2)])
+    def test_batch_scheduling(self, slots, peak):
+        slow = SlowClient(delay=0.05, slots=slots)
+        msgs = [Message(role="user", content="q")]
+
+        async def run():
+            aclient = AsyncLLMClient(slow)
+            return await aclient.chat_batch([(msgs, f"shared + {n}") for n in "abc"])
+
+        replies = asyncio.run(run())
+        assert [r.content for r in replies] == ["q", "q", "q"]
+        # Enough slots: one batch. Otherwise the lead primes the prefix first
+        assert slow.peak == peak
+        assert slow.started[0] == "shared + a"
+
+    def test_parallel_slots_probe(self, backend, capability_cache):
+        backend.slots = 4
+        assert _lmstudio(backend).parallel_slots() == 4
+        backend.slots = None
+        assert _lmstudio(backend).parallel_slots() == 4  # Persisted
+        paths = [p for p in backend.paths if p == "/props"]
+        assert len(paths) == 1
+
+    def test_request_timeout(self):
+        async def run():
+            aclient = AsyncLLMClient(SlowClient(delay=0.5), timeout=0.05)
+            await aclient.chat([Message(role="user", content="hi")])
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(run())
+
+    def test_interrupted_wait_cancels_work(self):
+        loop = LLMEventLoop()
+        cancelled = threading.Event()
+
+        async def work():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(concurrent.futures.TimeoutError):
+            loop.run(work(), timeout=0.05)
+        assert cancelled.wait(1)
@@ -75,6 +75,77 @@ class TestTokenizer:
         assert hasattr(counter, "count")
         assert hasattr(counter, "truncate_to_budget")
 
+    def _byte_encoding(self):
+        """Offline tiktoken encoding: bytes, plus merges up to 8 x 'a'."""
+        tiktoken = pytest.importorskip("tiktoken")
+        ranks = {bytes([i]): i for i in range(256)}
+        ranks.update({b"aa": 256, b"aaaa": 257, b"aaaaaaaa": 258})
+        return tiktoken.Encoding(
+            name="test_bytes",
+            pat_str=r"\S+|\s+",
+            mergeable_ranks=ranks,
+            special_tokens={},
+        )
+
+    def test_tiktoken_truncate_encodes_bounded_prefix(self):
+        """Truncation cost tracks the budget, not the input length."""
+        from src.context.tokenizer import TiktokenCounter
+
+        encoding = self._byte_encoding()
+        seen: list[int] = []
+
+        class SpyEncoder:
+            def encode(self, text):
+                seen.append(len(text))
+                return encoding.encode(text)
+
+            def decode(self, tokens):
+                return encoding.decode(tokens)
+
+        counter = TiktokenCounter(encoder=SpyEncoder())
+        text = "word " * 10_000  # 50k characters
+        truncated = counter.truncate_to_budget(text, 100)
+
+        assert truncated == encoding.decode(encoding.encode(text)[:100])
+        assert max(seen) < 5_000
+
+    def test_tiktoken_truncate_grows_short_estimate(self):
+        """Dense tokens (more chars than the estimate) still truncate exactly."""
+        from src.context.tokenizer import TiktokenCounter
+
+        encoding = self._byte_encoding()
+        counter = TiktokenCounter(encoder=encoding)
+        text = "a" * 80_000  # 8 chars per token
+
+        assert counter.truncate_to_budget(text, 100) == "a" * 800
+        assert counter.truncate_to_budget("a" * 80, 100) == "a" * 80
+
+    def test_count_batch_matches_count(self):
+        """Batch counts equal per-text counts, with 0 for empty strings."""
+        from src.context.tokenizer import TiktokenCounter
+
+        texts = ["Hello, world!", "", "word " * 50]
+        fallback = FallbackCounter()
+        assert fallback.count_batch(texts) == [fallback.count(t) for t in texts]
+
+        counter = TiktokenCounter(encoder=self._byte_encoding())
+        assert counter.count_batch(texts) == [counter.count(t) for t in texts]
+
+    def test_encoder_loaded_lazily(self):
+        """Importing the tokenizer module does not load the encoder."""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        code = (
+            "import src.context.tokenizer as t; "
+            "assert not t._encoder_loaded; "
+            "t.count_tokens('hi'); "
+            "assert t._encoder_loaded"
+        )
+        root = Path(__file__).parent.parent
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=root)
+
 
 # -----------------------------------------------------------------------------
 # Block Priority Tests
@@ -309,6 +380,45 @@ class TestPromptPacker:
         assert "Current mission: Test" in prompt
         assert info.total_tokens > 0
 
+    def test_pack_counts_each_section_once(self):
+        """Sections are counted in one batch; nothing is re-encoded."""
+        class CountingCounter(FallbackCounter):
+            def __init__(self):
+                super().__init__()
+                self.single = 0
+                self.batches = 0
+
+            def count(self, text):
+                self.single += 1
+                return super().count(text)
+
+            def count_batch(self, texts):
+                self.batches += 1
+                return super().count_batch(texts)
+
+        counter = CountingCounter()
+        packer = PromptPacker(total_budget=100)
+        packer._token_counter = counter
+        window = RollingWindow()
+        window.add_block(TranscriptBlock(
+            id="b1", timestamp=datetime.now(), role="user", content="Hello",
+        ))
+        counter.single = 0
+
+        _, info = packer.pack(
+            system="You are the GM.",
+            rules_core="core " * 20,
+            rules_narrative="narrative " * 50,  # Skipped under strain
+            state="state " * 1600,              # Truncated
+            window=window,
+            user_input="Go.",
+        )
+
+        assert counter.batches == 1
+        assert counter.single == 1  # Formatted window only
+        assert info.get_section(PackSection.STATE).truncated
+        assert set(info.stage_ms) == {"count", "sections", "window", "assemble"}
+
     def test_pack_with_narrative_guidance(self):
         """Pack includes narrative guidance when not under strain."""
         packer = PromptPacker(total_budget=20000)  # Large budget = no strain
@@ -477,3 +587,328 @@ class TestContextIntegration:
         )
         # Should be higher strain now
         assert info2.strain_tier.value >= info1.strain_tier.value
+
+
+# -----------------------------------------------------------------------------
+# Digest Tracker Tests
+# -----------------------------------------------------------------------------
+
+class TestDigestTracker:
+    """Tests for the event-maintained campaign digest."""
+
+    @pytest.fixture
+    def tracked(self, tmp_path):
+        from src.context.digest import DigestManager, DigestTracker
+        from src.state import NPC, CampaignManager, MemoryCampaignStore, reset_event_bus
+        from src.state.schema import FactionName, NPCAgenda
+
+        reset_event_bus()
+        manager = CampaignManager(MemoryCampaignStore())
+        manager.create_campaign("Digest Test")
+        tracker = DigestTracker(manager, DigestManager(tmp_path))
+        tracker.attach()
+        assert tracker.digest is not None  # Initial full build
+        npc = NPC(
+            name="Marta",
+            faction=FactionName.EMBER_COLONIES,
+            agenda=NPCAgenda(wants="Safe passage", fears="Raids"),
+        )
+        manager.add_npc(npc)
+        yield manager, tracker, npc
+        tracker.detach()
+        reset_event_bus()
+
+    def _comparable(self, digest):
+        data = digest.to_dict()
+        for key in ("last_updated", "revision"):
+            data.pop(key)
+        for hinge in data["hinge_index"]:
+            hinge.pop("timestamp")
+        return data
+
+    def test_incremental_matches_full_rebuild(self, tracked):
+        """Applying events one by one yields the same digest as generate()."""
+        from src.context.digest import DigestManager
+        from src.state.schema import FactionName
+
+        manager, tracker, npc = tracked
+        manager.log_hinge_moment("Checkpoint standoff", "Let them pass", "Mercy")
+        manager.shift_faction(FactionName.NEXUS, 2, "Shared the relay codes")
+        manager.update_npc_memory(npc.id, "You kept your word")
+        manager.record_npc_interaction(npc.id, "Delivered medicine", "Grateful", 10)
+        kept = manager.queue_dormant_thread("Stolen cache", "At the depot", "Ambush")
+        dropped = manager.queue_dormant_thread("Loose talk", "At the market", "Rumors")
+        avoided = manager.log_avoidance("Refugee plea", "Trust", "Remembered", "minor")
+        manager.queue_dormant_thread("Late thread", "Cross the river", "Toll raised")
+        manager.surface_dormant_thread(dropped.id, "At the market")
+
+        incremental = tracker.digest
+        rebuilt = DigestManager().generate(manager.current)
+
+        assert self._comparable(incremental) == self._comparable(rebuilt)
+        assert incremental.revision > 0
+        origins = [t.origin for t in incremental.open_threads]
+        assert origins[-1] == f"[AVOIDED] {avoided.situation}"
+        assert kept.origin in origins and dropped.origin not in origins
+
+    def test_prompt_text_cached_until_change(self, tracked):
+        """Prompt text is reused until an event changes the digest."""
+        manager, tracker, npc = tracked
+        assert tracker.prompt_text() == ""  # Empty digest injects nothing
+
+        manager.update_npc_memory(npc.id, "Saw the convoy burn")
+        first = tracker.prompt_text()
+        assert "Saw the convoy burn" in first
+        assert tracker.prompt_text() is first
+
+        manager.update_npc_memory(npc.id, "Heard the broadcast")
+        assert tracker.prompt_text() is not first
+        assert "Heard the broadcast" in tracker.prompt_text()
+
+    def test_persisted_digest_versioned_by_state_version(self, tracked, tmp_path):
+        """A persisted digest is reused only at the same state_version."""
+        from src.context.digest import DigestManager, DigestTracker
+
+        manager, _, npc = tracked
+        manager.current.persisted_ = True
+        manager.update_npc_memory(npc.id, "Owes you a favor")
+        saved = DigestManager(tmp_path).load(manager.current.meta.id)
+        assert saved is not None
+        assert saved.npc_anchors["Marta"] == ["Owes you a favor"]
+
+        fresh = DigestTracker(manager, DigestManager(tmp_path))
+        assert fresh.digest.revision == saved.revision
+
+        manager.current.state_version += 1
+        stale = DigestTracker(manager, DigestManager(tmp_path))
+        assert stale.digest.revision == 0  # Rebuilt from the campaign
+        assert stale.digest.state_version == manager.current.state_version
+
+    def test_untracked_changes_invalidate_persisted_digest(self, tracked, tmp_path):
+        """Edits made while no tracker listens are caught by the fingerprint."""
+        from src.context.digest import DigestManager, DigestTracker
+
+        manager, tracker, npc = tracked
+        manager.current.persisted_ = True
+        manager.update_npc_memory(npc.id, "Owes you a favor")
+        tracker.detach()
+
+        # Same state_version, but the campaign moved on
+        manager.update_npc_memory(npc.id, "Called the favor in")
+        fresh = DigestTracker(manager, DigestManager(tmp_path))
+        assert fresh.digest.npc_anchors["Marta"] == [
+            "Owes you a favor", "Called the favor in",
+        ]
+
+    def test_noop_turn_leaves_digest_untouched(self, tracked):
+        """A resolved turn that changes nothing keeps the cached prompt."""
+        from src.state import EventType, get_event_bus
+
+        manager, tracker, npc = tracked
+        manager.update_npc_memory(npc.id, "Saw the convoy burn")
+        text = tracker.prompt_text()
+        revision = tracker.digest.revision
+
+        for _ in range(3):
+            get_event_bus().emit(
+                EventType.TURN_RESOLVED, campaign_id=manager.current.meta.id,
+            )
+
+        assert tracker.digest.revision == revision
+        assert tracker.prompt_text() is text
+
+
+# -----------------------------------------------------------------------------
+# Scene Recap Summarizer Tests
+# -----------------------------------------------------------------------------
+
+class TestSceneRecapSummarizer:
+    """Tests for background scene recaps under strain."""
+
+    def _strained_window(self, count: int = 12) -> RollingWindow:
+        window = RollingWindow()
+        for i in range(count):
+            role = "user" if i % 2 == 0 else "assistant"
+            window.add_block(TranscriptBlock(
+                id=f"block_{i}",
+                timestamp=datetime.now() + timedelta(minutes=i),
+                role=role,
+                content=f"Exchange {i} with the Ember courier.",
+            ))
+        return window
+
+    def _pack(self, packer: PromptPacker, window: RollingWindow):
+        return packer.pack(
+            system="You are the GM. " * 40,
+            state="Mission: courier run. " * 20,
+            window=window,
+            user_input="I keep walking.",
+        )
+
+    def test_first_strained_turn_falls_back_without_waiting(self):
+        """Recap is prepared in the background; the count summary is used meanwhile."""
+        from src.context.recap import SceneRecapSummarizer
+        from src.llm import MockLLMClient
+
+        client = MockLLMClient(responses=["The courier was paid and left."])
+        summarizer = SceneRecapSummarizer(lambda: client)
+        packer = PromptPacker(total_budget=200, summarizer=summarizer)
+
+        _, info = self._pack(packer, self._strained_window())
+
+        assert info.trimmed_blocks > 0
+        assert "narrative exchanges" in info.scene_recap
+        summarizer.wait(timeout=5)
+        assert len(client.calls) == 1
+
+    def test_ready_recap_replaces_count_summary(self):
+        """Once condensed, the LLM recap is used and not regenerated."""
+        from src.context.recap import SceneRecapSummarizer
+        from src.llm import MockLLMClient
+
+        client = MockLLMClient(responses=["The courier was paid and left."])
+        summarizer = SceneRecapSummarizer(lambda: client)
+        packer = PromptPacker(total_budget=200, summarizer=summarizer)
+        window = self._strained_window()
+
+        self._pack(packer, window)
+        summarizer.wait(timeout=5)
+        prompt, info = self._pack(packer, window)
+
+        assert info.scene_recap == "[Scene recap: The courier was paid and left.]"
+        assert "[[" not in prompt
+        assert "The courier was paid and left." in prompt
+        assert len(client.calls) == 1
+
+    def test_recap_folds_in_new_blocks_with_bounded_input(self):
+        """Later jobs send the previous recap plus only uncovered blocks."""
+        from src.context.recap import SceneRecapSummarizer
+        from src.llm import MockLLMClient
+
+        client = MockLLMClient(responses=["First recap.", "Second recap."])
+        blocks = self._strained_window(4).blocks
+        summarizer = SceneRecapSummarizer(
+            lambda: client, max_input_tokens=blocks[0].token_count,
+        )
+
+        assert summarizer.request(blocks[:3]) is None
+        summarizer.wait(timeout=5)
+        # Input cap: one block per job
+        assert "Exchange 1" not in client.calls[0]["messages"][0].content
+
+        assert summarizer.request(blocks[:3]) == "[Scene recap: First recap.]"
+        summarizer.wait(timeout=5)
+        second = client.calls[1]["messages"][0].content
+        assert "First recap." in second
+        assert "Exchange 1" in second and "Exchange 0" not in second
+        assert summarizer.recap == "[Scene recap: Second recap.]"
+
+    def test_hold_defers_recap_until_turn_finishes(self):
+        """A job started while the main turn holds the backend waits for it."""
+        from src.context.recap import SceneRecapSummarizer
+        from src.llm import MockLLMClient
+
+        client = MockLLMClient(responses=["Recap."])
+        summarizer = SceneRecapSummarizer(lambda: client)
+        blocks = self._strained_window(4).blocks
+
+        with summarizer.hold():
+            summarizer.request(blocks[:2])
+            summarizer.wait(timeout=0.1)
+            assert client.calls == []
+        summarizer.wait(timeout=5)
+        assert len(client.calls) == 1
+
+    def test_instant_failure_does_not_deadlock_or_retry(self):
+        """A job that finishes immediately (no client) neither hangs nor loops."""
+        from src.context.recap import SceneRecapSummarizer
+
+        summarizer = SceneRecapSummarizer(lambda: None)
+        blocks = self._strained_window(4).blocks
+
+        for _ in range(3):
+            assert summarizer.request(blocks[:2]) is None
+            summarizer.wait(timeout=5)
+        summarizer.shutdown()
+
+    def test_below_threshold_does_not_summarize(self):
+        """No LLM work is scheduled when pressure is low."""
+        from src.context.recap import SceneRecapSummarizer
+        from src.llm import MockLLMClient
+
+        client = MockLLMClient(responses=["unused"])
+        summarizer = SceneRecapSummarizer(lambda: client)
+        packer = PromptPacker(total_budget=100000, summarizer=summarizer)
+
+        _, info = self._pack(packer, self._strained_window(30))
+
+        summarizer.wait(timeout=5)
+        assert info.scene_recap is None
+        assert client.calls == []
+
+
+# -----------------------------------------------------------------------------
+# Context Prefetch Tests
+# -----------------------------------------------------------------------------
+
+class TestContextPrefetch:
+    """Speculative context builds while the player types."""
+
+    class FakeRetriever:
+        def __init__(self):
+            self.topics: list[str] = []
+
+        def query(self, topic, factions=None, strain_tier=None):
+            self.topics.append(topic)
+            return type("Result", (), {"is_empty": False})()
+
+        def format_for_prompt(self, result):
+            return "Lore: the courier route."
+
+    @pytest.fixture
+    def agent(self, manager, campaign):
+        from pathlib import Path
+
+        from src.agent import SentinelAgent
+        from src.llm import MockLLMClient
+
+        agent = SentinelAgent(
+            manager,
+            prompts_dir=Path(__file__).parent.parent / "prompts",
+            client=MockLLMClient(responses=["The courier nods."]),
+        )
+        agent.unified_retriever = self.FakeRetriever()
+        builds = []
+        get_sections = agent.prompt_loader.get_sections
+        agent.prompt_loader.get_sections = lambda *a: builds.append(1) or get_sections(*a)
+        agent.builds = builds
+        yield agent
+        agent.close()
+
+    def test_respond_reuses_prefetch(self, agent):
+        assert agent.prefetch_context("I follow the courier") is True
+        agent.respond("I follow the courier")
+
+        assert len(agent.builds) == 1
+        assert agent.unified_retriever.topics == ["I follow the courier"]
+
+    def test_changed_input_only_redoes_retrieval(self, agent):
+        agent.prefetch_context("I follow")
+        agent.respond("I follow the courier")
+
+        assert len(agent.builds) == 1
+        assert agent.unified_retriever.topics == ["I follow", "I follow the courier"]
+
+    def test_state_change_discards_prefetch(self, agent, manager):
+        agent.prefetch_context("I follow the courier")
+        manager.save_campaign()  # Every mutation saves
+        agent.respond("I follow the courier")
+
+        assert len(agent.builds) == 2
+
+    def test_prefetch_is_consumed_once(self, agent):
+        agent.prefetch_context("I wait")
+        agent.respond("I wait")
+        agent.respond("I wait")
+
+        assert len(agent.builds) == 2
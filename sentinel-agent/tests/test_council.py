@@ -299,6 +299,21 @@ class TestCouncilIntegration:
         # All system prompts should be different (different advisor personalities)
         assert len(set(system_prompts)) == 3, "All advisor prompts should be unique"
 
+    def test_advisor_prompts_share_situation_prefix(self, agent_with_mock_responses):
+        """The situation opens every advisor prompt; personas come after it."""
+        agent, mock = agent_with_mock_responses
+
+        agent.consult("What should I do?")
+
+        system_prompts = sorted(call["system"] for call in mock.calls)
+        prefix = system_prompts[0]
+        for other in system_prompts[1:]:
+            while not other.startswith(prefix):
+                prefix = prefix[:-1]
+        assert "# Current Situation" in prefix
+        for system in system_prompts:
+            assert "Your Worldview" not in system[:len(prefix)]
+
     def test_detects_hallucinated_identical_responses(self):
         """Should be able to detect when advisors give identical responses."""
         # Simulate hallucination: all advisors return the same thing
@@ -4,6 +4,7 @@ import pytest
 from src.state.schema import DormantThread, ThreadSeverity
 from src.state.manager import CampaignManager
 from src.state.store import MemoryCampaignStore
+from src.state.triggers import trigger_index
 
 
 class TestDormantThreadKeywords:
@@ -234,3 +235,65 @@ class TestBackwardsCompatibility:
 
         # Thread count should include it
         assert len(manager.current.dormant_threads) == 1
+
+
+class TestTriggerIndex:
+    """The campaign keyword index behind thread and leverage matching."""
+
+    @pytest.fixture
+    def manager(self):
+        manager = CampaignManager(MemoryCampaignStore())
+        manager.create_campaign("Test")
+        return manager
+
+    def _indexed(self, manager) -> set[str]:
+        return {t.id for t, _ in trigger_index(manager.current).match_threads(
+            {kw for t in manager.current.dormant_threads for kw in t.trigger_keywords}
+        )}
+
+    def test_queue_and_surface_update_index(self, manager):
+        first = manager.queue_dormant_thread("A", "When player returns to the warehouse district", "X")
+        second = manager.queue_dormant_thread("B", "When player meets the smuggler convoy", "Y")
+        index = trigger_index(manager.current)
+
+        assert self._indexed(manager) == {first.id, second.id}
+        manager.surface_dormant_thread(first.id, "test")
+
+        assert trigger_index(manager.current) is index  # Maintained, not rebuilt
+        assert index.match_threads({"warehouse", "district"}) == []
+        assert [t.id for t, _ in index.match_threads({"smuggler"})] == [second.id]
+
+    def test_direct_edits_trigger_rebuild(self, manager):
+        manager.queue_dormant_thread("A", "When player returns to the warehouse district", "X")
+        legacy = DormantThread(
+            origin="Legacy", trigger_condition="", consequence="Z",
+            trigger_keywords=["Harbor", "crane"],
+        )
+        manager.current.dormant_threads.append(legacy)
+
+        matches = manager.check_thread_triggers("The harbor crane creaks")
+
+        assert [m["thread_id"] for m in matches] == [legacy.id]
+        assert matches[0]["score"] == 1.0
+
+    def test_matches_keep_list_order(self, manager):
+        threads = [
+            manager.queue_dormant_thread(str(i), f"When the warehouse convoy {word} arrives", "X")
+            for i, word in enumerate(["blue", "green", "amber"])
+        ]
+        manager.current.dormant_threads.reverse()  # Same length, same list
+
+        found = [t.id for t, _ in trigger_index(manager.current).match_threads({"warehouse"})]
+
+        assert found == [t.id for t in threads]  # Grant order is indexed order
+
+    def test_loaded_campaign_is_indexed(self, manager):
+        thread = manager.queue_dormant_thread("A", "When player returns to the warehouse district", "X")
+        campaign_id = manager.current.meta.id
+        manager.persist_campaign()
+        manager._cache.clear()
+
+        loaded = manager.load_campaign(campaign_id)
+
+        assert loaded._trigger_index is not None
+        assert [t.id for t, _ in trigger_index(loaded).match_threads({"warehouse"})] == [thread.id]
@@ -170,3 +170,60 @@ class TestLocalBudgets:
         total = sum(b.tokens for b in LOCAL_BUDGETS.values())
         # Allow some headroom for tool schemas
         assert total < 6000, f"Local budget total {total} too high for 8k context"
+
+
+# -----------------------------------------------------------------------------
+# Context-Derived Budget Tests
+# -----------------------------------------------------------------------------
+
+class TestContextBudgets:
+    """Tests for budgets derived from the model's context window."""
+
+    def test_derived_budgets_match_hand_tuned_tables(self):
+        """16k and 8k windows land near the DEFAULT and LOCAL totals."""
+        from src.context.packer import budgets_for_context
+
+        _, standard_total = budgets_for_context(16384)
+        _, local_total = budgets_for_context(8192, local=True)
+        assert abs(standard_total - 13000) < 500
+        assert abs(local_total - 5000) < 500
+
+    def test_large_context_scales_flexible_sections_only(self):
+        """Fixed sections keep their size; skipped sections stay skipped."""
+        from src.context.packer import budgets_for_context
+
+        budgets, total = budgets_for_context(32768, local=True)
+        assert total > 20000
+        assert budgets[PackSection.SYSTEM] == LOCAL_BUDGETS[PackSection.SYSTEM]
+        assert budgets[PackSection.DIGEST].tokens == 0
+        assert budgets[PackSection.WINDOW].tokens > LOCAL_BUDGETS[PackSection.WINDOW].tokens
+
+    def test_response_tokens_come_out_of_the_pack(self):
+        """A larger reply reservation shrinks the pack."""
+        from src.context.packer import budgets_for_context
+
+        _, small_reply = budgets_for_context(16384, response_tokens=1024)
+        _, large_reply = budgets_for_context(16384, response_tokens=4096)
+        assert small_reply - large_reply == 3072
+
+    def test_agent_syncs_budgets_per_model(self):
+        """The agent rescales on model change and falls back when unknown."""
+        from src.agent import SentinelAgent
+        from src.llm import MockLLMClient
+        from src.state import CampaignManager, MemoryCampaignStore
+
+        manager = CampaignManager(MemoryCampaignStore())
+        client = MockLLMClient(model_name="big", context_length=32768)
+        agent = SentinelAgent(
+            manager,
+            prompts_dir=Path(__file__).parent.parent / "prompts",
+            client=client,
+        )
+        agent.close()
+
+        agent._sync_budgets()
+        assert agent.packer.total_budget > 20000
+
+        client._model_name, client._context_length = "unknown", None
+        agent._sync_budgets()
+        assert agent.packer.total_budget == 13000
@@ -0,0 +1,182 @@
+"""
+Tests for the copy-on-write campaign overlay.
+"""
+
+import pytest
+
+from src.state.manager import CampaignManager
+from src.state.overlay import CampaignOverlay
+from src.state.schema import DormantThread, FactionName, Region
+from src.state.schemas.action import Action, ActionType, Proposal
+from src.state.store import MemoryCampaignStore
+from src.state.triggers import trigger_index
+from src.systems.cascades import CascadeProcessor
+from src.systems.travel import TravelResolver
+from src.systems.turns import TurnOrchestrator
+from src.systems.validation import ActionValidator
+
+
+@pytest.fixture
+def campaign():
+    manager = CampaignManager(MemoryCampaignStore())
+    campaign = manager.create_campaign("Overlay")
+    campaign.dormant_threads.append(DormantThread(
+        origin="Left the convoy behind",
+        trigger_condition="Returning to the corridor",
+        consequence="The convoy remembers",
+        created_session=0,
+        trigger_keywords=["convoy"],
+    ))
+    return campaign
+
+
+class TestCopyOnWrite:
+    """Reads share the base; writes copy only what they touch."""
+
+    def test_reads_do_not_copy(self, campaign):
+        overlay = CampaignOverlay(campaign)
+
+        assert overlay.map_state.current_region == campaign.map_state.current_region
+        assert len(overlay.npcs.active) == len(campaign.npcs.active)
+        assert overlay.factions.nexus == campaign.factions.nexus
+        assert not overlay.touched("map_state", "npcs", "factions")
+
+    def test_write_copies_one_field(self, campaign):
+        overlay = CampaignOverlay(campaign)
+
+        overlay.map_state.current_region = Region.GULF_PASSAGE
+
+        assert overlay.map_state.current_region == Region.GULF_PASSAGE
+        assert campaign.map_state.current_region == Region.RUST_CORRIDOR
+        assert overlay.touched("map_state")
+        assert not overlay.touched("factions", "history", "npcs")
+
+    def test_method_call_copies_field(self, campaign):
+        overlay = CampaignOverlay(campaign)
+
+        overlay.factions.get(FactionName.NEXUS).shift(2)
+
+        assert overlay.factions.nexus.standing.value == "Allied"
+        assert campaign.factions.nexus.standing.value == "Neutral"
+
+    def test_view_taken_before_copy_follows_it(self, campaign):
+        overlay = CampaignOverlay(campaign)
+        standing = overlay.factions.lattice
+
+        overlay.factions.get(FactionName.LATTICE).shift(1)
+
+        assert standing.standing.value == "Friendly"
+
+    def test_assigned_views_are_copied(self, campaign):
+        overlay = CampaignOverlay(campaign)
+
+        overlay.dormant_threads = [t for t in overlay.dormant_threads]
+        overlay.dormant_threads[0].consequence = "Changed"
+
+        assert campaign.dormant_threads[0].consequence == "The convoy remembers"
+
+    def test_unknown_field_rejected(self, campaign):
+        with pytest.raises(AttributeError, match="no field"):
+            CampaignOverlay(campaign).not_a_field = 1
+
+
+class TestDiffCommit:
+    """diff(), commit(), fork() and stacking."""
+
+    def test_diff_skips_unchanged_copies(self, campaign):
+        overlay = CampaignOverlay(campaign)
+        overlay.touch("npcs")
+        overlay.turn_count += 1
+
+        assert overlay.diff() == {"turn_count": 1}
+
+    def test_commit_applies_delta(self, campaign):
+        overlay = CampaignOverlay(campaign)
+        overlay.map_state.current_region = Region.BREADBASKET
+        overlay.state_version += 1
+
+        changes = overlay.commit()
+
+        assert set(changes) == {"map_state", "state_version"}
+        assert campaign.map_state.current_region == Region.BREADBASKET
+        assert campaign.state_version == 1
+        assert not overlay.touched("map_state")
+
+    def test_fork_is_independent(self, campaign):
+        overlay = CampaignOverlay(campaign)
+        overlay.factions.get(FactionName.COVENANT).shift(1)
+
+        fork = overlay.fork()
+        fork.factions.get(FactionName.COVENANT).shift(1)
+
+        assert overlay.factions.covenant.standing.value == "Friendly"
+        assert fork.factions.covenant.standing.value == "Allied"
+        assert campaign.factions.covenant.standing.value == "Neutral"
+
+    def test_stacked_commit_lands_one_layer_down(self, campaign):
+        outer = CampaignOverlay(campaign)
+        inner = CampaignOverlay(outer)
+        inner.factions.get(FactionName.WITNESSES).shift(-1)
+
+        inner.commit()
+
+        assert outer.factions.witnesses.standing.value == "Unfriendly"
+        assert campaign.factions.witnesses.standing.value == "Neutral"
+
+    def test_materialize(self, campaign):
+        overlay = CampaignOverlay(campaign)
+        overlay.turn_count = 4
+
+        assert overlay.materialize().turn_count == 4
+        assert campaign.turn_count == 0
+
+
+class TestTriggerIndex:
+    """Overlays share their base's index until they copy the threads."""
+
+    def test_untouched_overlay_shares_index(self, campaign):
+        assert trigger_index(CampaignOverlay(campaign)) is trigger_index(campaign)
+
+    def test_touched_overlay_indexes_its_copies(self, campaign):
+        overlay = CampaignOverlay(campaign)
+        overlay.dormant_threads = []
+
+        assert trigger_index(overlay).match_threads({"convoy"}) == []
+        assert len(trigger_index(campaign).match_threads({"convoy"})) == 1
+
+
+class TestOrchestrator:
+    """Turns resolve against an overlay and commit once."""
+
+    def test_failed_resolution_leaves_campaign_untouched(self, campaign):
+        def exploding_resolver(action, state, seed):
+            state.factions.get(FactionName.NEXUS).shift(2)
+            raise RuntimeError("boom")
+
+        orchestrator = TurnOrchestrator(campaign)
+        orchestrator.set_validator(ActionValidator().validate)
+        orchestrator.register_resolver(ActionType.TRAVEL.value, exploding_resolver)
+        proposal = Proposal(action_type=ActionType.TRAVEL, payload={"to": "breadbasket"})
+        orchestrator.propose(proposal)
+
+        with pytest.raises(RuntimeError):
+            orchestrator.commit(Action.from_proposal(proposal, campaign.state_version))
+
+        assert campaign.factions.nexus.standing.value == "Neutral"
+        assert campaign.state_version == 0
+
+    def test_travel_commits(self, campaign):
+        orchestrator = TurnOrchestrator(campaign)
+        orchestrator.set_validator(ActionValidator().validate)
+        orchestrator.register_resolver(ActionType.TRAVEL.value, TravelResolver().resolve)
+        orchestrator.set_cascade_processor(CascadeProcessor().process)
+        destination = ActionValidator()._load_regions()["rust_corridor"]["routes"]
+        proposal = Proposal(action_type=ActionType.TRAVEL, payload={"to": sorted(destination)[0]})
+        orchestrator.propose(proposal)
+
+        result = orchestrator.commit(Action.from_proposal(proposal, campaign.state_version))
+
+        assert campaign.map_state.current_region.value == sorted(destination)[0]
+        assert campaign.region.value == sorted(destination)[0]
+        assert campaign.state_version == result.state_version == 1
+        assert result.state_snapshot["map"]["current_region"] == sorted(destination)[0]
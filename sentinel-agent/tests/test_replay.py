@@ -0,0 +1,129 @@
+"""
+Tests for stable turn seeds, the action log and replay.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.state.action_log import JsonlActionLog, LoggedAction, MemoryActionLog, state_hash
+from src.state.event_bus import EventType, get_event_bus
+from src.state.manager import CampaignManager
+from src.state.schemas.action import Action, ActionType
+from src.state.store import JsonCampaignStore, MemoryCampaignStore
+from src.systems.replay import ReplayEngine, ReplayMismatch, record_actions
+from src.systems.turns import turn_seed
+
+
+@pytest.fixture
+def campaign():
+    manager = CampaignManager(MemoryCampaignStore())
+    return manager.create_campaign("Replay")
+
+
+def _recorded(campaign, count=30, checkpoint_every=5):
+    snapshot = campaign.model_copy(deep=True)
+    log = record_actions(campaign, count, seed=1, checkpoint_every=checkpoint_every)
+    return snapshot, list(log.entries())
+
+
+class TestTurnSeed:
+    """Seeds depend only on campaign and action ids."""
+
+    def test_stable_across_processes(self):
+        code = (
+            "from src.systems.turns import turn_seed; "
+            "print(turn_seed('camp1', 'action-1'))"
+        )
+        seeds = {
+            subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                env={"PYTHONHASHSEED": hash_seed}, cwd=Path(__file__).parent.parent,
+            ).stdout.strip()
+            for hash_seed in ("1", "2")
+        }
+        assert seeds == {str(turn_seed("camp1", "action-1"))}
+
+    def test_keyed_by_campaign(self):
+        assert turn_seed("a", "action-1") != turn_seed("b", "action-1")
+        assert 0 <= turn_seed("a", "action-1") < 2**31
+
+
+class TestActionLog:
+    """Orchestrator logging and JSONL storage."""
+
+    def test_commits_are_logged_with_checkpoints(self, campaign):
+        _, entries = _recorded(campaign, count=10, checkpoint_every=5)
+
+        assert [e.state_version for e in entries] == list(range(1, 11))
+        assert [e.state_hash is not None for e in entries] == [i % 5 == 0 for i in range(1, 11)]
+        assert entries[-1].state_hash == state_hash(campaign)
+
+    def test_jsonl_round_trip_skips_torn_line(self, tmp_path):
+        log = JsonlActionLog.for_campaign(tmp_path, "camp1")
+        entry = LoggedAction(
+            action=Action(action_type=ActionType.LOCAL, state_version=0),
+            seed=7, state_version=1,
+        )
+        log.append(entry)
+        with open(log.path, "a", encoding="utf-8") as f:
+            f.write('{"action": {"action_ty')
+
+        assert list(log.entries()) == [entry]
+
+    def test_store_delete_removes_log(self, tmp_path):
+        store = JsonCampaignStore(tmp_path)
+        campaign = CampaignManager(store).create_campaign("Logged")
+        store.save(campaign)
+        log = JsonlActionLog.for_campaign(tmp_path, campaign.meta.id)
+        log.append(LoggedAction(
+            action=Action(action_type=ActionType.LOCAL, state_version=0), seed=1, state_version=1,
+        ))
+
+        assert store.delete(campaign.meta.id)
+        assert not log.path.exists()
+
+
+class TestReplay:
+    """Rebuilding state from a snapshot plus the log."""
+
+    def test_replay_reproduces_state(self, campaign):
+        snapshot, entries = _recorded(campaign)
+
+        result = ReplayEngine().replay(snapshot, entries)
+
+        assert result.actions == 30
+        assert result.verified == 6
+        assert state_hash(result.campaign) == state_hash(campaign)
+        assert snapshot.state_version == 0
+
+    def test_fast_forward_from_later_snapshot(self, campaign):
+        snapshot, entries = _recorded(campaign)
+        middle = ReplayEngine().replay(snapshot, entries, until=12).campaign
+
+        result = ReplayEngine().replay(middle, entries)
+
+        assert middle.state_version == 12
+        assert result.skipped == 12
+        assert result.actions == 18
+        assert state_hash(result.campaign) == state_hash(campaign)
+
+    def test_tampered_checkpoint_detected(self, campaign):
+        snapshot, entries = _recorded(campaign)
+        entries[9] = entries[9].model_copy(update={"state_hash": "0" * 32})
+
+        with pytest.raises(ReplayMismatch, match="state version 10"):
+            ReplayEngine().replay(snapshot, entries)
+
+    def test_replay_is_silent(self, campaign):
+        snapshot, entries = _recorded(campaign, count=5)
+        seen = []
+        bus = get_event_bus()
+        bus.on(EventType.REGION_CHANGED, seen.append)
+        try:
+            ReplayEngine().replay(snapshot, entries)
+        finally:
+            bus.off(EventType.REGION_CHANGED, seen.append)
+        assert seen == []
@@ -0,0 +1,132 @@
+"""
+Tests for the content-addressed LLM response cache.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.llm import MockLLMClient
+from src.llm.base import LLMResponse, Message
+from src.llm.cache import (
+    ResponseCache,
+    disable_response_cache,
+    enable_response_cache,
+    request_key,
+)
+
+
+def _key(content: str = "hi", **overrides) -> str:
+    args = {
+        "model": "m",
+        "messages": [Message(role="user", content=content)],
+        "system": "sys",
+        "tools": None,
+        "temperature": 0.0,
+        "max_tokens": 100,
+    }
+    args.update(overrides)
+    return request_key(**args)
+
+
+@pytest.fixture
+def global_cache(tmp_path):
+    cache = enable_response_cache(tmp_path / "cache")
+    yield cache
+    disable_response_cache()
+
+
+class TestRequestKey:
+    """Keys depend on exactly what determines the response."""
+
+    def test_stable_and_sensitive(self):
+        assert _key() == _key()
+        assert _key() != _key(content="hello")
+        assert _key() != _key(model="other")
+        assert _key() != _key(temperature=0.7)
+        assert _key() != _key(max_tokens=200)
+
+    def test_tool_schema_order_does_not_matter(self):
+        a = [{"name": "x", "description": "d", "parameters": {"a": 1, "b": 2}}]
+        b = [{"parameters": {"b": 2, "a": 1}, "description": "d", "name": "x"}]
+        assert _key(tools=a) == _key(tools=b)
+
+
+class TestResponseCache:
+    """Storage, namespaces and LRU eviction."""
+
+    def test_round_trip_survives_restart(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        cache.put("model/a", "k1", LLMResponse(content="answer"))
+
+        reopened = ResponseCache(tmp_path)
+        assert reopened.get("model/a", "k1").content == "answer"
+        assert reopened.get("model/b", "k1") is None  # Per-model namespace
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        cache.put("m", "a", LLMResponse(content="x" * 100))
+        entry_size = cache.size_bytes
+        cache.max_bytes = entry_size * 2 + 16  # Timestamps vary in length
+
+        cache.put("m", "b", LLMResponse(content="x" * 100))
+        cache.get("m", "a")  # a is now more recent than b
+        cache.put("m", "c", LLMResponse(content="x" * 100))
+
+        assert cache.get("m", "a") is not None
+        assert cache.get("m", "b") is None
+        assert cache.get("m", "c") is not None
+        assert cache.size_bytes <= cache.max_bytes
+
+    def test_clear_one_model(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        cache.put("a", "k", LLMResponse(content="1"))
+        cache.put("b", "k", LLMResponse(content="2"))
+        assert cache.clear("a") == 1
+        assert cache.get("a", "k") is None
+        assert cache.get("b", "k").content == "2"
+
+
+class TestCachedCalls:
+    """Clients use the cache only when reuse is allowed."""
+
+    def test_chat_cached_requires_determinism_or_reuse(self, global_cache):
+        client = MockLLMClient(responses=["one", "two", "three", "four"])
+        msgs = [Message(role="user", content="analyze")]
+
+        assert client.chat_cached(msgs, temperature=0.7).content == "one"
+        assert client.chat_cached(msgs, temperature=0.7).content == "two"
+
+        assert client.chat_cached(msgs, reuse=True).content == "three"
+        assert client.chat_cached(msgs, reuse=True).content == "three"
+
+        assert client.chat_cached(msgs, temperature=0).content == "four"
+        assert client.chat_cached(msgs, temperature=0).content == "four"
+        assert len(client.calls) == 4
+
+    def test_disabled_by_default(self):
+        client = MockLLMClient(responses=["one", "two"])
+        msgs = [Message(role="user", content="analyze")]
+        client.chat_cached(msgs, reuse=True)
+        client.chat_cached(msgs, reuse=True)
+        assert len(client.calls) == 2
+
+    def test_repeated_consult_is_served_from_cache(self, global_cache, manager, campaign):
+        from src.agent import SentinelAgent
+
+        client = MockLLMClient(responses=["a", "b", "c"])
+        agent = SentinelAgent(
+            manager,
+            prompts_dir=Path(__file__).parent.parent / "prompts",
+            client=client,
+        )
+        try:
+            first = agent.consult("Should I go?")
+            second = agent.consult("Should I go?")
+        finally:
+            agent.close()
+
+        assert [r.response for r in first] == [r.response for r in second]
+        assert len(client.calls) == 3
+        assert global_cache.hits == 3
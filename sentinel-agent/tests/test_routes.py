@@ -0,0 +1,158 @@
+"""
+Tests for the precomputed region route graph.
+"""
+
+import json
+
+import pytest
+
+from src.state.manager import CampaignManager
+from src.state.schema import FactionName
+from src.state.schemas.action import ActionType, Proposal
+from src.state.store import MemoryCampaignStore
+from src.systems.routes import (
+    BYPASS,
+    CLOSED,
+    OPEN,
+    RouteGraph,
+    TravelProfile,
+    compile_requirement,
+    route_graph,
+)
+from src.systems.travel import TravelResolver
+from src.systems.validation import ActionValidator
+
+
+# A line a-b-c-d with a gated shortcut a-d, and a closed spur c-e
+REGIONS = {
+    "a": {"name": "A", "routes": {
+        "b": {"requirements": []},
+        "d": {
+            "requirements": [{"type": "faction", "faction": "nexus", "min_standing": "friendly"}],
+            "alternatives": [{"type": "risky"}],
+        },
+    }},
+    "b": {"name": "B", "routes": {"a": {"requirements": []}, "c": {"requirements": []}}},
+    "c": {"name": "C", "routes": {
+        "b": {"requirements": []},
+        "d": {"requirements": []},
+        "e": {"requirements": [{"type": "vehicle", "capability": "offroad"}]},
+    }},
+    "d": {"name": "D", "routes": {
+        "c": {
+            "requirements": [{"type": "vehicle", "capability": "offroad"}],
+            "alternatives": [{"type": "contact", "faction": "wanderers"}],
+        },
+    }},
+    "e": {"name": "E", "routes": {}},
+}
+
+
+@pytest.fixture
+def campaign():
+    manager = CampaignManager(MemoryCampaignStore())
+    return manager.create_campaign("Routes")
+
+
+@pytest.fixture
+def graph():
+    return RouteGraph(REGIONS)
+
+
+class TestCompile:
+    """Requirements compile to checks against a profile."""
+
+    def test_faction_ids_resolve(self):
+        check = compile_requirement({"type": "faction", "faction": "ghost_networks", "min_standing": "friendly"})
+
+        assert check.faction == FactionName.GHOST_NETWORKS
+        assert check.min_standing == 3
+
+    def test_contact_needs_neutral(self, campaign):
+        check = compile_requirement({"type": "contact", "faction": "lattice"})
+
+        assert check.met(TravelProfile.from_campaign(campaign))
+        campaign.factions.get(FactionName.LATTICE).shift(-1)
+        assert not check.met(TravelProfile.from_campaign(campaign))
+
+    def test_unknown_types_skipped(self):
+        assert compile_requirement({"type": "weather"}) is None
+
+    def test_graph_shares_identical_checks(self):
+        graph = route_graph()
+        assert len(graph.checks) == len(set(graph.checks))
+        assert all(e.mask or not e.checks for e in graph.edges())
+
+
+class TestPlanning:
+    """All-pairs plans under the campaign's standings."""
+
+    def test_shortest_takes_bypass(self, graph, campaign):
+        plan = graph.plan(campaign, "d", source="a")
+
+        assert plan.path == ("a", "d")
+        assert plan.bypassed == ("d",)
+
+    def test_cheapest_avoids_bypass(self, graph, campaign):
+        plan = graph.plan(campaign, "d", source="a", cheapest=True)
+
+        assert plan.path == ("a", "b", "c", "d")
+        assert plan.bypasses == 0
+        assert [p.payload["to"] for p in plan.proposals()] == ["b", "c", "d"]
+
+    def test_standing_change_opens_route(self, graph, campaign):
+        edge = graph.route("a", "d")
+        before = graph.satisfied(campaign)
+        campaign.factions.get(FactionName.NEXUS).shift(1)
+
+        assert edge.state(before) == BYPASS
+        assert edge.state(graph.satisfied(campaign)) == OPEN
+        assert graph.plan(campaign, "d", source="a", cheapest=True).path == ("a", "d")
+
+    def test_reachable_without_bypass(self, graph, campaign):
+        assert set(graph.reachable(campaign, source="d")) == {"a", "b", "c"}
+        assert graph.reachable(campaign, source="d", bypass=False) == {}
+
+    def test_closed_route_unreachable(self, graph, campaign):
+        assert graph.route("c", "e").state(graph.satisfied(campaign)) == CLOSED
+        assert graph.plan(campaign, "e", source="a") is None
+
+    def test_unknown_region(self, graph, campaign):
+        assert graph.plan(campaign, "nowhere", source="a") is None
+
+    def test_graph_is_read_only(self, graph):
+        with pytest.raises(TypeError):
+            graph.regions["a"]["name"] = "Changed"
+
+
+class TestShared:
+    """One graph per regions file."""
+
+    def test_validator_and_resolver_share_graph(self, tmp_path):
+        path = tmp_path / "regions.json"
+        path.write_text(json.dumps({"regions": REGIONS}))
+
+        assert route_graph(path) is route_graph(path)
+        assert ActionValidator(path).routes is route_graph(path)
+        assert TravelResolver(path)._load_regions() is route_graph(path).regions
+
+    def test_faction_requirement_met(self, campaign):
+        validator = ActionValidator()
+        target = next(
+            e.target for e in validator.routes.edges()
+            if e.source == campaign.map_state.current_region.value
+            and any(c.kind == "faction" for c in e.checks)
+        )
+
+        result = validator.validate(Proposal(action_type=ActionType.TRAVEL, payload={"to": target}), campaign)
+
+        assert [r.status.value for r in result.requirements] == ["met"]
+
+    def test_no_direct_route_suggests_path(self, campaign):
+        validator = ActionValidator()
+        far = next(t for t, p in validator.routes.reachable(campaign).items() if p.hops > 1)
+
+        result = validator.validate(Proposal(action_type=ActionType.TRAVEL, payload={"to": far}), campaign)
+
+        assert not result.feasible
+        assert "Nearest path:" in result.summary
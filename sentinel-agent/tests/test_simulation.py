@@ -0,0 +1,134 @@
+"""
+Tests for the Monte Carlo what-if simulator.
+"""
+
+import pytest
+
+from src.state.manager import CampaignManager
+from src.state.schema import FactionName, Region
+from src.state.schemas.action import ActionType, Proposal
+from src.state.store import MemoryCampaignStore
+from src.systems.simulation import (
+    SimulationEngine,
+    _Tally,
+    WhatIfReport,
+    proposal_from_text,
+    simulate,
+    simulate_many,
+)
+
+
+@pytest.fixture
+def campaign():
+    manager = CampaignManager(MemoryCampaignStore())
+    return manager.create_campaign("What If")
+
+
+def _local(faction: FactionName, delta: int) -> Proposal:
+    return Proposal(
+        action_type=ActionType.LOCAL,
+        payload={"standing_changes": {faction.value: delta}},
+    )
+
+
+class TestRollout:
+    """Single rollouts through the turn engine."""
+
+    def test_same_seed_and_index_repeat(self, campaign):
+        engine = SimulationEngine()
+        first = engine.rollout(campaign, None, 5, ["drift", "wander"], seed=3, index=7)
+        second = engine.rollout(campaign, None, 5, ["drift", "wander"], seed=3, index=7)
+        assert first == second
+
+    def test_base_campaign_untouched(self, campaign):
+        before = campaign.model_dump_json()
+        SimulationEngine().rollout(campaign, _local(FactionName.NEXUS, 2), 3, ["drift"], 0, 0)
+        assert campaign.model_dump_json() == before
+
+    def test_travel_candidate_moves(self, campaign):
+        engine = SimulationEngine()
+        start = campaign.map_state.current_region.value
+        destination = engine.routes(start)[0]
+        candidate = Proposal(action_type=ActionType.TRAVEL, payload={"to": destination})
+
+        outcome = engine.rollout(campaign, candidate, 0, ["hold"], 0, 0)
+
+        assert outcome.feasible
+        assert outcome.region == destination
+
+    def test_local_candidate_shifts_standing(self, campaign):
+        outcome = SimulationEngine().rollout(
+            campaign, _local(FactionName.LATTICE, 2), 0, ["hold"], 0, 0,
+        )
+        assert outcome.standings["Lattice"] == "Allied"
+
+
+class TestReport:
+    """Tallies, reports and the process pool."""
+
+    def test_tally_merge_matches_single_tally(self, campaign):
+        engine = SimulationEngine()
+        outcomes = [engine.rollout(campaign, None, 2, ["drift"], 1, i) for i in range(6)]
+        whole, left, right = _Tally(), _Tally(), _Tally()
+        for i, outcome in enumerate(outcomes):
+            whole.add(outcome)
+            (left if i < 3 else right).add(outcome)
+        left.merge(right)
+        assert left == whole
+
+    def test_candidate_vs_baseline(self, campaign):
+        report, baseline = simulate_many(
+            campaign, [_local(FactionName.COVENANT, 2), None],
+            rollouts=12, turns=2, policies=["hold"], workers=1,
+        )
+
+        assert report.rollouts == baseline.rollouts == 12
+        assert report.standings["Covenant"] == {"Allied": 1.0}
+        assert baseline.standings["Covenant"] == {"Neutral": 1.0}
+        assert report.expected_standing("Covenant") - baseline.expected_standing("Covenant") == 2
+
+        text = report.format(baseline, campaign)
+        assert "12 rollouts x 2 turns" in text
+        assert "- Covenant: Allied 100%, +2.00 steps" in text
+
+    def test_equal_seeds_equal_reports(self, campaign):
+        runs = [
+            simulate(campaign, None, rollouts=8, turns=3, seed=5, workers=1)
+            for _ in range(2)
+        ]
+        assert runs[0].standings == runs[1].standings
+        assert runs[0].regions == runs[1].regions
+
+    def test_unsupported_action_rejected(self, campaign):
+        with pytest.raises(ValueError, match="initiate_combat"):
+            simulate(campaign, Proposal(action_type=ActionType.INITIATE_COMBAT, payload={}), rollouts=1)
+
+    def test_unknown_policy_rejected(self, campaign):
+        with pytest.raises(ValueError, match="Unknown policies"):
+            simulate(campaign, None, rollouts=1, policies=["scheme"])
+
+    def test_report_from_empty_tally(self):
+        report = WhatIfReport.from_tally(_Tally(), None, 5, 0, 0.0)
+        assert report.rollouts == 0
+        assert report.infeasible == 0
+
+
+class TestProposalFromText:
+    """Best-effort candidate parsing for /simulate whatif."""
+
+    def test_region_becomes_travel(self):
+        proposal = proposal_from_text("went to the Gulf Passage instead")
+        assert proposal.action_type == ActionType.TRAVEL
+        assert proposal.payload == {"to": Region.GULF_PASSAGE.value}
+
+    def test_faction_favor(self):
+        proposal = proposal_from_text("helped Ember instead")
+        assert proposal.payload["standing_changes"] == {"Ember Colonies": 1}
+
+    def test_faction_slight(self):
+        proposal = proposal_from_text("betrayed the Lattice")
+        assert proposal.action_type == ActionType.LOCAL
+        assert proposal.payload["standing_changes"] == {"Lattice": -1}
+
+    def test_nothing_recognized(self):
+        assert proposal_from_text("accepted the enhancement") is None
@@ -0,0 +1,176 @@
+"""
+Tests for incremental UI snapshots and their deltas.
+"""
+
+import pytest
+
+from src.state.event_bus import EventType, get_event_bus
+from src.state.manager import CampaignManager
+from src.state.schemas.action import Action, ActionType, Proposal
+from src.state.schemas.turn_result import SnapshotDelta
+from src.state.store import MemoryCampaignStore
+from src.systems.simulation import SimulationEngine
+from src.systems.snapshots import (
+    SnapshotBuilder,
+    SnapshotFeed,
+    apply_delta,
+    diff_snapshots,
+)
+
+
+@pytest.fixture
+def campaign():
+    manager = CampaignManager(MemoryCampaignStore())
+    return manager.create_campaign("Snapshots")
+
+
+def _commit(orchestrator, proposal):
+    orchestrator.propose(proposal)
+    return orchestrator.commit(Action.from_proposal(proposal, orchestrator.campaign.state_version))
+
+
+class TestDiff:
+    """JSON Pointer diff and apply."""
+
+    def test_leaf_change_and_removal(self):
+        old = {"a": 1, "factions": {"Nexus": "Neutral", "Lattice": "Neutral"}, "gone": 1}
+        new = {"a": 1, "factions": {"Nexus": "Friendly", "Lattice": "Neutral"}, "b": {"x": 1}}
+
+        changed, removed = diff_snapshots(old, new)
+
+        assert changed == {"/factions/Nexus": "Friendly", "/b": {"x": 1}}
+        assert removed == ["/gone"]
+
+    def test_keys_are_escaped(self):
+        changed, _ = diff_snapshots({}, {"a/b": {"c~d": 1}})
+
+        assert changed == {"/a~1b": {"c~d": 1}}
+        assert apply_delta({}, SnapshotDelta(state_version=1, changed=changed)) == {"a/b": {"c~d": 1}}
+
+    def test_apply_round_trips_without_mutating(self):
+        old = {"map": {"regions": {"rust_corridor": {"npcs_met": 0}}}, "turn_count": 0}
+        new = {"map": {"regions": {"rust_corridor": {"npcs_met": 2}}}, "turn_count": 1}
+        changed, removed = diff_snapshots(old, new)
+
+        result = apply_delta(old, SnapshotDelta(state_version=1, changed=changed, removed=removed))
+
+        assert result == new
+        assert old["map"]["regions"]["rust_corridor"]["npcs_met"] == 0
+
+
+class TestBuilder:
+    """Only changed sections are rebuilt."""
+
+    def test_first_build_is_full(self, campaign):
+        snapshot, delta = SnapshotBuilder().build(campaign)
+
+        assert delta.base_version is None
+        assert apply_delta({}, delta) == snapshot
+        assert set(snapshot) >= {"factions", "map", "npcs", "turn_count"}
+
+    def test_unchanged_sections_are_reused(self, campaign):
+        builder = SnapshotBuilder()
+        first, _ = builder.build(campaign)
+
+        campaign.factions.nexus.shift(1)
+        campaign.state_version += 1
+        second, delta = builder.build(campaign, {"factions", "state_version"})
+
+        assert second["map"] is first["map"]
+        assert second["npcs"] is first["npcs"]
+        assert second["factions"] is not first["factions"]
+        assert delta.base_version == 0
+        assert delta.changed == {"/state_version": 1, "/factions/Nexus": "Friendly"}
+
+    def test_invalidate_rebuilds_everything(self, campaign):
+        builder = SnapshotBuilder()
+        first, _ = builder.build(campaign)
+        campaign.factions.covenant.shift(-1)  # Out-of-band edit
+
+        builder.invalidate()
+        second, delta = builder.build(campaign, set())
+
+        assert second["map"] is not first["map"]
+        assert delta.changed == {"/factions/Covenant": "Unfriendly"}
+
+
+class TestFeed:
+    """Subscribers hear only about their paths."""
+
+    def test_only_touched_subscribers_called(self):
+        feed = SnapshotFeed()
+        feed.reset({"state_version": 0, "factions": {"Nexus": "Neutral"}, "map": {}})
+        calls = {"factions": [], "map": [], "root": []}
+        feed.subscribe("/factions", lambda s, p: calls["factions"].append(p))
+        feed.subscribe("/map", lambda s, p: calls["map"].append(p))
+        feed.subscribe("/", lambda s, p: calls["root"].append(p))
+
+        applied = feed.apply(SnapshotDelta(
+            base_version=0, state_version=1, changed={"/factions/Nexus": "Friendly"},
+        ))
+
+        assert applied
+        assert calls["factions"] == [["/factions/Nexus"]]
+        assert calls["map"] == []
+        assert calls["root"] == [["/factions/Nexus"]]
+        assert feed.snapshot["factions"]["Nexus"] == "Friendly"
+        assert feed.version == 1
+
+    def test_one_call_for_several_paths(self):
+        feed = SnapshotFeed()
+        feed.reset({"state_version": 0})
+        calls = []
+        feed.subscribe(("/region", "/turn_count"), lambda s, p: calls.append(sorted(p)))
+
+        feed.apply(SnapshotDelta(
+            base_version=0, state_version=1, changed={"/region": "gulf_passage", "/turn_count": 1},
+        ))
+
+        assert calls == [["/region", "/turn_count"]]
+
+    def test_out_of_order_delta_rejected(self):
+        feed = SnapshotFeed()
+        feed.reset({"state_version": 3})
+
+        assert not feed.apply(SnapshotDelta(base_version=1, state_version=2, changed={"/x": 1}))
+        assert feed.version == 3
+
+
+class TestOrchestrator:
+    """Turns publish deltas keyed by state_version."""
+
+    def test_travel_delta_skips_untouched_sections(self, campaign):
+        engine = SimulationEngine()
+        orchestrator = engine.orchestrator(campaign)
+        first = _commit(orchestrator, Proposal(
+            action_type=ActionType.LOCAL, payload={"standing_changes": {"Nexus": 1}},
+        ))
+        destination = engine.routes(campaign.map_state.current_region.value)[0]
+
+        second = _commit(orchestrator, Proposal(action_type=ActionType.TRAVEL, payload={"to": destination}))
+
+        delta = second.snapshot_delta
+        assert delta.base_version == first.state_version
+        assert delta.state_version == second.state_version
+        assert delta.changed["/map/current_region"] == destination
+        assert not any(p.startswith(("/factions", "/npcs")) for p in delta.paths)
+        assert second.state_snapshot["factions"] is first.state_snapshot["factions"]
+
+    def test_feed_tracks_orchestrator(self, campaign):
+        engine = SimulationEngine()
+        orchestrator = engine.orchestrator(campaign)
+        feed = SnapshotFeed()
+        bus = get_event_bus()
+        bus.on(EventType.SNAPSHOT_UPDATED, feed.on_event)
+        try:
+            _commit(orchestrator, Proposal(
+                action_type=ActionType.LOCAL, payload={"standing_changes": {"Lattice": 1}},
+            ))
+            result = _commit(orchestrator, Proposal(
+                action_type=ActionType.LOCAL, payload={"standing_changes": {"Lattice": 1}},
+            ))
+        finally:
+            bus.off(EventType.SNAPSHOT_UPDATED, feed.on_event)
+
+        assert feed.version == result.state_version
+        assert feed.snapshot == result.state_snapshot
@@ -0,0 +1,318 @@
+"""
+Tests for streaming chat completions.
+
+Covers SSE/NDJSON parsing, delta accumulation, skill-tag buffering, the
+streaming tool loop, and an LM Studio stream over a local HTTP server.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from src.llm.base import LLMClient, LLMResponse, StreamChunk, ToolCall
+from src.llm.streaming import (
+    ChatStreamAccumulator,
+    SkillTagBuffer,
+    iter_ndjson,
+    iter_sse_data,
+)
+
+
+def _sse(*events: dict) -> list[bytes]:
+    lines = []
+    for event in events:
+        lines += [f"data: {json.dumps(event)}\n".encode(), b"\n"]
+    return lines + [b"data: [DONE]\n", b"\n"]
+
+
+TOOLS = [{"name": "roll_check", "description": "Roll", "input_schema": {}}]
+
+
+def _delta(**delta) -> dict:
+    return {"choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+
+
+class ScriptedStreamClient(LLMClient):
+    """Streams scripted replies in small pieces; one reply per round."""
+
+    def __init__(self, replies: list[LLMResponse], native: bool = False, piece: int = 3):
+        self._replies = list(replies)
+        self._native = native
+        self._piece = piece
+        self.rounds = 0
+
+    @property
+    def supports_tools(self) -> bool:
+        return self._native
+
+    @property
+    def model_name(self) -> str:
+        return "scripted"
+
+    def chat(self, messages, system=None, tools=None, temperature=0.7, max_tokens=2048):
+        self.rounds += 1
+        return self._replies.pop(0)
+
+    def chat_stream(self, messages, system=None, tools=None, temperature=0.7, max_tokens=2048):
+        response = self.chat(messages, system, tools, temperature, max_tokens)
+        text = response.content
+        for i in range(0, len(text), self._piece):
+            yield StreamChunk(text=text[i:i + self._piece])
+        yield StreamChunk(response=response)
+
+
+# -----------------------------------------------------------------------------
+# Parsing
+# -----------------------------------------------------------------------------
+
+class TestStreamParsing:
+    """SSE / NDJSON framing and delta accumulation."""
+
+    def test_sse_events_until_done(self):
+        lines = [
+            b": keep-alive\n",
+            b'data: {"a": 1}\n',
+            b"\n",
+            b'data: {"b":\n',
+            b"data: 2}\n",
+            b"\n",
+            b"data: [DONE]\n",
+            b'data: {"c": 3}\n',
+        ]
+        assert list(iter_sse_data(lines)) == [{"a": 1}, {"b": 2}]
+
+    def test_ndjson_skips_blank_and_broken_lines(self):
+        lines = [b'{"a": 1}\n', b"\n", b"not json\n", b'{"b": 2}']
+        assert list(iter_ndjson(lines)) == [{"a": 1}, {"b": 2}]
+
+    def test_openai_deltas_and_tool_call_fragments(self):
+        acc = ChatStreamAccumulator()
+        texts = [acc.feed(e) for e in iter_sse_data(_sse(
+            _delta(role="assistant", content="Rain "),
+            _delta(content="falls."),
+            _delta(tool_calls=[{"index": 0, "id": "call_1",
+                                "function": {"name": "roll_", "arguments": '{"sk'}}]),
+            _delta(tool_calls=[{"index": 0,
+                                "function": {"name": "check", "arguments": 'ill": "Hack"}'}}]),
+            {"choices": [{"index": 0, "delta": {}, "finish_reason": "tool_calls"}]},
+        ))]
+
+        assert "".join(texts) == "Rain falls."
+        response = acc.response()
+        assert response.content == "Rain falls."
+        assert response.finish_reason == "tool_calls"
+        assert response.tool_calls == [
+            ToolCall(id="call_1", name="roll_check", arguments={"skill": "Hack"}),
+        ]
+
+    def test_ollama_native_events(self):
+        acc = ChatStreamAccumulator()
+        for event in iter_ndjson([
+            b'{"message": {"role": "assistant", "content": "Hi"}, "done": false}\n',
+            b'{"message": {"role": "assistant", "content": " there"}, "done": false}\n',
+            (b'{"message": {"role": "assistant", "content": ""}, "done": true, '
+             b'"done_reason": "stop"}\n'),
+        ]):
+            acc.feed(event)
+        assert acc.done
+        assert acc.response().content == "Hi there"
+
+
+# -----------------------------------------------------------------------------
+# Skill tag buffering
+# -----------------------------------------------------------------------------
+
+class TestSkillTagBuffer:
+    """Prose flows through; skill tags never reach the display."""
+
+    def _run(self, text: str, piece: int) -> str:
+        buffer = SkillTagBuffer()
+        out = [buffer.feed(text[i:i + piece]) for i in range(0, len(text), piece)]
+        return "".join(out) + buffer.flush()
+
+    @pytest.mark.parametrize("piece", [1, 2, 5, 100])
+    def test_tool_tags_are_swallowed(self, piece):
+        text = 'You wait. <tool>{"name": "roll_check", "args": {}}</tool> The door opens.'
+        assert self._run(text, piece) == "You wait.  The door opens."
+
+    def test_prose_is_not_held_back(self):
+        buffer = SkillTagBuffer()
+        assert buffer.feed("The guard nods") == "The guard nods"
+        # "<t" could still become "<tool>", so only that tail waits
+        assert buffer.feed(" at you <t") == " at you "
+        assert buffer.feed("hen leaves") == "<then leaves"
+
+    def test_unclosed_tag_is_dropped_at_flush(self):
+        buffer = SkillTagBuffer()
+        assert buffer.feed('Done. <tool>{"name": "x"') == "Done. "
+        assert buffer.flush() == ""
+
+    def test_skills_are_parsed_as_tags_close(self):
+        buffer = SkillTagBuffer()
+        buffer.feed('Rolling. <tool>{"name": "roll_check", "args": {"dc"')
+        assert buffer.take_skills() == []
+        buffer.feed(': 10}}</tool> and [TOOL: explore_lore(topic="nexus")]')
+        skills = buffer.take_skills()
+        assert [(s.name, s.arguments) for s in skills] == [
+            ("roll_check", {"dc": 10}),
+            ("explore_lore", {"topic": "nexus"}),
+        ]
+        assert buffer.take_skills() == []
+
+    def test_prose_after_a_tag_stops_the_round(self):
+        buffer = SkillTagBuffer(stop_after_tags=True)
+        tag = '<tool>{"name": "roll_check", "args": {}}</tool>'
+        assert buffer.feed(f"You wait. {tag}\n") == "You wait. \n"
+        assert not buffer.stopped
+        assert buffer.feed("The door opens.") == ""
+        assert buffer.stopped
+        assert buffer.content == f"You wait. {tag}"
+        assert buffer.flush() == ""
+
+
+# -----------------------------------------------------------------------------
+# Streaming tool loop
+# -----------------------------------------------------------------------------
+
+class TestChatWithToolsStream:
+    """chat_with_tools_stream forwards text and runs tools."""
+
+    def test_skill_path_hides_tags_and_runs_tools(self):
+        client = ScriptedStreamClient([
+            LLMResponse(content='Rolling. <tool>{"name": "roll_check", "args": {"dc": 10}}</tool>'),
+            LLMResponse(content="Success - the lock gives."),
+        ])
+        calls, shown = [], []
+
+        result = client.chat_with_tools_stream(
+            messages=[],
+            tools=TOOLS,
+            tool_executor=lambda name, args: calls.append((name, args)) or {"ok": True},
+            on_text=shown.append,
+        )
+
+        assert result == "Success - the lock gives."
+        assert calls == [("roll_check", {"dc": 10})]
+        assert "<tool>" not in "".join(shown)
+        assert "".join(shown).endswith("Success - the lock gives.")
+        assert all(shown)  # No empty deltas
+
+    def test_skill_tools_start_before_generation_ends(self):
+        dispatched = threading.Event()
+        seen = {"waited": None, "finished": False}
+
+        class SlowTailClient(ScriptedStreamClient):
+            def chat_stream(self, messages, system=None, tools=None, temperature=0.7, max_tokens=2048):
+                self.rounds += 1
+                if self.rounds == 2:
+                    yield StreamChunk(text="Nothing there.")
+                    yield StreamChunk(response=LLMResponse(content="Nothing there."))
+                    return
+                yield StreamChunk(text='Checking. <tool>{"name": "explore_lore", "args": {}}</tool>')
+                seen["waited"] = dispatched.wait(1)
+                yield StreamChunk(text=" The archive says")
+                yield StreamChunk(text=" something invented.")
+                seen["finished"] = True
+
+        client = SlowTailClient([])
+        tools = [{"name": "explore_lore", "input_schema": {}, "read_only": True}]
+        shown = []
+
+        result = client.chat_with_tools_stream(
+            messages=[],
+            tools=tools,
+            tool_executor=lambda name, args: dispatched.set() or {"lore": "none"},
+            on_text=shown.append,
+        )
+
+        assert result == "Nothing there."
+        assert seen["waited"]  # Tool ran while the model was still generating
+        assert not seen["finished"]  # Generation cut once prose followed the tag
+        assert "invented" not in "".join(shown)
+
+    def test_native_path_streams_each_round(self):
+        client = ScriptedStreamClient([
+            LLMResponse(content="", tool_calls=[ToolCall("c1", "roll_check", {})]),
+            LLMResponse(content="The lock gives."),
+        ], native=True)
+        shown = []
+
+        result = client.chat_with_tools_stream(
+            messages=[],
+            tools=TOOLS,
+            tool_executor=lambda name, args: {"ok": True},
+            on_text=shown.append,
+        )
+
+        assert result == "The lock gives."
+        assert "".join(shown) == "The lock gives."
+        assert len(shown) > 1
+        assert client.rounds == 2
+
+    def test_agent_streams_tokens(self, manager, campaign):
+        from src.agent import SentinelAgent
+        from src.llm import MockLLMClient
+
+        client = MockLLMClient(responses=["The rain keeps falling."])
+        agent = SentinelAgent(
+            manager,
+            prompts_dir=Path(__file__).parent.parent / "prompts",
+            client=client,
+        )
+        tokens = []
+        try:
+            response = agent.respond("I wait.", on_token=tokens.append)
+        finally:
+            agent.close()
+
+        assert response == "The rain keeps falling."
+        assert "".join(tokens).strip() == response
+        assert client.calls[-1]["method"] == "chat_with_tools_stream"
+
+
+# -----------------------------------------------------------------------------
+# Backend stream over HTTP
+# -----------------------------------------------------------------------------
+
+class TestLMStudioStream:
+    """LMStudioClient.chat_stream against a local SSE server."""
+
+    def test_chat_stream_over_sse(self):
+        from src.llm.base import Message
+        from src.llm.lmstudio import LMStudioClient
+
+        bodies = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                bodies.append(json.loads(self.rfile.read(length)))
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                for line in _sse(_delta(content="Hello"), _delta(content=", runner")):
+                    self.wfile.write(line)
+                    self.wfile.flush()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            client = LMStudioClient(
+                base_url=f"http://127.0.0.1:{server.server_port}/v1",
+                model="test-model",
+            )
+            chunks = list(client.chat_stream([Message(role="user", content="hi")]))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert [c.text for c in chunks[:-1]] == ["Hello", ", runner"]
+        assert chunks[-1].response.content == "Hello, runner"
+        assert bodies[0]["stream"] is True
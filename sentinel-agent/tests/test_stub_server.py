@@ -0,0 +1,119 @@
+"""
+Tests for the deterministic stub LLM server and the respond() benchmark
+that runs against it.
+"""
+
+import json
+import urllib.request
+
+import pytest
+
+from src.bench import main as bench_main
+from src.bench import run_benchmark
+from src.llm.base import Message
+from src.llm.lmstudio import LMStudioClient
+from src.llm.ollama import OllamaClient
+from src.llm.stub_server import StubLLMServer
+
+ROLL = [{
+    "name": "roll_check",
+    "description": "Roll a skill check",
+    "parameters": {"type": "object", "properties": {"skill": {"type": "string"}}},
+}]
+
+
+@pytest.fixture
+def stub():
+    server = StubLLMServer(reply_tokens=6, tool_name="roll_check", tool_args={"skill": "Hacking"})
+    with server:
+        yield server
+
+
+def _post(url: str, payload: dict) -> bytes:
+    request = urllib.request.Request(
+        url, data=json.dumps(payload).encode(), headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.read()
+
+
+class TestStubServer:
+    """Protocol coverage through the real clients."""
+
+    def test_replies_are_deterministic(self, stub):
+        client = LMStudioClient(base_url=stub.openai_url)
+        messages = [Message(role="user", content="Status report")]
+
+        first = client.chat(messages)
+        second = client.chat(messages)
+        other = client.chat([Message(role="user", content="Something else")])
+
+        assert first.content == second.content
+        assert first.content != other.content
+        assert first.completion_tokens == 6
+
+    def test_stream_matches_blocking_reply(self, stub):
+        client = LMStudioClient(base_url=stub.openai_url)
+        messages = [Message(role="user", content="Status report")]
+
+        chunks = list(client.chat_stream(messages))
+
+        assert "".join(c.text for c in chunks) == client.chat(messages).content
+        assert chunks[-1].response.completion_tokens == 6
+
+    def test_tool_round_trip(self, stub):
+        client = LMStudioClient(base_url=stub.openai_url)
+        calls = []
+
+        def executor(name, args):
+            calls.append((name, args))
+            return {"success": True, "total": 12}
+
+        reply = client.chat_with_tools(
+            [Message(role="user", content="Hack the door")], tools=ROLL, tool_executor=executor,
+        )
+
+        assert calls == [("roll_check", {"skill": "Hacking"})]
+        assert reply.endswith(".")
+
+    def test_ollama_native_api(self, stub):
+        body = _post(f"{stub.url}/api/chat", {
+            "model": "stub-model", "stream": False,
+            "messages": [{"role": "user", "content": "Status report"}],
+        })
+        reply = json.loads(body)
+        assert reply["done"] and reply["eval_count"] == 6
+
+        lines = _post(f"{stub.url}/api/chat", {
+            "model": "stub-model", "messages": [{"role": "user", "content": "Status report"}],
+        }).decode().splitlines()
+        streamed = [json.loads(line) for line in lines]
+        assert "".join(s["message"]["content"] for s in streamed) == reply["message"]["content"]
+        assert streamed[-1]["done"]
+
+    def test_ollama_client(self, stub):
+        client = OllamaClient(base_url=stub.openai_url)
+
+        response = client.chat([Message(role="user", content="Status report")])
+
+        assert response.content.endswith(".")
+        assert "/v1/chat/completions" in stub.requests
+
+
+class TestBenchmark:
+    """The respond() harness."""
+
+    def test_reports_every_stage(self):
+        result = run_benchmark(turns=3, campaigns=2, warmup=1, lore_dir=None, reply_tokens=8)
+
+        summary = result.summary()
+        assert set(summary) == {"total", "context", "retrieval", "packing", "llm", "post"}
+        assert all(len(values) == 3 for values in result.timings.values())
+        assert summary["total"]["p95"] >= summary["llm"]["p95"]
+
+    def test_budget_failure_exits_nonzero(self, capsys):
+        args = ["--turns", "2", "--warmup", "0", "--no-lore"]
+
+        assert bench_main(args + ["--budget", "total=60"]) == 0
+        assert bench_main(args + ["--budget", "total=0"]) == 1
+        assert "total p95" in capsys.readouterr().err
@@ -0,0 +1,148 @@
+"""
+Tests for per-backend LLM telemetry: usage parsing, the rolling metrics
+store and its JSONL export, and client instrumentation.
+"""
+
+import json
+
+import pytest
+
+from src.llm.base import LLMResponse, Message, ToolCall
+from src.llm.streaming import ChatStreamAccumulator
+from src.llm.telemetry import (
+    CallMetrics,
+    CallTimer,
+    MetricsStore,
+    get_metrics_store,
+    load_metrics,
+    summarize,
+)
+
+from .test_connection_pool import FakeBackend, _lmstudio
+
+
+def _metrics(backend="lmstudio@a:1", latency=1.0, ttft=0.2, completion=80) -> CallMetrics:
+    return CallMetrics(
+        backend=backend, model="m", prompt_tokens=100, completion_tokens=completion,
+        latency=latency, ttft=ttft, tokens_per_sec=completion / (latency - (ttft or 0)),
+        usage_reported=True, streamed=ttft is not None, timestamp=0.0,
+    )
+
+
+@pytest.fixture
+def backend():
+    server = FakeBackend()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def store():
+    store = get_metrics_store()
+    store.clear()
+    yield store
+    store.clear()
+
+
+class TestUsageParsing:
+    """Backend-reported token counts."""
+
+    def test_openai_usage_chunk(self):
+        acc = ChatStreamAccumulator()
+        acc.feed({"choices": [{"delta": {"content": "Hi"}, "finish_reason": "stop"}]})
+        acc.feed({"choices": [], "usage": {"prompt_tokens": 30, "completion_tokens": 2}})
+
+        response = acc.response()
+        assert response.content == "Hi"
+        assert (response.prompt_tokens, response.completion_tokens) == (30, 2)
+
+    def test_ollama_native_counts(self):
+        acc = ChatStreamAccumulator()
+        acc.feed({"message": {"content": "Hi"}, "done": False})
+        acc.feed({"message": {"content": ""}, "done": True,
+                  "prompt_eval_count": 40, "eval_count": 5})
+
+        response = acc.response()
+        assert (response.prompt_tokens, response.completion_tokens) == (40, 5)
+
+
+class TestMetricsStore:
+    """Rolling window, summaries and export."""
+
+    def test_window_and_summary(self):
+        store = MetricsStore(window=3)
+        for latency in (1.0, 2.0, 3.0, 4.0):
+            store.record(_metrics(latency=latency, ttft=None))
+        store.record(_metrics(backend="ollama@b:2", completion=10))
+
+        assert len(store.recent()) == 3
+        summary = store.summary()
+        assert summary["lmstudio@a:1"]["calls"] == 2
+        assert summary["lmstudio@a:1"]["latency_p50"] in (3.0, 4.0)
+        assert summary["lmstudio@a:1"]["ttft_p50"] is None
+        assert summary["ollama@b:2"]["tokens_per_sec"] == pytest.approx(10 / 0.8)
+
+    def test_jsonl_export_round_trips(self, tmp_path):
+        path = tmp_path / ".perf.jsonl"
+        MetricsStore(export_path=path).record(_metrics())
+        MetricsStore(export_path=path).record(_metrics(latency=3.0))  # Next session
+        with path.open("a") as f:
+            f.write("not json\n")
+
+        records = load_metrics(path)
+        assert [r.latency for r in records] == [1.0, 3.0]
+        assert summarize(records)["lmstudio@a:1"]["calls"] == 2
+
+    def test_timer_counts_locally_without_usage(self):
+        store = MetricsStore()
+        timer = CallTimer("mock", "m", store=store)
+        response = LLMResponse(
+            content="The door opens.",
+            tool_calls=[ToolCall("c0", "roll_check", {"skill": "Hacking"})],
+        )
+
+        metrics = timer.finish(response, [Message(role="user", content="Open it")], "GM")
+
+        assert not metrics.usage_reported
+        assert metrics.prompt_tokens > 0 and metrics.completion_tokens > 0
+        assert metrics.ttft is None and not metrics.streamed
+        assert store.last() is metrics
+
+
+class TestClientTelemetry:
+    """Real clients record each call."""
+
+    def test_chat_records_backend_usage(self, backend, store):
+        client = _lmstudio(backend)
+
+        client.chat([Message(role="user", content="hi")])
+
+        last = store.last()
+        assert last.backend == f"lmstudio@{backend.url.removeprefix('http://')}"
+        assert last.model == "test-model"
+        assert (last.prompt_tokens, last.completion_tokens) == (12, 1)
+        assert last.usage_reported and not last.streamed
+
+    def test_stream_records_ttft_and_usage(self, backend, store, tmp_path):
+        store.export_path = tmp_path / ".perf.jsonl"
+        try:
+            client = _lmstudio(backend)
+            chunks = list(client.chat_stream([Message(role="user", content="hi")]))
+        finally:
+            store.export_path = None
+
+        assert chunks[-1].response.completion_tokens == 2
+        last = store.last()
+        assert last.streamed and 0 <= last.ttft <= last.latency
+        assert last.completion_tokens == 2
+        exported = [json.loads(line) for line in (tmp_path / ".perf.jsonl").read_text().splitlines()]
+        assert exported[-1]["ttft"] == last.ttft
+
+    def test_abandoned_stream_is_not_recorded(self, backend, store):
+        client = _lmstudio(backend)
+
+        stream = client.chat_stream([Message(role="user", content="hi")])
+        next(stream)
+        stream.close()
+
+        assert store.last() is None
@@ -0,0 +1,114 @@
+"""
+Tests for tool execution within one model round: read-only calls run
+concurrently, mutating calls keep their order.
+"""
+
+import threading
+import time
+
+from src.llm.base import LLMClient, LLMResponse, ToolCall, run_tool_calls
+from src.tools.registry import get_all_schemas
+
+TOOLS = [
+    {"name": "read_gm_scratchpad", "input_schema": {}, "read_only": True},
+    {"name": "explore_lore", "input_schema": {}, "read_only": True},
+    {"name": "update_npc", "input_schema": {}},
+]
+
+
+class RecordingExecutor:
+    """Tool executor that sleeps, and logs start/end of each call."""
+
+    def __init__(self, delay: float = 0.1):
+        self.delay = delay
+        self.log: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, name: str, args: dict) -> dict:
+        with self._lock:
+            self.log.append(("start", args["id"]))
+        time.sleep(self.delay)
+        with self._lock:
+            self.log.append(("end", args["id"]))
+        return {"id": args["id"]}
+
+
+class ToolRoundClient(LLMClient):
+    """Asks for the given tool calls once, then answers."""
+
+    def __init__(self, tool_calls: list[ToolCall]):
+        self._replies = [
+            LLMResponse(content="", tool_calls=tool_calls),
+            LLMResponse(content="Done."),
+        ]
+        self.seen: list = []
+
+    @property
+    def supports_tools(self) -> bool:
+        return True
+
+    @property
+    def model_name(self) -> str:
+        return "tool-round"
+
+    def chat(self, messages, system=None, tools=None, temperature=0.7, max_tokens=2048):
+        self.seen = list(messages)
+        return self._replies.pop(0)
+
+
+class TestToolRounds:
+    """run_tool_calls and the native tool loop."""
+
+    def test_reads_run_concurrently_in_call_order(self):
+        executor = RecordingExecutor()
+        calls = [("explore_lore", {"id": str(i)}) for i in range(3)]
+
+        start = time.perf_counter()
+        results = run_tool_calls(calls, executor, TOOLS)
+        elapsed = time.perf_counter() - start
+
+        assert [r["id"] for r in results] == ["0", "1", "2"]
+        assert elapsed < 0.25  # About one read, not three
+
+    def test_mutations_are_barriers(self):
+        executor = RecordingExecutor(delay=0.02)
+        calls = [
+            ("read_gm_scratchpad", {"id": "r1"}),
+            ("explore_lore", {"id": "r2"}),
+            ("update_npc", {"id": "w1"}),
+            ("update_npc", {"id": "w2"}),
+            ("explore_lore", {"id": "r3"}),
+        ]
+
+        results = run_tool_calls(calls, executor, TOOLS)
+
+        assert [r["id"] for r in results] == ["r1", "r2", "w1", "w2", "r3"]
+        order = executor.log
+        w1 = order.index(("start", "w1"))
+        assert {("end", "r1"), ("end", "r2")} <= set(order[:w1])
+        assert order[w1 + 1] == ("end", "w1")
+        assert order[w1 + 2:w1 + 4] == [("start", "w2"), ("end", "w2")]
+        assert order[-2:] == [("start", "r3"), ("end", "r3")]
+
+    def test_native_loop_feeds_results_in_order(self):
+        client = ToolRoundClient([
+            ToolCall(f"c{i}", "explore_lore", {"id": str(i)}) for i in range(3)
+        ])
+        executor = RecordingExecutor()
+
+        result = client.chat_with_tools(
+            messages=[], tools=TOOLS, tool_executor=executor,
+        )
+
+        assert result == "Done."
+        tool_messages = [m for m in client.seen if m.role == "tool"]
+        assert [m.tool_call_id for m in tool_messages] == ["c0", "c1", "c2"]
+
+    def test_registry_marks_only_reads(self):
+        read_only = {s["name"] for s in get_all_schemas() if s.get("read_only")}
+        assert read_only == {
+            "read_gm_scratchpad",
+            "explore_lore",
+            "describe_npc_appearance",
+            "verify_choices",
+        }
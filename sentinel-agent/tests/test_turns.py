@@ -0,0 +1,135 @@
+"""
+Tests for batched turn commits.
+"""
+
+import pytest
+
+from src.state.action_log import MemoryActionLog, state_hash
+from src.state.event_bus import EventType, get_event_bus
+from src.state.manager import CampaignManager
+from src.state.schema import FactionName
+from src.state.schemas.action import Action, ActionType, Proposal
+from src.state.store import MemoryCampaignStore
+from src.systems.replay import ReplayEngine
+from src.systems.simulation import SimulationEngine
+from src.systems.turns import BatchRejectedError, StaleStateError, TurnPhase
+
+
+@pytest.fixture
+def campaign():
+    manager = CampaignManager(MemoryCampaignStore())
+    return manager.create_campaign("Batch")
+
+
+@pytest.fixture
+def engine():
+    return SimulationEngine()
+
+
+def _queue(campaign, engine) -> list[Action]:
+    """Travel two hops, then do two local favors."""
+    first = engine.routes(campaign.map_state.current_region.value)[0]
+    second = next(r for r in engine.routes(first) if r != campaign.map_state.current_region.value)
+    proposals = [
+        Proposal(action_type=ActionType.TRAVEL, payload={"to": first}),
+        Proposal(action_type=ActionType.TRAVEL, payload={"to": second}),
+        Proposal(action_type=ActionType.LOCAL, payload={"standing_changes": {"Nexus": 2}}),
+        Proposal(action_type=ActionType.LOCAL, payload={"standing_changes": {"Covenant": 1}}),
+    ]
+    return [
+        Action.from_proposal(p, campaign.state_version)
+        for p in proposals
+    ]
+
+
+def _commit_singly(orchestrator, actions):
+    for action in actions:
+        orchestrator.propose(Proposal(action_type=action.action_type, payload=action.payload))
+        orchestrator.commit(action.model_copy(update={"state_version": orchestrator.campaign.state_version}))
+
+
+class TestCommitBatch:
+    """commit_batch() against the single-action path."""
+
+    def test_same_state_as_single_commits(self, campaign, engine):
+        single = campaign.model_copy(deep=True)
+        actions = _queue(campaign, engine)
+
+        result = engine.orchestrator(campaign).commit_batch(actions)
+        _commit_singly(engine.orchestrator(single), actions)
+
+        assert state_hash(campaign) == state_hash(single)
+        assert campaign.state_version == result.state_version == 4
+        assert result.turn_number == 4
+        assert result.action_ids == [a.action_id for a in actions]
+        assert result.state_snapshot["factions"]["Nexus"] == "Allied"
+
+    def test_one_summary_event_and_one_persist(self, campaign, engine):
+        persisted = []
+        resolved = []
+        bus = get_event_bus()
+        bus.on(EventType.TURN_RESOLVED, resolved.append)
+        orchestrator = engine.orchestrator(campaign)
+        orchestrator.set_persist_fn(persisted.append)
+        actions = _queue(campaign, engine)
+        try:
+            orchestrator.commit_batch(actions)
+        finally:
+            bus.off(EventType.TURN_RESOLVED, resolved.append)
+
+        assert len(persisted) == 1
+        assert len(resolved) == 1
+        assert resolved[0].data["action_ids"] == [a.action_id for a in actions]
+        assert orchestrator.phase == TurnPhase.IDLE
+
+    def test_notices_merged_by_headline(self, campaign, engine):
+        actions = [
+            Action(action_type=ActionType.LOCAL, state_version=0,
+                   payload={"standing_changes": {faction.value: 5}})
+            for faction in (FactionName.NEXUS, FactionName.COVENANT)
+        ]
+
+        result = engine.orchestrator(campaign).commit_batch(actions)
+
+        ripples = [n for n in result.cascade_notices if n["headline"] == "Ripple Effect"]
+        assert len(ripples) == 1
+        assert any("allied with Nexus" in d for d in ripples[0]["details"])
+        assert any("hostile to Covenant" in d for d in ripples[0]["details"])
+
+    def test_infeasible_action_applies_nothing(self, campaign, engine):
+        actions = _queue(campaign, engine)
+        actions.insert(2, Action(
+            action_type=ActionType.TRAVEL, state_version=0, payload={"to": "nowhere"},
+        ))
+        before = state_hash(campaign)
+        orchestrator = engine.orchestrator(campaign)
+
+        with pytest.raises(BatchRejectedError) as excinfo:
+            orchestrator.commit_batch(actions)
+
+        assert excinfo.value.index == 2
+        assert state_hash(campaign) == before
+        assert orchestrator.phase == TurnPhase.IDLE
+
+    def test_stale_action_rejected_up_front(self, campaign, engine):
+        actions = _queue(campaign, engine)
+        actions[1] = actions[1].model_copy(update={"state_version": 3})
+
+        with pytest.raises(StaleStateError):
+            engine.orchestrator(campaign).commit_batch(actions)
+        assert campaign.state_version == 0
+
+    def test_logged_per_action_and_replayable(self, campaign, engine):
+        snapshot = campaign.model_copy(deep=True)
+        log = MemoryActionLog()
+        orchestrator = engine.orchestrator(campaign)
+        orchestrator.set_action_log(log, checkpoint_every=2)
+
+        orchestrator.commit_batch(_queue(campaign, engine))
+
+        entries = list(log.entries())
+        assert [e.state_version for e in entries] == [1, 2, 3, 4]
+        assert [e.action.state_version for e in entries] == [0, 1, 2, 3]
+        result = ReplayEngine().replay(snapshot, entries)
+        assert result.verified == 2
+        assert state_hash(result.campaign) == state_hash(campaign)